@@ -0,0 +1,86 @@
+"""Compare broken-pipe strategies for a command whose output is cut short by ``head -1``.
+
+Usage:
+    python benchmarks/bench_broken_pipe.py [--lines 5000000] [--runs 5]
+
+Each run starts a fresh interpreter that echoes ``--lines`` lines through
+``run_cli`` under one :class:`BrokenPipeStrategy`. The parent behaves like
+``head -1``: it reads a single line and closes the pipe. Reported per strategy:
+
+* ``total``  – wall time from spawn until the producer has exited.
+* ``after``  – time from closing the pipe until the producer has exited, i.e.
+  the cost of reacting to ``EPIPE`` and tearing down.
+* ``exit``   – the producer's exit status as a shell would report it.
+* ``stderr`` – bytes of diagnostics the producer emitted (teardown noise).
+
+POSIX only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import textwrap
+import time
+
+from lib_cli_exit_tools import BrokenPipeStrategy
+
+_CHILD = textwrap.dedent(
+    """
+    import sys
+
+    import rich_click as click
+
+    from lib_cli_exit_tools import BrokenPipeStrategy, config, run_cli
+
+
+    @click.command()
+    def flood() -> None:
+        for index in range({lines}):
+            click.echo(f"line {index}")
+
+
+    config.broken_pipe_strategy = BrokenPipeStrategy(sys.argv[1])
+    raise SystemExit(run_cli(flood, []))
+    """
+)
+
+
+def _run_once(lines: int, strategy: BrokenPipeStrategy) -> tuple[float, float, int, int]:
+    script = _CHILD.replace("{lines}", str(lines))
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script, strategy.value],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    proc.stdout.readline()
+    proc.stdout.close()
+    closed = time.perf_counter()
+    stderr = proc.stderr.read()
+    status = proc.wait()
+    finished = time.perf_counter()
+    shell_status = 128 - status if status < 0 else status
+    return (finished - started) * 1000.0, (finished - closed) * 1000.0, shell_status, len(stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=5_000_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for strategy in BrokenPipeStrategy:
+        results = [_run_once(args.lines, strategy) for _ in range(args.runs)]
+        total = statistics.median(result[0] for result in results)
+        after = statistics.median(result[1] for result in results)
+        codes = sorted({result[2] for result in results})
+        noise = max(result[3] for result in results)
+        print(f"{strategy.value:<10} total {total:8.2f} ms   after {after:7.2f} ms   exit {codes}   stderr {noise} bytes")
+
+
+if __name__ == "__main__":
+    main()
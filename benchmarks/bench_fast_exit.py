@@ -0,0 +1,65 @@
+"""Measure interpreter shutdown time for a heap-heavy command with and without fast exit.
+
+Usage:
+    python benchmarks/bench_fast_exit.py [--objects 2000000] [--runs 3]
+
+Each run starts a fresh interpreter whose command builds ``--objects`` small
+dicts and keeps them alive in a module global. The child prints a monotonic
+timestamp when the command body finishes; the parent records when the process
+has fully exited. The difference is the teardown cost ``fast_exit`` removes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import textwrap
+import time
+
+_CHILD = textwrap.dedent(
+    """
+    import sys
+    import time
+
+    import rich_click as click
+
+    from lib_cli_exit_tools import run_cli
+
+    HEAP: list[dict[str, object]] = []
+
+
+    @click.command()
+    def build() -> None:
+        HEAP.extend({"index": i, "label": str(i), "tags": [i]} for i in range({objects}))
+        print(time.monotonic(), file=sys.stderr, flush=True)
+
+
+    raise SystemExit(run_cli(build, [], fast_exit={fast_exit}))
+    """
+)
+
+
+def _shutdown_ms(objects: int, fast_exit: bool) -> float:
+    script = _CHILD.replace("{objects}", str(objects)).replace("{fast_exit}", str(fast_exit))
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    finished = time.monotonic()
+    marker = float(proc.stderr.strip().splitlines()[-1])
+    return (finished - marker) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=2_000_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    for fast_exit in (False, True):
+        samples = [_shutdown_ms(args.objects, fast_exit) for _ in range(args.runs)]
+        label = "fast_exit" if fast_exit else "default"
+        print(f"{label:<10} shutdown median {statistics.median(samples):9.2f} ms   min {min(samples):9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Measure the per-invocation overhead of phase-timing instrumentation.
+
+Usage:
+    python benchmarks/bench_phase_timings.py [--runs 20000]
+
+Runs a no-op Click command in-process through:
+
+* ``click``     – ``command.main`` directly, the floor without ``run_cli``.
+* ``run_cli``   – ``run_cli`` with no hook and ``config.timings`` off.
+* ``hook``      – ``run_cli`` with a ``phase_hook`` collecting every phase.
+
+Signal installation is disabled so only the instrumentation differs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import rich_click as click
+
+from lib_cli_exit_tools import run_cli
+
+
+@click.command()
+def noop() -> None:
+    """Return immediately."""
+
+
+def _per_call_us(action: Callable[[], object], runs: int) -> float:
+    started = time.perf_counter()
+    for _ in range(runs):
+        action()
+    return (time.perf_counter() - started) / runs * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20_000)
+    args = parser.parse_args()
+    runs: int = args.runs
+    phases: list[str] = []
+
+    cases: dict[str, Callable[[], object]] = {
+        "click": lambda: noop.main([], standalone_mode=False),
+        "run_cli": lambda: run_cli(noop, [], install_signals=False),
+        "hook": lambda: run_cli(noop, [], install_signals=False, phase_hook=lambda phase, _started, _finished: phases.append(phase)),
+    }
+    for label, action in cases.items():
+        print(f"{label:<8} {_per_call_us(action, runs):8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
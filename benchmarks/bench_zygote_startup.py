@@ -0,0 +1,89 @@
+"""Compare cold-start latency against zygote fork-per-request latency.
+
+Usage:
+    python benchmarks/bench_zygote_startup.py [--runs 20]
+
+Measures three ways of running ``lib-cli-exit-tools info`` with stdout sent to
+``/dev/null``:
+
+* ``cold``   – a fresh ``python -m lib_cli_exit_tools`` interpreter per run.
+* ``fork``   – :meth:`Zygote.run` forking the already-warm benchmark process.
+* ``socket`` – :func:`request_zygote_run` against a zygote served from a
+  background process (client cost included, interpreter start excluded).
+
+POSIX only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from lib_cli_exit_tools import Zygote, request_zygote_run
+from lib_cli_exit_tools.cli import cli
+
+
+def _time_runs(action: Callable[[], int], runs: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        code = action()
+        samples.append((time.perf_counter() - started) * 1000.0)
+        if code != 0:
+            raise SystemExit(f"benchmark command failed with exit code {code}")
+    return samples
+
+
+def _cold_start(devnull: int) -> int:
+    return subprocess.call([sys.executable, "-m", "lib_cli_exit_tools", "info"], stdout=devnull)
+
+
+def _serve(socket_path: str, runs: int) -> None:
+    Zygote(cli, prog_name="lib-cli-exit-tools").serve(socket_path, max_requests=runs)
+
+
+def _wait_for(path: Path) -> None:
+    deadline = time.monotonic() + 10.0
+    while not path.exists():
+        if time.monotonic() > deadline:
+            raise SystemExit("zygote socket did not appear")
+        time.sleep(0.01)
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(f"{label:<8} median {statistics.median(samples):8.2f} ms   min {min(samples):8.2f} ms   max {max(samples):8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    runs: int = args.runs
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    stdio = (0, devnull, 2)
+    launcher = Zygote(cli, prog_name="lib-cli-exit-tools")
+
+    _report("cold", _time_runs(lambda: _cold_start(devnull), runs))
+    _report("fork", _time_runs(lambda: launcher.run(["info"], stdio=stdio), runs))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = Path(tmp) / "zygote.sock"
+        server = multiprocessing.get_context("fork").Process(target=_serve, args=(str(socket_path), runs))
+        server.start()
+        _wait_for(socket_path)
+        _report("socket", _time_runs(lambda: request_zygote_run(str(socket_path), ["info"], stdio=stdio), runs))
+        server.join()
+    os.close(devnull)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,12 +17,15 @@ from . import lib_cli_exit_tools as _facade
 # the facade module. Attributes are assigned explicitly so static type checkers
 # understand the exports, while the debug assertion keeps this module aligned
 # with the facade surface.
+BrokenPipeStrategy = _facade.BrokenPipeStrategy
 ExitCodeStyle = _facade.ExitCodeStyle
 CliSignalError = _facade.CliSignalError
 SigBreakInterrupt = _facade.SigBreakInterrupt
 SigIntInterrupt = _facade.SigIntInterrupt
 SigTermInterrupt = _facade.SigTermInterrupt
 SignalSpec = _facade.SignalSpec
+TimeoutInterrupt = _facade.TimeoutInterrupt
+StallInterrupt = _facade.StallInterrupt
 config = _facade.config
 config_overrides = _facade.config_overrides
 default_signal_specs = _facade.default_signal_specs
@@ -31,10 +34,44 @@ get_system_exit_code = _facade.get_system_exit_code
 handle_cli_exception = _facade.handle_cli_exception
 i_should_fail = _facade.i_should_fail
 install_signal_handlers = _facade.install_signal_handlers
+signal_deliveries = _facade.signal_deliveries
+defer_signals = _facade.defer_signals
+install_signal_relay = _facade.install_signal_relay
 print_exception_message = _facade.print_exception_message
 reset_config = _facade.reset_config
 run_cli = _facade.run_cli
+run_cli_async = _facade.run_cli_async
 cli_session = _facade.cli_session
+Zygote = _facade.Zygote
+request_zygote_run = _facade.request_zygote_run
+GcPolicy = _facade.GcPolicy
+GcStats = _facade.GcStats
+PhaseHook = _facade.PhaseHook
+PhaseTimings = _facade.PhaseTimings
+StatsStore = _facade.StatsStore
+RunRecord = _facade.RunRecord
+CommandStats = _facade.CommandStats
+RusageFormat = _facade.RusageFormat
+ForkSignalPolicy = _facade.ForkSignalPolicy
+FailureKind = _facade.FailureKind
+classify_exception = _facade.classify_exception
+is_transient = _facade.is_transient
+RetryPolicy = _facade.RetryPolicy
+ThreadFailure = _facade.ThreadFailure
+WorkerThreadFailed = _facade.WorkerThreadFailed
+heartbeat = _facade.heartbeat
+CancellationToken = _facade.CancellationToken
+current_cancellation_token = _facade.current_cancellation_token
+CancellableThreadPool = _facade.CancellableThreadPool
+CancellableProcessPool = _facade.CancellableProcessPool
+run_child = _facade.run_child
+ChildResult = _facade.ChildResult
+fan_out = _facade.fan_out
+fan_out_async = _facade.fan_out_async
+FanOutError = _facade.FanOutError
+ExceptionRecord = _facade.ExceptionRecord
+RemoteError = _facade.RemoteError
+transport_exceptions = _facade.transport_exceptions
 
 __all__ = list(_facade.PUBLIC_API)  # pyright: ignore[reportUnsupportedDunderAll]
 
@@ -0,0 +1,86 @@
+"""Broken-pipe adapters for CLIs writing into short-lived pipeline readers.
+
+Purpose:
+    Implement the process-level halves of :class:`BrokenPipeStrategy`:
+    restoring the default ``SIGPIPE`` disposition and silencing stdout once
+    its reader has gone away.
+Contents:
+    * :func:`install_broken_pipe_strategy` applying the signal-level part of
+      a strategy and returning a restorer.
+    * :func:`discard_stdout` redirecting the stdout descriptor to
+      :data:`os.devnull`.
+System Integration:
+    :func:`lib_cli_exit_tools.run_cli` installs the strategy alongside the
+    signal handlers and calls :func:`discard_stdout` before mapping a
+    ``BrokenPipeError`` when the ``DEVNULL`` strategy is active.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import sys
+import threading
+from collections.abc import Callable
+from contextlib import suppress
+
+from ..core.configuration import BrokenPipeStrategy
+
+__all__ = ["discard_stdout", "install_broken_pipe_strategy"]
+
+
+def _noop() -> None:
+    """Restorer used when a strategy changed nothing process-wide."""
+
+
+def install_broken_pipe_strategy(strategy: BrokenPipeStrategy) -> Callable[[], None]:
+    """Apply the process-wide part of ``strategy`` and return a restorer.
+
+    Why:
+        Python ignores ``SIGPIPE`` at start-up so writes fail with ``EPIPE``
+        instead; restoring ``SIG_DFL`` lets the kernel end the process on the
+        first failed write with no unwinding and no teardown flushes.
+    Parameters:
+        strategy: Selected broken-pipe handling. Only ``SIGNAL`` changes
+            process state here; the other strategies act when the error is
+            handled.
+    Returns:
+        Callable restoring the previous ``SIGPIPE`` disposition. A no-op when
+        nothing was changed (non-``SIGNAL`` strategy, no ``SIGPIPE`` on this
+        platform, or not running on the main thread).
+    """
+
+    signum = getattr(signal, "SIGPIPE", None)
+    if strategy is not BrokenPipeStrategy.SIGNAL or signum is None:
+        return _noop
+    if threading.current_thread() is not threading.main_thread():
+        return _noop
+    previous = signal.signal(signum, signal.SIG_DFL)
+
+    def _restore() -> None:
+        signal.signal(signum, previous)
+
+    return _restore
+
+
+def discard_stdout() -> None:
+    """Point the stdout descriptor at :data:`os.devnull`.
+
+    Why:
+        After the first ``EPIPE`` every further write and the interpreter's
+        final flush fail again, each printing "Exception ignored" noise.
+        Swapping the descriptor underneath ``sys.stdout`` makes those flushes
+        succeed silently without touching the Python-level stream object.
+    Side Effects:
+        Replaces the file descriptor behind ``sys.stdout``; buffered bytes are
+        discarded on the next flush. Best effort: does nothing when stdout has
+        no real descriptor.
+    """
+
+    with suppress(AttributeError, OSError, ValueError):
+        target = sys.stdout.fileno()
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        try:
+            os.dup2(devnull, target)
+        finally:
+            os.close(devnull)
@@ -0,0 +1,117 @@
+"""Run-scoped cancellation token set when a signal interrupts the command.
+
+Purpose:
+    A ``SignalSpec`` handler raises only in the main thread; worker threads
+    and processes keep running. A token they can poll tells them the run is
+    being torn down.
+Contents:
+    * :class:`CancellationToken` thread-safe, set-once cancellation flag.
+    * :func:`cancellation_scope` context manager activating a token for a run.
+    * :func:`current_cancellation_token` returning the active token.
+    * :func:`cancel_current` cancelling the active token (signal handlers).
+System Integration:
+    ``run_cli`` opens one :func:`cancellation_scope` per invocation. The
+    handlers from :func:`install_signal_handlers` and the event-loop signal
+    handlers of ``run_cli_async`` cancel it before raising, and the pools in
+    :mod:`lib_cli_exit_tools.adapters.pools` use it by default.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Generator
+from concurrent.futures import CancelledError
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+__all__ = [
+    "CancellationToken",
+    "cancel_current",
+    "cancellation_scope",
+    "current_cancellation_token",
+]
+
+
+class CancellationToken:
+    """Flag telling workers that the command is being cancelled.
+
+    Why:
+        Worker threads cannot be interrupted from outside; they have to
+        check whether to stop. The flag is set once and never cleared.
+    Examples:
+        >>> token = CancellationToken()
+        >>> token.cancelled
+        False
+        >>> token.cancel("SIGINT", signum=2)
+        >>> token.cancelled, token.reason, token.signum
+        (True, 'SIGINT', 2)
+    """
+
+    __slots__ = ("_event", "_reason", "_signum")
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._reason: str | None = None
+        self._signum: int | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        """``True`` once :meth:`cancel` has been called."""
+        return self._event.is_set()
+
+    @property
+    def reason(self) -> str | None:
+        """Reason passed to the first :meth:`cancel` call."""
+        return self._reason
+
+    @property
+    def signum(self) -> int | None:
+        """Signal that caused the cancellation, if any."""
+        return self._signum
+
+    def cancel(self, reason: str = "cancelled", *, signum: int | None = None) -> None:
+        """Set the token; only the first call records ``reason`` and ``signum``."""
+        if self._event.is_set():
+            return
+        self._reason = reason
+        self._signum = signum
+        self._event.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the token is cancelled or ``timeout`` passes; return :attr:`cancelled`."""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise :class:`concurrent.futures.CancelledError` once the token is cancelled."""
+        if self._event.is_set():
+            raise CancelledError(self._reason)
+
+
+_active: ContextVar[CancellationToken | None] = ContextVar("lib_cli_exit_tools_cancellation", default=None)
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken | None = None) -> Generator[CancellationToken]:
+    """Make ``token`` (or a new one) the current token for the enclosed block."""
+    active = token or CancellationToken()
+    reset = _active.set(active)
+    try:
+        yield active
+    finally:
+        _active.reset(reset)
+
+
+def current_cancellation_token() -> CancellationToken | None:
+    """Return the token of the ``run_cli`` call running in this context.
+
+    Commands read it here and pass it to worker threads explicitly, because
+    threads do not inherit context variables.
+    """
+    return _active.get()
+
+
+def cancel_current(reason: str, *, signum: int | None = None) -> None:
+    """Cancel the current token, if a :func:`cancellation_scope` is active."""
+    token = _active.get()
+    if token is not None:
+        token.cancel(reason, signum=signum)
@@ -0,0 +1,499 @@
+"""Run child processes with signal forwarding and bounded output capture.
+
+Purpose:
+    ``subprocess.run(check=True, capture_output=True)`` holds all child
+    output in memory, hides it until the child exits, and leaves the child
+    running when the parent is interrupted. A child killed by a signal also
+    reports a negative ``returncode``, which is not a valid exit status.
+Contents:
+    * :data:`DEFAULT_TAIL_BYTES` bytes of each stream kept for error reports.
+    * :data:`DEFAULT_KILL_TIMEOUT` seconds a child gets after the forwarded signal.
+    * :data:`DEFAULT_FAN_OUT_LIMIT` children :func:`fan_out` runs at once.
+    * :class:`ChildResult` outcome of a finished child.
+    * :class:`TailBuffer` keeping the last bytes of a stream.
+    * :class:`FanOutError` exception group of failed fan-out children.
+    * :func:`run_child` running a command to completion.
+    * :func:`fan_out` / :func:`fan_out_async` running many commands on one
+      event loop with a concurrency limit.
+System Integration:
+    When a ``SignalSpec`` handler interrupts :func:`run_child`, the signal
+    recorded on the run's :class:`CancellationToken` is forwarded to the
+    child's process group before the exception propagates to ``run_cli``.
+    Failures raise :class:`subprocess.CalledProcessError` carrying the output
+    tails, which :func:`print_exception_message` already prints and
+    :func:`get_system_exit_code` maps to ``128 + N`` for signal deaths.
+    :func:`fan_out` collects them in a :class:`FanOutError`, whose exit code
+    is that of its first failure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import signal
+import subprocess  # nosec B404 - running commands is the purpose of this module
+import sys
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import IO, Any, Protocol
+
+from ..core.exit_codes import exit_code_from_returncode
+from .cancellation import current_cancellation_token
+from .event_loop import run_awaitable
+
+__all__ = [
+    "DEFAULT_FAN_OUT_LIMIT",
+    "DEFAULT_KILL_TIMEOUT",
+    "DEFAULT_TAIL_BYTES",
+    "ChildResult",
+    "FanOutError",
+    "TailBuffer",
+    "fan_out",
+    "fan_out_async",
+    "run_child",
+]
+
+#: Bytes of stdout and of stderr kept for error reports.
+DEFAULT_TAIL_BYTES = 64 * 1024
+
+#: Seconds a child may take to exit after the forwarded signal before it is killed.
+DEFAULT_KILL_TIMEOUT = 5.0
+
+#: Children :func:`fan_out` runs at the same time unless told otherwise.
+DEFAULT_FAN_OUT_LIMIT = 16
+
+#: Largest chunk read from a child pipe at once; also the longest line
+#: :func:`fan_out` holds back while waiting for its newline.
+_CHUNK = 64 * 1024
+
+#: ``Popen`` keywords placing the child in a new process group.
+_NEW_SESSION = os.name != "nt"
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0) if os.name == "nt" else 0
+
+_INHERIT: Any = object()
+
+
+@dataclass(frozen=True, slots=True)
+class ChildResult:
+    """Outcome of a child run by :func:`run_child`.
+
+    Fields:
+        args: The command that ran.
+        returncode: ``Popen.returncode``; negative when killed by a signal.
+        stdout_tail: Last bytes of the child's stdout.
+        stderr_tail: Last bytes of the child's stderr.
+    """
+
+    args: tuple[str, ...]
+    returncode: int
+    stdout_tail: bytes
+    stderr_tail: bytes
+
+    @property
+    def exit_code(self) -> int:
+        """Shell-style exit status (``128 + N`` for a death by signal ``N``)."""
+        return exit_code_from_returncode(self.returncode)
+
+
+if sys.version_info >= (3, 11):
+
+    class FanOutError(ExceptionGroup[Exception]):  # noqa: F821 - builtin since Python 3.11
+        """Failures of the children started by one :func:`fan_out` call.
+
+        Holds one :class:`subprocess.CalledProcessError` (or :class:`OSError`
+        for a command that could not start) per failed child, in command
+        order. :func:`get_system_exit_code` resolves it to the exit code of
+        the first one.
+        """
+
+else:  # pragma: no cover - Python 3.10 has no ExceptionGroup
+
+    class FanOutError(Exception):
+        """Failures of the children started by one :func:`fan_out` call."""
+
+        def __init__(self, message: str, exceptions: Sequence[Exception]) -> None:
+            super().__init__(message, tuple(exceptions))
+            self.message = message
+            self.exceptions = tuple(exceptions)
+
+        def __str__(self) -> str:
+            return f"{self.message} ({len(self.exceptions)} sub-exceptions)"
+
+
+class TailBuffer:
+    """Keep the last ``limit`` bytes appended to it.
+
+    Examples:
+        >>> tail = TailBuffer(4)
+        >>> tail.append(b"hello ")
+        >>> tail.append(b"world")
+        >>> tail.value()
+        b'orld'
+    """
+
+    __slots__ = ("_buffer", "_limit")
+
+    def __init__(self, limit: int) -> None:
+        self._buffer = bytearray()
+        self._limit = max(0, limit)
+
+    def append(self, chunk: bytes) -> None:
+        """Add ``chunk`` and drop whatever no longer fits."""
+        self._buffer += chunk
+        excess = len(self._buffer) - self._limit
+        if excess > 0:
+            del self._buffer[:excess]
+
+    def value(self) -> bytes:
+        """Return the bytes currently kept."""
+        return bytes(self._buffer)
+
+
+class _Signalable(Protocol):
+    """Process handle shared by :class:`subprocess.Popen` and asyncio processes."""
+
+    @property
+    def pid(self) -> int: ...
+
+    def send_signal(self, sig: int, /) -> None: ...
+
+    def kill(self) -> None: ...
+
+
+def run_child(
+    args: Sequence[str],
+    *,
+    check: bool = True,
+    cwd: str | os.PathLike[str] | None = None,
+    env: Mapping[str, str] | None = None,
+    stdout: IO[Any] | None = _INHERIT,
+    stderr: IO[Any] | None = _INHERIT,
+    tail_bytes: int = DEFAULT_TAIL_BYTES,
+    kill_timeout: float = DEFAULT_KILL_TIMEOUT,
+) -> ChildResult:
+    """Run ``args`` to completion, streaming its output as it arrives.
+
+    Parameters:
+        args: Command and arguments; no shell is involved.
+        check: Raise :class:`subprocess.CalledProcessError` on a non-zero
+            return code.
+        cwd: Working directory of the child.
+        env: Environment of the child; defaults to the parent's.
+        stdout: Stream receiving the child's stdout; defaults to
+            :data:`sys.stdout` at call time, ``None`` discards it.
+        stderr: Stream receiving the child's stderr; defaults to
+            :data:`sys.stderr` at call time, ``None`` discards it.
+        tail_bytes: Bytes of each stream kept for :class:`ChildResult` and
+            the error, however much the child writes.
+        kill_timeout: Seconds the child gets to exit after a forwarded
+            signal before its process group is killed.
+    Returns:
+        :class:`ChildResult` of the finished child.
+    Raises:
+        subprocess.CalledProcessError: With ``check`` and a non-zero return
+            code; ``output`` and ``stderr`` hold the tails.
+        BaseException: Whatever interrupted the wait (``SigIntInterrupt``,
+            ``KeyboardInterrupt``, …), after the child has been stopped.
+    Side Effects:
+        Starts the child in its own process group (a new session on POSIX,
+        ``CREATE_NEW_PROCESS_GROUP`` on Windows), so a terminal ``Ctrl+C``
+        reaches it only through the forwarding, exactly once.
+    """
+    command = tuple(args)
+    process = subprocess.Popen(  # nosec B603 - no shell, arguments passed as a list
+        command,
+        cwd=cwd,
+        env=None if env is None else dict(env),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=_NEW_SESSION,
+        creationflags=_CREATION_FLAGS,
+    )
+    out_tail, err_tail = TailBuffer(tail_bytes), TailBuffer(tail_bytes)
+    readers = [
+        _start_reader(process.stdout, sys.stdout if stdout is _INHERIT else stdout, out_tail),
+        _start_reader(process.stderr, sys.stderr if stderr is _INHERIT else stderr, err_tail),
+    ]
+    try:
+        returncode = process.wait()
+    except BaseException as exc:
+        _stop_child(process, _forwarded_signal(exc), kill_timeout)
+        _join(readers, kill_timeout)
+        raise
+    _join(readers, None)
+    result = ChildResult(command, returncode, out_tail.value(), err_tail.value())
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, list(command), output=result.stdout_tail, stderr=result.stderr_tail)
+    return result
+
+
+def _start_reader(pipe: IO[bytes] | None, sink: IO[Any] | None, tail: TailBuffer) -> threading.Thread:
+    """Start a daemon thread copying ``pipe`` to ``sink`` and ``tail``."""
+    thread = threading.Thread(target=_pump, args=(pipe, sink, tail), name="child-output", daemon=True)
+    thread.start()
+    return thread
+
+
+def _join(readers: list[threading.Thread], timeout: float | None) -> None:
+    """Wait for the readers; a bounded wait leaves pipes held by orphans behind."""
+    for reader in readers:
+        reader.join(timeout)
+
+
+def _pump(pipe: IO[bytes] | None, sink: IO[Any] | None, tail: TailBuffer) -> None:
+    """Copy chunks until end of file; a failing ``sink`` is dropped, not the child."""
+    if pipe is None:
+        return
+    with pipe:
+        fd = pipe.fileno()
+        for chunk in iter(lambda: os.read(fd, _CHUNK), b""):
+            tail.append(chunk)
+            if sink is not None and not _write(sink, chunk):
+                sink = None
+
+
+def _write(sink: IO[Any], chunk: bytes) -> bool:
+    """Write ``chunk`` to a binary or text stream; return ``False`` once it fails."""
+    try:
+        binary = getattr(sink, "buffer", None)
+        if binary is not None:
+            sink.flush()
+            binary.write(chunk)
+            binary.flush()
+        elif isinstance(sink, io.TextIOBase):
+            sink.write(chunk.decode(sink.encoding or "utf-8", errors="replace"))
+            sink.flush()
+        else:
+            sink.write(chunk)
+            sink.flush()
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _forwarded_signal(exc: BaseException) -> int:
+    """Pick the signal to forward for the exception that interrupted the wait."""
+    token = current_cancellation_token()
+    if token is not None and token.signum is not None:
+        return token.signum
+    if isinstance(exc, KeyboardInterrupt):
+        return signal.SIGINT
+    return signal.SIGTERM
+
+
+def _stop_child(process: subprocess.Popen[bytes], signum: int, kill_timeout: float) -> None:
+    """Forward ``signum`` to the child's group; kill it after ``kill_timeout``."""
+    if process.poll() is not None:
+        return
+    _signal_group(process, signum)
+    try:
+        process.wait(kill_timeout)
+    except subprocess.TimeoutExpired:
+        _signal_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+        with suppress(subprocess.TimeoutExpired):
+            process.wait(kill_timeout)
+
+
+def _signal_group(process: _Signalable, signum: int) -> None:
+    """Send ``signum`` to the process group led by ``process``."""
+    with suppress(OSError):
+        if os.name == "nt":
+            if signum in (signal.SIGINT, getattr(signal, "SIGBREAK", None)):
+                process.send_signal(getattr(signal, "CTRL_BREAK_EVENT", signal.SIGTERM))
+            else:
+                process.kill()
+        else:
+            os.killpg(process.pid, signum)
+
+
+def fan_out(
+    commands: Iterable[Sequence[str]],
+    *,
+    limit: int = DEFAULT_FAN_OUT_LIMIT,
+    names: Sequence[str] | None = None,
+    check: bool = True,
+    cwd: str | os.PathLike[str] | None = None,
+    env: Mapping[str, str] | None = None,
+    stdout: IO[Any] | None = _INHERIT,
+    stderr: IO[Any] | None = _INHERIT,
+    tail_bytes: int = DEFAULT_TAIL_BYTES,
+    kill_timeout: float = DEFAULT_KILL_TIMEOUT,
+) -> list[ChildResult]:
+    """Run ``commands`` with at most ``limit`` children alive at a time.
+
+    Why:
+        A thread per child (plus one per pipe) runs into descriptor and
+        thread limits with hundreds of commands. Here one event loop reads
+        every pipe, and only ``limit`` children (three descriptors each)
+        exist at once.
+    Parameters:
+        commands: Commands to run; each is an argument list, no shell.
+        limit: Maximum number of children running at the same time.
+        names: Line prefix label per command; defaults to its position.
+        check: Raise :class:`FanOutError` when any child fails.
+        cwd: Working directory of every child.
+        env: Environment of every child; defaults to the parent's.
+        stdout: Stream receiving prefixed stdout lines; defaults to
+            :data:`sys.stdout` at call time, ``None`` discards them.
+        stderr: Stream receiving prefixed stderr lines; defaults to
+            :data:`sys.stderr` at call time, ``None`` discards them.
+        tail_bytes: Bytes of each stream kept per child.
+        kill_timeout: Seconds children get to exit after a forwarded
+            signal before their process groups are killed.
+    Returns:
+        One :class:`ChildResult` per command, in command order.
+    Raises:
+        FanOutError: With ``check``, after every child has finished, when a
+            child returned non-zero or could not be started (the latter
+            also without ``check``).
+    Side Effects:
+        Runs the children on a new event loop via :func:`run_awaitable`, so
+        inside ``run_cli_async`` it uses the session's loop factory. Each
+        line is written as ``[name] line``; lines of different children
+        never interleave within a line.
+    """
+    return run_awaitable(
+        fan_out_async(
+            commands,
+            limit=limit,
+            names=names,
+            check=check,
+            cwd=cwd,
+            env=env,
+            stdout=stdout,
+            stderr=stderr,
+            tail_bytes=tail_bytes,
+            kill_timeout=kill_timeout,
+        )
+    )
+
+
+async def fan_out_async(
+    commands: Iterable[Sequence[str]],
+    *,
+    limit: int = DEFAULT_FAN_OUT_LIMIT,
+    names: Sequence[str] | None = None,
+    check: bool = True,
+    cwd: str | os.PathLike[str] | None = None,
+    env: Mapping[str, str] | None = None,
+    stdout: IO[Any] | None = _INHERIT,
+    stderr: IO[Any] | None = _INHERIT,
+    tail_bytes: int = DEFAULT_TAIL_BYTES,
+    kill_timeout: float = DEFAULT_KILL_TIMEOUT,
+) -> list[ChildResult]:
+    """Coroutine version of :func:`fan_out` for ``async def`` commands.
+
+    Cancelling it forwards the run's signal (``SIGTERM`` when none was
+    recorded) to every running child and kills them after ``kill_timeout``.
+    """
+    argvs = [tuple(command) for command in commands]
+    labels = list(names) if names is not None else [str(index) for index in range(len(argvs))]
+    if len(labels) != len(argvs):
+        raise ValueError(f"got {len(labels)} names for {len(argvs)} commands")
+    spawn = _Spawn(
+        asyncio.Semaphore(max(1, limit)),
+        cwd,
+        None if env is None else dict(env),
+        sys.stdout if stdout is _INHERIT else stdout,
+        sys.stderr if stderr is _INHERIT else stderr,
+        tail_bytes,
+        kill_timeout,
+    )
+    outcomes = await asyncio.gather(*(_run_prefixed(argv, label, spawn) for argv, label in zip(argvs, labels)))
+    failures = [_as_failure(outcome) for outcome in outcomes if _failed(outcome, check)]
+    if failures:
+        raise FanOutError(f"{len(failures)} of {len(argvs)} commands failed", failures)
+    return [outcome for outcome in outcomes if isinstance(outcome, ChildResult)]
+
+
+@dataclass(frozen=True, slots=True)
+class _Spawn:
+    """Settings shared by the children of one :func:`fan_out_async` call."""
+
+    limiter: asyncio.Semaphore
+    cwd: str | os.PathLike[str] | None
+    env: dict[str, str] | None
+    stdout: IO[Any] | None
+    stderr: IO[Any] | None
+    tail_bytes: int
+    kill_timeout: float
+
+
+async def _run_prefixed(argv: tuple[str, ...], label: str, spawn: _Spawn) -> ChildResult | OSError:
+    """Run one fan-out child once a slot is free; a start failure is returned."""
+    async with spawn.limiter:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                cwd=spawn.cwd,
+                env=spawn.env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=_NEW_SESSION,
+                creationflags=_CREATION_FLAGS,
+            )
+        except OSError as exc:
+            return exc
+        prefix = f"[{label}] ".encode()
+        out_tail, err_tail = TailBuffer(spawn.tail_bytes), TailBuffer(spawn.tail_bytes)
+        try:
+            await asyncio.gather(
+                _pump_lines(process.stdout, prefix, spawn.stdout, out_tail),
+                _pump_lines(process.stderr, prefix, spawn.stderr, err_tail),
+            )
+            returncode = await process.wait()
+        except BaseException as exc:
+            await _stop_async_child(process, _forwarded_signal(exc), spawn.kill_timeout)
+            raise
+        return ChildResult(argv, returncode, out_tail.value(), err_tail.value())
+
+
+async def _pump_lines(
+    reader: asyncio.StreamReader | None,
+    prefix: bytes,
+    sink: IO[Any] | None,
+    tail: TailBuffer,
+) -> None:
+    """Copy ``reader`` to ``sink`` line by line with ``prefix``, and to ``tail``."""
+    if reader is None:
+        return
+    pending = b""
+    while chunk := await reader.read(_CHUNK):
+        tail.append(chunk)
+        *lines, pending = (pending + chunk).split(b"\n")
+        if len(pending) >= _CHUNK:
+            lines.append(pending)
+            pending = b""
+        if lines and sink is not None and not _write(sink, b"".join(prefix + line + b"\n" for line in lines)):
+            sink = None
+    if pending and sink is not None:
+        _write(sink, prefix + pending + b"\n")
+
+
+async def _stop_async_child(process: asyncio.subprocess.Process, signum: int, kill_timeout: float) -> None:
+    """Forward ``signum`` to a fan-out child's group; kill it after ``kill_timeout``."""
+    if process.returncode is not None:
+        return
+    _signal_group(process, signum)
+    try:
+        await asyncio.wait_for(process.wait(), kill_timeout)
+    except asyncio.TimeoutError:
+        _signal_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(process.wait(), kill_timeout)
+
+
+def _failed(outcome: ChildResult | OSError, check: bool) -> bool:
+    """Return ``True`` for a child that could not start, or returned non-zero under ``check``."""
+    return isinstance(outcome, OSError) or (check and outcome.returncode != 0)
+
+
+def _as_failure(outcome: ChildResult | OSError) -> Exception:
+    """Turn a failed outcome into the exception :class:`FanOutError` carries."""
+    if isinstance(outcome, OSError):
+        return outcome
+    return subprocess.CalledProcessError(outcome.returncode, list(outcome.args), output=outcome.stdout_tail, stderr=outcome.stderr_tail)
@@ -0,0 +1,214 @@
+"""Event loop for Click commands whose callbacks are coroutines.
+
+Purpose:
+    Run ``async def`` commands without ``asyncio.run`` wrappers, and deliver
+    signals to them as task cancellation instead of exceptions raised at an
+    arbitrary bytecode inside the loop, which leaves transports half-closed.
+Contents:
+    * :data:`LoopFactory` callable type creating the event loop.
+    * :data:`DEFAULT_DRAIN_TIMEOUT` seconds granted to leftover tasks.
+    * :func:`event_loop_session` context manager configuring loop runs.
+    * :func:`run_awaitable` running a command's awaitable result.
+System Integration:
+    ``run_cli`` passes the return value of ``cli.main`` to
+    :func:`run_awaitable`; ``run_cli_async`` wraps ``run_cli`` in
+    :func:`event_loop_session` with its loop factory, drain timeout, and
+    signal specs.
+
+Signals:
+    Inside a session each :class:`SignalSpec` is registered with
+    ``loop.add_signal_handler``. The first signal cancels the main task and
+    gives it ``drain_timeout`` seconds to unwind; the run then ends with the
+    spec's exception, so the exit code still comes from the spec. Repeats
+    follow the spec's grace window and escalation count. Where the
+    loop cannot install handlers (Windows, worker threads) the synchronous
+    handlers stay in charge. Outside a session awaitables run on a fresh
+    default loop without loop handlers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import signal
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Sequence
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from .runtime import note
+from .signals import SignalSpec, record_signal_delivery
+
+__all__ = [
+    "DEFAULT_DRAIN_TIMEOUT",
+    "LoopFactory",
+    "event_loop_session",
+    "run_awaitable",
+]
+
+#: Callable returning a new, unstarted event loop (e.g. ``uvloop.new_event_loop``).
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+#: Seconds tasks may take to unwind after cancellation before they are abandoned.
+DEFAULT_DRAIN_TIMEOUT = 5.0
+
+_T = TypeVar("_T")
+
+
+class _LoopSession:
+    """Settings of one :func:`event_loop_session` block."""
+
+    __slots__ = ("drain_timeout", "loop_factory", "signal_specs")
+
+    def __init__(
+        self,
+        loop_factory: LoopFactory | None = None,
+        drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+        signal_specs: Sequence[SignalSpec] = (),
+    ) -> None:
+        self.loop_factory = loop_factory
+        self.drain_timeout = drain_timeout
+        self.signal_specs = signal_specs
+
+
+class _Interrupt:
+    """First signal received while the main task runs."""
+
+    __slots__ = ("spec",)
+
+    def __init__(self) -> None:
+        self.spec: SignalSpec | None = None
+
+
+_active: ContextVar[_LoopSession | None] = ContextVar("lib_cli_exit_tools_event_loop", default=None)
+
+
+@contextmanager
+def event_loop_session(
+    *,
+    loop_factory: LoopFactory | None = None,
+    drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+    signal_specs: Sequence[SignalSpec] = (),
+) -> Generator[None]:
+    """Configure how :func:`run_awaitable` runs awaitables inside the block.
+
+    Parameters:
+        loop_factory: Creates the event loop; defaults to
+            :func:`asyncio.new_event_loop`.
+        drain_timeout: Seconds cancelled tasks may take to unwind, both the
+            main task after a signal and tasks still pending once it ends.
+        signal_specs: Signals to deliver as cancellation of the main task;
+            empty leaves signal handling to the synchronous handlers.
+    """
+    token = _active.set(_LoopSession(loop_factory, drain_timeout, signal_specs))
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def run_awaitable(result: _T | Awaitable[_T]) -> _T:
+    """Run ``result`` to completion on a new event loop when it is awaitable.
+
+    Returns:
+        The awaited value, or ``result`` itself when it is not awaitable.
+    Raises:
+        The exception class of the :class:`SignalSpec` whose signal cancelled
+        the main task; otherwise whatever the awaitable raises.
+    Side Effects:
+        Creates, sets as current, and closes an event loop; temporarily
+        replaces the handlers of the session's signals.
+    """
+    if not inspect.isawaitable(result):
+        return result
+    session = _active.get() or _LoopSession()
+    return _run_on_new_loop(_as_coroutine(result), session)
+
+
+async def _as_coroutine(awaitable: Awaitable[_T]) -> _T:
+    """Wrap any awaitable so it can become a task."""
+    return await awaitable
+
+
+def _run_on_new_loop(coroutine: Coroutine[Any, Any, _T], session: _LoopSession) -> _T:
+    """Run ``coroutine`` as the main task of a fresh loop, then drain and close it."""
+    loop = (session.loop_factory or asyncio.new_event_loop)()
+    interrupt = _Interrupt()
+    try:
+        asyncio.set_event_loop(loop)
+        main = loop.create_task(coroutine)
+
+        def _on_signal(spec: SignalSpec) -> None:
+            _cancel_main(loop, main, spec, interrupt, session.drain_timeout)
+
+        with _loop_signal_handlers(loop, session.signal_specs, _on_signal):
+            try:
+                return loop.run_until_complete(main)
+            except (asyncio.CancelledError, RuntimeError):
+                if interrupt.spec is None or (main.done() and not main.cancelled()):
+                    raise
+                raise interrupt.spec.exception() from None
+    finally:
+        try:
+            _drain(loop, session.drain_timeout)
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+def _cancel_main(
+    loop: asyncio.AbstractEventLoop,
+    main: asyncio.Task[Any],
+    spec: SignalSpec,
+    interrupt: _Interrupt,
+    drain_timeout: float,
+) -> None:
+    """Cancel the main task on the first signal and bound its unwinding."""
+    if record_signal_delivery(spec) != "raise" or interrupt.spec is not None:
+        return
+    interrupt.spec = spec
+    main.cancel()
+    loop.call_later(drain_timeout, _stop_if_running, loop, main)
+
+
+def _stop_if_running(loop: asyncio.AbstractEventLoop, main: asyncio.Task[Any]) -> None:
+    """Stop the loop when the cancelled main task overran the drain timeout."""
+    if not main.done():
+        loop.stop()
+
+
+@contextmanager
+def _loop_signal_handlers(
+    loop: asyncio.AbstractEventLoop,
+    specs: Sequence[SignalSpec],
+    on_signal: Callable[[SignalSpec], None],
+) -> Generator[None]:
+    """Route ``specs`` to ``on_signal`` through the loop; restore the old handlers."""
+    installed: list[tuple[int, Any]] = []
+    for spec in specs:
+        try:
+            previous = signal.getsignal(spec.signum)
+            loop.add_signal_handler(spec.signum, on_signal, spec)
+        except (NotImplementedError, RuntimeError, ValueError, OSError):
+            continue
+        installed.append((spec.signum, previous))
+    try:
+        yield
+    finally:
+        for signum, previous in reversed(installed):
+            with suppress(NotImplementedError, RuntimeError, ValueError, OSError, TypeError):
+                loop.remove_signal_handler(signum)
+                signal.signal(signum, previous)
+
+
+def _drain(loop: asyncio.AbstractEventLoop, drain_timeout: float) -> None:
+    """Cancel leftover tasks, wait up to ``drain_timeout``, and shut generators down."""
+    pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        _, abandoned = loop.run_until_complete(asyncio.wait(pending, timeout=drain_timeout))
+        if abandoned:
+            note(f"event loop: abandoned {len(abandoned)} task(s) still running after {drain_timeout:g}s")
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.run_until_complete(loop.shutdown_default_executor())
@@ -0,0 +1,183 @@
+"""NDJSON lifecycle events written to an inherited file descriptor.
+
+Purpose:
+    Let orchestrators observe every CLI run (start, exit-code resolution,
+    signals, exit) without scraping stderr.
+Contents:
+    * :data:`EVENT_FD_ENV` naming the environment variable that selects the
+      descriptor (for example ``LIB_CLI_EXIT_TOOLS_EVENT_FD=3``).
+    * :class:`EventStream` writing one compact JSON object per line.
+    * :func:`event_stream_from_env` resolving the descriptor from the
+      environment.
+    * :func:`emit_event` recording into the stream of the active run, if any.
+System Integration:
+    :func:`lib_cli_exit_tools.run_cli` activates a stream per invocation via a
+    :class:`~contextvars.ContextVar`; the exit-code resolver chain and the
+    signal handlers installed by :func:`install_signal_handlers` call
+    :func:`emit_event` without needing the stream passed around.
+
+Line format:
+    Every event carries ``event`` (``start``, ``resolved``, ``signal``,
+    ``timeout``, ``retry``, ``thread_failure`` or ``exit``), ``ts`` (Unix time) and ``pid`` plus event-specific fields. Each
+    line is written with a single ``write`` of at most ``PIPE_BUF`` bytes, so
+    lines from many processes sharing one pipe never interleave. The
+    descriptor's blocking mode is left alone (the parent may share it); a
+    zero-timeout poll before each write drops events on a full pipe instead
+    of stalling the CLI.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import select
+import time
+from collections.abc import Mapping
+from contextvars import ContextVar, Token
+from typing import cast
+
+__all__ = [
+    "EVENT_FD_ENV",
+    "EventStream",
+    "activate_event_stream",
+    "deactivate_event_stream",
+    "emit_event",
+    "event_stream_from_env",
+]
+
+#: Environment variable holding the descriptor number events are written to.
+EVENT_FD_ENV = "LIB_CLI_EXIT_TOOLS_EVENT_FD"
+
+#: Largest line written in one atomic ``write``; POSIX guarantees 512.
+_MAX_LINE = getattr(select, "PIPE_BUF", 512)
+#: Longest string field value kept before truncation.
+_MAX_TEXT = 256
+#: Most list items (for example ``argv`` entries) kept before truncation.
+_MAX_ITEMS = 16
+
+
+class EventStream:
+    """Write compact NDJSON lifecycle events to a file descriptor.
+
+    Why:
+        A single ``os.write`` per line of at most ``PIPE_BUF`` bytes is atomic
+        on pipes, which is what lets many concurrent CLIs share one reader.
+    Parameters:
+        fd: Descriptor inherited from the parent. The stream never changes
+            its blocking mode and never closes it.
+    Attributes:
+        dropped: Number of events discarded because the descriptor was full,
+            closed, or the line could not be shortened below ``PIPE_BUF``.
+    """
+
+    __slots__ = ("_fd", "dropped")
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+        self.dropped = 0
+
+    @property
+    def fd(self) -> int:
+        """Descriptor events are written to."""
+        return self._fd
+
+    def emit(self, event: str, **fields: object) -> None:
+        """Write one event line; never blocks and never raises."""
+        line = _encode({"event": event, "ts": round(time.time(), 6), "pid": os.getpid(), **fields})
+        if line is None or not _writable(self._fd):
+            self.dropped += 1
+            return
+        try:
+            os.write(self._fd, line)
+        except OSError:
+            self.dropped += 1
+
+
+def _writable(fd: int) -> bool:
+    """Return whether ``fd`` accepts a ``PIPE_BUF`` write without blocking.
+
+    Uses :func:`select.poll` where available (no ``FD_SETSIZE`` limit). Where
+    ``select`` rejects the descriptor (Windows pipes) the write is attempted.
+    """
+    if hasattr(select, "poll"):
+        poller = select.poll()
+        poller.register(fd, select.POLLOUT)
+        return any(mask == select.POLLOUT for _, mask in poller.poll(0))
+    try:
+        _, ready, _ = select.select([], [fd], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(ready)
+
+
+def _encode(payload: dict[str, object]) -> bytes | None:
+    """Serialise ``payload`` to one line that fits into ``PIPE_BUF``.
+
+    Long strings and lists are shortened first; if that is not enough only
+    scalar fields survive and ``truncated`` is set.
+    """
+    line = _dump(payload)
+    if len(line) <= _MAX_LINE:
+        return line
+    line = _dump({key: _shorten(value) for key, value in payload.items()})
+    if len(line) <= _MAX_LINE:
+        return line
+    scalars = {key: value for key, value in payload.items() if isinstance(value, int | float | bool) or value is None}
+    line = _dump({"event": payload["event"], **scalars, "truncated": True})
+    return line if len(line) <= _MAX_LINE else None
+
+
+def _dump(payload: dict[str, object]) -> bytes:
+    """Return ``payload`` as compact, newline-terminated UTF-8 JSON."""
+    return (json.dumps(payload, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+def _shorten(value: object) -> object:
+    """Truncate long strings and string lists so a line stays atomic."""
+    if isinstance(value, str) and len(value) > _MAX_TEXT:
+        return value[: _MAX_TEXT - 3] + "..."
+    if isinstance(value, list):
+        return [_shorten(item) for item in cast("list[object]", value)[:_MAX_ITEMS]]
+    return value
+
+
+def event_stream_from_env(environ: Mapping[str, str] | None = None) -> EventStream | None:
+    """Return a stream for the descriptor named by :data:`EVENT_FD_ENV`.
+
+    Parameters:
+        environ: Mapping to read instead of :data:`os.environ` (tests).
+    Returns:
+        ``None`` when the variable is unset, not an integer, or names a
+        descriptor that is not open, so a misconfigured orchestrator never
+        breaks the CLI itself.
+    """
+
+    raw = (os.environ if environ is None else environ).get(EVENT_FD_ENV, "").strip()
+    if not raw:
+        return None
+    try:
+        fd = int(raw)
+        os.fstat(fd)
+    except (ValueError, OSError):
+        return None
+    return EventStream(fd)
+
+
+_active: ContextVar[EventStream | None] = ContextVar("lib_cli_exit_tools_event_stream", default=None)
+
+
+def activate_event_stream(stream: EventStream | None) -> Token[EventStream | None]:
+    """Make ``stream`` the target of :func:`emit_event` and return a reset token."""
+    return _active.set(stream)
+
+
+def deactivate_event_stream(token: Token[EventStream | None]) -> None:
+    """Restore the stream that was active before :func:`activate_event_stream`."""
+    _active.reset(token)
+
+
+def emit_event(event: str, **fields: object) -> None:
+    """Emit ``event`` on the active stream; a no-op outside instrumented runs."""
+    stream = _active.get()
+    if stream is not None:
+        stream.emit(event, **fields)
@@ -0,0 +1,113 @@
+"""Deadline-bounded flushing for standard streams attached to slow readers.
+
+Purpose:
+    Stop a stalled pipe reader from holding the process hostage at exit: a
+    plain ``flush`` blocks for as long as the reader refuses to drain.
+Contents:
+    * :func:`flush_within` flushing one stream, optionally bounded by a
+      monotonic deadline, and reporting how many bytes had to be dropped.
+System Integration:
+    :func:`lib_cli_exit_tools.flush_streams` and ``run_cli`` finalisation call
+    into this module when :attr:`config.flush_deadline` is set. Deadlines only
+    apply on POSIX descriptors; other streams fall back to a plain flush.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import suppress
+
+__all__ = ["flush_within"]
+
+
+def flush_within(stream: object, deadline_at: float | None) -> int:
+    """Flush ``stream``, giving up on a stalled reader at ``deadline_at``.
+
+    Why:
+        Switching the descriptor to non-blocking mode and waiting with
+        :func:`select.select` lets the flush make progress whenever the reader
+        drains, without ever blocking past the deadline.
+    What:
+        Without a deadline (or a real descriptor) this is a plain ``flush``.
+        Otherwise the flush is retried as the descriptor becomes writable.
+        When time runs out, the unwritten bytes are flushed into a scratch
+        file to count them and the descriptor is pointed at
+        :data:`os.devnull`, so neither later writes nor interpreter shutdown
+        block on the dead reader again.
+    Parameters:
+        stream: Object exposing ``flush`` and usually ``fileno``.
+        deadline_at: :func:`time.monotonic` timestamp after which to give up,
+            or ``None`` to wait indefinitely.
+    Returns:
+        Number of bytes dropped; ``0`` when everything was written.
+    Raises:
+        OSError: Propagated from ``flush`` for failures other than a full
+            pipe (for example ``BrokenPipeError``), so callers keep choosing
+            how to react.
+    """
+
+    flush = getattr(stream, "flush", None)
+    if not callable(flush):
+        return 0
+    fd = _descriptor_of(stream) if deadline_at is not None else None
+    if fd is None or deadline_at is None:
+        flush()
+        return 0
+    was_blocking = os.get_blocking(fd)
+    os.set_blocking(fd, False)
+    try:
+        if _drain(flush, fd, deadline_at):
+            return 0
+        return _divert_pending_output(flush, fd)
+    finally:
+        with suppress(OSError):
+            os.set_blocking(fd, was_blocking)
+
+
+def _descriptor_of(stream: object) -> int | None:
+    """Return the POSIX descriptor behind ``stream`` or ``None`` when unavailable."""
+    if os.name != "posix":
+        return None
+    fileno = getattr(stream, "fileno", None)
+    if not callable(fileno):
+        return None
+    with suppress(OSError, ValueError):
+        fd = fileno()
+        if isinstance(fd, int):
+            return fd
+    return None
+
+
+def _drain(flush: Callable[[], object], fd: int, deadline_at: float) -> bool:
+    """Retry ``flush`` until it succeeds (``True``) or the deadline passes (``False``)."""
+    while True:
+        try:
+            flush()
+            return True
+        except BlockingIOError:
+            pass
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            return False
+        _, writable, _ = select.select([], [fd], [], remaining)
+        if not writable:
+            return False
+
+
+def _divert_pending_output(flush: Callable[[], object], fd: int) -> int:
+    """Count and discard the bytes ``flush`` could not deliver to ``fd``."""
+    with tempfile.TemporaryFile() as sink:
+        os.dup2(sink.fileno(), fd)
+        with suppress(OSError, ValueError):
+            flush()
+        dropped = os.fstat(sink.fileno()).st_size
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, fd)
+    finally:
+        os.close(devnull)
+    return dropped
@@ -0,0 +1,130 @@
+"""Fork hooks that keep children of a CLI process quiet and lightweight.
+
+Purpose:
+    ``os.fork`` (directly or through multiprocessing's ``fork`` start method)
+    copies the raising handlers from :func:`install_signal_handlers`, the
+    shared :data:`config`, an active profiler or memory tracer, and unflushed
+    stdio buffers into every child. A ``SIGTERM`` broadcast to the process
+    group then makes each child print "Terminated (SIGTERM/SIGBREAK)." and
+    unwind a command it does not own, while still profiling itself.
+Contents:
+    * :func:`install_fork_hooks` registering the ``os.register_at_fork``
+      hooks once per process.
+    * :func:`remember_signal_handler` / :func:`forget_signal_handler`
+      recording which signals currently carry a raising handler.
+    * :func:`apply_fork_signal_policy` applying a :class:`ForkSignalPolicy`
+      to those signals.
+System Integration:
+    :func:`install_signal_handlers` installs the hooks and records its
+    handlers here. Before a fork the parent flushes ``sys.stdout`` and
+    ``sys.stderr`` so buffered output is not written twice. In the child the
+    hook applies :attr:`config.fork_signal_policy`, switches off the parent's
+    per-run reports (:func:`reset_run_reports`), and discards the active
+    profiler and memory tracer without writing their reports.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import sys
+import threading
+from contextlib import suppress
+from typing import Any
+
+from ..core.configuration import ForkSignalPolicy, config, reset_run_reports
+from .memory_trace import discard_memory_trace
+from .profiling import discard_profiling
+
+__all__ = [
+    "apply_fork_signal_policy",
+    "forget_signal_handler",
+    "install_fork_hooks",
+    "remember_signal_handler",
+]
+
+#: Raising handlers per signal, innermost last, each with the handler it replaced.
+_installed: dict[int, list[tuple[Any, Any]]] = {}
+_lock = threading.Lock()
+_hooks_installed = False
+
+
+def install_fork_hooks() -> None:
+    """Register the fork hooks with :func:`os.register_at_fork` once.
+
+    Side Effects:
+        Later forks of this process flush stdio first and give the child the
+        signal policy and configuration described in the module docstring.
+        A no-op where ``os.register_at_fork`` does not exist (Windows).
+    """
+    global _hooks_installed
+    with _lock:
+        if _hooks_installed or not hasattr(os, "register_at_fork"):
+            return
+        os.register_at_fork(before=_flush_stdio, after_in_child=_prepare_child)
+        _hooks_installed = True
+
+
+def remember_signal_handler(signum: int, handler: Any, previous: Any) -> None:
+    """Record that ``handler`` now handles ``signum`` in place of ``previous``."""
+    with _lock:
+        _installed.setdefault(signum, []).append((handler, previous))
+
+
+def forget_signal_handler(signum: int, handler: Any) -> None:
+    """Drop the record of ``handler`` once it has been uninstalled."""
+    with _lock:
+        entries = _installed.get(signum, [])
+        entries[:] = [entry for entry in entries if entry[0] is not handler]
+        if not entries:
+            _installed.pop(signum, None)
+
+
+def apply_fork_signal_policy(policy: ForkSignalPolicy) -> None:
+    """Replace the recorded raising handlers according to ``policy``.
+
+    Why:
+        Runs in every freshly forked child; public so custom fork helpers can
+        apply a different policy to a particular child.
+    Side Effects:
+        Unless ``policy`` is ``KEEP``: changes the process-wide handlers of
+        every recorded signal, detaches the signal wakeup descriptor so the
+        child's signals cannot wake the parent's event loop, and clears the
+        records.
+    """
+    if policy is ForkSignalPolicy.KEEP:
+        return
+    with _lock:
+        originals = {signum: entries[0][1] for signum, entries in _installed.items() if entries}
+        _installed.clear()
+    for signum, original in originals.items():
+        with suppress(OSError, RuntimeError, TypeError, ValueError):
+            signal.signal(signum, _replacement(policy, original))
+    with suppress(ValueError):
+        signal.set_wakeup_fd(-1)
+
+
+def _replacement(policy: ForkSignalPolicy, original: Any) -> Any:
+    """Return the handler ``policy`` installs in place of a raising handler."""
+    if policy is ForkSignalPolicy.IGNORE:
+        return signal.SIG_IGN
+    if policy is ForkSignalPolicy.PREVIOUS and original is not None:
+        return original
+    return signal.SIG_DFL
+
+
+def _flush_stdio() -> None:
+    """Flush ``sys.stdout`` and ``sys.stderr`` so the child starts with empty buffers."""
+    for stream in (sys.stdout, sys.stderr):
+        with suppress(Exception):
+            stream.flush()
+
+
+def _prepare_child() -> None:
+    """Give a freshly forked child its signal policy and a quiet configuration."""
+    global _lock
+    _lock = threading.Lock()  # another parent thread may have held it during the fork
+    apply_fork_signal_policy(config.fork_signal_policy)
+    reset_run_reports()
+    discard_profiling()
+    discard_memory_trace()
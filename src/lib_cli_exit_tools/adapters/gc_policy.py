@@ -0,0 +1,158 @@
+"""Garbage-collector tuning adapters for short-lived CLI invocations.
+
+Purpose:
+    Let CLIs that allocate heavily and then exit trade cyclic-GC work for a
+    little extra memory, and measure what the collector actually cost.
+Contents:
+    * :class:`GcPolicy` dataclass describing freeze/threshold/disable choices.
+    * :class:`GcStats` per-invocation collection counts and pause time.
+    * :func:`apply_gc_policy` applying a policy and returning a restorer that
+      reverts the settings and yields the collected statistics.
+System Integration:
+    :func:`lib_cli_exit_tools.run_cli` applies the policy right before the
+    command runs and restores it in ``_finalise_cli_run``, mirroring how
+    signal handlers are installed and restored.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TextIO
+
+from .runtime import note
+
+__all__ = ["GcPolicy", "GcStats", "apply_gc_policy"]
+
+_GENERATIONS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class GcPolicy:
+    """Describe how the cyclic garbage collector behaves during a command.
+
+    Fields:
+        freeze: Move every object alive before the command (the post-import
+            heap) into the permanent generation via :func:`gc.freeze`, so
+            collections during the run never rescan it.
+        thresholds: Replacement for :func:`gc.get_threshold` while the command
+            runs; larger values mean fewer, later collections.
+        disable: Turn automatic collection off entirely for the command's
+            duration. Explicit :func:`gc.collect` calls still work.
+        report: Print a one-line collection summary to stderr afterwards.
+        on_stats: Optional callback receiving the :class:`GcStats` for the
+            invocation, e.g. to forward to metrics.
+    """
+
+    freeze: bool = False
+    thresholds: tuple[int, int, int] | None = None
+    disable: bool = False
+    report: bool = False
+    on_stats: Callable[[GcStats], None] | None = None
+
+
+@dataclass(slots=True)
+class GcStats:
+    """Collector activity observed while a :class:`GcPolicy` was active.
+
+    Fields:
+        collections: Number of collections per generation (0, 1, 2).
+        collected: Unreachable objects freed across all collections.
+        pause_seconds: Total wall time spent inside the collector.
+    """
+
+    collections: list[int] = field(default_factory=lambda: [0] * _GENERATIONS)
+    collected: int = 0
+    pause_seconds: float = 0.0
+
+    def summary(self) -> str:
+        """Return a compact single-line description of the statistics.
+
+        Examples:
+            >>> GcStats(collections=[3, 1, 0], collected=42, pause_seconds=0.0025).summary()
+            'gc: collections gen0=3 gen1=1 gen2=0, collected=42, pause=2.50 ms'
+        """
+        counts = " ".join(f"gen{generation}={count}" for generation, count in enumerate(self.collections))
+        return f"gc: collections {counts}, collected={self.collected}, pause={self.pause_seconds * 1000:.2f} ms"
+
+
+class _PauseRecorder:
+    """``gc.callbacks`` entry accumulating collection counts and pause time."""
+
+    def __init__(self) -> None:
+        self.stats = GcStats()
+        self._started: float | None = None
+
+    def __call__(self, phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+            return
+        if self._started is not None:
+            self.stats.pause_seconds += time.perf_counter() - self._started
+            self._started = None
+        generation = info.get("generation", 0)
+        if 0 <= generation < _GENERATIONS:
+            self.stats.collections[generation] += 1
+        self.stats.collected += info.get("collected", 0)
+
+
+def apply_gc_policy(policy: GcPolicy, *, stream: TextIO | None = None) -> Callable[[], GcStats]:
+    """Apply ``policy`` and return a callable that restores prior GC settings.
+
+    Parameters:
+        policy: Tuning choices to apply for the command's duration.
+        stream: Destination for ``policy.report``; defaults to ``sys.stderr``.
+    Returns:
+        Restorer that reverts thresholds, enablement and freezing, reports the
+        statistics according to ``policy``, and returns them. When the host
+        had already frozen objects, the freeze is left in place: unfreezing
+        would also release the host's own permanent generation.
+    """
+
+    recorder = _PauseRecorder()
+    was_enabled = gc.isenabled()
+    previous_thresholds = gc.get_threshold()
+    was_frozen = gc.get_freeze_count() > 0
+    gc.callbacks.append(recorder)
+    if policy.freeze:
+        gc.freeze()
+    if policy.thresholds is not None:
+        gc.set_threshold(*policy.thresholds)
+    if policy.disable:
+        gc.disable()
+
+    def _restore() -> GcStats:
+        _remove_callback(recorder)
+        gc.set_threshold(*previous_thresholds)
+        if was_enabled:
+            gc.enable()
+        if policy.freeze and not was_frozen:
+            gc.unfreeze()
+        _report(policy, recorder.stats, stream)
+        return recorder.stats
+
+    return _restore
+
+
+def _remove_callback(recorder: _PauseRecorder) -> None:
+    """Detach ``recorder`` from :data:`gc.callbacks` if still registered."""
+    if recorder in gc.callbacks:
+        gc.callbacks.remove(recorder)
+
+
+def _report(policy: GcPolicy, stats: GcStats, stream: TextIO | None) -> None:
+    """Deliver ``stats`` to the configured callback and/or stderr.
+
+    A failing ``on_stats`` callback is noted on stderr instead of raising out
+    of run finalisation.
+    """
+    if policy.on_stats is not None:
+        try:
+            policy.on_stats(stats)
+        except Exception as exc:  # noqa: BLE001 - metrics must not fail the run
+            note(f"gc: on_stats callback failed: {exc!r}")
+    if policy.report:
+        print(stats.summary(), file=stream or sys.stderr)
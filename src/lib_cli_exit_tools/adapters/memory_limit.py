@@ -0,0 +1,181 @@
+"""Address-space ceiling and emergency memory reserve for a command run.
+
+Purpose:
+    Turn runaway allocations into a clean ``MemoryError`` with a meaningful
+    exit code instead of an OOM kill, and keep enough memory aside to report
+    it.
+Contents:
+    * :func:`parse_memory_size` reading sizes such as ``512M`` or ``2G``.
+    * :func:`memory_limited` context manager lowering the soft
+      ``RLIMIT_AS`` (``RLIMIT_DATA`` on macOS) for the enclosed block.
+    * :func:`start_memory_limit` applying the ceiling from inside a run.
+    * :class:`MemoryReserve` preallocated buffer released on ``MemoryError``.
+System Integration:
+    ``run_cli`` wraps command execution in :func:`memory_limited` with
+    :attr:`config.max_memory` (or its ``max_memory`` parameter) and passes it
+    a :class:`MemoryReserve` that is filled only once a ceiling is applied;
+    the bundled CLI's ``--max-memory`` option calls :func:`start_memory_limit`
+    from the group callback. The ceiling is lifted before the exception
+    handler runs.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Callable, Generator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+
+from .runtime import note
+
+__all__ = [
+    "DEFAULT_RESERVE_BYTES",
+    "MemoryReserve",
+    "memory_limited",
+    "parse_memory_size",
+    "start_memory_limit",
+]
+
+#: Bytes held back by :class:`MemoryReserve` unless told otherwise.
+DEFAULT_RESERVE_BYTES = 1 << 20
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*$", re.IGNORECASE)
+_SIZE_FACTORS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_memory_size(text: str) -> int:
+    """Return the byte count of ``text`` (binary units, case-insensitive).
+
+    Raises:
+        ValueError: When ``text`` is not a positive size.
+    Examples:
+        >>> parse_memory_size("512M"), parse_memory_size("1.5GiB"), parse_memory_size("4096")
+        (536870912, 1610612736, 4096)
+    """
+    match = _SIZE_PATTERN.match(text)
+    if match is None:
+        raise ValueError(f"invalid memory size {text!r}; expected e.g. 512M or 2G")
+    size = int(float(match.group(1)) * _SIZE_FACTORS[match.group(2).upper()])
+    if size <= 0:
+        raise ValueError(f"memory size must be positive, got {text!r}")
+    return size
+
+
+class MemoryReserve:
+    """Preallocated buffer freed when the process runs out of memory.
+
+    Why:
+        After a ``MemoryError`` the traceback still pins the failing frames
+        and their data, so rendering even a one-line summary can fail again
+        and replace the real error with a secondary crash. Releasing a
+        buffer allocated up front gives the error path room to work.
+    Parameters:
+        size: Bytes to hold back; ``0`` holds nothing.
+    """
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self, size: int = DEFAULT_RESERVE_BYTES) -> None:
+        self._buffer: bytearray | None = bytearray(size) if size > 0 else None
+
+    @property
+    def held(self) -> int:
+        """Bytes still held back."""
+        return 0 if self._buffer is None else len(self._buffer)
+
+    def hold(self, size: int = DEFAULT_RESERVE_BYTES) -> None:
+        """Allocate ``size`` bytes unless a buffer is already held."""
+        if self._buffer is None and size > 0:
+            self._buffer = bytearray(size)
+
+    def release(self) -> None:
+        """Free the buffer; later calls are no-ops."""
+        self._buffer = None
+
+
+class _MemoryLimit:
+    """Soft resource limit of one :func:`memory_limited` block."""
+
+    __slots__ = ("_reserve", "_restore")
+
+    def __init__(self, reserve: MemoryReserve | None) -> None:
+        self._reserve = reserve
+        self._restore: Callable[[], None] | None = None
+
+    def start(self, limit: int) -> None:
+        """Fill the reserve, then lower the soft limit to ``limit`` bytes, replacing an earlier ceiling."""
+        if self._reserve is not None:
+            self._reserve.hold()
+        self.finish()
+        self._restore = _apply_limit(limit)
+
+    def finish(self) -> None:
+        """Restore the soft limit that was in place before :meth:`start`."""
+        restore, self._restore = self._restore, None
+        if restore is not None:
+            restore()
+
+
+_active: ContextVar[_MemoryLimit | None] = ContextVar("lib_cli_exit_tools_memory_limit", default=None)
+
+
+@contextmanager
+def memory_limited(limit: int | None, *, reserve: MemoryReserve | None = None) -> Generator[None]:
+    """Cap the address space (data segment on macOS) of the enclosed block.
+
+    Parameters:
+        limit: Ceiling in bytes; ``None`` leaves the block unlimited unless
+            :func:`start_memory_limit` is called inside it. Values above the
+            hard limit are clamped to it.
+        reserve: Filled with :meth:`MemoryReserve.hold` when a ceiling is
+            applied, so runs without one do not pay for the buffer.
+    Side Effects:
+        Changes the process-wide soft limit and restores it on exit. Prints
+        a note and runs unlimited where :mod:`resource` is unavailable.
+    """
+    ceiling = _MemoryLimit(reserve)
+    token = _active.set(ceiling)
+    if limit is not None:
+        ceiling.start(limit)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+        ceiling.finish()
+
+
+def start_memory_limit(limit: int) -> bool:
+    """Apply ``limit`` to the enclosing :func:`memory_limited` block.
+
+    Returns:
+        ``False`` when called outside a :func:`memory_limited` block.
+    """
+    ceiling = _active.get()
+    if ceiling is None:
+        return False
+    ceiling.start(limit)
+    return True
+
+
+def _apply_limit(limit: int) -> Callable[[], None] | None:
+    """Set the soft memory limit and return a restorer, or ``None`` when unsupported."""
+    try:
+        import resource
+    except ImportError:
+        note("max-memory: not supported on this platform; running without a limit")
+        return None
+    which = resource.RLIMIT_DATA if sys.platform == "darwin" else resource.RLIMIT_AS
+    soft, hard = resource.getrlimit(which)
+    ceiling = limit if hard == resource.RLIM_INFINITY else min(limit, hard)
+    try:
+        resource.setrlimit(which, (ceiling, hard))
+    except (OSError, ValueError) as exc:
+        note(f"max-memory: could not set limit ({exc})")
+        return None
+
+    def _restore() -> None:
+        with suppress(OSError, ValueError):
+            resource.setrlimit(which, (soft, hard))
+
+    return _restore
@@ -0,0 +1,227 @@
+"""Allocation tracing with a top-sites report on exit or failure.
+
+Purpose:
+    Find what a CLI allocates before it gets OOM-killed on large inputs:
+    trace allocations with :mod:`tracemalloc` and report the busiest
+    allocation sites plus the peak traced memory.
+Contents:
+    * :func:`traced_memory` context manager tracing the enclosed block and
+      reporting when it exits, unless a report was already produced.
+    * :func:`start_memory_trace` switching tracing on from inside a run.
+    * :func:`report_memory_trace` reporting immediately (the failure path of
+      :func:`handle_cli_exception` calls it while the failing frames are
+      still alive).
+    * :func:`discard_memory_trace` stopping the trace without a report
+      (forked children).
+    * :func:`compare_snapshots` diffing two snapshot files from separate runs.
+System Integration:
+    ``run_cli`` wraps command execution and exception handling in
+    :func:`traced_memory` when :attr:`config.trace_memory` (or its
+    ``trace_memory`` parameter) is set; the bundled CLI's
+    ``--trace-memory`` options call :func:`start_memory_trace` from the group
+    callback. Reports are plain ``print`` calls on stderr, never Rich, so the
+    failure path stays cheap.
+"""
+
+from __future__ import annotations
+
+import linecache
+import tracemalloc
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .runtime import note
+
+__all__ = [
+    "compare_snapshots",
+    "discard_memory_trace",
+    "report_memory_trace",
+    "start_memory_trace",
+    "traced_memory",
+]
+
+_UNITS = ("B", "KiB", "MiB", "GiB")
+
+
+class _MemoryTrace:
+    """Tracing state of one :func:`traced_memory` block."""
+
+    __slots__ = ("_owns_tracing", "_reported", "_snapshot_path", "_top")
+
+    def __init__(self) -> None:
+        self._top: int | None = None
+        self._snapshot_path: str | None = None
+        self._owns_tracing = False
+        self._reported = False
+
+    def start(self, top: int, snapshot_path: str | None) -> None:
+        """Begin tracing, or update the report settings when already tracing.
+
+        A tracer someone else started is reused and left running.
+        """
+        self._top, self._snapshot_path = max(top, 0), snapshot_path
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    def report(self) -> None:
+        """Print the top allocation sites and peak once; later calls are no-ops."""
+        if self._top is None or self._reported or not tracemalloc.is_tracing():
+            return
+        self._reported = True
+        snapshot = _filtered(tracemalloc.take_snapshot())
+        current, peak = tracemalloc.get_traced_memory()
+        note(_format_report(snapshot, self._top, current, peak))
+        if self._snapshot_path is not None:
+            _dump_snapshot(snapshot, self._snapshot_path)
+
+    def discard(self) -> None:
+        """Stop a tracer started here and never report."""
+        self._reported = True
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def finish(self) -> None:
+        """Report if nothing was reported yet, then stop a tracer started here."""
+        self.report()
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+
+_active: ContextVar[_MemoryTrace | None] = ContextVar("lib_cli_exit_tools_memory_trace", default=None)
+
+
+@contextmanager
+def traced_memory(top: int | None, snapshot_path: str | None = None) -> Generator[None]:
+    """Trace allocations of the enclosed block and report them on exit.
+
+    Parameters:
+        top: Number of allocation sites to report; ``None`` leaves tracing
+            off unless :func:`start_memory_trace` is called inside the block.
+        snapshot_path: Optional file receiving the :class:`tracemalloc.Snapshot`
+            for :func:`compare_snapshots`.
+    Side Effects:
+        Starts and stops :mod:`tracemalloc` (an already running tracer is
+        left running) and prints the report to stderr.
+    """
+    trace = _MemoryTrace()
+    token = _active.set(trace)
+    if top is not None:
+        trace.start(top, snapshot_path)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+        trace.finish()
+
+
+def start_memory_trace(top: int, snapshot_path: str | None = None) -> bool:
+    """Start tracing the enclosing :func:`traced_memory` block from here on.
+
+    When the block is already tracing, only ``top`` and ``snapshot_path``
+    are replaced.
+
+    Returns:
+        ``False`` when called outside a :func:`traced_memory` block.
+    """
+    trace = _active.get()
+    if trace is None:
+        return False
+    trace.start(top, snapshot_path)
+    return True
+
+
+def report_memory_trace() -> None:
+    """Report the active trace now instead of when its block exits.
+
+    Why:
+        During exception handling the failing frames and their locals are
+        still referenced by the traceback, so the snapshot shows what was
+        live when the command failed rather than what survived unwinding.
+    """
+    trace = _active.get()
+    if trace is not None:
+        trace.report()
+
+
+def discard_memory_trace() -> None:
+    """Stop the active trace without ever reporting it (forked children)."""
+    trace = _active.get()
+    if trace is not None:
+        trace.discard()
+
+
+def compare_snapshots(old_path: str, new_path: str, limit: int = 10) -> str:
+    """Return the ``limit`` allocation sites that grew or shrank the most.
+
+    Parameters:
+        old_path: Snapshot written by an earlier run.
+        new_path: Snapshot written by a later run.
+        limit: Number of sites to list.
+    Raises:
+        OSError: When a snapshot file cannot be read.
+    """
+    old = tracemalloc.Snapshot.load(old_path)
+    new = tracemalloc.Snapshot.load(new_path)
+    differences = new.compare_to(old, "lineno")[:limit]
+    lines = [f"  {'size diff':>12}{'count diff':>12}  location"]
+    for stat in differences:
+        sign = "-" if stat.size_diff < 0 else "+"
+        lines.append(f"  {sign + _size(abs(stat.size_diff)):>12}{stat.count_diff:>+12}  {_location(stat.traceback)}")
+    return "\n".join(lines)
+
+
+def _filtered(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    """Drop allocations made by the import machinery and tracemalloc itself."""
+    return snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, linecache.__file__),
+        )
+    )
+
+
+def _format_report(snapshot: tracemalloc.Snapshot, top: int, current: int, peak: int) -> str:
+    """Render peak/current traced memory and the ``top`` allocation sites."""
+    lines = [f"memory: peak {_size(peak)}, current {_size(current)} (traced)"]
+    statistics: Sequence[tracemalloc.Statistic] = snapshot.statistics("lineno")[:top]
+    if statistics:
+        lines.append(f"  {'size':>10}{'count':>9}  location")
+    for stat in statistics:
+        lines.append(f"  {_size(stat.size):>10}{stat.count:>9}  {_location(stat.traceback)}")
+    return "\n".join(lines)
+
+
+def _location(traceback: tracemalloc.Traceback) -> str:
+    """Format the innermost frame of ``traceback`` as ``file:line``."""
+    frame = traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def _size(size: float) -> str:
+    """Format a byte count with a binary unit.
+
+    Examples:
+        >>> _size(512), _size(1536), _size(3 * 1024**3)
+        ('512 B', '1.5 KiB', '3.0 GiB')
+    """
+    for unit in _UNITS[:-1]:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} {_UNITS[-1]}"
+
+
+def _dump_snapshot(snapshot: tracemalloc.Snapshot, path: str) -> None:
+    """Write ``snapshot`` to ``path``, noting failures instead of raising."""
+    try:
+        snapshot.dump(path)
+    except OSError as exc:
+        note(f"memory: could not write snapshot {path}: {exc.strerror or exc}")
+        return
+    note(f"memory: wrote snapshot {path}")
@@ -0,0 +1,298 @@
+"""Worker pools that stop promptly when the command is cancelled.
+
+Purpose:
+    After ``SIGINT`` the main thread unwinds, but ``executor.shutdown(wait=True)``
+    in a ``finally`` block still waits for every queued and running task, so
+    the CLI can take minutes to exit. These pools drop queued work and bound
+    the wait for running work once the run's :class:`CancellationToken` is set.
+Contents:
+    * :data:`DEFAULT_JOIN_TIMEOUT` seconds granted to running work.
+    * :class:`CancellableThreadPool` thread pool with daemon workers.
+    * :class:`CancellableProcessPool` process pool forwarding the signal to
+      its workers' process groups and transporting their exceptions.
+System Integration:
+    Both pools default to :func:`current_cancellation_token`, which
+    ``run_cli`` cancels when a ``SignalSpec`` fires. Leaving a ``with`` block
+    with an exception cancels queued work as well.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import signal
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import suppress
+from multiprocessing.context import BaseContext
+from types import TracebackType
+from typing import Any, ParamSpec, TypeVar
+
+from ..core.exception_record import transport_exceptions
+from .cancellation import CancellationToken, current_cancellation_token
+from .runtime import note
+
+__all__ = [
+    "DEFAULT_JOIN_TIMEOUT",
+    "CancellableProcessPool",
+    "CancellableThreadPool",
+]
+
+#: Seconds running work may take to finish after cancellation before it is abandoned.
+DEFAULT_JOIN_TIMEOUT = 5.0
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+_WorkItem = tuple["Future[Any]", Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+def _resolve_token(token: CancellationToken | None) -> CancellationToken:
+    """Return ``token``, else the current run's token, else a private one."""
+    return token or current_cancellation_token() or CancellationToken()
+
+
+class CancellableThreadPool(Executor):
+    """Thread pool whose queued work is dropped once its token is cancelled.
+
+    Why:
+        Threads cannot be interrupted, so after cancellation the pool stops
+        handing out queued work and waits at most ``join_timeout`` for
+        running tasks. Workers are daemon threads, so tasks that ignore the
+        token do not hold up interpreter exit either.
+    Parameters:
+        max_workers: Number of worker threads; defaults to
+            ``min(32, os.cpu_count() + 4)`` like :class:`ThreadPoolExecutor`.
+        token: Cancellation token; defaults to the current ``run_cli`` token.
+            Long tasks should poll it (pass it as an argument).
+        join_timeout: Seconds running tasks get after cancellation.
+        thread_name_prefix: Prefix of the worker thread names.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        token: CancellationToken | None = None,
+        join_timeout: float = DEFAULT_JOIN_TIMEOUT,
+        thread_name_prefix: str = "cli-worker",
+    ) -> None:
+        self.token = _resolve_token(token)
+        self.join_timeout = join_timeout
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._prefix = thread_name_prefix
+        self._queue: queue.SimpleQueue[_WorkItem | None] = queue.SimpleQueue()
+        self._threads: list[threading.Thread] = []
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, fn: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs) -> Future[_T]:
+        """Schedule ``fn(*args, **kwargs)``; refuse new work once cancelled or shut down."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self.token.raise_if_cancelled()
+            future: Future[_T] = Future()
+            self._queue.put((future, fn, args, kwargs))
+            self._start_worker_if_needed()
+            return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop the pool; after cancellation, drop queued work and bound the wait.
+
+        Parameters:
+            wait: Wait for running work; after cancellation at most
+                ``join_timeout`` seconds.
+            cancel_futures: Cancel queued work even without a cancelled token.
+        """
+        with self._lock:
+            self._closed = True
+        cancelling = cancel_futures or self.token.cancelled
+        if cancelling:
+            _cancel_queued(self._queue)
+        for _ in self._threads:
+            self._queue.put(None)
+        if wait:
+            _join_threads(self._threads, self.join_timeout if cancelling else None)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        self.shutdown(wait=True, cancel_futures=exc_type is not None)
+        return None
+
+    def _start_worker_if_needed(self) -> None:
+        """Start a worker unless an idle one is available or the pool is full."""
+        if self._idle.acquire(blocking=False) or len(self._threads) >= self._max_workers:
+            return
+        thread = threading.Thread(
+            target=self._work,
+            name=f"{self._prefix}_{len(self._threads)}",
+            daemon=True,
+        )
+        thread.start()
+        self._threads.append(thread)
+
+    def _work(self) -> None:
+        """Run queued items until a ``None`` sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if self.token.cancelled:
+                future.cancel()
+            elif future.set_running_or_notify_cancel():
+                _run_item(future, fn, args, kwargs)
+            del item, future, fn, args, kwargs
+            self._idle.release()
+
+
+def _run_item(future: Future[Any], fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+    """Run one work item and settle its future."""
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as exc:  # noqa: BLE001 - delivered through the future
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+def _cancel_queued(pending: queue.SimpleQueue[_WorkItem | None]) -> None:
+    """Cancel every queued work item that has not started."""
+    while True:
+        try:
+            item = pending.get_nowait()
+        except queue.Empty:
+            return
+        if item is not None:
+            item[0].cancel()
+
+
+def _join_threads(threads: list[threading.Thread], timeout: float | None) -> None:
+    """Join ``threads`` within ``timeout`` seconds in total and report stragglers."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for thread in threads:
+        thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+    abandoned = sum(thread.is_alive() for thread in threads)
+    if abandoned:
+        note(f"pool: abandoned {abandoned} running task(s) after {timeout:g}s")
+
+
+class CancellableProcessPool(ProcessPoolExecutor):
+    """Process pool that forwards the cancelling signal to its workers.
+
+    Why:
+        A signal sent to the CLI's PID (``kill -INT``) reaches only the
+        parent. Here each worker leads its own process group (POSIX), so
+        the parent can forward the signal to it and to any subprocesses it
+        started, while a terminal ``Ctrl+C`` is handled by the parent alone.
+    Parameters:
+        max_workers: Number of worker processes.
+        token: Cancellation token; defaults to the current ``run_cli`` token.
+        join_timeout: Seconds workers get to exit after the signal before
+            they are killed.
+        mp_context: Optional :mod:`multiprocessing` context.
+        initializer: Optional callable run in each worker after it has
+            moved into its own process group.
+        initargs: Arguments for ``initializer``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        token: CancellationToken | None = None,
+        join_timeout: float = DEFAULT_JOIN_TIMEOUT,
+        mp_context: BaseContext | None = None,
+        initializer: Callable[..., object] | None = None,
+        initargs: tuple[Any, ...] = (),
+    ) -> None:
+        super().__init__(
+            max_workers,
+            mp_context=mp_context,
+            initializer=_enter_own_process_group,
+            initargs=(initializer, initargs),
+        )
+        self.token = _resolve_token(token)
+        self.join_timeout = join_timeout
+
+    def submit(self, fn: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs) -> Future[_T]:
+        """Schedule ``fn(*args, **kwargs)``; refuse new work once cancelled.
+
+        Exceptions from ``fn`` travel as :class:`ExceptionRecord` and are
+        rebuilt in this process, keeping their class, ``errno``/``returncode``,
+        and traceback even when they are not picklable.
+        """
+        self.token.raise_if_cancelled()
+        return super().submit(transport_exceptions(fn), *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop the pool; after cancellation, signal the workers and bound the wait.
+
+        Parameters:
+            wait: Wait for running work; after cancellation at most
+                ``join_timeout`` seconds before the workers are killed.
+            cancel_futures: Cancel queued work even without a cancelled token.
+        """
+        if not (cancel_futures or self.token.cancelled):
+            super().shutdown(wait=wait)
+            return
+        processes = list((self._processes or {}).values())
+        manager: threading.Thread | None = getattr(self, "_executor_manager_thread", None)
+        signum = self.token.signum or signal.SIGTERM
+        for process in processes:
+            _signal_process_group(process.pid, signum)
+        super().shutdown(wait=False, cancel_futures=True)
+        if wait:
+            deadline = time.monotonic() + self.join_timeout
+            _join_processes(processes, deadline, self.join_timeout)
+            if manager is not None:  # settles the futures of dead workers
+                manager.join(max(0.0, deadline - time.monotonic()))
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        self.shutdown(wait=True, cancel_futures=exc_type is not None)
+        return None
+
+
+def _enter_own_process_group(initializer: Callable[..., object] | None, initargs: tuple[Any, ...]) -> None:
+    """Worker initializer: lead a new process group, then run the caller's initializer."""
+    if hasattr(os, "setpgid"):
+        with suppress(OSError):
+            os.setpgid(0, 0)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _signal_process_group(pid: int | None, signum: int) -> None:
+    """Send ``signum`` to the process group led by ``pid`` (the process on Windows)."""
+    if pid is None:
+        return
+    if hasattr(os, "killpg"):
+        with suppress(OSError):
+            os.killpg(pid, signum)
+            return
+    with suppress(OSError):
+        os.kill(pid, signum)
+
+
+def _join_processes(processes: list[Any], deadline: float, timeout: float) -> None:
+    """Join ``processes`` until the monotonic ``deadline``; kill the rest."""
+    for process in processes:
+        process.join(max(0.0, deadline - time.monotonic()))
+    survivors = [process for process in processes if process.is_alive()]
+    for process in survivors:
+        with suppress(OSError):
+            process.kill()
+    if survivors:
+        note(f"pool: killed {len(survivors)} worker process(es) still running after {timeout:g}s")
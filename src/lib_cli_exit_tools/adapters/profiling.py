@@ -0,0 +1,178 @@
+"""Deterministic profiling of a command run under :func:`run_cli`.
+
+Purpose:
+    Profile a CLI through its real entry point: ``python -m cProfile`` loses
+    the console-script wrapper and the signal handling ``run_cli`` installs.
+Contents:
+    * :func:`profiled` context manager running the enclosed block under
+      :mod:`cProfile` and writing a ``pstats`` file however the block ends.
+    * :func:`start_profiling` switching profiling on from inside a run.
+    * :func:`discard_profiling` stopping it without writing a file (forked
+      children).
+    * :func:`top_functions` rendering the most expensive functions by
+      cumulative time, leaving out this package's own frames.
+System Integration:
+    ``run_cli`` wraps command execution in :func:`profiled` when
+    :attr:`config.profile_path` is set; the bundled CLI's ``--profile``
+    options call :func:`start_profiling` from the group callback. The file
+    is written before the exception handler runs, so failures and ``SigIntInterrupt``/``SigTermInterrupt`` still
+    leave a complete profile behind.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .runtime import note
+
+__all__ = ["discard_profiling", "profiled", "start_profiling", "top_functions"]
+
+#: Frames below this directory belong to lib_cli_exit_tools itself.
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _ProfileSession:
+    """Profiler of one :func:`profiled` block, started on demand."""
+
+    __slots__ = ("_path", "_profiler", "_top")
+
+    def __init__(self) -> None:
+        self._profiler: cProfile.Profile | None = None
+        self._path = ""
+        self._top = 0
+
+    def start(self, path: str, top: int) -> None:
+        """Begin profiling into ``path``; later calls are no-ops."""
+        if self._profiler is not None:
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as exc:
+            note(f"profile: not recorded ({exc})")
+            return
+        self._profiler, self._path, self._top = profiler, path, top
+
+    def finish(self) -> None:
+        """Stop profiling and write the statistics, if profiling ever started."""
+        profiler = self._profiler
+        if profiler is None:
+            return
+        profiler.disable()
+        self._profiler = None
+        _write_profile(profiler, self._path, self._top)
+
+    def discard(self) -> None:
+        """Stop profiling without writing any statistics."""
+        profiler, self._profiler = self._profiler, None
+        if profiler is not None:
+            profiler.disable()
+
+
+_active: ContextVar[_ProfileSession | None] = ContextVar("lib_cli_exit_tools_profile", default=None)
+
+
+@contextmanager
+def profiled(path: str | None, top: int = 0) -> Generator[None]:
+    """Profile the enclosed block and dump the statistics to ``path``.
+
+    Parameters:
+        path: ``pstats`` output file; ``None`` leaves the block unprofiled
+            unless :func:`start_profiling` is called from inside it.
+        top: When positive, also print the ``top`` functions by cumulative
+            time to stderr (see :func:`top_functions`).
+    Side Effects:
+        Writes the ``pstats`` file and a one-line note to stderr once the
+        block exits, normally or by exception. When another profiler is
+        already active the block runs unprofiled and a warning is printed.
+    """
+    session = _ProfileSession()
+    token = _active.set(session)
+    if path is not None:
+        session.start(path, top)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+        session.finish()
+
+
+def start_profiling(path: str, top: int = 0) -> bool:
+    """Start profiling the enclosing :func:`profiled` block from this point on.
+
+    Why:
+        Click group callbacks (such as ``--profile``) run inside the command,
+        after :func:`profiled` has been entered; this lets them switch the
+        profiler on for the subcommand that follows.
+    Returns:
+        ``False`` when called outside a :func:`profiled` block.
+    """
+    session = _active.get()
+    if session is None:
+        return False
+    session.start(path, top)
+    return True
+
+
+def discard_profiling() -> None:
+    """Stop profiling the enclosing :func:`profiled` block and drop its statistics.
+
+    Why:
+        A forked child inherits the parent's profiler; were it to return
+        through the block it would overwrite the parent's ``pstats`` file.
+    """
+    session = _active.get()
+    if session is not None:
+        session.discard()
+
+
+def _write_profile(profiler: cProfile.Profile, path: str, top: int) -> None:
+    """Dump ``profiler`` to ``path`` and print the optional summary."""
+    try:
+        profiler.dump_stats(path)
+    except OSError as exc:
+        note(f"profile: could not write {path}: {exc.strerror or exc}")
+        return
+    note(f"profile: wrote {path}")
+    if top > 0:
+        note(top_functions(pstats.Stats(profiler), top))
+
+
+def top_functions(stats: pstats.Stats, limit: int) -> str:
+    """Render the ``limit`` functions with the highest cumulative time.
+
+    Why:
+        The runner's own wrappers sit on every stack and would otherwise fill
+        the top of a cumulative listing, so frames from this package are
+        skipped.
+    Returns:
+        Aligned table with cumulative seconds, own seconds, call count, and
+        ``file:line(function)``.
+    """
+    entries = getattr(stats, "stats", {})
+    rows = sorted(
+        ((key, value) for key, value in entries.items() if not _is_own_frame(key[0])),
+        key=lambda item: item[1][3],
+        reverse=True,
+    )[:limit]
+    lines = [f"  {'cumtime':>9}{'tottime':>10}{'calls':>9}  function"]
+    for (filename, line, function), (_, calls, tottime, cumtime, _) in rows:
+        lines.append(f"  {cumtime:>9.3f}{tottime:>10.3f}{calls:>9}  {_location(filename, line, function)}")
+    return "\n".join(lines)
+
+
+def _is_own_frame(filename: str) -> bool:
+    """Return ``True`` for frames defined inside lib_cli_exit_tools."""
+    return filename.startswith(_PACKAGE_ROOT)
+
+
+def _location(filename: str, line: int, function: str) -> str:
+    """Format a profile key like :mod:`pstats` does, with a short path."""
+    if filename == "~":
+        return function
+    return f"{os.path.basename(filename)}:{line}({function})"
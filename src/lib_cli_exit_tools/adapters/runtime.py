@@ -0,0 +1,55 @@
+"""Small interpreter-level helpers shared by the adapters.
+
+Purpose:
+    Keep one copy of the two primitives that the diagnostic and interruption
+    adapters all need: a stderr note that never fails, and injecting an
+    exception into another thread.
+Contents:
+    * :func:`note` printing a diagnostic line to stderr.
+    * :func:`raise_in_thread` raising an exception class asynchronously in
+      another thread.
+System Integration:
+    Used by the profiling, memory, timeout, watchdog, thread-failure, pool,
+    event-loop and signal adapters, and by the zygote launcher. Not part of
+    the public facade.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import sys
+from contextlib import suppress
+
+__all__ = ["note", "raise_in_thread"]
+
+
+def note(message: str) -> None:
+    """Print ``message`` to stderr, ignoring a closed or broken stream.
+
+    Why:
+        Diagnostics written while a run is failing or shutting down must not
+        raise a second error of their own.
+    """
+    with suppress(Exception):
+        print(message, file=sys.stderr)
+
+
+def raise_in_thread(ident: int, exc_type: type[BaseException] | None) -> None:
+    """Raise ``exc_type`` asynchronously in thread ``ident``.
+
+    Why:
+        ``PyThreadState_SetAsyncExc`` is the only way to interrupt a thread
+        other than the main one. The exception takes effect at the thread's
+        next bytecode, not inside a blocking call, and only a class (not an
+        instance) can be injected, so it carries no arguments.
+    Parameters:
+        ident: :func:`threading.get_ident` value of the target thread.
+        exc_type: Exception class to raise; ``None`` clears a pending one.
+    Side Effects:
+        Does nothing on interpreters without ``ctypes.pythonapi``. Before
+        Python 3.12, clearing with ``None`` leaves the interpreter checking
+        for a pending exception at every bytecode until one is delivered.
+    """
+    with suppress(AttributeError):  # pragma: no cover - not CPython
+        exc = None if exc_type is None else ctypes.py_object(exc_type)
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(ident), exc)
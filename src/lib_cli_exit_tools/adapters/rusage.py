@@ -0,0 +1,164 @@
+"""Resource usage of a CLI run, reported on exit.
+
+Purpose:
+    Size containers for CLI jobs (memory limits, CPU shares, I/O budgets)
+    without wrapping every invocation in ``/usr/bin/time``.
+Contents:
+    * :class:`ResourceUsage` snapshot of one :func:`resource.getrusage` scope.
+    * :class:`ResourceReport` wall time plus usage of the process and of its
+      waited-for children.
+    * :func:`sample_resource_report` taking a report; ``None`` without
+      :mod:`resource` (Windows).
+    * :func:`format_resource_report` rendering a report for humans or as JSON.
+System Integration:
+    :func:`lib_cli_exit_tools.run_cli` prints a report to stderr after every
+    run, successful or failed, when :attr:`config.rusage` (``--rusage`` /
+    ``--rusage-json`` on the bundled CLI) selects a
+    :class:`~lib_cli_exit_tools.core.configuration.RusageFormat`.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from ..core.configuration import RusageFormat
+
+__all__ = [
+    "ResourceReport",
+    "ResourceUsage",
+    "format_resource_report",
+    "sample_resource_report",
+    "sample_resource_usage",
+]
+
+#: ``ru_maxrss`` is kilobytes on Linux and the BSDs but bytes on macOS.
+_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceUsage:
+    """Counters of one :func:`resource.getrusage` scope.
+
+    Fields:
+        user_cpu: CPU seconds spent in user mode.
+        system_cpu: CPU seconds spent in the kernel.
+        max_rss: Peak resident set size in bytes (largest child for the
+            children scope).
+        voluntary_switches: Context switches while waiting (I/O, locks).
+        involuntary_switches: Context switches forced by the scheduler.
+        block_in: Filesystem block input operations.
+        block_out: Filesystem block output operations.
+    """
+
+    user_cpu: float
+    system_cpu: float
+    max_rss: int
+    voluntary_switches: int
+    involuntary_switches: int
+    block_in: int
+    block_out: int
+
+    @property
+    def cpu_time(self) -> float:
+        """User plus system CPU seconds."""
+        return self.user_cpu + self.system_cpu
+
+    @classmethod
+    def from_rusage(cls, usage: Any) -> ResourceUsage:
+        """Build a snapshot from a :class:`resource.struct_rusage`."""
+        return cls(
+            user_cpu=usage.ru_utime,
+            system_cpu=usage.ru_stime,
+            max_rss=usage.ru_maxrss * _MAXRSS_SCALE,
+            voluntary_switches=usage.ru_nvcsw,
+            involuntary_switches=usage.ru_nivcsw,
+            block_in=usage.ru_inblock,
+            block_out=usage.ru_oublock,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceReport:
+    """Resource usage of one run.
+
+    Fields:
+        wall: Wall-clock seconds of the run.
+        self_usage: Usage of the CLI process itself.
+        children: Usage of terminated and waited-for child processes.
+    """
+
+    wall: float
+    self_usage: ResourceUsage
+    children: ResourceUsage
+
+
+def sample_resource_usage() -> ResourceUsage | None:
+    """Return the usage of this process so far, or ``None`` without :mod:`resource`."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return ResourceUsage.from_rusage(resource.getrusage(resource.RUSAGE_SELF))
+
+
+def sample_resource_report(wall: float) -> ResourceReport | None:
+    """Return the usage of this process and its children for a run of ``wall`` seconds.
+
+    Returns:
+        ``None`` where :mod:`resource` is unavailable (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    return ResourceReport(
+        wall=wall,
+        self_usage=ResourceUsage.from_rusage(resource.getrusage(resource.RUSAGE_SELF)),
+        children=ResourceUsage.from_rusage(resource.getrusage(resource.RUSAGE_CHILDREN)),
+    )
+
+
+def format_resource_report(report: ResourceReport, style: RusageFormat) -> str:
+    """Render ``report`` as aligned text or as one JSON object.
+
+    Examples:
+        >>> usage = ResourceUsage(0.5, 0.25, 50 * 1024 * 1024, 10, 2, 0, 8)
+        >>> idle = ResourceUsage(0.0, 0.0, 0, 0, 0, 0, 0)
+        >>> print(format_resource_report(ResourceReport(1.5, usage, idle), RusageFormat.HUMAN))
+        rusage:
+          wall               1.500 s
+          user cpu           0.500 s
+          system cpu         0.250 s
+          peak rss          50.0 MiB
+          ctx switches      10 voluntary / 2 involuntary
+          block io           0 in / 8 out
+        >>> format_resource_report(ResourceReport(1.5, usage, idle), RusageFormat.JSON).startswith('{"wall": 1.5, "self": {')
+        True
+    """
+    if style is RusageFormat.JSON:
+        return json.dumps({"wall": round(report.wall, 6), "self": asdict(report.self_usage), "children": asdict(report.children)})
+    lines = ["rusage:", f"  {'wall':<16}{report.wall:>7.3f} s"]
+    lines.extend(_human_lines(report.self_usage))
+    if _has_activity(report.children):
+        lines.append("rusage (children):")
+        lines.extend(_human_lines(report.children))
+    return "\n".join(lines)
+
+
+def _human_lines(usage: ResourceUsage) -> list[str]:
+    """Return the aligned text rows for one usage scope."""
+    return [
+        f"  {'user cpu':<16}{usage.user_cpu:>7.3f} s",
+        f"  {'system cpu':<16}{usage.system_cpu:>7.3f} s",
+        f"  {'peak rss':<16}{usage.max_rss / (1024 * 1024):>6.1f} MiB",
+        f"  {'ctx switches':<16}{usage.voluntary_switches:>4} voluntary / {usage.involuntary_switches} involuntary",
+        f"  {'block io':<16}{usage.block_in:>5} in / {usage.block_out} out",
+    ]
+
+
+def _has_activity(usage: ResourceUsage) -> bool:
+    """Return ``True`` when any child process consumed resources."""
+    return usage.cpu_time > 0 or usage.max_rss > 0
@@ -0,0 +1,214 @@
+"""Main-thread signal relay for ``run_cli`` calls on worker threads.
+
+Purpose:
+    ``signal.signal`` only works on the main thread of the main interpreter,
+    so a web service running CLI commands from request-handler threads could
+    neither install handlers nor interrupt those commands. The relay owns the
+    process-wide handlers instead and forwards each signal to every run
+    subscribed from another thread.
+Contents:
+    * :func:`install_signal_relay` installing the relay from the main thread.
+    * :func:`subscribe_to_signal_relay` registering a run's callback.
+    * :func:`signal_relay_installed` telling whether a relay is active.
+System Integration:
+    :func:`install_signal_handlers` detects worker threads and embedded
+    interpreters and subscribes the run here instead of calling
+    ``signal.signal``; the callback raises the spec's exception in the run's
+    thread and cancels its :class:`CancellationToken`.
+
+Dispatch:
+    The relay points ``signal.set_wakeup_fd`` at a socket pair. The C-level
+    handler writes each signal number to it even while the main thread is
+    blocked in native code, and a daemon thread reads it and calls the
+    subscribers inside the context they subscribed from, so lifecycle events
+    and cancellation reach the right run. When another component already
+    owns the wakeup descriptor (an asyncio loop on the main thread), the
+    Python-level handler dispatches instead. With no run subscribed, a signal
+    falls through to the handler that was installed before the relay.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import signal
+import socket
+import threading
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from types import FrameType
+from typing import Any
+
+__all__ = [
+    "install_signal_relay",
+    "signal_relay_installed",
+    "subscribe_to_signal_relay",
+]
+
+#: Callback receiving the number of a relayed signal.
+_Subscriber = Callable[[int], None]
+
+
+class _Relay:
+    """Handlers, wakeup socket, and reader thread of an installed relay."""
+
+    def __init__(self, signums: Iterable[int]) -> None:
+        self._subscribers: dict[int, tuple[_Subscriber, contextvars.Context]] = {}
+        self._next_key = 0
+        self._lock = threading.RLock()  # re-entered when a handler interrupts a dispatch
+        self._previous: dict[int, Any] = {}
+        self._reader, self._writer = socket.socketpair()
+        self._writer.setblocking(False)
+        self._direct = False
+        self._thread: threading.Thread | None = None
+        for signum in signums:
+            with suppress(OSError, RuntimeError, ValueError):
+                self._previous[signum] = signal.signal(signum, self._on_signal)
+
+    def start(self) -> None:
+        """Take over the wakeup descriptor, or dispatch from the handler when it is taken."""
+        previous_fd = signal.set_wakeup_fd(self._writer.fileno(), warn_on_full_buffer=False)
+        if previous_fd != -1:
+            signal.set_wakeup_fd(previous_fd)
+            self._direct = True
+            return
+        self._thread = threading.Thread(target=self._pump, name="cli-signal-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Restore the previous handlers and wakeup descriptor; stop the reader."""
+        if not self._direct:
+            signal.set_wakeup_fd(-1)
+        for signum, previous in self._previous.items():
+            with suppress(OSError, RuntimeError, TypeError, ValueError):
+                signal.signal(signum, previous)
+        self._writer.close()
+        if self._thread is not None:
+            self._thread.join()
+        self._reader.close()
+
+    def subscribe(self, callback: _Subscriber) -> Callable[[], None]:
+        """Register ``callback`` with the caller's context; return the unsubscriber."""
+        with self._lock:
+            key = self._next_key
+            self._next_key += 1
+            self._subscribers[key] = (callback, contextvars.copy_context())
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                self._subscribers.pop(key, None)
+
+        return _unsubscribe
+
+    def dispatch(self, signum: int) -> bool:
+        """Call every subscriber with ``signum``; ``False`` when none is subscribed."""
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+            for callback, context in subscribers:
+                with suppress(RuntimeError):  # context already entered by an interrupted dispatch
+                    context.run(callback, signum)
+        return bool(subscribers)
+
+    def _on_signal(self, signum: int, frame: FrameType | None) -> None:
+        """Python-level handler: dispatch directly, or fall through when nobody listens."""
+        if self._direct and self.dispatch(signum):
+            return
+        if not self._direct and self._has_subscribers():
+            return  # the reader thread dispatches from the wakeup descriptor
+        self._fall_through(signum, frame)
+
+    def _has_subscribers(self) -> bool:
+        with self._lock:
+            return bool(self._subscribers)
+
+    def _fall_through(self, signum: int, frame: FrameType | None) -> None:
+        """Give ``signum`` to the handler that was installed before the relay."""
+        previous = self._previous.get(signum)
+        if callable(previous):
+            previous(signum, frame)
+        elif previous in (signal.SIG_DFL, None):
+            signal.signal(signum, signal.SIG_DFL)
+            try:
+                signal.raise_signal(signum)
+            finally:
+                signal.signal(signum, self._on_signal)
+
+    def _pump(self) -> None:
+        """Reader thread: dispatch every signal number written to the wakeup socket."""
+        while True:
+            try:
+                data = self._reader.recv(64)
+            except OSError:
+                return
+            if not data:
+                return
+            for signum in data:
+                self.dispatch(signum)
+
+
+_relay: _Relay | None = None
+_relay_lock = threading.Lock()
+
+
+def install_signal_relay(signums: Iterable[int] | None = None) -> Callable[[], None]:
+    """Install the relay that forwards signals to ``run_cli`` calls on other threads.
+
+    Why:
+        Worker threads cannot install signal handlers; a host such as a web
+        service calls this once at startup so the commands its request
+        handlers run through ``run_cli`` stay interruptible.
+    Parameters:
+        signums: Signals to relay; defaults to ``SIGINT`` plus ``SIGTERM``
+            and ``SIGBREAK`` where available.
+    Returns:
+        Callable restoring the previous handlers and wakeup descriptor.
+    Raises:
+        ValueError: When called outside the main thread of the main
+            interpreter.
+        RuntimeError: When a relay is already installed.
+    """
+    global _relay
+    if threading.current_thread() is not threading.main_thread():
+        raise ValueError("install_signal_relay must be called from the main thread")
+    with _relay_lock:
+        if _relay is not None:
+            raise RuntimeError("a signal relay is already installed")
+        relay = _Relay(_default_signums() if signums is None else signums)
+        try:
+            relay.start()
+        except BaseException:
+            relay.stop()
+            raise
+        _relay = relay
+
+    def _uninstall() -> None:
+        global _relay
+        with _relay_lock:
+            if _relay is relay:
+                _relay = None
+        relay.stop()
+
+    return _uninstall
+
+
+def subscribe_to_signal_relay(callback: _Subscriber) -> Callable[[], None] | None:
+    """Forward relayed signals to ``callback``, run in the caller's context.
+
+    Returns:
+        Callable ending the subscription, or ``None`` when no relay is
+        installed.
+    """
+    with _relay_lock:
+        relay = _relay
+    if relay is None:
+        return None
+    return relay.subscribe(callback)
+
+
+def signal_relay_installed() -> bool:
+    """Return ``True`` while a relay from :func:`install_signal_relay` is active."""
+    return _relay is not None
+
+
+def _default_signums() -> list[int]:
+    """Return ``SIGINT`` plus ``SIGTERM``/``SIGBREAK`` where the platform has them."""
+    return [signal.SIGINT, *(getattr(signal, name) for name in ("SIGTERM", "SIGBREAK") if hasattr(signal, name))]
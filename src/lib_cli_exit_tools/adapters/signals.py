@@ -8,29 +8,75 @@ Contents:
     * :class:`SignalSpec` dataclass describing signal→exception mappings.
     * :func:`default_signal_specs` building platform-aware defaults.
     * :func:`install_signal_handlers` installing reversible handlers.
+    * :func:`record_signal_delivery` applying a spec's repeat policy and
+      :func:`signal_deliveries` exposing the delivery counts.
+    * :func:`defer_signals` context manager postponing the raise until a
+      critical section ends.
 System Integration:
     The application runner leverages these helpers to provide consistent exit
     codes across console entry points while allowing tests to inject fakes.
+    On worker threads and in embedded interpreters the handlers are routed
+    through :mod:`lib_cli_exit_tools.adapters.signal_relay`.
+
+Repeated signals:
+    By default every delivery raises the spec's exception. Specs opting in
+    with :attr:`SignalSpec.grace_window` only count a repeat arriving within
+    that many seconds of the raising delivery, so a user hammering ``Ctrl+C``
+    cannot interrupt ``finally`` blocks over and over; once
+    :attr:`SignalSpec.escalate_after` deliveries arrived the process exits
+    immediately with the spec's exit code. A delivery after the window has
+    passed counts as a new interrupt and starts counting from one again.
+    Every delivery is reported as a ``signal`` lifecycle event carrying its
+    ``count`` and ``action`` (``raise``, ``coalesce``, or ``escalate``).
+
+Deferred signals:
+    Inside :func:`defer_signals` a raising delivery is recorded instead and
+    its exception raised when the block exits, so an output file or database
+    write is never cut in half. An optional maximum deferral re-delivers the
+    signal from a timer thread once it has waited long enough; escalation
+    still ends the process immediately.
 """
 
 from __future__ import annotations
 
+import os
 import signal
-from contextlib import ExitStack
+import threading
+import time
+from contextlib import ExitStack, contextmanager, suppress
 from dataclasses import dataclass
 from types import FrameType
-from typing import Callable, Iterable, Sequence
+from typing import Callable, Generator, Iterable, Literal, Sequence
+
+from .cancellation import cancel_current
+from .events import emit_event
+from .fork_safety import forget_signal_handler, install_fork_hooks, remember_signal_handler
+from .runtime import raise_in_thread
+from .signal_relay import subscribe_to_signal_relay
 
 __all__ = [
     "CliSignalError",
     "SigIntInterrupt",
     "SigTermInterrupt",
     "SigBreakInterrupt",
+    "TimeoutInterrupt",
+    "StallInterrupt",
     "SignalSpec",
+    "DEFAULT_SIGNAL_GRACE",
+    "DeliveryAction",
     "default_signal_specs",
+    "defer_signals",
     "install_signal_handlers",
+    "record_signal_delivery",
+    "signal_deliveries",
 ]
 
+#: Suggested :attr:`SignalSpec.grace_window` for specs opting into coalescing.
+DEFAULT_SIGNAL_GRACE = 5.0
+
+#: What a delivery did: raised the spec's exception, was only counted, or exited the process.
+DeliveryAction = Literal["raise", "coalesce", "escalate"]
+
 
 class CliSignalError(RuntimeError):
     """Base class for translating OS signals into structured CLI errors.
@@ -55,6 +101,40 @@ class SigBreakInterrupt(CliSignalError):
     """Raised when the process receives ``SIGBREAK`` on Windows consoles."""
 
 
+class TimeoutInterrupt(CliSignalError):
+    """Raised when a run exceeds its wall-clock timeout.
+
+    Delivered by ``SIGALRM`` on the main thread or injected by a watchdog
+    thread elsewhere (see :mod:`lib_cli_exit_tools.adapters.timeout`);
+    :func:`handle_cli_exception` maps it to exit code ``124``.
+
+    Attributes:
+        seconds: The exceeded limit, or ``None`` when the watchdog injected
+            the bare class.
+    """
+
+    def __init__(self, seconds: float | None = None) -> None:
+        super().__init__(f"timed out after {seconds:g}s" if seconds is not None else "timed out")
+        self.seconds = seconds
+
+
+class StallInterrupt(CliSignalError):
+    """Raised when a run stops calling :func:`heartbeat` for too long.
+
+    Injected by the heartbeat watchdog (see
+    :mod:`lib_cli_exit_tools.adapters.watchdog`) when interrupting is
+    enabled; :func:`handle_cli_exception` maps it to exit code ``125``.
+
+    Attributes:
+        seconds: The exceeded heartbeat interval, or ``None`` when the
+            watchdog injected the bare class.
+    """
+
+    def __init__(self, seconds: float | None = None) -> None:
+        super().__init__(f"no heartbeat for {seconds:g}s" if seconds is not None else "stalled")
+        self.seconds = seconds
+
+
 @dataclass(slots=True)
 class SignalSpec:
     """Describe how to translate a low-level signal into CLI-facing behaviour.
@@ -64,12 +144,21 @@ class SignalSpec:
         exception: Exception type raised by the generated handler.
         message: User-facing text echoed to stderr when the signal fires.
         exit_code: Numeric code returned to the operating system.
+        grace_window: Seconds after a raising delivery during which repeats
+            are counted but not raised, so they cannot interrupt the cleanup
+            it started; a later delivery restarts the count. ``None``
+            (default) raises on every delivery.
+        escalate_after: Delivery count at which the process exits at once
+            via :func:`os._exit` with ``exit_code``, skipping the remaining
+            cleanup; ``None`` (default) never escalates.
     """
 
     signum: int
     exception: type[BaseException]
     message: str
     exit_code: int
+    grace_window: float | None = None
+    escalate_after: int | None = None
 
 
 _Handler = Callable[[int, FrameType | None], None]
@@ -94,21 +183,224 @@ def default_signal_specs(extra: Iterable[SignalSpec] | None = None) -> list[Sign
     return specs
 
 
-def _make_raise_handler(exc_type: type[BaseException]) -> _Handler:
-    """Wrap ``exc_type`` in a signal-compatible callable."""
+class _Deliveries:
+    """Deliveries of one signal since its handler was installed or its last grace window ended."""
+
+    __slots__ = ("count", "raised_at")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.raised_at: float | None = None
+
+    def record(self, spec: SignalSpec) -> DeliveryAction:
+        """Count a delivery and decide what it does under ``spec``'s policy."""
+        now = time.monotonic()
+        if self._handled(spec, now):
+            self.count, self.raised_at = 0, None
+        self.count += 1
+        if spec.escalate_after is not None and self.count >= spec.escalate_after:
+            return "escalate"
+        if self.raised_at is not None and spec.grace_window is not None and now - self.raised_at < spec.grace_window:
+            return "coalesce"
+        self.raised_at = now
+        return "raise"
+
+    def _handled(self, spec: SignalSpec, now: float) -> bool:
+        """Return ``True`` once the grace window of the last raising delivery has passed."""
+        return self.raised_at is not None and spec.grace_window is not None and now - self.raised_at >= spec.grace_window
+
+
+#: Per-signal delivery state; only touched from the main thread, where handlers run, so no lock
+#: (a lock taken by a handler could deadlock against the code it interrupted).
+_deliveries: dict[int, _Deliveries] = {}
+
+
+def record_signal_delivery(spec: SignalSpec) -> DeliveryAction:
+    """Count a delivery of ``spec.signum`` and apply the spec's repeat policy.
+
+    Why:
+        Shared by the synchronous handlers and the event-loop handlers of
+        ``run_cli_async`` so both coalesce and escalate the same way.
+    Returns:
+        ``"raise"`` when the caller should interrupt the command,
+        ``"coalesce"`` when the delivery was only counted.
+    Side Effects:
+        Emits a ``signal`` lifecycle event and cancels the current
+        :class:`CancellationToken`. On escalation writes a note to stderr and
+        ends the process with :func:`os._exit` instead of returning.
+    """
+    return _record_delivery(spec, _deliveries.setdefault(spec.signum, _Deliveries()))
+
+
+def _record_delivery(spec: SignalSpec, deliveries: _Deliveries) -> DeliveryAction:
+    """Count a delivery in ``deliveries``, report it, and escalate when due."""
+    action = deliveries.record(spec)
+    count = deliveries.count
+    name = _signal_name(spec.signum)
+    emit_event("signal", signal=spec.signum, name=name, count=count, action=action)
+    cancel_current(name, signum=spec.signum)
+    if action == "escalate":
+        _escalate(spec, count)
+    return action
+
+
+def signal_deliveries() -> dict[int, int]:
+    """Return how often each signal arrived since its main-thread handler was installed.
+
+    For specs with a :attr:`SignalSpec.grace_window` the count restarts with
+    the first delivery after the window has passed.
+    """
+    return {signum: deliveries.count for signum, deliveries in list(_deliveries.items())}
+
+
+def _escalate(spec: SignalSpec, count: int) -> None:
+    """Exit the process immediately with ``spec.exit_code``."""
+    with suppress(OSError):
+        os.write(2, f"{spec.message} Received {count} times; exiting immediately.\n".encode())
+    os._exit(spec.exit_code)
+
+
+class _Deferral:
+    """Signals recorded by the outermost active :func:`defer_signals` block."""
+
+    __slots__ = ("_lock", "_timer", "expired", "forced", "max_deferral", "pending")
+
+    def __init__(self, max_deferral: float | None) -> None:
+        self.max_deferral = max_deferral
+        self.pending: list[SignalSpec] = []
+        self.forced = False
+        self.expired = False
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()  # never taken by signal handlers
+
+    def defer(self, spec: SignalSpec) -> bool:
+        """Record ``spec`` for the end of the block; ``False`` once deferral is over."""
+        if self.expired:
+            return False
+        self.pending.append(spec)
+        if self.max_deferral is not None and self._timer is None:
+            self._timer = threading.Timer(self.max_deferral, self._force, (spec.signum,))
+            self._timer.daemon = True
+            self._timer.start()
+        return True
+
+    def take_forced(self) -> SignalSpec | None:
+        """Return the signal to honour after the maximum deferral; end deferral."""
+        self.forced = False
+        self.expired = True
+        spec = self.pending[0] if self.pending else None
+        self.pending.clear()
+        return spec
+
+    def close(self) -> SignalSpec | None:
+        """End deferral and return the first recorded signal, if any."""
+        with self._lock:
+            self.expired = True
+        if self._timer is not None:
+            self._timer.cancel()
+        spec = self.pending[0] if self.pending else None
+        self.pending.clear()
+        return spec
+
+    def _force(self, signum: int) -> None:
+        """Timer thread: wake the main thread so the handler raises the recorded signal."""
+        with self._lock:
+            if self.expired or not self.pending:
+                return
+            self.forced = True
+            signal.raise_signal(signum)
+
+
+_deferral: _Deferral | None = None
+
+
+@contextmanager
+def defer_signals(max_deferral: float | None = None) -> Generator[None]:
+    """Postpone signal exceptions until the enclosed critical section ends.
+
+    Why:
+        A ``SigIntInterrupt`` raised in the middle of writing an output file
+        or database leaves a corrupted artifact the next run has to rebuild.
+    What:
+        While the block runs, the handlers from :func:`install_signal_handlers`
+        record a raising delivery instead of raising it; the first recorded
+        signal's exception is raised as the block exits, normally or by
+        exception. Repeat policies still apply, so an escalating delivery
+        ends the process at once.
+    Parameters:
+        max_deferral: Seconds a recorded signal may wait; afterwards it is
+            raised inside the block anyway. ``None`` (default) waits for the
+            block to end.
+    Side Effects:
+        Only effective on the main thread, where the handlers raise; nested
+        blocks join the outermost one and elsewhere the block has no effect.
+    """
+    global _deferral
+    if _deferral is not None or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    deferral = _deferral = _Deferral(max_deferral)
+    try:
+        yield
+    finally:
+        spec = deferral.close()
+        _deferral = None
+        if spec is not None:
+            raise spec.exception()
+
+
+def _make_raise_handler(spec: SignalSpec) -> _Handler:
+    """Wrap ``spec`` in a signal-compatible callable applying its repeat policy."""
 
     def _handler(signo: int, frame: FrameType | None) -> None:  # pragma: no cover - just raises
-        raise exc_type()
+        deferral = _deferral
+        if deferral is not None and deferral.forced:
+            forced = deferral.take_forced()
+            if forced is not None:
+                raise forced.exception()
+        if record_signal_delivery(spec) != "raise":
+            return
+        if deferral is not None and deferral.defer(spec):
+            return
+        raise spec.exception()
 
     return _handler
 
 
+def _reset_deliveries(signum: int) -> None:
+    """Start counting deliveries of ``signum`` afresh for a new handler."""
+    _deliveries[signum] = _Deliveries()
+
+
+def _signal_name(signo: int) -> str:
+    """Return the symbolic name for ``signo`` (``"SIGINT"``), or its number."""
+    try:
+        return signal.Signals(signo).name
+    except ValueError:
+        return str(signo)
+
+
 def install_signal_handlers(specs: Sequence[SignalSpec] | None = None) -> Callable[[], None]:
-    """Install signal handlers that re-raise as structured exceptions."""
+    """Install signal handlers that re-raise as structured exceptions.
+
+    Also registers the fork hooks of
+    :mod:`lib_cli_exit_tools.adapters.fork_safety`, so processes forked while
+    the handlers are installed follow :attr:`config.fork_signal_policy`.
+
+    Outside the main thread of the main interpreter, where ``signal.signal``
+    refuses to work, the specs are subscribed to the relay from
+    :func:`install_signal_relay` instead: a relayed signal raises the spec's
+    exception in the calling thread at its next bytecode and cancels the
+    run's :class:`CancellationToken`. Without a relay the run simply is not
+    interrupted by signals.
+    """
 
+    install_fork_hooks()
     active_specs = _choose_specs(specs)
-    stack = _register_handlers(active_specs)
-    return stack.close
+    if threading.current_thread() is threading.main_thread():
+        with suppress(ValueError):  # embedded interpreter: handlers only work in the main one
+            return _register_handlers(active_specs).close
+    return _relay_handlers(active_specs)
 
 
 def _choose_specs(specs: Sequence[SignalSpec] | None) -> list[SignalSpec]:
@@ -123,16 +415,48 @@ def _register_handlers(specs: Sequence[SignalSpec]) -> ExitStack:
 
     stack = ExitStack()
     for spec in specs:
-        handler = _make_raise_handler(spec.exception)
+        handler = _make_raise_handler(spec)
         try:
             previous = signal.getsignal(spec.signum)
             signal.signal(spec.signum, handler)
         except (AttributeError, OSError, RuntimeError):  # pragma: no cover - platform differences
             continue
+        except ValueError:
+            stack.close()
+            raise
+        _reset_deliveries(spec.signum)
         stack.callback(signal.signal, spec.signum, previous)
+        remember_signal_handler(spec.signum, handler, previous)
+        stack.callback(forget_signal_handler, spec.signum, handler)
     return stack
 
 
+def _relay_handlers(specs: Sequence[SignalSpec]) -> Callable[[], None]:
+    """Subscribe ``specs`` for the calling thread to the main-thread signal relay."""
+    by_signum = {spec.signum: spec for spec in specs}
+    deliveries = {signum: _Deliveries() for signum in by_signum}
+    target = threading.get_ident()
+
+    def _deliver(signum: int) -> None:
+        spec = by_signum.get(signum)
+        if spec is not None and _record_delivery(spec, deliveries[signum]) == "raise":
+            raise_in_thread(target, spec.exception)
+
+    unsubscribe = subscribe_to_signal_relay(_deliver)
+    if unsubscribe is None:
+        return _no_restore
+
+    def _restore() -> None:
+        unsubscribe()
+        raise_in_thread(target, None)  # drop a delivery the run no longer needs
+
+    return _restore
+
+
+def _no_restore() -> None:
+    """Restorer of a run that installed nothing."""
+
+
 def _standard_signal_specs() -> list[SignalSpec]:
     """Return the base set of signal specifications for all platforms."""
     specs: list[SignalSpec] = [_sigint_spec()]
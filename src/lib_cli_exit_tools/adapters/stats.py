@@ -0,0 +1,282 @@
+"""Persistent run statistics collected across CLI invocations.
+
+Purpose:
+    Answer "which subcommands are getting slower" and "how often does each exit
+    code occur" across thousands of unattended (cron) runs without an external
+    metrics service.
+Contents:
+    * :data:`STATS_PATH_ENV` naming the environment variable that enables
+      recording (for example ``LIB_CLI_EXIT_TOOLS_STATS_DB=~/.cache/cli.db``).
+    * :class:`RunRecord` describing one finished invocation.
+    * :class:`CommandStats` summarising one command path.
+    * :class:`StatsStore` SQLite-backed store with pre-aggregated rollups.
+    * :func:`resource_usage` sampling peak RSS and CPU time of this process.
+System Integration:
+    :func:`lib_cli_exit_tools.run_cli` appends one :class:`RunRecord` per
+    invocation when :attr:`config.stats_path` (or :data:`STATS_PATH_ENV`) names
+    a database; the ``stats`` subcommand renders :meth:`StatsStore.summaries`.
+
+Storage layout:
+    ``runs`` is the append-only log. Each insert also updates two rollup tables
+    in the same transaction: ``exit_rollup`` (runs, durations, CPU, peak RSS per
+    command and exit code) and ``latency_rollup`` (a log-scale latency
+    histogram per command with eight buckets per doubling, about 9% relative
+    error). Summaries read only the rollups, so queries cost the same whether
+    the log holds a hundred runs or ten million. The database runs in WAL mode
+    so concurrent invocations append without blocking readers.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+from collections.abc import Iterable, Mapping, Sequence
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .rusage import sample_resource_usage
+
+__all__ = [
+    "STATS_PATH_ENV",
+    "CommandStats",
+    "RunRecord",
+    "StatsStore",
+    "resource_usage",
+    "stats_path_from_env",
+]
+
+#: Environment variable naming the statistics database.
+STATS_PATH_ENV = "LIB_CLI_EXIT_TOOLS_STATS_DB"
+
+#: Histogram buckets per doubling of latency; bucket ``b`` ends at ``2 ** (b / 8)`` ms.
+_BUCKETS_PER_DOUBLING = 8
+#: Milliseconds a concurrent writer waits for the database lock before giving up.
+_BUSY_TIMEOUT_MS = 2000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    command TEXT NOT NULL,
+    exit_code INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    cpu_time REAL,
+    peak_rss INTEGER
+);
+CREATE TABLE IF NOT EXISTS exit_rollup (
+    command TEXT NOT NULL,
+    exit_code INTEGER NOT NULL,
+    runs INTEGER NOT NULL,
+    total_duration REAL NOT NULL,
+    total_cpu REAL NOT NULL,
+    max_rss INTEGER NOT NULL,
+    PRIMARY KEY (command, exit_code)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS latency_rollup (
+    command TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    runs INTEGER NOT NULL,
+    PRIMARY KEY (command, bucket)
+) WITHOUT ROWID;
+"""
+
+_INSERT_RUN = "INSERT INTO runs (ts, command, exit_code, duration, cpu_time, peak_rss) VALUES (?, ?, ?, ?, ?, ?)"
+_UPSERT_EXIT = """
+INSERT INTO exit_rollup (command, exit_code, runs, total_duration, total_cpu, max_rss) VALUES (?, ?, 1, ?, ?, ?)
+ON CONFLICT (command, exit_code) DO UPDATE SET
+    runs = runs + 1,
+    total_duration = total_duration + excluded.total_duration,
+    total_cpu = total_cpu + excluded.total_cpu,
+    max_rss = MAX(max_rss, excluded.max_rss)
+"""
+_UPSERT_LATENCY = """
+INSERT INTO latency_rollup (command, bucket, runs) VALUES (?, ?, 1)
+ON CONFLICT (command, bucket) DO UPDATE SET runs = runs + 1
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RunRecord:
+    """One finished CLI invocation.
+
+    Fields:
+        command: Space-separated command path (``"mycli sync"``).
+        exit_code: Exit code returned by :func:`run_cli`.
+        duration: Wall-clock seconds from start to finalisation.
+        cpu_time: User plus system CPU seconds, or ``None`` when unavailable.
+        peak_rss: Peak resident set size in bytes, or ``None`` when unavailable.
+        ts: Unix timestamp of the end of the run.
+    """
+
+    command: str
+    exit_code: int
+    duration: float
+    cpu_time: float | None
+    peak_rss: int | None
+    ts: float
+
+
+@dataclass(frozen=True, slots=True)
+class CommandStats:
+    """Aggregated statistics of one command path.
+
+    Fields:
+        command: Command path the numbers belong to.
+        runs: Number of recorded invocations.
+        percentiles: Latency in seconds per requested percentile (``50.0`` …),
+            accurate to one histogram bucket.
+        exit_codes: Number of runs per exit code.
+        mean_cpu: Mean CPU seconds per run.
+        max_rss: Largest peak RSS in bytes seen for the command.
+    """
+
+    command: str
+    runs: int
+    percentiles: Mapping[float, float] = field(default_factory=dict[float, float])
+    exit_codes: Mapping[int, int] = field(default_factory=dict[int, int])
+    mean_cpu: float = 0.0
+    max_rss: int = 0
+
+
+class StatsStore:
+    """SQLite store for :class:`RunRecord` entries and their rollups.
+
+    Parameters:
+        path: Database file; parent directories are created on first use.
+    """
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = Path(path).expanduser()
+
+    @property
+    def path(self) -> Path:
+        """Location of the database file."""
+        return self._path
+
+    def record(self, records: Iterable[RunRecord]) -> int:
+        """Append ``records`` and update the rollups in a single transaction.
+
+        Returns:
+            Number of records written.
+        Raises:
+            sqlite3.Error: When the database is locked past the busy timeout or
+                unusable; callers recording from ``run_cli`` swallow it.
+        """
+        batch = list(records)
+        if not batch:
+            return 0
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(_INSERT_RUN, [_run_row(record) for record in batch])
+            connection.executemany(_UPSERT_EXIT, [_exit_row(record) for record in batch])
+            connection.executemany(_UPSERT_LATENCY, [(record.command, _bucket(record.duration)) for record in batch])
+        return len(batch)
+
+    def summaries(self, percentiles: Sequence[float] = (50.0, 90.0, 99.0)) -> list[CommandStats]:
+        """Return per-command statistics computed from the rollup tables.
+
+        Parameters:
+            percentiles: Percentiles (0–100) to derive from the latency histogram.
+        Returns:
+            One :class:`CommandStats` per command, sorted by command path;
+            empty when the database does not exist yet.
+        """
+        if not self._path.exists():
+            return []
+        with closing(self._connect()) as connection:
+            exits = connection.execute("SELECT command, exit_code, runs, total_cpu, max_rss FROM exit_rollup ORDER BY command, exit_code").fetchall()
+            latency = connection.execute("SELECT command, bucket, runs FROM latency_rollup ORDER BY command, bucket").fetchall()
+        return _build_summaries(exits, latency, percentiles)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database in WAL mode and ensure the schema exists."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=_BUSY_TIMEOUT_MS / 1000)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+
+def _run_row(record: RunRecord) -> tuple[float, str, int, float, float | None, int | None]:
+    """Return the ``runs`` row for ``record``."""
+    return (record.ts, record.command, record.exit_code, record.duration, record.cpu_time, record.peak_rss)
+
+
+def _exit_row(record: RunRecord) -> tuple[str, int, float, float, int]:
+    """Return the ``exit_rollup`` contribution of ``record``."""
+    return (record.command, record.exit_code, record.duration, record.cpu_time or 0.0, record.peak_rss or 0)
+
+
+def _bucket(duration: float) -> int:
+    """Map ``duration`` seconds to its log-scale histogram bucket."""
+    milliseconds = max(duration * 1000.0, 1e-3)
+    return math.ceil(math.log2(milliseconds) * _BUCKETS_PER_DOUBLING)
+
+
+def _bucket_upper_bound(bucket: int) -> float:
+    """Return the largest duration in seconds that falls into ``bucket``."""
+    return 2.0 ** (bucket / _BUCKETS_PER_DOUBLING) / 1000.0
+
+
+def _build_summaries(
+    exits: Sequence[tuple[str, int, int, float, int]],
+    latency: Sequence[tuple[str, int, int]],
+    percentiles: Sequence[float],
+) -> list[CommandStats]:
+    """Combine rollup rows into :class:`CommandStats` entries."""
+    histograms: dict[str, list[tuple[int, int]]] = {}
+    for command, bucket, runs in latency:
+        histograms.setdefault(command, []).append((bucket, runs))
+    grouped: dict[str, list[tuple[int, int, float, int]]] = {}
+    for command, exit_code, runs, total_cpu, max_rss in exits:
+        grouped.setdefault(command, []).append((exit_code, runs, total_cpu, max_rss))
+    summaries: list[CommandStats] = []
+    for command, rows in grouped.items():
+        runs = sum(row[1] for row in rows)
+        histogram = histograms.get(command, [])
+        summaries.append(
+            CommandStats(
+                command=command,
+                runs=runs,
+                percentiles={p: _percentile(histogram, p) for p in percentiles},
+                exit_codes={row[0]: row[1] for row in rows},
+                mean_cpu=sum(row[2] for row in rows) / runs if runs else 0.0,
+                max_rss=max(row[3] for row in rows),
+            )
+        )
+    return summaries
+
+
+def _percentile(histogram: Sequence[tuple[int, int]], percentile: float) -> float:
+    """Return the upper bound of the bucket containing ``percentile``."""
+    total = sum(runs for _, runs in histogram)
+    if not total:
+        return 0.0
+    rank = max(1, math.ceil(total * percentile / 100.0))
+    seen = 0
+    for bucket, runs in histogram:
+        seen += runs
+        if seen >= rank:
+            return _bucket_upper_bound(bucket)
+    return _bucket_upper_bound(histogram[-1][0])
+
+
+def resource_usage() -> tuple[float | None, int | None]:
+    """Return ``(cpu_seconds, peak_rss_bytes)`` of this process so far.
+
+    Both values are ``None`` where :mod:`resource` is unavailable (Windows).
+    """
+    usage = sample_resource_usage()
+    if usage is None:
+        return None, None
+    return usage.cpu_time, usage.max_rss
+
+
+def stats_path_from_env(environ: Mapping[str, str] | None = None) -> str | None:
+    """Return the database path named by :data:`STATS_PATH_ENV`, if any."""
+    raw = (os.environ if environ is None else environ).get(STATS_PATH_ENV, "").strip()
+    return raw or None
@@ -0,0 +1,234 @@
+"""Capture of exceptions escaping worker threads during a command run.
+
+Purpose:
+    A worker thread that dies with an exception does not stop the main
+    thread, so a command can return ``0`` while part of its work failed; the
+    only trace is the default excepthook output on stderr. Recording those
+    failures lets ``run_cli`` fold them into the exit code.
+Contents:
+    * :class:`ThreadFailure` record of one captured exception.
+    * :class:`WorkerThreadFailed` raised in the command's thread to cancel it
+      after the first failure.
+    * :func:`watch_thread_failures` context manager installing
+      :func:`threading.excepthook` and :func:`sys.unraisablehook`.
+    * :func:`start_thread_watch` enabling the watch from inside a run.
+System Integration:
+    ``run_cli`` wraps command execution in :func:`watch_thread_failures` with
+    :attr:`config.thread_failures` (or its ``thread_failures`` parameter),
+    renders each failure through :func:`print_exception_message`, and turns
+    the first one into the exit code with :func:`get_system_exit_code`. The
+    bundled CLI's ``--thread-failures`` option calls :func:`start_thread_watch`
+    from the group callback.
+
+Cancellation:
+    With ``cancel`` enabled the first failure raises
+    :class:`WorkerThreadFailed` in the thread that entered the block, using
+    ``PyThreadState_SetAsyncExc``. It takes effect at the next bytecode, not
+    inside a blocking call such as ``Thread.join`` without a timeout.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator, Sequence
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from .events import emit_event
+from .runtime import raise_in_thread
+
+__all__ = [
+    "ThreadFailure",
+    "WorkerThreadFailed",
+    "start_thread_watch",
+    "watch_thread_failures",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class ThreadFailure:
+    """One exception captured by :func:`watch_thread_failures`.
+
+    Fields:
+        exception: The exception that escaped, with its traceback attached.
+        thread_name: Name of the thread it escaped from.
+        origin: Header describing where it was caught, e.g. ``Exception in
+            thread worker-1`` or ``Exception ignored in: <object>``.
+    """
+
+    exception: BaseException
+    thread_name: str
+    origin: str
+
+
+class WorkerThreadFailed(RuntimeError):
+    """Raised in the command's thread to cancel it after a worker thread failed.
+
+    Only a class can be injected into another thread, so the instance carries
+    no details; the failures themselves are in the watch's record.
+    """
+
+
+class _Withdrawn(Exception):
+    """Marker that replaces an undelivered cancellation so it can be consumed."""
+
+
+class _ThreadWatch:
+    """Hooks and failure record of one :func:`watch_thread_failures` block."""
+
+    __slots__ = ("_cancel", "_done", "_failures", "_injected", "_lock", "_render", "_restore", "_target")
+
+    def __init__(self, render: Callable[[ThreadFailure], None]) -> None:
+        self._cancel = False
+        self._done = False
+        self._failures: list[ThreadFailure] = []
+        self._injected = False
+        self._lock = threading.Lock()
+        self._render = render
+        self._restore: Callable[[], None] | None = None
+        self._target = threading.get_ident()
+
+    @property
+    def failures(self) -> list[ThreadFailure]:
+        """Failures recorded so far, oldest first."""
+        return self._failures
+
+    def start(self, cancel: bool) -> None:
+        """Install the hooks, or update ``cancel`` when they are installed."""
+        self._cancel = cancel
+        if self._restore is None:
+            self._restore = _install_hooks(self._record)
+
+    def finish(self) -> None:
+        """Stop cancelling, drop a cancellation not yet delivered, and put the previous hooks back."""
+        with self._lock:
+            self._done = True
+            if self._injected and threading.get_ident() == self._target:
+                _withdraw_pending_exception(self._target)
+        restore, self._restore = self._restore, None
+        if restore is not None:
+            restore()
+
+    def _record(self, failure: ThreadFailure) -> None:
+        """Store and render ``failure``; cancel the command on the first one.
+
+        The cancellation is injected under the lock, before the slow
+        rendering, so it cannot land after :meth:`finish` ended the block.
+        """
+        with self._lock:
+            self._failures.append(failure)
+            if self._cancel and not self._done and len(self._failures) == 1:
+                raise_in_thread(self._target, WorkerThreadFailed)
+                self._injected = True
+        emit_event("thread_failure", thread=failure.thread_name, exception=type(failure.exception).__name__)
+        with suppress(Exception):
+            self._render(failure)
+
+
+def _withdraw_pending_exception(ident: int) -> None:
+    """Replace an exception pending for the current thread and consume it here.
+
+    Why:
+        Clearing it with ``raise_in_thread(ident, None)`` would leave CPython
+        before 3.12 checking for an asynchronous exception at every bytecode
+        for the rest of the process; delivering a marker resets that check.
+    """
+    with suppress(_Withdrawn):
+        raise_in_thread(ident, _Withdrawn)
+        deadline = time.monotonic() + 0.1  # delivered at the first loop jump
+        while time.monotonic() < deadline:
+            pass
+
+
+_active: ContextVar[_ThreadWatch | None] = ContextVar("lib_cli_exit_tools_thread_watch", default=None)
+
+
+@contextmanager
+def watch_thread_failures(
+    enabled: bool,
+    *,
+    cancel: bool = False,
+    render: Callable[[ThreadFailure], None],
+) -> Generator[Sequence[ThreadFailure]]:
+    """Record exceptions escaping other threads while the block runs.
+
+    Parameters:
+        enabled: Install the hooks now; when ``False`` they are installed
+            only if :func:`start_thread_watch` is called inside the block.
+        cancel: Raise :class:`WorkerThreadFailed` in the calling thread on
+            the first failure.
+        render: Called with each failure from the failing thread, in place
+            of the default hook output.
+    Yields:
+        The live list of recorded failures, oldest first.
+    Side Effects:
+        Replaces :func:`threading.excepthook` and :func:`sys.unraisablehook`
+        for the duration of the block. Hooks installed by the host before
+        the block still run after ``render``; the interpreter's default
+        hooks do not, so failures are not printed twice. ``SystemExit`` in
+        a thread is ignored, as with the default hook.
+    """
+    watch = _ThreadWatch(render)
+    token = _active.set(watch)
+    if enabled:
+        watch.start(cancel)
+    try:
+        yield watch.failures
+    finally:
+        _active.reset(token)
+        watch.finish()
+
+
+def start_thread_watch(*, cancel: bool = False) -> bool:
+    """Install the hooks of the enclosing :func:`watch_thread_failures` block.
+
+    Returns:
+        ``False`` when called outside a :func:`watch_thread_failures` block.
+    """
+    watch = _active.get()
+    if watch is None:
+        return False
+    watch.start(cancel)
+    return True
+
+
+def _install_hooks(record: Callable[[ThreadFailure], None]) -> Callable[[], None]:
+    """Route thread and unraisable exceptions to ``record``; return the restorer."""
+    previous_thread_hook = threading.excepthook
+    previous_unraisable_hook = sys.unraisablehook
+
+    def _thread_hook(args: Any) -> None:
+        if args.exc_value is not None and not issubclass(args.exc_type, SystemExit):
+            name = args.thread.name if args.thread is not None else str(threading.get_ident())
+            record(ThreadFailure(args.exc_value, name, f"Exception in thread {name}"))
+        if previous_thread_hook is not threading.__excepthook__:
+            previous_thread_hook(args)
+
+    def _unraisable_hook(args: Any) -> None:
+        if args.exc_value is not None:
+            record(ThreadFailure(args.exc_value, threading.current_thread().name, _unraisable_origin(args)))
+        if previous_unraisable_hook is not sys.__unraisablehook__:
+            previous_unraisable_hook(args)
+
+    threading.excepthook = _thread_hook
+    sys.unraisablehook = _unraisable_hook
+
+    def _restore() -> None:
+        threading.excepthook = previous_thread_hook
+        sys.unraisablehook = previous_unraisable_hook
+
+    return _restore
+
+
+def _unraisable_origin(args: Any) -> str:
+    """Build the header the default unraisable hook would print."""
+    message = args.err_msg or "Exception ignored in"
+    if args.object is None:
+        return message
+    with suppress(Exception):
+        return f"{message}: {args.object!r}"
+    return message
@@ -0,0 +1,220 @@
+"""Wall-clock timeout for a command run under :func:`run_cli`.
+
+Purpose:
+    Stop scheduled jobs that hang (for example on a network filesystem)
+    without wrapping them in coreutils ``timeout``, which kills the process
+    from outside and so bypasses the CLI's own signal messages and exit-code
+    mapping.
+Contents:
+    * :data:`TIMEOUT_EXIT_CODE` – ``124``, the code ``timeout(1)`` uses.
+    * :func:`enforce_timeout` context manager raising
+      :class:`~lib_cli_exit_tools.adapters.signals.TimeoutInterrupt` inside
+      the enclosed block once the deadline passes.
+    * :func:`start_timeout` arming the timeout from inside a run.
+    * :func:`format_stacks` rendering the stacks of all threads.
+System Integration:
+    ``run_cli`` wraps command execution in :func:`enforce_timeout` with
+    :attr:`config.timeout` (or its ``timeout`` parameter); the bundled CLI's
+    ``--timeout`` option calls :func:`start_timeout` from the group callback.
+    :func:`handle_cli_exception` maps the interrupt to :data:`TIMEOUT_EXIT_CODE`.
+
+Delivery:
+    On the main thread of a POSIX interpreter the deadline is an
+    ``ITIMER_REAL`` timer whose ``SIGALRM`` handler raises the interrupt, so
+    blocking system calls are interrupted too. Elsewhere (Windows, or
+    ``run_cli`` called from a worker thread) a daemon watchdog thread injects
+    the interrupt into the running thread with
+    ``PyThreadState_SetAsyncExc``; it takes effect at the next bytecode, not
+    inside a blocking call. In both cases an optional grace period bounds the
+    time left for unwinding: when it expires the process exits immediately
+    with :data:`TIMEOUT_EXIT_CODE`.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import signal
+import sys
+import threading
+import traceback
+from collections.abc import Callable, Generator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from types import FrameType
+
+from .events import emit_event
+from .runtime import note, raise_in_thread
+from .signals import TimeoutInterrupt
+
+__all__ = [
+    "TIMEOUT_EXIT_CODE",
+    "enforce_timeout",
+    "format_stacks",
+    "start_timeout",
+]
+
+#: Exit code of a timed-out run, matching coreutils ``timeout``.
+TIMEOUT_EXIT_CODE = 124
+
+
+class _Deadline:
+    """Timer of one :func:`enforce_timeout` block, armed on demand."""
+
+    __slots__ = ("_disarm", "_done", "_lock", "_seconds")
+
+    def __init__(self) -> None:
+        self._disarm: Callable[[], None] | None = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._seconds = 0.0
+
+    def start(self, seconds: float, grace: float | None, dump_stacks: bool) -> None:
+        """Arm the deadline ``seconds`` from now, replacing an armed one."""
+        self.cancel()
+        self._seconds = seconds
+
+        def _expire() -> None:
+            self._expire(grace, dump_stacks)
+
+        if _alarm_available():
+            self._disarm = _arm_alarm(seconds, _expire)
+        else:
+            self._disarm = _arm_watchdog(seconds, _expire, self._done, self._lock)
+
+    def cancel(self) -> None:
+        """Disarm the timer if it is armed."""
+        disarm, self._disarm = self._disarm, None
+        if disarm is not None:
+            disarm()
+
+    def finish(self) -> None:
+        """Disarm the timer and stop a pending grace-period kill."""
+        with self._lock:
+            self._done.set()
+        self.cancel()
+
+    def _expire(self, grace: float | None, dump_stacks: bool) -> None:
+        """Record the timeout, dump stacks, and start the grace-period kill."""
+        emit_event("timeout", seconds=self._seconds)
+        if dump_stacks:
+            note(format_stacks())
+        if grace is not None:
+            threading.Thread(target=_kill_after, args=(grace, self._done), name="cli-timeout-kill", daemon=True).start()
+
+
+_active: ContextVar[_Deadline | None] = ContextVar("lib_cli_exit_tools_timeout", default=None)
+
+
+@contextmanager
+def enforce_timeout(
+    seconds: float | None,
+    *,
+    grace: float | None = None,
+    dump_stacks: bool = False,
+) -> Generator[None]:
+    """Interrupt the enclosed block with ``TimeoutInterrupt`` after ``seconds``.
+
+    Parameters:
+        seconds: Wall-clock limit; ``None`` leaves the block unlimited unless
+            :func:`start_timeout` is called from inside it.
+        grace: Seconds the interrupted block may spend unwinding before the
+            process exits with :data:`TIMEOUT_EXIT_CODE`; ``None`` waits
+            indefinitely.
+        dump_stacks: Print the stacks of all threads to stderr when the
+            deadline passes.
+    Side Effects:
+        On the main thread, replaces the ``SIGALRM`` handler and the
+        ``ITIMER_REAL`` timer for the duration of the block; otherwise starts
+        a daemon watchdog thread.
+    """
+    deadline = _Deadline()
+    token = _active.set(deadline)
+    if seconds is not None:
+        deadline.start(seconds, grace, dump_stacks)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+        deadline.finish()
+
+
+def start_timeout(seconds: float, *, grace: float | None = None, dump_stacks: bool = False) -> bool:
+    """Arm the enclosing :func:`enforce_timeout` block, counting from now.
+
+    Why:
+        Click group callbacks (such as ``--timeout``) run inside the command,
+        after :func:`enforce_timeout` has been entered.
+    Returns:
+        ``False`` when called outside an :func:`enforce_timeout` block.
+    """
+    deadline = _active.get()
+    if deadline is None:
+        return False
+    deadline.start(seconds, grace, dump_stacks)
+    return True
+
+
+def format_stacks() -> str:
+    """Render the current stack of every thread, innermost frame last."""
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    blocks: list[str] = []
+    for ident, frame in sys._current_frames().items():  # pyright: ignore[reportPrivateUsage]
+        stack = "".join(traceback.format_stack(frame))
+        blocks.append(f"Thread {names.get(ident, ident)} ({ident}):\n{stack}")
+    return "\n".join(blocks)
+
+
+def _alarm_available() -> bool:
+    """Return ``True`` when ``SIGALRM`` can deliver the timeout to this thread."""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+def _arm_alarm(seconds: float, on_expiry: Callable[[], None]) -> Callable[[], None]:
+    """Schedule ``SIGALRM`` after ``seconds`` and return the disarming callable."""
+
+    def _handler(signo: int, frame: FrameType | None) -> None:
+        on_expiry()
+        raise TimeoutInterrupt(seconds)
+
+    previous = signal.signal(signal.SIGALRM, _handler)
+    signal.setitimer(signal.ITIMER_REAL, max(seconds, 1e-6))
+
+    def _disarm() -> None:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+    return _disarm
+
+
+def _arm_watchdog(
+    seconds: float,
+    on_expiry: Callable[[], None],
+    done: threading.Event,
+    lock: threading.Lock,
+) -> Callable[[], None]:
+    """Start a watchdog injecting the interrupt into the calling thread."""
+    target = threading.get_ident()
+    cancelled = threading.Event()
+
+    def _watch() -> None:
+        if cancelled.wait(seconds):
+            return
+        with lock:
+            if done.is_set() or cancelled.is_set():
+                return
+            on_expiry()
+            raise_in_thread(target, TimeoutInterrupt)
+
+    context = contextvars.copy_context()  # the ``timeout`` event reaches the run's stream
+    threading.Thread(target=context.run, args=(_watch,), name="cli-timeout-watchdog", daemon=True).start()
+    return cancelled.set
+
+
+def _kill_after(grace: float, done: threading.Event) -> None:
+    """Exit the process with :data:`TIMEOUT_EXIT_CODE` unless ``done`` is set in time."""
+    if done.wait(grace):
+        return
+    with suppress(OSError):
+        os.write(2, f"Timeout grace period of {grace:g}s expired; killing.\n".encode())
+    os._exit(TIMEOUT_EXIT_CODE)
@@ -0,0 +1,179 @@
+"""Heartbeat watchdog reporting commands that stop making progress.
+
+Purpose:
+    A hung job is otherwise noticed only when a scheduler-wide timeout kills
+    it hours later, and a wall-clock timeout has to allow for the
+    slowest healthy run. Commands that call :func:`heartbeat` from their
+    main loop can instead be reported (and optionally interrupted) as soon
+    as the heartbeats stop for a short interval.
+Contents:
+    * :data:`STALL_EXIT_CODE` – ``125``, the exit code of an interrupted
+      stall.
+    * :func:`heartbeat` recording progress from any thread.
+    * :func:`watch_heartbeat` context manager watching the enclosed block.
+    * :func:`start_watchdog` arming the watchdog from inside a run.
+System Integration:
+    ``run_cli`` wraps command execution in :func:`watch_heartbeat` with
+    :attr:`config.watchdog` (or its ``watchdog`` parameter); the bundled
+    CLI's ``--watchdog`` option calls :func:`start_watchdog` from the group
+    callback. :func:`handle_cli_exception` maps
+    :class:`~lib_cli_exit_tools.adapters.signals.StallInterrupt` to
+    :data:`STALL_EXIT_CODE`.
+
+Detection:
+    :func:`heartbeat` increments a module-level integer without a lock, so
+    it can sit in tight loops; concurrent calls may lose an increment, but
+    the count still changes. A daemon thread compares the count a few times
+    per interval. Once it has not changed for the whole interval, the thread
+    prints the stacks of all threads to stderr and emits a ``stall`` event;
+    with ``interrupt`` it then injects :class:`StallInterrupt` into the
+    watched thread with ``PyThreadState_SetAsyncExc``, which takes effect at
+    the next bytecode, not inside a blocking call. Without ``interrupt`` the
+    stall is reported once and the watchdog re-arms when heartbeats resume.
+    The count is process-wide, so concurrent runs keep each other alive.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .events import emit_event
+from .runtime import note, raise_in_thread
+from .signals import StallInterrupt
+from .timeout import format_stacks
+
+__all__ = [
+    "STALL_EXIT_CODE",
+    "heartbeat",
+    "start_watchdog",
+    "watch_heartbeat",
+]
+
+#: Exit code of a run interrupted for missing heartbeats, next to ``timeout(1)``'s ``124``.
+STALL_EXIT_CODE = 125
+
+#: Checks of the heartbeat count per interval.
+_CHECKS_PER_INTERVAL = 4
+#: Upper bound in seconds between two checks.
+_MAX_CHECK_PERIOD = 1.0
+
+_beats: int = 0
+
+
+def heartbeat() -> None:
+    """Tell the watchdog that the command is still making progress.
+
+    Why:
+        A lock-free integer increment, cheap enough for the innermost loop
+        and safe to call from any thread or outside a watched run.
+    """
+    global _beats
+    _beats += 1
+
+
+class _Watchdog:
+    """Watcher thread of one :func:`watch_heartbeat` block, armed on demand."""
+
+    __slots__ = ("_done", "_lock", "_stopped")
+
+    def __init__(self) -> None:
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._stopped: threading.Event | None = None
+
+    def start(self, seconds: float, interrupt: bool) -> None:
+        """Start watching the calling thread, replacing a running watcher."""
+        self.cancel()
+        stopped = self._stopped = threading.Event()
+        context = contextvars.copy_context()  # the ``stall`` event reaches the run's stream
+        threading.Thread(
+            target=context.run,
+            args=(self._watch, seconds, interrupt, threading.get_ident(), stopped),
+            name="cli-heartbeat-watchdog",
+            daemon=True,
+        ).start()
+
+    def cancel(self) -> None:
+        """Stop the watcher thread if one is running."""
+        stopped, self._stopped = self._stopped, None
+        if stopped is not None:
+            stopped.set()
+
+    def finish(self) -> None:
+        """Stop the watcher and make sure it no longer interrupts the block."""
+        with self._lock:
+            self._done.set()
+        self.cancel()
+
+    def _watch(self, seconds: float, interrupt: bool, target: int, stopped: threading.Event) -> None:
+        """Report a stall once the heartbeat count stays unchanged for ``seconds``."""
+        period = min(seconds / _CHECKS_PER_INTERVAL, _MAX_CHECK_PERIOD)
+        seen, last_change, reported = _beats, time.monotonic(), False
+        while not stopped.wait(period):
+            beats, now = _beats, time.monotonic()
+            if beats != seen:
+                seen, last_change, reported = beats, now, False
+            elif not reported and now - last_change >= seconds:
+                reported = True
+                with self._lock:
+                    if self._done.is_set() or stopped.is_set():
+                        return
+                    _report_stall(now - last_change)
+                    if interrupt:
+                        raise_in_thread(target, StallInterrupt)
+                        return
+
+
+_active: ContextVar[_Watchdog | None] = ContextVar("lib_cli_exit_tools_watchdog", default=None)
+
+
+@contextmanager
+def watch_heartbeat(seconds: float | None, *, interrupt: bool = False) -> Generator[None]:
+    """Report the enclosed block when :func:`heartbeat` is silent for ``seconds``.
+
+    Parameters:
+        seconds: Longest allowed gap between heartbeats; the block's start
+            counts as the first one. ``None`` leaves the block unwatched
+            unless :func:`start_watchdog` is called from inside it.
+        interrupt: Raise :class:`StallInterrupt` in the enclosed block after
+            reporting the stall.
+    Side Effects:
+        Starts a daemon watcher thread; a stall prints all thread stacks to
+        stderr and emits a ``stall`` lifecycle event.
+    """
+    watchdog = _Watchdog()
+    token = _active.set(watchdog)
+    if seconds is not None:
+        watchdog.start(seconds, interrupt)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+        watchdog.finish()
+
+
+def start_watchdog(seconds: float, *, interrupt: bool = False) -> bool:
+    """Arm the enclosing :func:`watch_heartbeat` block, counting from now.
+
+    Why:
+        Click group callbacks (such as ``--watchdog``) run inside the
+        command, after :func:`watch_heartbeat` has been entered.
+    Returns:
+        ``False`` when called outside a :func:`watch_heartbeat` block.
+    """
+    watchdog = _active.get()
+    if watchdog is None:
+        return False
+    watchdog.start(seconds, interrupt)
+    return True
+
+
+def _report_stall(idle: float) -> None:
+    """Emit the ``stall`` event and print the stacks of all threads."""
+    emit_event("stall", seconds=round(idle, 3), heartbeats=_beats)
+    note(f"No heartbeat for {idle:.1f}s; stacks of all threads:\n{format_stacks()}")
@@ -0,0 +1,141 @@
+"""In-process retries of transient command failures.
+
+Purpose:
+    Rerunning a whole CLI process after a dropped connection costs a full
+    interpreter start-up; re-invoking the command inside the running process
+    only costs the command itself.
+Contents:
+    * :class:`RetryPolicy` describing attempts, exponential backoff with
+      jitter, and a cap on total retry time.
+    * :func:`call_with_retry` running a callable under a policy.
+System Integration:
+    :func:`lib_cli_exit_tools.run_cli` wraps command invocation in
+    :func:`call_with_retry` when given a ``retry`` policy; failures are
+    classified by :func:`lib_cli_exit_tools.core.exit_codes.is_transient`
+    unless the policy supplies its own predicate. Every retry is announced
+    on stderr and as a ``retry`` lifecycle event.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TypeVar
+
+from ..adapters.events import emit_event
+from ..core.exit_codes import is_transient
+
+__all__ = ["RetryPolicy", "call_with_retry"]
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Describe when and how often a failed command is re-invoked.
+
+    Fields:
+        attempts: Total number of invocations, including the first one.
+        initial_delay: Seconds before the first retry.
+        multiplier: Growth factor applied to the delay after each retry.
+        max_delay: Upper bound for a single delay before jitter.
+        jitter: Fraction of each delay that is randomised; ``1.0`` ("full
+            jitter") picks uniformly between zero and the delay, ``0.0``
+            makes delays deterministic. Spreads out clients that failed
+            together.
+        max_total: Seconds after the first attempt started beyond which no
+            retry is scheduled; ``None`` removes the cap.
+        retry_on: Predicate deciding which failures are retried; defaults to
+            :func:`~lib_cli_exit_tools.core.exit_codes.is_transient`.
+        on_retry: Optional callback receiving ``(attempt, exception, delay)``
+            before each retry sleeps.
+    """
+
+    attempts: int = 3
+    initial_delay: float = 0.1
+    multiplier: float = 2.0
+    max_delay: float = 5.0
+    jitter: float = 1.0
+    max_total: float | None = 30.0
+    retry_on: Callable[[BaseException], bool] = is_transient
+    on_retry: Callable[[int, BaseException, float], None] | None = None
+
+    def backoff(self, attempt: int, sample: float | None = None) -> float:
+        """Return the delay in seconds after failed attempt number ``attempt``.
+
+        Parameters:
+            attempt: 1-based number of the attempt that just failed.
+            sample: Random value in ``[0, 1)`` used for jitter; drawn from
+                :func:`random.random` when omitted.
+        Examples:
+            >>> policy = RetryPolicy(initial_delay=0.1, multiplier=2.0, max_delay=0.3)
+            >>> [round(policy.backoff(n, sample=0.0), 3) for n in (1, 2, 3)]
+            [0.1, 0.2, 0.3]
+            >>> round(policy.backoff(2, sample=0.5), 3)
+            0.1
+        """
+        ceiling = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        drawn = random.random() if sample is None else sample
+        return ceiling * (1.0 - self.jitter * drawn)
+
+
+def call_with_retry(
+    action: Callable[[], _T],
+    policy: RetryPolicy,
+    *,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> _T:
+    """Run ``action``, re-invoking it after failures that ``policy`` retries.
+
+    Parameters:
+        action: Zero-argument callable to run.
+        policy: Retry settings.
+        sleep: Replacement for :func:`time.sleep` (tests).
+        clock: Replacement for :func:`time.monotonic` (tests).
+    Returns:
+        The result of the first successful invocation.
+    Raises:
+        BaseException: The last failure, unchanged, once it is permanent, the
+            attempts are used up, or the next delay would overrun
+            :attr:`RetryPolicy.max_total`.
+    """
+    started = clock()
+    attempt = 1
+    while True:
+        try:
+            return action()
+        except BaseException as exc:
+            delay = _retry_delay(policy, attempt, exc, clock() - started)
+            if delay is None:
+                raise
+            failure = exc
+        _announce_retry(policy, attempt, failure, delay)
+        sleep(delay)
+        attempt += 1
+
+
+def _retry_delay(policy: RetryPolicy, attempt: int, exc: BaseException, elapsed: float) -> float | None:
+    """Return the delay before the next attempt, or ``None`` to give up."""
+    if attempt >= policy.attempts or not policy.retry_on(exc):
+        return None
+    delay = policy.backoff(attempt)
+    if policy.max_total is not None and elapsed + delay > policy.max_total:
+        return None
+    return delay
+
+
+def _announce_retry(policy: RetryPolicy, attempt: int, exc: BaseException, delay: float) -> None:
+    """Report an upcoming retry on stderr, the event stream, and ``on_retry``."""
+    emit_event("retry", attempt=attempt, delay=round(delay, 6), exception=type(exc).__name__)
+    with suppress(Exception):
+        print(
+            f"retry: attempt {attempt} of {policy.attempts} failed ({type(exc).__name__}: {exc}); retrying in {delay:.2f}s",
+            file=sys.stderr,
+        )
+    if policy.on_retry is not None:
+        policy.on_retry(attempt, exc, delay)
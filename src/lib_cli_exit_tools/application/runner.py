@@ -9,6 +9,8 @@ Contents:
       diagnostics.
     * :func:`run_cli` – orchestrates signal installation, command execution, and
       cleanup.
+    * :func:`run_cli_async` – :func:`run_cli` for ``async def`` commands, with
+      signals delivered as task cancellation.
     * Supporting utilities for Rich-based output and stream management.
 System Integration:
     Imported by the package root and CLI adapters to keep behaviour consistent
@@ -18,7 +20,11 @@ System Integration:
 
 from __future__ import annotations
 
+import atexit
+import inspect
+import os
 import sys
+import time
 from contextlib import contextmanager, nullcontext, suppress
 from typing import Callable, ContextManager, Generator, Iterable, Literal, Protocol, Sequence, TextIO, TypedDict, cast
 
@@ -28,9 +34,58 @@ from rich.console import Console
 from rich.text import Text
 from rich.traceback import Traceback
 
-from ..adapters.signals import SignalSpec, default_signal_specs, install_signal_handlers
-from ..core.configuration import ExitCodeStyle, config, config_overrides
+from ..adapters.broken_pipe import discard_stdout, install_broken_pipe_strategy
+from ..adapters.cancellation import cancellation_scope
+from ..adapters.event_loop import DEFAULT_DRAIN_TIMEOUT, LoopFactory, event_loop_session, run_awaitable
+from ..adapters.events import (
+    EventStream,
+    activate_event_stream,
+    deactivate_event_stream,
+    emit_event,
+    event_stream_from_env,
+)
+from ..adapters.flush import flush_within
+from ..adapters.gc_policy import GcPolicy, GcStats, apply_gc_policy
+from ..adapters.memory_limit import MemoryReserve, memory_limited
+from ..adapters.memory_trace import report_memory_trace, traced_memory
+from ..adapters.profiling import profiled
+from ..adapters.rusage import format_resource_report, sample_resource_report
+from ..adapters.signals import (
+    SignalSpec,
+    StallInterrupt,
+    TimeoutInterrupt,
+    default_signal_specs,
+    install_signal_handlers,
+)
+from ..adapters.stats import RunRecord, StatsStore, resource_usage, stats_path_from_env
+from ..adapters.thread_failures import ThreadFailure, WorkerThreadFailed, watch_thread_failures
+from ..adapters.timeout import TIMEOUT_EXIT_CODE, enforce_timeout
+from ..adapters.watchdog import STALL_EXIT_CODE, watch_heartbeat
+from ..core.configuration import (
+    BrokenPipeStrategy,
+    ExitCodeStyle,
+    ForkSignalPolicy,
+    RusageFormat,
+    config,
+    config_overrides,
+)
 from ..core.exit_codes import get_system_exit_code
+from .retry import RetryPolicy, call_with_retry
+from .timings import (
+    PHASE_COMMAND,
+    PHASE_FINALISE,
+    PHASE_HANDLE_EXCEPTION,
+    PHASE_PARSE,
+    PHASE_PRINT_EXCEPTION,
+    PHASE_SIGNALS,
+    PhaseHook,
+    PhaseTimings,
+    activate_timings,
+    current_timings,
+    deactivate_timings,
+    install_invoke_probe,
+    timed_phase,
+)
 
 RichColorSystem = Literal["auto", "standard", "256", "truecolor", "windows"]
 ExitResolver = Callable[[BaseException], int | None]
@@ -46,7 +101,27 @@ class SessionOverrides(TypedDict, total=False):
     traceback: bool
     exit_code_style: ExitCodeStyle
     broken_pipe_exit_code: int
+    broken_pipe_strategy: BrokenPipeStrategy
     traceback_force_color: bool
+    fast_exit: bool
+    flush_deadline: float | None
+    flush_truncated_exit_code: int
+    timings: bool
+    stats_path: str | None
+    rusage: RusageFormat | None
+    profile_path: str | None
+    profile_top: int
+    trace_memory: int | None
+    trace_memory_snapshot: str | None
+    timeout: float | None
+    timeout_grace: float | None
+    timeout_dump_stacks: bool
+    watchdog: float | None
+    watchdog_interrupt: bool
+    max_memory: int | None
+    thread_failures: bool
+    cancel_on_thread_failure: bool
+    fork_signal_policy: ForkSignalPolicy
 
 
 class ClickCommand(Protocol):
@@ -59,7 +134,7 @@ class ClickCommand(Protocol):
         complete_var: str | None = ...,
         standalone_mode: bool = ...,
         **_: object,
-    ) -> None: ...
+    ) -> object: ...
 
 
 __all__ = [
@@ -67,6 +142,7 @@ __all__ = [
     "print_exception_message",
     "flush_streams",
     "run_cli",
+    "run_cli_async",
     "cli_session",
     "SessionOverrides",
 ]
@@ -95,20 +171,34 @@ def _default_echo(message: str, *, err: bool = True) -> None:
     click.echo(message, err=err)
 
 
-def flush_streams() -> None:
+def flush_streams(deadline: float | None = None) -> int:
     """Flush standard streams so diagnostics do not linger in buffers.
 
     Why:
         Rich tracebacks and click output use buffering; flushing ensures users
         see diagnostics even when the process exits immediately afterward.
+    Parameters:
+        deadline: Optional number of seconds the flush may wait on a stalled
+            pipe reader (POSIX descriptors only). Output still unwritten when
+            it expires is dropped and stdio is redirected to
+            :data:`os.devnull`. ``None`` waits indefinitely.
     Returns:
-        ``None``.
+        Number of bytes dropped because the deadline expired.
     Side Effects:
         Calls ``flush`` on ``sys.stdout`` and ``sys.stderr`` when available.
     """
 
-    for stream in _streams_to_flush():
-        _flush_stream(stream)
+    return _flush_streams_until(_deadline_at(deadline))
+
+
+def _deadline_at(deadline: float | None) -> float | None:
+    """Convert a relative ``deadline`` in seconds into a monotonic timestamp."""
+    return None if deadline is None else time.monotonic() + deadline
+
+
+def _flush_streams_until(deadline_at: float | None) -> int:
+    """Flush every standard stream against a shared deadline and sum dropped bytes."""
+    return sum(_flush_stream(stream, deadline_at) for stream in _streams_to_flush())
 
 
 def _streams_to_flush() -> Iterable[object]:
@@ -126,18 +216,40 @@ def _streams_to_flush() -> Iterable[object]:
             yield stream
 
 
-def _flush_stream(stream: object) -> None:
+def _flush_streams_reliably() -> bool:
+    """Flush standard streams and report whether every flush succeeded.
+
+    Why:
+        :func:`flush_streams` swallows errors because it is best-effort; the
+        fast-exit path must know whether output actually reached its target
+        before bypassing the interpreter's own final flush.
+    Returns:
+        ``True`` when all streams flushed without raising.
+    """
+    for stream in _streams_to_flush():
+        flush = getattr(stream, "flush", None)
+        if not callable(flush):
+            continue
+        try:
+            flush()
+        except (OSError, ValueError):  # write failure or closed stream
+            return False
+    return True
+
+
+def _flush_stream(stream: object, deadline_at: float | None = None) -> int:
     """Flush ``stream`` if it exposes a callable ``flush`` attribute.
 
     Parameters:
         stream: Object potentially offering a ``flush`` method.
+        deadline_at: Optional monotonic timestamp bounding the flush.
     Returns:
-        ``None``; silently ignores errors because flushing is best-effort.
+        Bytes dropped at the deadline; silently ignores errors because
+        flushing is best-effort.
     """
-    flush = getattr(stream, "flush", None)
-    if callable(flush):  # pragma: no branch - simple guard
-        with suppress(Exception):  # pragma: no cover - best effort
-            flush()
+    with suppress(Exception):  # pragma: no cover - best effort
+        return flush_within(stream, deadline_at)
+    return 0
 
 
 def _build_console(
@@ -219,6 +331,8 @@ def print_exception_message(
     trace_back: bool | None = None,
     length_limit: int = 500,
     stream: TextIO | None = None,
+    *,
+    exc: BaseException | None = None,
 ) -> None:
     """Emit the active exception message and optional traceback to ``stream``.
 
@@ -232,13 +346,26 @@ def print_exception_message(
         length_limit: Maximum length of the summary string when tracebacks are
             suppressed.
         stream: Target text stream; defaults to ``sys.stderr``.
+        exc: Exception to render instead of the active one, e.g. one caught
+            in another thread.
     Side Effects:
         Flushes standard streams, inspects ``sys.exc_info()``, and prints via
         Rich using the active colour configuration.
     """
 
-    flush_streams()
-    exc_info = _active_exception()
+    with timed_phase(PHASE_PRINT_EXCEPTION):
+        _print_active_exception(trace_back, length_limit, stream, exc)
+
+
+def _print_active_exception(
+    trace_back: bool | None,
+    length_limit: int,
+    stream: TextIO | None,
+    exc: BaseException | None = None,
+) -> None:
+    """Render ``exc`` or ``sys.exc_info()`` as configured by :func:`print_exception_message`."""
+    _flush_streams_by_deadline()
+    exc_info = exc if exc is not None else _active_exception()
     if exc_info is None:
         return
 
@@ -250,7 +377,7 @@ def print_exception_message(
 
     _render_exception_view(console, exc_info, render_traceback, length_limit)
     _finalise_console(console)
-    flush_streams()
+    _flush_streams_by_deadline()
 
 
 def _active_exception() -> BaseException | None:
@@ -350,12 +477,17 @@ def handle_cli_exception(
         Integer exit code suitable for :func:`sys.exit`.
     Side Effects:
         May write to stderr, invoke :func:`print_exception_message`, and render
-        rich tracebacks when requested.
+        rich tracebacks when requested. Inside a ``run_cli`` call with memory
+        tracing enabled, the allocation report is printed here while the
+        failing frames are still alive.
     """
 
     specs = _resolve_signal_specs(signal_specs)
     echo_fn = _choose_echo(echo)
-    return _resolve_exit_code(exc, specs, echo_fn)
+    with timed_phase(PHASE_HANDLE_EXCEPTION):
+        exit_code = _resolve_exit_code(exc, specs, echo_fn)
+    report_memory_trace()
+    return exit_code
 
 
 def _choose_echo(echo: _Echo | None) -> _Echo:
@@ -369,22 +501,32 @@ def _resolve_exit_code(
     echo: _Echo,
 ) -> int:
     """Walk the resolver chain until a numeric exit code emerges."""
-    for resolver in _exception_resolvers(specs, echo):
+    for name, resolver in _exception_resolvers(specs, echo):
         code = resolver(exc)
         if code is not None:
+            _emit_resolved_event(name, code, exc)
             return code
-    return _render_and_translate(exc)
+    code = _render_and_translate(exc)
+    _emit_resolved_event("exception", code, exc)
+    return code
 
 
 def _exception_resolvers(
     specs: Sequence[SignalSpec],
     echo: _Echo,
-) -> Iterable[ExitResolver]:
-    """Yield exit-code resolver callables in priority order."""
-    yield _signal_resolver(specs, echo)
-    yield _broken_pipe_exit
-    yield _click_exit_code
-    yield _system_exit_code
+) -> Iterable[tuple[str, ExitResolver]]:
+    """Yield ``(name, resolver)`` pairs in priority order."""
+    yield "timeout", _timeout_resolver(echo)
+    yield "stall", _stall_resolver(echo)
+    yield "signal", _signal_resolver(specs, echo)
+    yield "broken_pipe", _broken_pipe_exit
+    yield "click", _click_exit_code
+    yield "system_exit", _system_exit_code
+
+
+def _emit_resolved_event(resolver: str, exit_code: int, exc: BaseException) -> None:
+    """Record which resolver produced ``exit_code`` on the event stream."""
+    emit_event("resolved", resolver=resolver, exit_code=exit_code, exception=type(exc).__name__)
 
 
 def _signal_resolver(
@@ -399,6 +541,40 @@ def _signal_resolver(
     return _resolver
 
 
+def _timeout_resolver(echo: _Echo) -> ExitResolver:
+    """Wrap :func:`_timeout_exit_code` with the captured echo function."""
+
+    def _resolver(exc: BaseException) -> int | None:
+        return _timeout_exit_code(exc, echo)
+
+    return _resolver
+
+
+def _timeout_exit_code(exc: BaseException, echo: _Echo) -> int | None:
+    """Return ``124`` for a :class:`TimeoutInterrupt`, as ``timeout(1)`` does."""
+    if not isinstance(exc, TimeoutInterrupt):
+        return None
+    echo(f"Timed out after {exc.seconds:g}s." if exc.seconds is not None else "Timed out.", err=True)
+    return TIMEOUT_EXIT_CODE
+
+
+def _stall_resolver(echo: _Echo) -> ExitResolver:
+    """Wrap :func:`_stall_exit_code` with the captured echo function."""
+
+    def _resolver(exc: BaseException) -> int | None:
+        return _stall_exit_code(exc, echo)
+
+    return _resolver
+
+
+def _stall_exit_code(exc: BaseException, echo: _Echo) -> int | None:
+    """Return ``125`` for a :class:`StallInterrupt` raised by the heartbeat watchdog."""
+    if not isinstance(exc, StallInterrupt):
+        return None
+    echo(f"Stalled: no heartbeat for {exc.seconds:g}s." if exc.seconds is not None else "Stalled.", err=True)
+    return STALL_EXIT_CODE
+
+
 def _resolve_signal_specs(specs: Sequence[SignalSpec] | None) -> Sequence[SignalSpec]:
     """Resolve caller-provided signal specs, defaulting to standard ones."""
     return specs if specs is not None else default_signal_specs()
@@ -524,6 +700,17 @@ def cli_session(
             install_signals: bool = True,
             exception_handler: Callable[[BaseException], int] | None = None,
             signal_installer: Callable[[Sequence[SignalSpec] | None], Callable[[], None]] | None = None,
+            fast_exit: bool | None = None,
+            gc_policy: GcPolicy | None = None,
+            phase_hook: PhaseHook | None = None,
+            event_fd: int | None = None,
+            rusage: RusageFormat | None = None,
+            trace_memory: int | None = None,
+            timeout: float | None = None,
+            watchdog: float | None = None,
+            max_memory: int | None = None,
+            retry: RetryPolicy | None = None,
+            thread_failures: bool | None = None,
         ) -> int:
             chosen_handler = exception_handler or handler
             return run_cli(
@@ -534,6 +721,17 @@ def cli_session(
                 install_signals=install_signals,
                 exception_handler=chosen_handler,
                 signal_installer=signal_installer,
+                fast_exit=fast_exit,
+                gc_policy=gc_policy,
+                phase_hook=phase_hook,
+                event_fd=event_fd,
+                rusage=rusage,
+                trace_memory=trace_memory,
+                timeout=timeout,
+                watchdog=watchdog,
+                max_memory=max_memory,
+                retry=retry,
+                thread_failures=thread_failures,
             )
 
         yield _run
@@ -603,6 +801,17 @@ def run_cli(
     install_signals: bool = True,
     exception_handler: Callable[[BaseException], int] | None = None,
     signal_installer: Callable[[Sequence[SignalSpec] | None], Callable[[], None]] | None = None,
+    fast_exit: bool | None = None,
+    gc_policy: GcPolicy | None = None,
+    phase_hook: PhaseHook | None = None,
+    event_fd: int | None = None,
+    rusage: RusageFormat | None = None,
+    trace_memory: int | None = None,
+    timeout: float | None = None,
+    watchdog: float | None = None,
+    max_memory: int | None = None,
+    retry: RetryPolicy | None = None,
+    thread_failures: bool | None = None,
 ) -> int:
     """Execute a Click command with shared signal/error handling installed.
 
@@ -616,26 +825,278 @@ def run_cli(
         prog_name: Override for Click's displayed program name.
         signal_specs: Optional signal configuration overriding the defaults.
         install_signals: When ``False`` skips handler registration (useful for
-            hosts that already manage signals).
+            hosts that already manage signals). On worker threads the run
+            subscribes to the relay from :func:`install_signal_relay`.
         exception_handler: Callable returning an exit code when exceptions
             occur; defaults to :func:`handle_cli_exception`.
         signal_installer: Callable responsible for installing signal handlers;
             defaults to :func:`install_signal_handlers`.
+        fast_exit: When ``True`` terminate the process via :func:`os._exit`
+            after flushing and running ``atexit`` callbacks instead of
+            returning; ``None`` defers to :data:`config.fast_exit`. Falls back
+            to a normal return when flushing fails.
+        gc_policy: Optional :class:`GcPolicy` applied right before the command
+            runs (freeze the post-import heap, raise thresholds, or disable
+            collection) and reverted during finalisation.
+        phase_hook: Optional callback receiving ``(phase, started, finished)``
+            monotonic timestamps as each phase of the run completes (see
+            :mod:`lib_cli_exit_tools.application.timings`). With
+            :data:`config.timings` enabled the breakdown is also printed to
+            stderr.
+        event_fd: Descriptor receiving NDJSON lifecycle events (``start``,
+            ``resolved``, ``signal``, ``exit``); ``None`` falls back to the
+            ``LIB_CLI_EXIT_TOOLS_EVENT_FD`` environment variable. See
+            :mod:`lib_cli_exit_tools.adapters.events`.
+        rusage: Print wall time, CPU, peak RSS, context switches, and block
+            I/O of the process and its children to stderr once the run ends,
+            successfully or not, as :attr:`RusageFormat.HUMAN` text or
+            :attr:`RusageFormat.JSON`; ``None`` defers to
+            :data:`config.rusage`. Skipped where :mod:`resource` is missing.
+        trace_memory: Trace allocations with :mod:`tracemalloc` and report
+            the peak plus this many top allocation sites to stderr once the
+            command ends, or from :func:`handle_cli_exception` when it fails;
+            ``None`` defers to :data:`config.trace_memory`.
+        timeout: Wall-clock seconds the command may run before it is
+            interrupted with :class:`TimeoutInterrupt`, which resolves to exit
+            code ``124``; ``None`` defers to :data:`config.timeout`.
+            :data:`config.timeout_grace` bounds the unwinding that follows and
+            :data:`config.timeout_dump_stacks` prints all thread stacks first.
+        watchdog: Longest gap in seconds between two :func:`heartbeat` calls
+            from the command before the stacks of all threads are printed
+            to stderr as a stall report; ``None`` defers to
+            :data:`config.watchdog`. With :data:`config.watchdog_interrupt`
+            the stall also raises :class:`StallInterrupt`, which resolves to
+            exit code ``125``.
+        max_memory: Memory ceiling in bytes applied with ``setrlimit`` while
+            the command runs, so runaway allocations raise ``MemoryError``
+            (exit code ``12``, or ``71`` in sysexits mode); ``None`` defers to
+            :data:`config.max_memory`. A small reserve allocated with the
+            ceiling is freed before a ``MemoryError`` is handled so its
+            summary can still be rendered.
+        retry: Optional :class:`RetryPolicy`; failures it classifies as
+            transient (see
+            :func:`~lib_cli_exit_tools.core.exit_codes.is_transient`) re-invoke the command in this
+            process after an exponential, jittered backoff, until the attempts
+            or :attr:`RetryPolicy.max_total` run out. Only the last failure
+            reaches ``exception_handler``. Output of failed attempts is not
+            withdrawn, so retry only commands that are safe to repeat.
+        thread_failures: Capture exceptions escaping worker threads (and
+            unraisable exceptions) while the command runs, render each through
+            :func:`print_exception_message`, and turn a successful exit into
+            the :func:`get_system_exit_code` of the first one; ``None`` defers
+            to :data:`config.thread_failures`. With
+            :data:`config.cancel_on_thread_failure` the first failure also
+            cancels the command.
     Returns:
         Integer exit code suitable for :func:`sys.exit`.
     Side Effects:
-        May install process-wide signal handlers, execute the Click command, and
-        flush IO streams.
+        May install process-wide signal handlers (including ``SIGPIPE`` under
+        :attr:`BrokenPipeStrategy.SIGNAL`), execute the Click command, and
+        flush IO streams. With :data:`config.stats_path` set, appends a run
+        record to the statistics database. With fast exit enabled the process
+        ends here. The run's :class:`CancellationToken` (see
+        :func:`current_cancellation_token`) is cancelled when a
+        :class:`SignalSpec` fires, so worker threads can stop.
     """
 
     specs = _resolve_signal_specs(signal_specs)
     handler = _choose_exception_handler(exception_handler, specs)
-    restorer = _install_signal_handlers_when_requested(install_signals, signal_installer, specs)
+    events = _resolve_event_stream(event_fd)
+    started = time.monotonic()
+    with _instrumented_run(phase_hook, events) as timings:
+        _emit_start_event(argv, prog_name)
+        with timed_phase(PHASE_SIGNALS):
+            restorer = _install_signal_handlers_when_requested(install_signals, signal_installer, specs)
+            pipe_restorer = install_broken_pipe_strategy(config.broken_pipe_strategy)
+            gc_restorer = _apply_gc_policy_when_requested(gc_policy)
+        try:
+            exit_code = _run_command_with_handler(
+                cli,
+                argv,
+                prog_name,
+                handler,
+                memory_top=_memory_top(trace_memory),
+                timeout=_timeout_seconds(timeout),
+                watchdog=_watchdog_seconds(watchdog),
+                max_memory=_memory_ceiling(max_memory),
+                retry=retry,
+                thread_failures=_thread_watch_enabled(thread_failures),
+            )
+        finally:
+            with timed_phase(PHASE_FINALISE):
+                dropped = _finalise_cli_run(restorer, pipe_restorer, gc_restorer)
+    _report_timings_if_requested(timings)
+    _report_rusage_if_requested(rusage, started)
+    exit_code = _exit_code_after_flush(exit_code, dropped)
+    _emit_exit_event(events, exit_code, started)
+    _record_stats_if_enabled(cli, argv, prog_name, exit_code, started)
+    if _fast_exit_requested(fast_exit):
+        _fast_exit(exit_code)
+    return exit_code
+
+
+def run_cli_async(
+    cli: ClickCommand,
+    argv: Sequence[str] | None = None,
+    *,
+    loop_factory: LoopFactory | None = None,
+    drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+    prog_name: str | None = None,
+    signal_specs: Sequence[SignalSpec] | None = None,
+    install_signals: bool = True,
+    exception_handler: Callable[[BaseException], int] | None = None,
+    signal_installer: Callable[[Sequence[SignalSpec] | None], Callable[[], None]] | None = None,
+    fast_exit: bool | None = None,
+    gc_policy: GcPolicy | None = None,
+    phase_hook: PhaseHook | None = None,
+    event_fd: int | None = None,
+    rusage: RusageFormat | None = None,
+    trace_memory: int | None = None,
+    timeout: float | None = None,
+    watchdog: float | None = None,
+    max_memory: int | None = None,
+    retry: RetryPolicy | None = None,
+    thread_failures: bool | None = None,
+) -> int:
+    """Execute a Click command whose callback is a coroutine function.
+
+    Why:
+        Synchronous signal handlers raise at an arbitrary bytecode inside the
+        event loop, leaving transports half-closed. Here the loop's own
+        handlers turn a signal into cancellation of the main task, so
+        ``finally`` blocks and ``async with`` exits run at ``await`` points.
+    What:
+        Runs :func:`run_cli`; when the command returns an awaitable it is
+        run as the main task of a new loop. The first signal of
+        ``signal_specs`` cancels that task; once it has unwound (or
+        ``drain_timeout`` passed) the spec's exception is handled as usual,
+        so the exit code still comes from the :class:`SignalSpec`. Tasks
+        left when the main task ends are cancelled and given
+        ``drain_timeout`` seconds as well. Parsing and synchronous commands
+        keep the synchronous handlers.
+    Parameters:
+        loop_factory: Callable returning a new event loop, e.g.
+            ``uvloop.new_event_loop``; defaults to
+            :func:`asyncio.new_event_loop`.
+        drain_timeout: Seconds cancelled tasks may take to unwind before
+            they are abandoned.
+        Others: As for :func:`run_cli`.
+    Returns:
+        Integer exit code suitable for :func:`sys.exit`.
+    Side Effects:
+        As for :func:`run_cli`. While the loop runs, the handlers of the
+        spec signals are replaced through ``loop.add_signal_handler`` (POSIX
+        main thread only; elsewhere the synchronous handlers stay active).
+    """
+    specs = _resolve_signal_specs(signal_specs)
+    with event_loop_session(
+        loop_factory=loop_factory,
+        drain_timeout=drain_timeout,
+        signal_specs=specs if install_signals else (),
+    ):
+        return run_cli(
+            cli,
+            argv,
+            prog_name=prog_name,
+            signal_specs=specs,
+            install_signals=install_signals,
+            exception_handler=exception_handler,
+            signal_installer=signal_installer,
+            fast_exit=fast_exit,
+            gc_policy=gc_policy,
+            phase_hook=phase_hook,
+            event_fd=event_fd,
+            rusage=rusage,
+            trace_memory=trace_memory,
+            timeout=timeout,
+            watchdog=watchdog,
+            max_memory=max_memory,
+            retry=retry,
+            thread_failures=thread_failures,
+        )
+
+
+def _resolve_event_stream(event_fd: int | None) -> EventStream | None:
+    """Return the lifecycle event stream for this run, if one was requested."""
+    if event_fd is not None:
+        return EventStream(event_fd)
+    return event_stream_from_env()
+
 
+@contextmanager
+def _instrumented_run(phase_hook: PhaseHook | None, events: EventStream | None) -> Generator[PhaseTimings]:
+    """Activate the run-scoped timing recorder, event stream, and cancellation token."""
+    timings = PhaseTimings(hook=phase_hook)
+    timings_token = activate_timings(timings)
+    events_token = activate_event_stream(events)
     try:
-        return _run_command_with_handler(cli, argv, prog_name, handler)
+        with cancellation_scope():
+            yield timings
     finally:
-        _finalise_cli_run(restorer)
+        deactivate_event_stream(events_token)
+        deactivate_timings(timings_token)
+
+
+def _emit_start_event(argv: Sequence[str] | None, prog_name: str | None) -> None:
+    """Record the invocation on the active event stream."""
+    emit_event("start", argv=list(argv) if argv is not None else sys.argv[1:], prog=prog_name, ppid=os.getppid())
+
+
+def _emit_exit_event(events: EventStream | None, exit_code: int, started: float) -> None:
+    """Record the final exit code and wall duration of the run."""
+    if events is not None:
+        events.emit("exit", exit_code=exit_code, duration=round(time.monotonic() - started, 6))
+
+
+def _record_stats_if_enabled(
+    cli: ClickCommand,
+    argv: Sequence[str] | None,
+    prog_name: str | None,
+    exit_code: int,
+    started: float,
+) -> None:
+    """Append this run to the statistics database when one is configured.
+
+    Failures (locked or unwritable database) are ignored: statistics must
+    never change the outcome of the command they describe.
+    """
+    path = config.stats_path or stats_path_from_env()
+    if path is None:
+        return
+    cpu_time, peak_rss = resource_usage()
+    record = RunRecord(
+        command=_command_path(cli, argv, prog_name),
+        exit_code=exit_code,
+        duration=time.monotonic() - started,
+        cpu_time=cpu_time,
+        peak_rss=peak_rss,
+        ts=time.time(),
+    )
+    with suppress(Exception):
+        StatsStore(path).record([record])
+
+
+def _command_path(cli: ClickCommand, argv: Sequence[str] | None, prog_name: str | None) -> str:
+    """Return the space-separated subcommand path selected by ``argv``.
+
+    Walks nested groups by name and skips option-looking tokens; it does not
+    re-run Click's parser, so an option value that happens to equal a
+    subcommand name is taken as that subcommand.
+    """
+    args = list(argv) if argv is not None else sys.argv[1:]
+    parts = [prog_name or getattr(cli, "name", None) or os.path.basename(sys.argv[0]) or "cli"]
+    commands = getattr(cli, "commands", None)
+    for arg in args:
+        if not isinstance(commands, dict):
+            break
+        if arg.startswith("-"):
+            continue
+        command = cast("dict[str, object]", commands).get(arg)
+        if command is None:
+            break
+        parts.append(arg)
+        commands = getattr(command, "commands", None)
+    return " ".join(parts)
 
 
 def _choose_exception_handler(
@@ -669,29 +1130,304 @@ def _install_signal_handlers_when_requested(
     return installer(specs)
 
 
+def _apply_gc_policy_when_requested(policy: GcPolicy | None) -> Callable[[], GcStats] | None:
+    """Apply ``policy`` when provided and return its restorer."""
+    if policy is None:
+        return None
+    return apply_gc_policy(policy)
+
+
 def _run_command_with_handler(
     cli: ClickCommand,
     argv: Sequence[str] | None,
     prog_name: str | None,
     handler: Callable[[BaseException], int],
+    memory_top: int | None = None,
+    timeout: float | None = None,
+    watchdog: float | None = None,
+    max_memory: int | None = None,
+    retry: RetryPolicy | None = None,
+    thread_failures: bool = False,
 ) -> int:
-    """Invoke the Click command and delegate failures to ``handler``."""
+    """Invoke the Click command and delegate failures to ``handler``.
+
+    With :attr:`config.profile_path` set the invocation runs under
+    :func:`profiled`, which writes the profile before ``handler`` sees a
+    failure or signal interrupt. With ``memory_top`` set, invocation and
+    ``handler`` run under :func:`traced_memory`. Only the invocation itself
+    counts against ``timeout``, ``watchdog``, and ``max_memory``; with
+    ``retry`` that includes every attempt and the backoff between them.
+    Worker-thread failures recorded under ``thread_failures`` replace a zero
+    exit code.
+    """
+    reserve = MemoryReserve(0)
+    with (
+        traced_memory(memory_top, config.trace_memory_snapshot),
+        watch_thread_failures(
+            thread_failures,
+            cancel=config.cancel_on_thread_failure,
+            render=_render_thread_failure,
+        ) as failures,
+    ):
+        try:
+            with (
+                profiled(config.profile_path, config.profile_top),
+                enforce_timeout(timeout, grace=config.timeout_grace, dump_stacks=config.timeout_dump_stacks),
+                watch_heartbeat(watchdog, interrupt=config.watchdog_interrupt),
+                memory_limited(max_memory, reserve=reserve),
+            ):
+                _invoke_with_retry(cli, argv, prog_name, retry)
+        except BaseException as exc:  # noqa: BLE001 - single funnel for exit codes
+            if isinstance(exc, WorkerThreadFailed) and failures:
+                return _thread_failure_exit_code(failures[0])
+            failure = _surface_broken_pipe(exc)
+            _discard_stdout_after_broken_pipe(failure)
+            return _handle_failure(handler, failure, reserve)
+        if failures:
+            return _thread_failure_exit_code(failures[0])
+        return 0
+
+
+def _render_thread_failure(failure: ThreadFailure) -> None:
+    """Print a worker-thread failure the way command failures are printed."""
+    _default_echo(f"{failure.origin}:", err=True)
+    print_exception_message(trace_back=config.traceback, exc=failure.exception)
+
+
+def _thread_failure_exit_code(failure: ThreadFailure) -> int:
+    """Translate the first worker-thread failure into a non-zero exit code.
+
+    The failure was rendered when it happened, so only the code is resolved
+    here; a thread exception that maps to ``0`` still fails the run.
+    """
+    code = get_system_exit_code(failure.exception) or 1
+    _emit_resolved_event("thread_failure", code, failure.exception)
+    return code
+
+
+def _handle_failure(handler: Callable[[BaseException], int], failure: BaseException, reserve: MemoryReserve) -> int:
+    """Run ``handler`` without letting a ``MemoryError`` become a secondary crash.
+
+    The reserve is freed before a ``MemoryError`` is handled. If the handler
+    itself runs out of memory, the ``MemoryError`` exit code is returned
+    without further rendering.
+    """
+    if isinstance(failure, MemoryError):
+        reserve.release()
     try:
-        _invoke_command(cli, argv, prog_name)
-    except BaseException as exc:  # noqa: BLE001 - single funnel for exit codes
-        return handler(exc)
+        return handler(failure)
+    except MemoryError as exc:
+        reserve.release()
+        return get_system_exit_code(exc)
+
+
+def _memory_top(trace_memory: int | None) -> int | None:
+    """Resolve the memory-tracing site count, defaulting to :data:`config.trace_memory`."""
+    return config.trace_memory if trace_memory is None else trace_memory
+
+
+def _timeout_seconds(timeout: float | None) -> float | None:
+    """Resolve the wall-clock limit, defaulting to :data:`config.timeout`."""
+    return config.timeout if timeout is None else timeout
+
+
+def _watchdog_seconds(watchdog: float | None) -> float | None:
+    """Resolve the heartbeat interval, defaulting to :data:`config.watchdog`."""
+    return config.watchdog if watchdog is None else watchdog
+
+
+def _memory_ceiling(max_memory: int | None) -> int | None:
+    """Resolve the memory ceiling in bytes, defaulting to :data:`config.max_memory`."""
+    return config.max_memory if max_memory is None else max_memory
+
+
+def _thread_watch_enabled(thread_failures: bool | None) -> bool:
+    """Resolve worker-thread capture, defaulting to :data:`config.thread_failures`."""
+    if thread_failures is not None:
+        return thread_failures
+    return config.thread_failures or config.cancel_on_thread_failure
+
+
+def _surface_broken_pipe(exc: BaseException) -> BaseException:
+    """Recover the ``BrokenPipeError`` Click converts into ``SystemExit(1)``.
+
+    Why:
+        ``click.Command.main`` catches ``EPIPE`` even with ``standalone_mode``
+        disabled and calls ``sys.exit(1)``, which would otherwise bypass
+        :attr:`config.broken_pipe_exit_code` and the configured strategy.
+        Any other exit code raised while handling the pipe error is the
+        command's own choice and passes through unchanged.
+    """
+    if isinstance(exc, SystemExit) and exc.code == 1 and isinstance(exc.__context__, BrokenPipeError):
+        return exc.__context__
+    return exc
+
+
+def _discard_stdout_after_broken_pipe(exc: BaseException) -> None:
+    """Silence stdout for the ``DEVNULL`` strategy once its reader has gone."""
+    if isinstance(exc, BrokenPipeError) and config.broken_pipe_strategy is BrokenPipeStrategy.DEVNULL:
+        discard_stdout()
+
+
+def _finalise_cli_run(*restorers: Callable[[], object] | None) -> int:
+    """Run restorers in reverse installation order, then flush IO buffers.
+
+    Every restorer runs even when an earlier one fails, so a broken GC or
+    pipe restorer cannot leave the host's signal handlers replaced; the
+    first failure is re-raised after the flush.
+
+    Returns:
+        Bytes dropped because :attr:`config.flush_deadline` expired.
+    """
+    failure: Exception | None = None
+    for restore in reversed(restorers):
+        try:
+            _restore_handlers_if_needed(restore)
+        except Exception as exc:  # noqa: BLE001 - remaining restorers must still run
+            failure = failure or exc
+    deadline_at = _deadline_at(config.flush_deadline)
+    dropped = _flush_stdout_or_discard(deadline_at) + _flush_streams_until(deadline_at)
+    if dropped:
+        _report_dropped_output(dropped, deadline_at)
+    if failure is not None:
+        raise failure
+    return dropped
+
+
+def _flush_stdout_or_discard(deadline_at: float | None) -> int:
+    """Under the ``DEVNULL`` strategy, drop stdout if its final flush hits ``EPIPE``.
+
+    Why:
+        Output still buffered when the command returns fails only here; left
+        alone, interpreter shutdown retries the flush and prints noise.
+    Returns:
+        Bytes dropped because ``deadline_at`` expired.
+    """
+    if config.broken_pipe_strategy is not BrokenPipeStrategy.DEVNULL:
+        return 0
+    try:
+        return flush_within(sys.stdout, deadline_at)
+    except BrokenPipeError:
+        discard_stdout()
+    except (OSError, ValueError):
+        pass
     return 0
 
 
-def _finalise_cli_run(restorer: Callable[[], None] | None) -> None:
-    """Restore signal handlers when needed and flush IO buffers."""
-    _restore_handlers_if_needed(restorer)
-    flush_streams()
+def _flush_streams_by_deadline() -> None:
+    """Flush stdio within :attr:`config.flush_deadline`, reporting dropped output."""
+    deadline_at = _deadline_at(config.flush_deadline)
+    dropped = _flush_streams_until(deadline_at)
+    if dropped:
+        _report_dropped_output(dropped, deadline_at)
+
+
+def _report_dropped_output(dropped: int, deadline_at: float | None) -> None:
+    """Tell the user how much output the flush deadline discarded."""
+    with suppress(Exception):
+        print(f"flush deadline exceeded: dropped {dropped} bytes of unwritten output", file=sys.stderr)
+    _flush_stream(sys.stderr, deadline_at)
+
+
+def _report_timings_if_requested(timings: PhaseTimings) -> None:
+    """Print the phase breakdown to stderr when :data:`config.timings` is set."""
+    if not config.timings:
+        return
+    with suppress(Exception):
+        print(timings.summary(), file=sys.stderr)
+    _flush_stream(sys.stderr, _deadline_at(config.flush_deadline))
+
+
+def _report_rusage_if_requested(rusage: RusageFormat | None, started: float) -> None:
+    """Print the resource-usage report in the requested format to stderr."""
+    style = config.rusage if rusage is None else rusage
+    if style is None:
+        return
+    report = sample_resource_report(time.monotonic() - started)
+    if report is None:
+        return
+    with suppress(Exception):
+        print(format_resource_report(report, style), file=sys.stderr)
+    _flush_stream(sys.stderr, _deadline_at(config.flush_deadline))
+
+
+def _exit_code_after_flush(exit_code: int, dropped: int) -> int:
+    """Report truncated output of an otherwise successful run with its own code."""
+    if dropped and exit_code == 0:
+        return int(config.flush_truncated_exit_code)
+    return exit_code
+
+
+def _fast_exit_requested(fast_exit: bool | None) -> bool:
+    """Resolve the fast-exit toggle, defaulting to :data:`config.fast_exit`."""
+    return config.fast_exit if fast_exit is None else fast_exit
+
+
+def _fast_exit(exit_code: int) -> None:
+    """Terminate immediately with ``exit_code`` once output is safely flushed.
+
+    Why:
+        Interpreter shutdown walks every live object and module; for CLIs that
+        built millions of objects this can take seconds after the command has
+        already finished.
+    What:
+        Flushes stdio, runs registered ``atexit`` callbacks (logging handlers,
+        temp-file cleanup), flushes again, then calls :func:`os._exit`. When
+        any flush fails the function returns so the caller falls back to the
+        regular interpreter exit, which retries the flush and reports errors.
+    """
+    if not _flush_streams_reliably():
+        return
+    _run_atexit_callbacks()
+    if not _flush_streams_reliably():
+        return
+    os._exit(exit_code)
+
+
+def _run_atexit_callbacks() -> None:
+    """Run and clear registered ``atexit`` callbacks ahead of :func:`os._exit`."""
+    atexit._run_exitfuncs()  # pyright: ignore[reportPrivateUsage]
 
 
 def _invoke_command(cli: ClickCommand, argv: Sequence[str] | None, prog_name: str | None) -> None:
-    """Invoke the Click command with ``standalone_mode`` disabled."""
-    cli.main(args=_normalised_args(argv), standalone_mode=False, prog_name=prog_name)
+    """Invoke the Click command with ``standalone_mode`` disabled.
+
+    Parsing is timed from here until Click reaches the command's ``invoke``
+    (see :func:`install_invoke_probe`, installed for this call only when
+    :data:`config.timings` or a phase hook asks for the breakdown, and
+    :func:`start_command_phase`); otherwise the whole call counts as
+    parsing. A coroutine returned by an ``async def`` callback is then run by
+    :func:`run_awaitable` and counted as command time.
+    """
+    timings = current_timings()
+    if timings is None:
+        result = cli.main(args=_normalised_args(argv), standalone_mode=False, prog_name=prog_name)
+    else:
+        restore_invoke = install_invoke_probe(cli) if config.timings or timings.hook is not None else None
+        timings.start(PHASE_PARSE)
+        try:
+            result = cli.main(args=_normalised_args(argv), standalone_mode=False, prog_name=prog_name)
+        finally:
+            timings.stop(PHASE_PARSE)
+            timings.stop(PHASE_COMMAND)
+            if restore_invoke is not None:
+                restore_invoke()
+    if inspect.isawaitable(result):
+        with timed_phase(PHASE_COMMAND):
+            run_awaitable(result)
+
+
+def _invoke_with_retry(
+    cli: ClickCommand,
+    argv: Sequence[str] | None,
+    prog_name: str | None,
+    policy: RetryPolicy | None,
+) -> None:
+    """Invoke the command once, or under ``policy`` when one is given."""
+    if policy is None:
+        _invoke_command(cli, argv, prog_name)
+        return
+    call_with_retry(lambda: _invoke_command(cli, argv, prog_name), policy)
 
 
 def _normalised_args(argv: Sequence[str] | None) -> Sequence[str] | None:
@@ -699,8 +1435,8 @@ def _normalised_args(argv: Sequence[str] | None) -> Sequence[str] | None:
     return list(argv) if argv is not None else None
 
 
-def _restore_handlers_if_needed(restore: Callable[[], None] | None) -> None:
-    """Invoke the signal restorer callback when one was provided."""
+def _restore_handlers_if_needed(restore: Callable[[], object] | None) -> None:
+    """Invoke the restorer callback when one was provided."""
     if restore is None:
         return
     restore()
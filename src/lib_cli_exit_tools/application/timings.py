@@ -0,0 +1,234 @@
+"""Per-phase timing instrumentation for :func:`run_cli` invocations.
+
+Purpose:
+    Show where a slow CLI run spent its time: installing signal handlers,
+    Click parsing, the command body, exception handling and rendering, or the
+    final flush.
+Contents:
+    * Phase name constants (:data:`PHASE_SIGNALS` … :data:`PHASE_FINALISE`).
+    * :data:`PhaseHook` callback signature receiving monotonic timestamps.
+    * :class:`PhaseTimings` run-scoped recorder with a printable breakdown.
+    * :func:`timed_phase` context manager used by the runner around each phase.
+    * :func:`install_invoke_probe` splitting Click parsing from execution.
+    * :func:`start_command_phase` marking the same boundary from a group
+      callback.
+System Integration:
+    :func:`run_cli` activates one :class:`PhaseTimings` per invocation through
+    a :class:`~contextvars.ContextVar`, so nested helpers such as
+    :func:`handle_cli_exception` record into the right run without extra
+    parameters. Outside a run, :func:`timed_phase` costs one context-variable
+    lookup.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = [
+    "PHASE_COMMAND",
+    "PHASE_FINALISE",
+    "PHASE_HANDLE_EXCEPTION",
+    "PHASE_PARSE",
+    "PHASE_PRINT_EXCEPTION",
+    "PHASE_SIGNALS",
+    "PhaseHook",
+    "PhaseTimings",
+    "activate_timings",
+    "current_timings",
+    "deactivate_timings",
+    "install_invoke_probe",
+    "start_command_phase",
+    "timed_phase",
+]
+
+#: Installing signal handlers (and the broken-pipe/GC policies) before the command.
+PHASE_SIGNALS = "signals"
+#: ``cli.main`` up to the point Click dispatches to ``invoke`` (argument parsing).
+PHASE_PARSE = "parse"
+#: The top-level ``invoke``: group callbacks, subcommand dispatch, and the body.
+PHASE_COMMAND = "command"
+#: :func:`handle_cli_exception` translating a failure into an exit code.
+PHASE_HANDLE_EXCEPTION = "handle_exception"
+#: :func:`print_exception_message` rendering a summary or traceback.
+PHASE_PRINT_EXCEPTION = "print_exception"
+#: Restoring handlers and flushing stdio after the command.
+PHASE_FINALISE = "finalise"
+
+#: Callback receiving ``(phase, started, finished)`` as :func:`time.monotonic` values.
+PhaseHook = Callable[[str, float, float], None]
+
+
+@dataclass(slots=True)
+class PhaseTimings:
+    """Completed phases of one :func:`run_cli` invocation, in completion order.
+
+    Fields:
+        records: ``(phase, started, finished)`` tuples using
+            :func:`time.monotonic` timestamps.
+        hook: Optional callback invoked as each phase completes.
+    """
+
+    records: list[tuple[str, float, float]] = field(default_factory=list[tuple[str, float, float]])
+    hook: PhaseHook | None = None
+    _open: dict[str, float] = field(default_factory=dict[str, float], repr=False)
+
+    def start(self, phase: str) -> None:
+        """Mark ``phase`` as started now."""
+        self._open[phase] = time.monotonic()
+
+    def stop(self, phase: str) -> None:
+        """Complete ``phase`` if it is open; later calls are no-ops."""
+        started = self._open.pop(phase, None)
+        if started is not None:
+            self.record(phase, started, time.monotonic())
+
+    def is_open(self, phase: str) -> bool:
+        """Return ``True`` while ``phase`` has started but not stopped."""
+        return phase in self._open
+
+    def record(self, phase: str, started: float, finished: float) -> None:
+        """Store a completed phase and forward it to :attr:`hook`."""
+        self.records.append((phase, started, finished))
+        if self.hook is not None:
+            self.hook(phase, started, finished)
+
+    def durations(self) -> dict[str, float]:
+        """Return seconds spent per phase, summing repeated phases."""
+        totals: dict[str, float] = {}
+        for phase, started, finished in self.records:
+            totals[phase] = totals.get(phase, 0.0) + (finished - started)
+        return totals
+
+    def summary(self) -> str:
+        """Render a per-phase breakdown in milliseconds, ordered by start time.
+
+        Examples:
+            >>> timings = PhaseTimings()
+            >>> timings.record("parse", 1.0, 1.002)
+            >>> timings.record("command", 1.002, 1.0125)
+            >>> print(timings.summary())
+            timings (ms):
+              parse                 2.000
+              command              10.500
+              total                12.500
+        """
+        if not self.records:
+            return "timings (ms): no phases recorded"
+        ordered = sorted(self.records, key=lambda record: record[1])
+        lines = ["timings (ms):"]
+        lines.extend(f"  {phase:<16}{(finished - started) * 1000:>10.3f}" for phase, started, finished in ordered)
+        total = max(record[2] for record in ordered) - ordered[0][1]
+        lines.append(f"  {'total':<16}{total * 1000:>10.3f}")
+        return "\n".join(lines)
+
+
+_active: ContextVar[PhaseTimings | None] = ContextVar("lib_cli_exit_tools_phase_timings", default=None)
+
+
+def current_timings() -> PhaseTimings | None:
+    """Return the recorder of the :func:`run_cli` call running in this context."""
+    return _active.get()
+
+
+def activate_timings(timings: PhaseTimings) -> Token[PhaseTimings | None]:
+    """Make ``timings`` the active recorder and return a reset token."""
+    return _active.set(timings)
+
+
+def deactivate_timings(token: Token[PhaseTimings | None]) -> None:
+    """Restore the recorder that was active before :func:`activate_timings`."""
+    _active.reset(token)
+
+
+@contextmanager
+def timed_phase(phase: str) -> Generator[None]:
+    """Record the enclosed block as ``phase`` on the active recorder, if any."""
+    timings = _active.get()
+    if timings is None:
+        yield
+        return
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        timings.record(phase, started, time.monotonic())
+
+
+class _InvokeProbe:
+    """Wrap a Click command's ``invoke`` to split parsing from execution.
+
+    Why:
+        ``Command.main`` parses arguments and then calls ``self.invoke`` with
+        no hook in between; intercepting ``invoke`` on the instance marks the
+        boundary. :func:`run_cli` installs the probe only while timings are
+        requested and removes it when the run ends; it passes straight
+        through when no recorder is active.
+    """
+
+    __slots__ = ("_invoke",)
+
+    def __init__(self, invoke: Callable[[Any], Any]) -> None:
+        self._invoke = invoke
+
+    def __call__(self, ctx: Any) -> Any:
+        timings = _active.get()
+        if timings is None or not timings.is_open(PHASE_PARSE):
+            return self._invoke(ctx)
+        timings.stop(PHASE_PARSE)
+        timings.start(PHASE_COMMAND)
+        try:
+            return self._invoke(ctx)
+        finally:
+            timings.stop(PHASE_COMMAND)
+
+
+def install_invoke_probe(command: object) -> Callable[[], None] | None:
+    """Install :class:`_InvokeProbe` on ``command`` unless already present.
+
+    Objects without an ``invoke`` attribute (or refusing new attributes) are
+    left alone; their whole ``main`` call is then reported as parsing.
+
+    Returns:
+        Callable restoring the original ``invoke``, or ``None`` when nothing
+        was installed.
+    """
+    invoke = getattr(command, "invoke", None)
+    if invoke is None or isinstance(invoke, _InvokeProbe):
+        return None
+    shadowed = "invoke" in getattr(command, "__dict__", {})
+    try:
+        setattr(command, "invoke", _InvokeProbe(invoke))  # noqa: B010 - instance attribute shadows the method
+    except (AttributeError, TypeError):
+        return None
+
+    def _restore() -> None:
+        if shadowed:
+            setattr(command, "invoke", invoke)  # noqa: B010 - put the instance attribute back
+        else:
+            with suppress(AttributeError):
+                delattr(command, "invoke")
+
+    return _restore
+
+
+def start_command_phase() -> bool:
+    """End the active run's parse phase and open its command phase now.
+
+    Why:
+        A group callback enabling timings (such as ``--timings``) runs after
+        :func:`run_cli` decided against the invoke probe; marking the
+        boundary from the callback keeps parsing and execution apart.
+    Returns:
+        ``False`` when no run is active or parsing was already closed.
+    """
+    timings = _active.get()
+    if timings is None or not timings.is_open(PHASE_PARSE):
+        return False
+    timings.stop(PHASE_PARSE)
+    timings.start(PHASE_COMMAND)
+    return True
@@ -0,0 +1,310 @@
+"""Pre-fork zygote launcher for isolated, fast CLI execution.
+
+Purpose:
+    Pay the interpreter start-up and import cost once, then serve each request
+    from a freshly forked child so commands that mutate global state never
+    observe each other.
+Contents:
+    * :class:`Zygote` – warms imports and forks one child per request, either
+      directly (:meth:`Zygote.run`) or behind a Unix socket
+      (:meth:`Zygote.serve`).
+    * :func:`request_zygote_run` – minimal client forwarding ``argv`` and the
+      caller's stdio descriptors to a serving zygote.
+System Integration:
+    Children reset :data:`lib_cli_exit_tools.config`, reinstall the default
+    signal specs, and execute the command through :func:`run_cli`, so exit
+    codes and diagnostics match a cold start exactly. POSIX only; the module
+    imports cleanly elsewhere but :class:`Zygote` refuses to start without
+    :func:`os.fork`.
+
+Wire protocol (for non-Python clients):
+    The client connects to the ``AF_UNIX`` stream socket and sends one
+    newline-terminated JSON object ``{"argv": [...]}`` whose first segment
+    carries the client's stdin/stdout/stderr as ``SCM_RIGHTS`` ancillary data.
+    The zygote answers with the decimal exit code followed by a newline. A
+    malformed request is reported on the zygote's stderr and its connection
+    closed without a reply; the server keeps running.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import signal
+import socket
+import sys
+from collections.abc import Iterable, Sequence
+from contextlib import suppress
+
+from ..adapters.runtime import note
+from ..adapters.signals import SignalSpec, default_signal_specs
+from ..core.configuration import config, reset_config
+from .runner import ClickCommand, flush_streams, run_cli
+
+__all__ = ["Zygote", "request_zygote_run"]
+
+#: Number of descriptors (stdin, stdout, stderr) forwarded per request.
+_STDIO_COUNT = 3
+#: Upper bound for a single request read; argv payloads are tiny.
+_MAX_MESSAGE = 65536
+#: Dispositions of a freshly started interpreter, restored in every child.
+_COLD_START_HANDLERS = (
+    ("SIGCHLD", signal.SIG_DFL),
+    ("SIGHUP", signal.SIG_DFL),
+    ("SIGINT", signal.default_int_handler),
+    ("SIGTERM", signal.SIG_DFL),
+    ("SIGPIPE", signal.SIG_IGN),
+)
+
+
+class Zygote:
+    """Warm process that forks a fresh child for every CLI invocation.
+
+    Why:
+        An in-process server shares module globals between requests; a fork
+        gives each request a private copy of the warmed heap at the cost of a
+        page-table copy instead of a full interpreter start.
+    Parameters:
+        cli: Click command or group executed inside each child.
+        warm_modules: Dotted module names imported once in the zygote so
+            children inherit them already initialised.
+        prog_name: Program name forwarded to :func:`run_cli`.
+        signal_specs: Specs installed in each child; defaults to
+            :func:`default_signal_specs`.
+    Raises:
+        RuntimeError: When the platform lacks :func:`os.fork`.
+    """
+
+    def __init__(
+        self,
+        cli: ClickCommand,
+        *,
+        warm_modules: Iterable[str] = (),
+        prog_name: str | None = None,
+        signal_specs: Sequence[SignalSpec] | None = None,
+    ) -> None:
+        _require_fork()
+        self._cli = cli
+        self._prog_name = prog_name
+        self._signal_specs = list(signal_specs) if signal_specs is not None else default_signal_specs()
+        self._children: set[int] = set()
+        _import_warm_modules(warm_modules)
+
+    def run(self, argv: Sequence[str], *, stdio: Sequence[int] | None = None) -> int:
+        """Fork a child for ``argv``, wait for it, and return its exit code.
+
+        Parameters:
+            argv: Arguments passed to the command (excluding program name).
+            stdio: Optional ``(stdin, stdout, stderr)`` descriptors the child
+                adopts; ``None`` keeps the zygote's own streams.
+        Returns:
+            The child's exit code; signal deaths map to ``128 + signum``.
+        """
+
+        flush_streams(config.flush_deadline)
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - executes in the forked child
+            self._child_main(argv, stdio, report=None)
+        _, status = os.waitpid(pid, 0)
+        return _exit_code_from_status(status)
+
+    def serve(self, socket_path: str, *, max_requests: int | None = None, backlog: int = 64) -> None:
+        """Accept requests on ``socket_path`` and fork one child per request.
+
+        Parameters:
+            socket_path: Filesystem path of the ``AF_UNIX`` listening socket;
+                an existing socket file at this path is replaced.
+            max_requests: Stop after this many requests; ``None`` serves
+                until interrupted.
+            backlog: Listen queue length.
+        Side Effects:
+            Creates and finally unlinks ``socket_path``; reaps all children
+            before returning.
+        """
+
+        with suppress(FileNotFoundError):
+            os.unlink(socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(socket_path)
+            server.listen(backlog)
+            self._accept_loop(server, max_requests)
+        finally:
+            server.close()
+            with suppress(FileNotFoundError):
+                os.unlink(socket_path)
+            self._reap_children(block=True)
+
+    def _accept_loop(self, server: socket.socket, max_requests: int | None) -> None:
+        """Serve connections until ``max_requests`` have been dispatched."""
+        handled = 0
+        while max_requests is None or handled < max_requests:
+            conn, _ = server.accept()
+            with conn:
+                self._dispatch(conn, server)
+            handled += 1
+            self._reap_children(block=False)
+
+    def _dispatch(self, conn: socket.socket, server: socket.socket) -> None:
+        """Read one request from ``conn`` and hand it to a forked child.
+
+        A malformed request is reported on stderr and dropped, so one bad
+        client cannot stop the server.
+        """
+        try:
+            argv, fds = _receive_request(conn)
+        except (OSError, ValueError) as exc:
+            note(f"zygote: rejected request: {exc}")
+            return
+        try:
+            flush_streams(config.flush_deadline)
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover - executes in the forked child
+                server.close()
+                self._child_main(argv, fds, report=conn)
+            self._children.add(pid)
+        finally:
+            _close_fds(fds)
+
+    def _child_main(self, argv: Sequence[str], stdio: Sequence[int] | None, report: socket.socket | None) -> None:  # pragma: no cover - forked child
+        """Run the command inside the forked child and never return."""
+        code = 70
+        try:
+            _adopt_stdio(stdio)
+            _reset_child_signals()
+            reset_config()
+            code = run_cli(self._cli, argv, prog_name=self._prog_name, signal_specs=self._signal_specs)
+            if report is not None:
+                report.sendall(f"{code}\n".encode("ascii"))
+        finally:
+            flush_streams(config.flush_deadline)
+            os._exit(code)
+
+    def _reap_children(self, *, block: bool) -> None:
+        """Collect exited children so they do not linger as zombies."""
+        for pid in list(self._children):
+            finished, _ = os.waitpid(pid, 0 if block else os.WNOHANG)
+            if finished:
+                self._children.discard(pid)
+
+
+def request_zygote_run(socket_path: str, argv: Sequence[str], *, stdio: Sequence[int] = (0, 1, 2)) -> int:
+    """Ask the zygote at ``socket_path`` to run ``argv`` on our stdio.
+
+    Parameters:
+        socket_path: Path the zygote passed to :meth:`Zygote.serve`.
+        argv: Arguments for the command (excluding program name).
+        stdio: ``(stdin, stdout, stderr)`` descriptors lent to the child.
+    Returns:
+        Exit code reported by the child.
+    Raises:
+        ConnectionError: When the zygote closes the connection without
+            reporting an exit code (for example because the child crashed).
+    """
+
+    payload = json.dumps({"argv": list(argv)}).encode("utf-8") + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        socket.send_fds(client, [payload], list(stdio))
+        reply = _read_line(client)
+    if not reply:
+        raise ConnectionError("zygote closed the connection without reporting an exit code")
+    return int(reply)
+
+
+def _require_fork() -> None:
+    """Reject platforms without :func:`os.fork`."""
+    if not hasattr(os, "fork"):
+        raise RuntimeError("zygote mode requires os.fork (POSIX only)")
+
+
+def _import_warm_modules(names: Iterable[str]) -> None:
+    """Import every module in ``names`` so forked children inherit them."""
+    for name in names:
+        importlib.import_module(name)
+
+
+def _receive_request(conn: socket.socket) -> tuple[list[str], list[int]]:
+    """Return the ``argv`` list and stdio descriptors sent by a client.
+
+    Raises:
+        ValueError: When the payload is not a JSON object with an ``argv``
+            list or fewer than three descriptors arrived; the descriptors
+            received so far are closed.
+        OSError: When reading from ``conn`` fails; descriptors are closed
+            as well.
+    """
+    data, fds, _, _ = socket.recv_fds(conn, _MAX_MESSAGE, _STDIO_COUNT)
+    try:
+        while not data.endswith(b"\n"):
+            chunk = conn.recv(_MAX_MESSAGE)
+            if not chunk:
+                break
+            data += chunk
+        if len(fds) < _STDIO_COUNT:
+            raise ValueError(f"expected {_STDIO_COUNT} stdio descriptors, got {len(fds)}")
+        argv = _parse_argv(data)
+    except BaseException:
+        _close_fds(fds)
+        raise
+    return argv, list(fds)
+
+
+def _parse_argv(data: bytes) -> list[str]:
+    """Decode the ``{"argv": [...]}`` request payload."""
+    try:
+        argv = json.loads(data.decode("utf-8"))["argv"]
+        if not isinstance(argv, list):
+            raise TypeError("argv is not a list")
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"malformed request payload: {exc!r}") from exc
+    return [str(arg) for arg in argv]  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+
+
+def _close_fds(fds: Iterable[int]) -> None:
+    """Close every descriptor in ``fds``, ignoring ones already closed."""
+    for fd in fds:
+        with suppress(OSError):
+            os.close(fd)
+
+
+def _read_line(conn: socket.socket) -> bytes:
+    """Read from ``conn`` until a newline or EOF and return the stripped bytes."""
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(64)
+        if not chunk:
+            break
+        data += chunk
+    return data.strip()
+
+
+def _adopt_stdio(stdio: Sequence[int] | None) -> None:  # pragma: no cover - forked child
+    """Point descriptors 0-2 at the client's stdio and rebind ``sys`` streams.
+
+    Hosts that swapped ``sys.stdout`` for an in-memory object (test runners,
+    embedding shells) would otherwise swallow the child's output, so the
+    interpreter's original descriptor-backed streams are restored.
+    """
+    if not stdio:
+        return
+    for target, fd in enumerate(stdio[:_STDIO_COUNT]):
+        os.dup2(fd, target)
+    sys.stdin, sys.stdout, sys.stderr = sys.__stdin__, sys.__stdout__, sys.__stderr__
+
+
+def _reset_child_signals() -> None:  # pragma: no cover - forked child
+    """Give the child the dispositions of a cold start, whatever the server installed."""
+    for name, handler in _COLD_START_HANDLERS:
+        signum = getattr(signal, name, None)
+        if signum is not None:
+            signal.signal(signum, handler)
+
+
+def _exit_code_from_status(status: int) -> int:
+    """Translate a ``waitpid`` status into a shell-style exit code."""
+    code = os.waitstatus_to_exitcode(status)
+    if code < 0:
+        return 128 - code
+    return code
@@ -7,6 +7,8 @@ Contents:
     * :func:`cli` group exposing shared options.
     * :func:`cli_info` subcommand reporting distribution metadata.
     * :func:`cli_fail` subcommand triggering a deterministic failure for testing error paths.
+    * :func:`cli_stats` subcommand summarising recorded run statistics.
+    * :func:`cli_memory_diff` subcommand comparing two allocation snapshots.
     * :func:`main` entry point used by console scripts and ``python -m``.
 System Integration:
     The CLI mutates :data:`lib_cli_exit_tools.config` based on the ``--traceback``
@@ -18,6 +20,8 @@ from __future__ import annotations
 # --- Public surface re-exports (backward compatibility) ---
 from .commands import cli_fail as cli_fail
 from .commands import cli_info as cli_info
+from .commands import cli_memory_diff as cli_memory_diff
+from .commands import cli_stats as cli_stats
 from .group import CliContextState as CliContextState
 from .group import cli as cli
 from .group import main as main
@@ -25,3 +29,5 @@ from .group import main as main
 # --- Register subcommands with the root group ---
 cli.add_command(cli_info)
 cli.add_command(cli_fail)
+cli.add_command(cli_stats)
+cli.add_command(cli_memory_diff)
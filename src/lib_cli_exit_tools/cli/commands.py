@@ -2,21 +2,28 @@
 
 Purpose:
     Define individual CLI subcommands that expose library functionality to
-    end users (``info``, ``fail``).
+    end users (``info``, ``fail``, ``stats``, ``memory-diff``).
 Contents:
     * :data:`CLICK_CONTEXT_SETTINGS` shared context settings for all commands.
     * :func:`cli_info` subcommand reporting distribution metadata.
     * :func:`cli_fail` subcommand triggering a deterministic failure.
+    * :func:`cli_stats` subcommand summarising recorded run statistics.
+    * :func:`cli_memory_diff` subcommand comparing two allocation snapshots.
 System Integration:
     Commands are registered with the root group in :mod:`lib_cli_exit_tools.cli`.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import rich_click as click
 
 from .. import __init__conf__
 from .. import lib_cli_exit_tools
+from ..adapters.memory_trace import compare_snapshots
+from ..adapters.stats import STATS_PATH_ENV, CommandStats, StatsStore, stats_path_from_env
+from .typed_click import argument, option
 
 #: Help flag aliases applied to every Click command so documentation and CLI
 #: behaviour stay consistent (`-h` mirrors `--help`).
@@ -67,3 +74,73 @@ def cli_fail() -> None:
     """
 
     lib_cli_exit_tools.i_should_fail()
+
+
+@click.command("stats", context_settings=CLICK_CONTEXT_SETTINGS)
+@option(
+    "--db",
+    "db",
+    default=None,
+    metavar="PATH",
+    help=f"Statistics database (default: config.stats_path or ${STATS_PATH_ENV})",
+)
+def cli_stats(db: str | None) -> None:
+    """Print latency percentiles and exit-code histograms per command.
+
+    Why:
+        Spot subcommands that get slower over time, or fail more often,
+        across unattended runs recorded by :func:`lib_cli_exit_tools.run_cli`.
+    Parameters:
+        db: Database to read; defaults to
+            :attr:`lib_cli_exit_tools.config.stats_path`, then the
+            ``LIB_CLI_EXIT_TOOLS_STATS_DB`` environment variable.
+    Raises:
+        click.UsageError: When no database is configured.
+    Side Effects:
+        Writes one table row per recorded command path to stdout.
+    """
+    path = db or lib_cli_exit_tools.config.stats_path or stats_path_from_env()
+    if path is None:
+        raise click.UsageError(f"no statistics database configured; pass --db or set {STATS_PATH_ENV}")
+    summaries = StatsStore(path).summaries()
+    if not summaries:
+        click.echo(f"no runs recorded in {path}")
+        return
+    click.echo(_render_stats(summaries))
+
+
+def _render_stats(summaries: Sequence[CommandStats]) -> str:
+    """Format ``summaries`` as a fixed-width table.
+
+    Examples:
+        >>> row = CommandStats("cli sync", 3, {50.0: 0.012, 90.0: 0.02, 99.0: 0.02}, {0: 2, 1: 1}, 0.01, 0)
+        >>> print(_render_stats([row]))
+        command                     runs   p50 ms   p90 ms   p99 ms  exit codes
+        cli sync                       3     12.0     20.0     20.0  0×2 1×1
+    """
+    lines = [f"{'command':<24}{'runs':>8}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}  exit codes"]
+    for entry in summaries:
+        latency = "".join(f"{entry.percentiles.get(p, 0.0) * 1000:>9.1f}" for p in (50.0, 90.0, 99.0))
+        codes = " ".join(f"{code}×{count}" for code, count in sorted(entry.exit_codes.items()))
+        lines.append(f"{entry.command:<24}{entry.runs:>8}{latency}  {codes}")
+    return "\n".join(lines)
+
+
+@click.command("memory-diff", context_settings=CLICK_CONTEXT_SETTINGS)
+@argument("old", type=click.Path(exists=True, dir_okay=False))
+@argument("new", type=click.Path(exists=True, dir_okay=False))
+@option("--top", type=int, default=10, show_default=True, metavar="N", help="Number of allocation sites to list")
+def cli_memory_diff(old: str, new: str, top: int) -> None:
+    """Show the allocation sites that grew or shrank most between two runs.
+
+    Why:
+        Compare ``--trace-memory-snapshot`` files from a small and a large
+        input to see which code paths scale with the input size.
+    Parameters:
+        old: Snapshot written by the earlier run.
+        new: Snapshot written by the later run.
+        top: Number of allocation sites to list.
+    Side Effects:
+        Writes the difference table to stdout.
+    """
+    click.echo(compare_snapshots(old, new, top))
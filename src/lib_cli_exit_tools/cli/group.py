@@ -2,14 +2,15 @@
 
 Purpose:
     Define the top-level Click group with shared options (``--traceback``,
-    ``--version``) and the :func:`main` entry point used by console scripts.
+    ``--timings``, ``--rusage``, ``--profile``, ``--trace-memory``, ``--timeout``, ``--watchdog``, ``--max-memory``, ``--thread-failures``, ``--version``) and the :func:`main` entry point used by console scripts.
 Contents:
     * :class:`CliContextState` typed container for Click context state.
     * :func:`cli` root Click group.
     * :func:`main` entry point for console scripts and ``python -m``.
 System Integration:
-    The CLI mutates :data:`lib_cli_exit_tools.config` based on the ``--traceback``
-    flag before handing execution off to :func:`lib_cli_exit_tools.run_cli`.
+    The group callback assigns every option to :data:`lib_cli_exit_tools.config`
+    on each invocation, so a flag given to one :func:`main` call does not
+    leak into the next; execution is handed off to :func:`lib_cli_exit_tools.run_cli`.
 """
 
 from __future__ import annotations
@@ -21,10 +22,22 @@ import rich_click as click
 
 from .. import __init__conf__
 from .. import lib_cli_exit_tools
+from ..adapters.memory_limit import parse_memory_size, start_memory_limit
+from ..adapters.memory_trace import start_memory_trace
+from ..adapters.profiling import start_profiling
+from ..adapters.thread_failures import start_thread_watch
+from ..adapters.timeout import start_timeout
+from ..adapters.watchdog import start_watchdog
+from ..application.timings import start_command_phase
 from .commands import CLICK_CONTEXT_SETTINGS
 from .styling import _temporary_rich_click_configuration  # pyright: ignore[reportPrivateUsage]
 from .typed_click import option, version_option
 
+#: ``pstats`` file written by ``--profile`` without ``--profile-output``.
+_DEFAULT_PROFILE_PATH = f"{__init__conf__.shell_command}.pstats"
+#: Allocation sites reported by ``--trace-memory`` without ``--trace-memory-top``.
+_DEFAULT_MEMORY_TOP = 10
+
 
 @dataclass
 class CliContextState:
@@ -53,8 +66,135 @@ class CliContextState:
     default=False,
     help="Show full Python traceback on errors",
 )
+@option(
+    "--timings",
+    is_flag=True,
+    default=False,
+    help="Print a per-phase timing breakdown to stderr",
+)
+@option(
+    "--rusage",
+    is_flag=True,
+    default=False,
+    help="Print wall time, CPU, peak RSS, context switches and block I/O to stderr on exit",
+)
+@option(
+    "--rusage-json",
+    is_flag=True,
+    default=False,
+    help="Like --rusage but as one JSON object",
+)
+@option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help=f"Run the command under cProfile and write {_DEFAULT_PROFILE_PATH}",
+)
+@option(
+    "--profile-output",
+    default=None,
+    metavar="PATH",
+    help="Write the cProfile statistics to PATH (implies --profile)",
+)
+@option(
+    "--profile-top",
+    type=int,
+    default=0,
+    metavar="N",
+    help="Print the N functions with the most cumulative time (implies --profile)",
+)
+@option(
+    "--trace-memory",
+    is_flag=True,
+    default=False,
+    help=f"Trace allocations; report peak memory and the top {_DEFAULT_MEMORY_TOP} allocation sites on exit or failure",
+)
+@option(
+    "--trace-memory-top",
+    type=int,
+    default=None,
+    metavar="N",
+    help="Number of allocation sites to report (implies --trace-memory)",
+)
+@option(
+    "--trace-memory-snapshot",
+    default=None,
+    metavar="PATH",
+    help="Also write the tracemalloc snapshot to PATH for `memory-diff` (implies --trace-memory)",
+)
+@option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    metavar="SECONDS",
+    help="Abort the command with exit code 124 when it runs longer than SECONDS",
+)
+@option(
+    "--timeout-grace",
+    type=click.FloatRange(min=0),
+    default=None,
+    metavar="SECONDS",
+    help="After a timeout, kill the process if it has not exited within SECONDS",
+)
+@option(
+    "--timeout-dump-stacks",
+    is_flag=True,
+    default=False,
+    help="Print the stacks of all threads to stderr when the timeout fires",
+)
+@option(
+    "--watchdog",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    metavar="SECONDS",
+    help="Print the stacks of all threads when the command goes SECONDS without calling heartbeat()",
+)
+@option(
+    "--watchdog-interrupt",
+    is_flag=True,
+    default=False,
+    help="Also abort a stalled command with exit code 125 (requires --watchdog)",
+)
+@option(
+    "--max-memory",
+    default=None,
+    metavar="SIZE",
+    help="Limit the command's address space to SIZE (e.g. 512M, 2G); exceeding it raises MemoryError",
+)
+@option(
+    "--thread-failures",
+    is_flag=True,
+    default=False,
+    help="Report exceptions in worker threads and fail the run when one occurs",
+)
+@option(
+    "--cancel-on-thread-failure",
+    is_flag=True,
+    default=False,
+    help="Also cancel the command on the first worker-thread failure (implies --thread-failures)",
+)
 @click.pass_context
-def cli(ctx: click.Context, traceback: bool) -> None:
+def cli(
+    ctx: click.Context,
+    traceback: bool,
+    timings: bool,
+    rusage: bool,
+    rusage_json: bool,
+    profile: bool,
+    profile_output: str | None,
+    profile_top: int,
+    trace_memory: bool,
+    trace_memory_top: int | None,
+    trace_memory_snapshot: str | None,
+    timeout: float | None,
+    timeout_grace: float | None,
+    timeout_dump_stacks: bool,
+    watchdog: float | None,
+    watchdog_interrupt: bool,
+    max_memory: str | None,
+    thread_failures: bool,
+    cancel_on_thread_failure: bool,
+) -> None:
     """Root Click group that primes shared configuration state.
 
     Why:
@@ -63,8 +203,45 @@ def cli(ctx: click.Context, traceback: bool) -> None:
     Parameters:
         ctx: Click context object for the current invocation.
         traceback: When ``True`` enables traceback output for subsequent commands.
+        timings: When ``True`` :func:`lib_cli_exit_tools.run_cli` prints the
+            phase breakdown of this run to stderr once it finishes.
+        rusage: When ``True`` a human-readable resource-usage report is
+            printed to stderr after the run, including failed runs.
+        rusage_json: Same report as a single JSON object; wins over
+            ``rusage`` when both are given.
+        profile: When ``True`` the command runs under :mod:`cProfile`; the
+            ``pstats`` file is written even if it fails or is interrupted.
+        profile_output: ``pstats`` destination; defaults to
+            ``lib-cli-exit-tools.pstats`` in the working directory.
+        profile_top: Number of top functions by cumulative time to print.
+        trace_memory: When ``True`` allocations are traced with
+            :mod:`tracemalloc` and reported on exit or failure.
+        trace_memory_top: Number of allocation sites in the report.
+        trace_memory_snapshot: File receiving the snapshot for
+            ``memory-diff``.
+        timeout: Wall-clock limit in seconds for the subcommand; measured from
+            the group callback, so option parsing is not counted.
+        timeout_grace: Seconds left for unwinding after a timeout before the
+            process is killed.
+        timeout_dump_stacks: When ``True`` all thread stacks are printed when
+            the timeout fires.
+        watchdog: Longest gap in seconds between two ``heartbeat()`` calls
+            before all thread stacks are printed as a stall report.
+        watchdog_interrupt: When ``True`` a stall also aborts the
+            subcommand.
+        max_memory: Memory ceiling such as ``512M`` or ``2G`` applied with
+            ``setrlimit`` for the subcommand.
+        thread_failures: When ``True`` exceptions escaping worker threads
+            are rendered and fail the run.
+        cancel_on_thread_failure: When ``True`` the first such failure also
+            cancels the subcommand.
     Side Effects:
-        Mutates ``ctx.obj`` and :data:`lib_cli_exit_tools.config.traceback`.
+        Mutates ``ctx.obj`` and assigns, on every invocation,
+        :data:`lib_cli_exit_tools.config.traceback`,
+        :data:`lib_cli_exit_tools.config.timings`,
+        :data:`lib_cli_exit_tools.config.rusage`, and the ``profile_*`` /
+        ``trace_memory*`` / ``timeout*`` / ``watchdog*`` / ``max_memory`` /
+        ``*thread_failure*`` configuration fields.
     Examples:
         >>> from click.testing import CliRunner
         >>> runner = CliRunner()
@@ -73,7 +250,55 @@ def cli(ctx: click.Context, traceback: bool) -> None:
         True
     """
     _store_traceback_flag(ctx, traceback)
-    lib_cli_exit_tools.config.traceback = traceback
+    config = lib_cli_exit_tools.config
+    config.traceback = traceback
+    config.timings = timings
+    if timings:
+        start_command_phase()
+    config.rusage = _rusage_format(rusage, rusage_json)
+    profiling = profile or bool(profile_output) or profile_top > 0
+    config.profile_path = (profile_output or _DEFAULT_PROFILE_PATH) if profiling else None
+    config.profile_top = profile_top
+    if config.profile_path is not None:
+        start_profiling(config.profile_path, profile_top)
+    tracing = trace_memory or trace_memory_top is not None or bool(trace_memory_snapshot)
+    config.trace_memory = (_DEFAULT_MEMORY_TOP if trace_memory_top is None else trace_memory_top) if tracing else None
+    config.trace_memory_snapshot = trace_memory_snapshot
+    if config.trace_memory is not None:
+        start_memory_trace(config.trace_memory, trace_memory_snapshot)
+    config.timeout = timeout
+    config.timeout_grace = timeout_grace
+    config.timeout_dump_stacks = timeout_dump_stacks
+    if timeout is not None:
+        start_timeout(timeout, grace=timeout_grace, dump_stacks=timeout_dump_stacks)
+    config.watchdog = watchdog
+    config.watchdog_interrupt = watchdog_interrupt
+    if watchdog is not None:
+        start_watchdog(watchdog, interrupt=watchdog_interrupt)
+    config.max_memory = None if max_memory is None else _parse_max_memory(max_memory)
+    if config.max_memory is not None:
+        start_memory_limit(config.max_memory)
+    config.thread_failures = thread_failures or cancel_on_thread_failure
+    config.cancel_on_thread_failure = cancel_on_thread_failure
+    if config.thread_failures:
+        start_thread_watch(cancel=cancel_on_thread_failure)
+
+
+def _rusage_format(rusage: bool, rusage_json: bool) -> lib_cli_exit_tools.RusageFormat | None:
+    """Map ``--rusage``/``--rusage-json`` onto the report format; JSON wins."""
+    if rusage_json:
+        return lib_cli_exit_tools.RusageFormat.JSON
+    if rusage:
+        return lib_cli_exit_tools.RusageFormat.HUMAN
+    return None
+
+
+def _parse_max_memory(text: str) -> int:
+    """Convert ``--max-memory`` into bytes, reporting bad sizes as usage errors."""
+    try:
+        return parse_memory_size(text)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="'--max-memory'") from exc
 
 
 def _store_traceback_flag(ctx: click.Context, traceback: bool) -> None:
@@ -94,7 +319,7 @@ def _store_traceback_flag(ctx: click.Context, traceback: bool) -> None:
         state.traceback = traceback
 
 
-def main(argv: Sequence[str] | None = None) -> int:
+def main(argv: Sequence[str] | None = None, *, fast_exit: bool | None = None) -> int:
     """Run the CLI with :func:`lib_cli_exit_tools.run_cli` wiring.
 
     Why:
@@ -102,6 +327,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         returning an integer exit code instead of exiting directly.
     Parameters:
         argv: Optional iterable of arguments passed to Click (without program name).
+        fast_exit: Forwarded to :func:`lib_cli_exit_tools.run_cli`; ``True``
+            ends the process via :func:`os._exit` once output is flushed,
+            ``None`` defers to :data:`lib_cli_exit_tools.config.fast_exit`.
     Returns:
         Integer exit code from :func:`lib_cli_exit_tools.run_cli`.
     Side Effects:
@@ -121,4 +349,5 @@ def main(argv: Sequence[str] | None = None) -> int:
             cli,
             argv=list(argv) if argv is not None else None,
             prog_name=__init__conf__.shell_command,
+            fast_exit=fast_exit,
         )
@@ -1,6 +1,6 @@
 """Strictly-typed wrappers for rich_click's partially-typed decorators.
 
-rich_click ships ``py.typed``, but its ``option`` and ``version_option``
+rich_click ships ``py.typed``, but its ``argument``, ``option``, and ``version_option``
 decorators are typed with a partially-unknown return, so the strict type checker
 reports ``reportUnknownMemberType`` at every call site. click's own decorators
 are fully typed, but they default the parameter class to ``click.Option`` rather
@@ -29,6 +29,7 @@ _CommandDecorator = Callable[[Callable[..., Any]], Callable[..., Any]]
 class _RichClickDecorators(Protocol):
     """rich_click's decorator surface, declared with complete types."""
 
+    argument: Callable[..., _CommandDecorator]
     option: Callable[..., _CommandDecorator]
     version_option: Callable[..., _CommandDecorator]
 
@@ -38,6 +39,11 @@ class _RichClickDecorators(Protocol):
 _click = cast("_RichClickDecorators", click)
 
 
+def argument(*param_decls: str, **attrs: Any) -> _CommandDecorator:
+    """Typed wrapper over :func:`rich_click.argument`. See module docstring."""
+    return _click.argument(*param_decls, **attrs)
+
+
 def option(*param_decls: str, **attrs: Any) -> _CommandDecorator:
     """Typed wrapper over :func:`rich_click.option`. See module docstring."""
     return _click.option(*param_decls, **attrs)
@@ -48,4 +54,4 @@ def version_option(*param_decls: str, **attrs: Any) -> _CommandDecorator:
     return _click.version_option(*param_decls, **attrs)
 
 
-__all__ = ["option", "version_option"]
+__all__ = ["argument", "option", "version_option"]
@@ -11,6 +11,8 @@ Contents:
       configuration state for embedders and tests.
     * :func:`reset_config` – helper that restores defaults defined by
       :class:`_Config`.
+    * :func:`reset_run_reports` – drops per-run reports and limits inherited
+      by forked children.
 System Integration:
     Imported by higher layers (`application.runner`, `adapters.click_adapter`)
     to align behaviour while keeping the configuration schema centralized. The
@@ -26,7 +28,17 @@ from dataclasses import dataclass, fields
 from enum import Enum
 from typing import TypedDict
 
-__all__ = ["ExitCodeStyle", "_Config", "config", "config_overrides", "reset_config"]
+__all__ = [
+    "BrokenPipeStrategy",
+    "ExitCodeStyle",
+    "ForkSignalPolicy",
+    "RusageFormat",
+    "_Config",
+    "config",
+    "config_overrides",
+    "reset_config",
+    "reset_run_reports",
+]
 
 
 class ExitCodeStyle(str, Enum):
@@ -44,6 +56,64 @@ class ExitCodeStyle(str, Enum):
     SYSEXITS = "sysexits"
 
 
+class BrokenPipeStrategy(str, Enum):
+    """How a CLI reacts when the reader of its stdout goes away.
+
+    Why:
+        ``cmd | head -1`` closes the pipe after one line; mapping the resulting
+        ``BrokenPipeError`` to an exit code is portable but still unwinds the
+        command stack and leaves a dead stdout for interpreter shutdown to
+        flush again, printing "Exception ignored" noise.
+    Members:
+        EXCEPTION: Let ``BrokenPipeError`` propagate and map it to
+            :attr:`_Config.broken_pipe_exit_code` (default).
+        SIGNAL: Restore ``SIGPIPE`` to ``SIG_DFL`` so the kernel terminates the
+            process on the first failed write, like a C program. POSIX only;
+            falls back to ``EXCEPTION`` elsewhere.
+        DEVNULL: Map the error like ``EXCEPTION`` but first point stdout at
+            ``/dev/null`` via ``dup2`` so teardown flushes succeed silently.
+    """
+
+    EXCEPTION = "exception"
+    SIGNAL = "signal"
+    DEVNULL = "devnull"
+
+
+class RusageFormat(str, Enum):
+    """Rendering of the resource-usage report printed after a run.
+
+    Members:
+        HUMAN: Aligned text rows for terminals and logs.
+        JSON: One JSON object per run for log shippers and sizing scripts.
+    """
+
+    HUMAN = "human"
+    JSON = "json"
+
+
+class ForkSignalPolicy(str, Enum):
+    """Signal handling of a process forked while the CLI's handlers are installed.
+
+    Why:
+        A forked child inherits the handlers that raise ``SigTermInterrupt``
+        and friends, so a signal broadcast to the process group makes every
+        child render "Terminated" and unwind a command stack it does not own.
+    Members:
+        PREVIOUS: Restore the handlers that were in place before the CLI
+            installed its own, so ``SIGINT`` raises ``KeyboardInterrupt`` and
+            ``SIGTERM`` terminates silently (default).
+        DEFAULT: Reset every handled signal to ``SIG_DFL``; the child dies
+            silently with ``128 + N``.
+        IGNORE: Ignore the handled signals; the parent has to stop the child.
+        KEEP: Keep the CLI's raising handlers, as before the fork hooks existed.
+    """
+
+    PREVIOUS = "previous"
+    DEFAULT = "default"
+    IGNORE = "ignore"
+    KEEP = "keep"
+
+
 class ConfigSnapshot(TypedDict):
     """Type-safe snapshot of configuration values.
 
@@ -55,13 +125,53 @@ class ConfigSnapshot(TypedDict):
         traceback: Current traceback emission flag.
         exit_code_style: Current exit code mapping strategy.
         broken_pipe_exit_code: Current broken pipe exit code.
+        broken_pipe_strategy: Current broken pipe handling strategy.
         traceback_force_color: Current traceback color forcing flag.
+        fast_exit: Current fast-exit flag.
+        flush_deadline: Current final-flush deadline in seconds.
+        flush_truncated_exit_code: Current exit code for truncated output.
+        timings: Current phase-timing report flag.
+        stats_path: Current run-statistics database path.
+        rusage: Current resource-usage report format.
+        profile_path: Current cProfile output path.
+        profile_top: Current number of profiled functions to print.
+        trace_memory: Current number of allocation sites to report.
+        trace_memory_snapshot: Current tracemalloc snapshot output path.
+        timeout: Current wall-clock limit in seconds.
+        timeout_grace: Current grace period before the hard kill.
+        timeout_dump_stacks: Current stack-dump-on-timeout flag.
+        watchdog: Current longest gap between heartbeats in seconds.
+        watchdog_interrupt: Current interrupt-on-stall flag.
+        max_memory: Current memory ceiling in bytes.
+        thread_failures: Current worker-thread failure capture flag.
+        cancel_on_thread_failure: Current cancel-on-thread-failure flag.
+        fork_signal_policy: Current signal policy of forked children.
     """
 
     traceback: bool
     exit_code_style: ExitCodeStyle
     broken_pipe_exit_code: int
+    broken_pipe_strategy: BrokenPipeStrategy
     traceback_force_color: bool
+    fast_exit: bool
+    flush_deadline: float | None
+    flush_truncated_exit_code: int
+    timings: bool
+    stats_path: str | None
+    rusage: RusageFormat | None
+    profile_path: str | None
+    profile_top: int
+    trace_memory: int | None
+    trace_memory_snapshot: str | None
+    timeout: float | None
+    timeout_grace: float | None
+    timeout_dump_stacks: bool
+    watchdog: float | None
+    watchdog_interrupt: bool
+    max_memory: int | None
+    thread_failures: bool
+    cancel_on_thread_failure: bool
+    fork_signal_policy: ForkSignalPolicy
 
 
 @dataclass(slots=True)
@@ -85,8 +195,72 @@ class _Config:
         broken_pipe_exit_code: Exit code returned when a ``BrokenPipeError``
             occurs; defaults to ``141`` so pipelines can detect truncated
             output.
+        broken_pipe_strategy: Selects how ``EPIPE`` on stdout is handled; see
+            :class:`BrokenPipeStrategy`.
         traceback_force_color: Force Rich to emit ANSI-coloured tracebacks even
             when stdout/stderr are not detected as TTYs.
+        fast_exit: When ``True`` :func:`run_cli` terminates the process with
+            :func:`os._exit` once the exit code is known and streams flushed,
+            skipping interpreter teardown (GC, module cleanup) for CLIs that
+            leave large heaps behind. Registered ``atexit`` callbacks still run.
+        flush_deadline: Seconds the final stdout/stderr flush may wait for a
+            stalled pipe reader before dropping the remaining output;
+            ``None`` (default) waits indefinitely.
+        flush_truncated_exit_code: Exit code reported when the flush deadline
+            dropped output of an otherwise successful run; defaults to ``75``
+            (``EX_TEMPFAIL``) so callers can retry.
+        timings: When ``True`` :func:`run_cli` prints a per-phase timing
+            breakdown (signal install, parse, command, exception handling,
+            finalisation) to stderr after the run.
+        stats_path: SQLite database that :func:`run_cli` appends one
+            run record (command path, duration, exit code, CPU time, peak
+            RSS) to; ``None`` (default) falls back to the
+            ``LIB_CLI_EXIT_TOOLS_STATS_DB`` environment variable and records
+            nothing when that is unset too.
+        rusage: When set, :func:`run_cli` prints wall time, CPU, peak RSS,
+            context switches, and block I/O of the process and its children
+            to stderr after every run in the selected :class:`RusageFormat`;
+            ``None`` (default) disables the report.
+        profile_path: When set, :func:`run_cli` runs the command under
+            :mod:`cProfile` and writes the ``pstats`` file here, also when the
+            command fails or is interrupted; ``None`` (default) disables
+            profiling.
+        profile_top: Number of functions (by cumulative time, excluding this
+            package's frames) printed to stderr after profiling; ``0``
+            (default) prints none.
+        trace_memory: When set, :func:`run_cli` traces allocations with
+            :mod:`tracemalloc` and prints the peak traced memory plus this
+            many top allocation sites to stderr on exit, or from
+            :func:`handle_cli_exception` when the command fails; ``None``
+            (default) disables tracing.
+        trace_memory_snapshot: Optional file the traced snapshot is written
+            to so two runs can be compared; only used with ``trace_memory``.
+        timeout: Wall-clock seconds the command may run before
+            :func:`run_cli` interrupts it with a ``TimeoutInterrupt`` that
+            resolves to exit code ``124`` (as with coreutils ``timeout``);
+            ``None`` (default) never interrupts.
+        timeout_grace: Seconds the interrupted command may spend unwinding
+            before the process is killed outright with exit code ``124``;
+            ``None`` (default) waits indefinitely.
+        timeout_dump_stacks: When ``True`` the stacks of all threads are
+            printed to stderr when the timeout fires.
+        watchdog: Longest gap in seconds between two ``heartbeat()`` calls
+            before :func:`run_cli` prints the stacks of all threads as a
+            stall report; ``None`` (default) disables the watchdog.
+        watchdog_interrupt: When ``True`` a stall also interrupts the
+            command with a ``StallInterrupt`` that resolves to exit code
+            ``125``.
+        max_memory: Ceiling in bytes applied to the command via
+            ``setrlimit`` (``RLIMIT_AS``; ``RLIMIT_DATA`` on macOS) so runaway
+            allocations raise ``MemoryError`` instead of inviting the OOM
+            killer; ``None`` (default) leaves the limit alone.
+        thread_failures: When ``True`` exceptions escaping worker threads (and
+            unraisable exceptions) are rendered like command failures and turn
+            a successful exit into a failing one.
+        cancel_on_thread_failure: When ``True`` the first such failure also
+            cancels the running command; implies ``thread_failures``.
+        fork_signal_policy: Signal handling of processes forked while the
+            CLI's handlers are installed; see :class:`ForkSignalPolicy`.
     Side Effects:
         Mutations are process wide because :data:`config` exports a module-level
         instance. Callers should restore values in tests to avoid leakage.
@@ -95,13 +269,52 @@ class _Config:
     traceback: bool = False
     exit_code_style: ExitCodeStyle = ExitCodeStyle.ERRNO
     broken_pipe_exit_code: int = 141
+    broken_pipe_strategy: BrokenPipeStrategy = BrokenPipeStrategy.EXCEPTION
     traceback_force_color: bool = False
+    fast_exit: bool = False
+    flush_deadline: float | None = None
+    flush_truncated_exit_code: int = 75
+    timings: bool = False
+    stats_path: str | None = None
+    rusage: RusageFormat | None = None
+    profile_path: str | None = None
+    profile_top: int = 0
+    trace_memory: int | None = None
+    trace_memory_snapshot: str | None = None
+    timeout: float | None = None
+    timeout_grace: float | None = None
+    timeout_dump_stacks: bool = False
+    watchdog: float | None = None
+    watchdog_interrupt: bool = False
+    max_memory: int | None = None
+    thread_failures: bool = False
+    cancel_on_thread_failure: bool = False
+    fork_signal_policy: ForkSignalPolicy = ForkSignalPolicy.PREVIOUS
 
 
 #: Shared configuration singleton consulted by CLI orchestration helpers.
 config = _Config()
 
 
+#: Fields describing reports and limits of a single run (see :func:`reset_run_reports`).
+_RUN_REPORT_FIELDS = (
+    "timings",
+    "stats_path",
+    "rusage",
+    "profile_path",
+    "profile_top",
+    "trace_memory",
+    "trace_memory_snapshot",
+    "timeout",
+    "timeout_grace",
+    "timeout_dump_stacks",
+    "watchdog",
+    "watchdog_interrupt",
+    "thread_failures",
+    "cancel_on_thread_failure",
+)
+
+
 def _field_names() -> tuple[str, ...]:
     """Return the ordered configuration field names."""
 
@@ -116,7 +329,27 @@ def _default_values() -> ConfigSnapshot:
         traceback=defaults.traceback,
         exit_code_style=defaults.exit_code_style,
         broken_pipe_exit_code=defaults.broken_pipe_exit_code,
+        broken_pipe_strategy=defaults.broken_pipe_strategy,
         traceback_force_color=defaults.traceback_force_color,
+        fast_exit=defaults.fast_exit,
+        flush_deadline=defaults.flush_deadline,
+        flush_truncated_exit_code=defaults.flush_truncated_exit_code,
+        timings=defaults.timings,
+        stats_path=defaults.stats_path,
+        rusage=defaults.rusage,
+        profile_path=defaults.profile_path,
+        profile_top=defaults.profile_top,
+        trace_memory=defaults.trace_memory,
+        trace_memory_snapshot=defaults.trace_memory_snapshot,
+        timeout=defaults.timeout,
+        timeout_grace=defaults.timeout_grace,
+        timeout_dump_stacks=defaults.timeout_dump_stacks,
+        watchdog=defaults.watchdog,
+        watchdog_interrupt=defaults.watchdog_interrupt,
+        max_memory=defaults.max_memory,
+        thread_failures=defaults.thread_failures,
+        cancel_on_thread_failure=defaults.cancel_on_thread_failure,
+        fork_signal_policy=defaults.fork_signal_policy,
     )
 
 
@@ -127,7 +360,27 @@ def _snapshot_current_settings() -> ConfigSnapshot:
         traceback=config.traceback,
         exit_code_style=config.exit_code_style,
         broken_pipe_exit_code=config.broken_pipe_exit_code,
+        broken_pipe_strategy=config.broken_pipe_strategy,
         traceback_force_color=config.traceback_force_color,
+        fast_exit=config.fast_exit,
+        flush_deadline=config.flush_deadline,
+        flush_truncated_exit_code=config.flush_truncated_exit_code,
+        timings=config.timings,
+        stats_path=config.stats_path,
+        rusage=config.rusage,
+        profile_path=config.profile_path,
+        profile_top=config.profile_top,
+        trace_memory=config.trace_memory,
+        trace_memory_snapshot=config.trace_memory_snapshot,
+        timeout=config.timeout,
+        timeout_grace=config.timeout_grace,
+        timeout_dump_stacks=config.timeout_dump_stacks,
+        watchdog=config.watchdog,
+        watchdog_interrupt=config.watchdog_interrupt,
+        max_memory=config.max_memory,
+        thread_failures=config.thread_failures,
+        cancel_on_thread_failure=config.cancel_on_thread_failure,
+        fork_signal_policy=config.fork_signal_policy,
     )
 
 
@@ -137,7 +390,27 @@ def _restore_settings(snapshot: ConfigSnapshot) -> None:
     config.traceback = snapshot["traceback"]
     config.exit_code_style = snapshot["exit_code_style"]
     config.broken_pipe_exit_code = snapshot["broken_pipe_exit_code"]
+    config.broken_pipe_strategy = snapshot["broken_pipe_strategy"]
     config.traceback_force_color = snapshot["traceback_force_color"]
+    config.fast_exit = snapshot["fast_exit"]
+    config.flush_deadline = snapshot["flush_deadline"]
+    config.flush_truncated_exit_code = snapshot["flush_truncated_exit_code"]
+    config.timings = snapshot["timings"]
+    config.stats_path = snapshot["stats_path"]
+    config.rusage = snapshot["rusage"]
+    config.profile_path = snapshot["profile_path"]
+    config.profile_top = snapshot["profile_top"]
+    config.trace_memory = snapshot["trace_memory"]
+    config.trace_memory_snapshot = snapshot["trace_memory_snapshot"]
+    config.timeout = snapshot["timeout"]
+    config.timeout_grace = snapshot["timeout_grace"]
+    config.timeout_dump_stacks = snapshot["timeout_dump_stacks"]
+    config.watchdog = snapshot["watchdog"]
+    config.watchdog_interrupt = snapshot["watchdog_interrupt"]
+    config.max_memory = snapshot["max_memory"]
+    config.thread_failures = snapshot["thread_failures"]
+    config.cancel_on_thread_failure = snapshot["cancel_on_thread_failure"]
+    config.fork_signal_policy = snapshot["fork_signal_policy"]
 
 
 def _reject_unknown_fields(overrides: Mapping[str, object]) -> None:
@@ -155,6 +428,27 @@ def reset_config() -> None:
     _restore_settings(_default_values())
 
 
+def reset_run_reports() -> None:
+    """Switch off the per-run reports and limits while keeping exit-code semantics.
+
+    Why:
+        A forked child inherits :data:`config` from a parent that may be
+        profiling, tracing memory, or recording statistics for its own run;
+        the child must not repeat those reports or arm the parent's timeout
+        or watchdog.
+    Side Effects:
+        Resets ``timings``, ``stats_path``, ``rusage``, ``profile_path``,
+        ``profile_top``, ``trace_memory``, ``trace_memory_snapshot``,
+        ``timeout``, ``timeout_grace``, ``timeout_dump_stacks``,
+        ``watchdog``, ``watchdog_interrupt``, ``thread_failures``, and
+        ``cancel_on_thread_failure`` to their defaults.
+    """
+
+    defaults = _Config()
+    for name in _RUN_REPORT_FIELDS:
+        setattr(config, name, getattr(defaults, name))
+
+
 @contextmanager
 def config_overrides(**overrides: object) -> Generator[_Config]:
     """Snapshot configuration state and optionally apply temporary overrides."""
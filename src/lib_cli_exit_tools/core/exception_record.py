@@ -0,0 +1,353 @@
+"""Serialisable records of exceptions raised in other processes.
+
+Purpose:
+    An exception raised in a ``multiprocessing`` or ``ProcessPoolExecutor``
+    worker reaches the parent by pickling: the traceback is dropped, and an
+    exception whose constructor does not match its ``args`` fails to
+    unpickle at all. Either way the parent loses the ``errno`` or
+    ``returncode`` that decides the exit code.
+Contents:
+    * :class:`FrameRecord` / :class:`ExceptionRecord` plain-data snapshots of
+      an exception, its chain, and its frames.
+    * :data:`DEFAULT_MAX_FRAMES` innermost frames kept per exception.
+    * :class:`RemoteTraceback` attached as ``__cause__`` of rebuilt exceptions.
+    * :class:`RemoteError` stand-in when the original type cannot be rebuilt.
+    * :func:`transport_exceptions` wrapping worker callables so their
+      exceptions cross the process boundary as records.
+System Integration:
+    ``CancellableProcessPool`` wraps submitted callables with
+    :func:`transport_exceptions`. The parent receives the rebuilt exception,
+    so :func:`get_system_exit_code` and :func:`print_exception_message` treat
+    it like one raised locally.
+"""
+
+from __future__ import annotations
+
+import importlib
+import linecache
+import subprocess  # nosec B404 - rebuilds CalledProcessError from records
+import traceback
+from collections.abc import Callable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Generic, ParamSpec, TypeVar, cast
+
+__all__ = [
+    "DEFAULT_MAX_FRAMES",
+    "ExceptionRecord",
+    "FrameRecord",
+    "RemoteError",
+    "RemoteTraceback",
+    "transport_exceptions",
+]
+
+#: Frames kept per exception; the innermost ones are the useful ones.
+DEFAULT_MAX_FRAMES = 64
+
+#: Chained exceptions (``__cause__`` / ``__context__``) followed at most.
+_MAX_CHAIN = 8
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+_Scalar = str | int | float | bool | bytes | None
+
+
+@dataclass(frozen=True, slots=True)
+class FrameRecord:
+    """One traceback frame: where it ran, without the source text."""
+
+    filename: str
+    lineno: int
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class ExceptionRecord:
+    """Picklable, JSON-friendly snapshot of an exception.
+
+    Fields:
+        type_path: ``module.QualName`` of the exception class.
+        message: ``str(exc)``.
+        args: ``exc.args`` when they are plain data (scalars or sequences of
+            scalars), else ``None``.
+        errno: ``exc.errno`` for ``OSError`` and friends.
+        winerror: ``exc.winerror`` on Windows errors.
+        returncode: ``exc.returncode`` (``CalledProcessError``).
+        frames: Traceback frames, outermost first, at most
+            ``DEFAULT_MAX_FRAMES`` innermost ones.
+        cause: Record of ``__cause__``.
+        context: Record of ``__context__`` unless it was suppressed.
+    Examples:
+        >>> record = ExceptionRecord.capture(FileNotFoundError(2, "missing"))
+        >>> record.type_path, record.errno
+        ('builtins.FileNotFoundError', 2)
+        >>> rebuilt = record.rebuild()
+        >>> type(rebuilt).__name__, rebuilt.errno
+        ('FileNotFoundError', 2)
+    """
+
+    type_path: str
+    message: str
+    args: tuple[Any, ...] | None = None
+    errno: int | None = None
+    winerror: int | None = None
+    returncode: int | None = None
+    frames: tuple[FrameRecord, ...] = ()
+    cause: ExceptionRecord | None = None
+    context: ExceptionRecord | None = None
+
+    @classmethod
+    def capture(cls, exc: BaseException, *, max_frames: int = DEFAULT_MAX_FRAMES) -> ExceptionRecord:
+        """Record ``exc`` and its chain; reads no source files."""
+        return _capture(exc, max_frames, depth=0)
+
+    @property
+    def type_name(self) -> str:
+        """Class name as Python prints it (``ValueError``, ``subprocess.CalledProcessError``)."""
+        module, _, qualname = self.type_path.rpartition(".")
+        return qualname if module in ("builtins", "") else self.type_path
+
+    def format(self) -> str:
+        """Render the record like :func:`traceback.format_exception` would."""
+        return "".join(_format_chain(self))
+
+    def rebuild(self) -> BaseException:
+        """Recreate the exception in this process.
+
+        Returns:
+            An instance of the original class when it can be imported and
+            constructed from :attr:`args`; otherwise an ``OSError`` (errno
+            or winerror recorded), a ``CalledProcessError`` (returncode
+            recorded), or a :class:`RemoteError`. Its ``__cause__`` is a
+            :class:`RemoteTraceback` and ``exception_record`` holds ``self``.
+        """
+        exc = _construct(self) or _stand_in(self)
+        exc.__cause__ = RemoteTraceback(self.format())
+        with suppress(AttributeError, TypeError):
+            setattr(exc, "exception_record", self)  # noqa: B010 - undeclared on BaseException
+        return exc
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as JSON-compatible nested dictionaries."""
+        return {
+            "type_path": self.type_path,
+            "message": self.message,
+            "args": None if self.args is None else list(self.args),
+            "errno": self.errno,
+            "winerror": self.winerror,
+            "returncode": self.returncode,
+            "frames": [[frame.filename, frame.lineno, frame.name] for frame in self.frames],
+            "cause": None if self.cause is None else self.cause.to_dict(),
+            "context": None if self.context is None else self.context.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ExceptionRecord:
+        """Inverse of :meth:`to_dict`."""
+        args = data.get("args")
+        cause = data.get("cause")
+        context = data.get("context")
+        return cls(
+            type_path=str(data["type_path"]),
+            message=str(data.get("message", "")),
+            args=None if args is None else tuple(_as_tuple(item) for item in args),
+            errno=data.get("errno"),
+            winerror=data.get("winerror"),
+            returncode=data.get("returncode"),
+            frames=tuple(FrameRecord(str(f[0]), int(f[1]), str(f[2])) for f in data.get("frames", ())),
+            cause=None if cause is None else cls.from_dict(cause),
+            context=None if context is None else cls.from_dict(context),
+        )
+
+
+class RemoteTraceback(Exception):
+    """Carries the formatted traceback of an exception rebuilt from a record."""
+
+    def __init__(self, text: str) -> None:
+        super().__init__(text)
+        self.text = text
+
+    def __str__(self) -> str:
+        return f'\n"""\n{self.text}"""'
+
+
+class RemoteError(Exception):
+    """Stand-in for a remote exception whose class could not be rebuilt.
+
+    Attributes:
+        exception_record: The record it was rebuilt from.
+    """
+
+    def __init__(self, record: ExceptionRecord) -> None:
+        super().__init__(f"{record.type_name}: {record.message}")
+        self.exception_record = record
+
+
+class _Transported(Exception):
+    """Raised in a worker; unpickles in the parent as the rebuilt exception."""
+
+    def __init__(self, record: ExceptionRecord) -> None:
+        super().__init__(record.type_name, record.message)
+        self.record = record
+
+    def __reduce__(self) -> tuple[Callable[[ExceptionRecord], BaseException], tuple[ExceptionRecord]]:
+        return (_rebuild, (self.record,))
+
+
+def _rebuild(record: ExceptionRecord) -> BaseException:
+    """Unpickling hook of :class:`_Transported`."""
+    return record.rebuild()
+
+
+class _Transporting(Generic[_P, _T]):
+    """Picklable wrapper turning exceptions of ``fn`` into :class:`_Transported`."""
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[_P, _T]) -> None:
+        self.fn = fn
+
+    def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> _T:
+        try:
+            return self.fn(*args, **kwargs)
+        except Exception as exc:
+            raise _Transported(ExceptionRecord.capture(exc)) from exc
+
+
+def transport_exceptions(fn: Callable[_P, _T]) -> Callable[_P, _T]:
+    """Wrap ``fn`` so its exceptions survive the trip to the parent process.
+
+    Why:
+        Pass the result to ``multiprocessing.Pool.apply_async`` or
+        ``Executor.submit``. An exception from ``fn`` is pickled as its
+        :class:`ExceptionRecord` and rebuilt on unpickling, so the parent
+        sees the original class, ``errno``/``returncode``, and traceback even
+        when the exception itself is not picklable.
+    Parameters:
+        fn: Module-level (picklable) callable run in the worker.
+    Returns:
+        A picklable callable with the same signature.
+    """
+    return _Transporting(fn)
+
+
+def _capture(exc: BaseException, max_frames: int, depth: int) -> ExceptionRecord:
+    """Build the record of ``exc``, following its chain up to ``_MAX_CHAIN``."""
+    frames = tuple(FrameRecord(frame.f_code.co_filename, lineno, frame.f_code.co_name) for frame, lineno in traceback.walk_tb(exc.__traceback__))
+    cause = exc.__cause__
+    context = None if exc.__suppress_context__ else exc.__context__
+    follow = depth < _MAX_CHAIN
+    return ExceptionRecord(
+        type_path=f"{type(exc).__module__}.{type(exc).__qualname__}",
+        message=_safe_str(exc),
+        args=_portable_args(exc.args),
+        errno=_int_attribute(exc, "errno"),
+        winerror=_int_attribute(exc, "winerror"),
+        returncode=_int_attribute(exc, "returncode"),
+        frames=frames[-max_frames:] if max_frames > 0 else (),
+        cause=_capture(cause, max_frames, depth + 1) if cause is not None and follow else None,
+        context=_capture(context, max_frames, depth + 1) if context is not None and follow else None,
+    )
+
+
+def _safe_str(exc: BaseException) -> str:
+    """Return ``str(exc)``, or a placeholder when ``__str__`` fails."""
+    try:
+        return str(exc)
+    except Exception:  # noqa: BLE001 - any __str__ failure
+        return f"<unprintable {type(exc).__name__}>"
+
+
+def _int_attribute(exc: BaseException, name: str) -> int | None:
+    """Return ``exc.<name>`` when it is an ``int``."""
+    value = getattr(exc, name, None)
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _is_scalar(value: object) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool, bytes))
+
+
+def _portable_args(args: tuple[Any, ...]) -> tuple[Any, ...] | None:
+    """Return ``args`` with lists as tuples, or ``None`` when they are not plain data."""
+    portable: list[Any] = []
+    for item in args:
+        if _is_scalar(item):
+            portable.append(item)
+        elif isinstance(item, (list, tuple)) and all(_is_scalar(part) for part in cast("list[object]", item)):
+            portable.append(tuple(cast("list[_Scalar]", item)))
+        else:
+            return None
+    return tuple(portable)
+
+
+def _as_tuple(item: Any) -> Any:
+    """Turn JSON lists back into tuples."""
+    return tuple(cast("list[Any]", item)) if isinstance(item, list) else item
+
+
+def _resolve_type(type_path: str) -> type[BaseException] | None:
+    """Import the exception class named by ``type_path``."""
+    module_name, _, qualname = type_path.rpartition(".")
+    while module_name:
+        try:
+            target: Any = importlib.import_module(module_name)
+            break
+        except ImportError:
+            module_name, _, head = module_name.rpartition(".")
+            qualname = f"{head}.{qualname}"
+    else:
+        return None
+    for part in qualname.split("."):
+        target = getattr(target, part, None)
+    if isinstance(target, type) and issubclass(target, BaseException):
+        return target
+    return None
+
+
+def _construct(record: ExceptionRecord) -> BaseException | None:
+    """Instantiate the original class from the recorded args."""
+    cls = _resolve_type(record.type_path)
+    if cls is None:
+        return None
+    try:
+        exc = cls(*record.args) if record.args is not None else cls(record.message)
+    except Exception:  # noqa: BLE001 - constructor does not match the args
+        return None
+    if record.winerror is not None and getattr(exc, "winerror", None) is None:
+        with suppress(AttributeError, TypeError):
+            setattr(exc, "winerror", record.winerror)  # noqa: B010 - POSIX OSError lacks it
+    return exc
+
+
+def _stand_in(record: ExceptionRecord) -> BaseException:
+    """Pick a local exception that resolves to the same exit code."""
+    if record.errno is not None or record.winerror is not None:
+        exc = OSError(record.errno, f"{record.type_name}: {record.message}")
+        if record.winerror is not None:
+            setattr(exc, "winerror", record.winerror)  # noqa: B010 - POSIX OSError lacks it
+        return exc
+    if record.returncode is not None:
+        return subprocess.CalledProcessError(record.returncode, record.message)
+    return RemoteError(record)
+
+
+def _format_chain(record: ExceptionRecord) -> list[str]:
+    """Format ``record`` after its cause or context, as Python does."""
+    lines: list[str] = []
+    if record.cause is not None:
+        lines += _format_chain(record.cause)
+        lines.append("\nThe above exception was the direct cause of the following exception:\n\n")
+    elif record.context is not None:
+        lines += _format_chain(record.context)
+        lines.append("\nDuring handling of the above exception, another exception occurred:\n\n")
+    if record.frames:
+        lines.append("Traceback (most recent call last):\n")
+        for frame in record.frames:
+            lines.append(f'  File "{frame.filename}", line {frame.lineno}, in {frame.name}\n')
+            source = linecache.getline(frame.filename, frame.lineno).strip()
+            if source:
+                lines.append(f"    {source}\n")
+    lines.append(f"{record.type_name}: {record.message}\n" if record.message else f"{record.type_name}\n")
+    return lines
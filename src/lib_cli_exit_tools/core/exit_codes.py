@@ -6,6 +6,9 @@ Purpose:
     conventions.
 Contents:
     * :func:`get_system_exit_code` – primary mapping entry point.
+    * :func:`classify_exception` / :func:`is_transient` – label failures as
+      worth retrying or not.
+    * :func:`exit_code_from_returncode` – shell-style status of a child process.
     * :func:`_sysexits_mapping` – internal helper for sysexits mode.
 System Integration:
     Used by application orchestration and CLI adapters to convert unhandled
@@ -15,15 +18,80 @@ System Integration:
 
 from __future__ import annotations
 
+import errno
 import os
 import subprocess  # nosec B404 - imported for CalledProcessError type inspection
-from typing import Callable, Iterable, Mapping
+from enum import Enum
+from typing import Callable, Iterable, Mapping, cast
 
 from .configuration import ExitCodeStyle, config
 
-__all__ = ["get_system_exit_code"]
+__all__ = [
+    "TRANSIENT_ERRNOS",
+    "FailureKind",
+    "classify_exception",
+    "exit_code_from_returncode",
+    "get_system_exit_code",
+    "is_transient",
+]
 
 Resolver = Callable[[BaseException], int | None]
+TransienceResolver = Callable[[BaseException], bool | None]
+
+#: ``EX_TEMPFAIL`` – exit status meaning "temporary failure, try again later".
+_EX_TEMPFAIL = 75
+
+
+class FailureKind(str, Enum):
+    """Whether rerunning a failed command could succeed.
+
+    Members:
+        TRANSIENT: The cause is likely temporary (timeouts, resets, busy or
+            temporarily unavailable resources); retrying may succeed.
+        PERMANENT: Retrying the same input would fail the same way.
+    """
+
+    TRANSIENT = "transient"
+    PERMANENT = "permanent"
+
+
+#: errno values reported as :attr:`FailureKind.TRANSIENT`; names missing on
+#: the host platform are skipped.
+TRANSIENT_ERRNOS: frozenset[int] = frozenset(
+    code
+    for code in (
+        getattr(errno, name, None)
+        for name in (
+            "EAGAIN",
+            "EWOULDBLOCK",
+            "EINTR",
+            "EBUSY",
+            "ETIMEDOUT",
+            "ECONNRESET",
+            "ECONNREFUSED",
+            "ECONNABORTED",
+            "ENETDOWN",
+            "ENETUNREACH",
+            "ENETRESET",
+            "EHOSTDOWN",
+            "EHOSTUNREACH",
+            "ENOBUFS",
+            "EDEADLK",
+            "ETXTBSY",
+        )
+    )
+    if code is not None
+)
+
+#: Exception types that are transient even without an ``errno``.
+_TRANSIENT_TYPES: tuple[type[BaseException], ...] = (
+    TimeoutError,
+    ConnectionResetError,
+    ConnectionRefusedError,
+    ConnectionAbortedError,
+    InterruptedError,
+    BlockingIOError,
+)
 
 
 def _is_posix_platform() -> bool:
@@ -84,6 +152,7 @@ def _exit_resolvers() -> Iterable[Resolver]:
     """
 
     return (
+        _code_from_exception_group,
         _code_from_called_process_error,
         _code_from_keyboard_interrupt,
         _code_from_winerror_attribute,
@@ -95,6 +164,103 @@ def _exit_resolvers() -> Iterable[Resolver]:
     )
 
 
+def classify_exception(exc: BaseException) -> FailureKind:
+    """Why:
+        Let orchestrators and :func:`run_cli`'s retry policy decide whether a
+        failure is worth another attempt without keeping their own errno lists.
+    What:
+        Walk the transience resolvers and label ``exc``; anything not
+        recognised as transient is permanent.
+    Parameters:
+        exc: Exception raised by application or adapter code.
+    Returns:
+        :attr:`FailureKind.TRANSIENT` or :attr:`FailureKind.PERMANENT`.
+    Side Effects:
+        None.
+    Examples:
+        >>> import errno
+        >>> classify_exception(OSError(errno.ECONNRESET, "reset")).value
+        'transient'
+        >>> classify_exception(FileNotFoundError(errno.ENOENT, "missing")).value
+        'permanent'
+    """
+    return FailureKind.TRANSIENT if is_transient(exc) else FailureKind.PERMANENT
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Return ``True`` when :func:`classify_exception` labels ``exc`` transient.
+
+    Exceptions may decide for themselves with a boolean ``transient``
+    attribute, which wins over every other rule.
+    """
+    for resolver in _transience_resolvers():
+        verdict = resolver(exc)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+def _transience_resolvers() -> Iterable[TransienceResolver]:
+    """Yield transience resolvers ordered from most specific to most general."""
+    return (
+        _transient_from_attribute,
+        _transient_from_exit_status,
+        _transient_from_errno,
+        _transient_from_type,
+    )
+
+
+def _transient_from_attribute(exc: BaseException) -> bool | None:
+    """Honour an explicit boolean ``transient`` attribute on ``exc``."""
+    verdict = getattr(exc, "transient", None)
+    return verdict if isinstance(verdict, bool) else None
+
+
+def _transient_from_exit_status(exc: BaseException) -> bool | None:
+    """Treat ``EX_TEMPFAIL`` from ``sys.exit`` or a subprocess as transient."""
+    if isinstance(exc, SystemExit):
+        return exc.code == _EX_TEMPFAIL
+    if isinstance(exc, subprocess.CalledProcessError):
+        return exc.returncode == _EX_TEMPFAIL
+    return None
+
+
+def _transient_from_errno(exc: BaseException) -> bool | None:
+    """Look up the ``errno`` of an ``OSError`` in :data:`TRANSIENT_ERRNOS`."""
+    if not isinstance(exc, OSError) or exc.errno is None:
+        return None
+    return exc.errno in TRANSIENT_ERRNOS
+
+
+def _transient_from_type(exc: BaseException) -> bool | None:
+    """Recognise transient exception types raised without an ``errno``."""
+    return True if isinstance(exc, _TRANSIENT_TYPES) else None
+
+
+def _code_from_exception_group(exc: BaseException) -> int | None:
+    """Why:
+        An exception group (``asyncio.TaskGroup``, ``fan_out``) has no exit
+        status of its own; its members do.
+    What:
+        Resolve the group to the exit code of its first member, descending
+        into nested groups. Recognises groups by their ``exceptions`` tuple,
+        which also covers the ``exceptiongroup`` backport on Python 3.10.
+    Parameters:
+        exc: Exception under evaluation.
+    Returns:
+        Exit code of the first member, or ``None`` for anything else.
+    Side Effects:
+        None.
+    """
+    members: object = getattr(exc, "exceptions", None)
+    if not isinstance(members, tuple):
+        return None
+    first = next(iter(cast("tuple[object, ...]", members)), None)
+    if not isinstance(first, BaseException):
+        return None
+    return get_system_exit_code(first)
+
+
 def _code_from_called_process_error(exc: BaseException) -> int | None:
     """Why:
         Preserve exit statuses produced by failing subprocesses.
@@ -109,7 +275,30 @@ def _code_from_called_process_error(exc: BaseException) -> int | None:
     """
     if not isinstance(exc, subprocess.CalledProcessError):
         return None
-    return _safe_int(getattr(exc, "returncode", None)) or 1
+    returncode = _safe_int(getattr(exc, "returncode", None))
+    return exit_code_from_returncode(returncode) if returncode else 1
+
+
+def exit_code_from_returncode(returncode: int) -> int:
+    """Why:
+        :mod:`subprocess` reports a child killed by signal ``N`` as
+        ``returncode == -N``, which is not a valid process exit status.
+    What:
+        Map signal deaths to ``128 + N`` like POSIX shells; pass other values
+        through unchanged.
+    Parameters:
+        returncode: ``Popen.returncode`` of a finished child.
+    Returns:
+        Exit status suitable for :func:`sys.exit`.
+    Side Effects:
+        None.
+    Examples:
+        >>> exit_code_from_returncode(-9)
+        137
+        >>> exit_code_from_returncode(3)
+        3
+    """
+    return 128 - returncode if returncode < 0 else returncode
 
 
 def _code_from_keyboard_interrupt(exc: BaseException) -> int | None:
@@ -277,6 +466,7 @@ def _posix_exception_map() -> Mapping[type[BaseException], int]:
         IsADirectoryError: 21,
         NotADirectoryError: 20,
         TimeoutError: 110,
+        MemoryError: 12,
         TypeError: 22,
         ValueError: 22,
         RuntimeError: 1,
@@ -302,6 +492,7 @@ def _windows_exception_map() -> Mapping[type[BaseException], int]:
         IsADirectoryError: 267,
         NotADirectoryError: 267,
         TimeoutError: 1460,
+        MemoryError: 8,
         TypeError: 87,
         ValueError: 87,
         RuntimeError: 1,
@@ -341,10 +532,12 @@ def _sysexits_resolved_code(exc: BaseException) -> int:
 def _sysexits_resolvers() -> Iterable[Resolver]:
     """Yield sysexits-specific resolver callables."""
     return (
+        _code_from_exception_group,
         _sysexits_from_system_exit,
         _sysexits_from_keyboard_interrupt,
         _sysexits_from_called_process_error,
         _sysexits_from_broken_pipe,
+        _sysexits_from_memory_error,
         _sysexits_from_usage_errors,
         _sysexits_from_missing_resource,
         _sysexits_from_permission_denied,
@@ -375,7 +568,7 @@ def _sysexits_from_called_process_error(exc: BaseException) -> int | None:
     if not isinstance(exc, subprocess.CalledProcessError):
         return None
     try:
-        return int(exc.returncode)
+        return exit_code_from_returncode(int(exc.returncode))
     except Exception:
         return 1
 
@@ -387,6 +580,13 @@ def _sysexits_from_broken_pipe(exc: BaseException) -> int | None:
     return None
 
 
+def _sysexits_from_memory_error(exc: BaseException) -> int | None:
+    """Map exhausted memory to ``EX_OSERR``."""
+    if isinstance(exc, MemoryError):
+        return 71
+    return None
+
+
 def _sysexits_from_usage_errors(exc: BaseException) -> int | None:
     """Return the usage-error sysexits code for common argument mistakes."""
     if isinstance(exc, (TypeError, ValueError)):
@@ -5,14 +5,43 @@ Purpose:
     code translation, and CLI orchestration primitives after the refactor into
     layered modules.
 Contents:
-    * ``config`` from :mod:`lib_cli_exit_tools.core.configuration`.
+    * ``config`` and the :class:`BrokenPipeStrategy`, :class:`ExitCodeStyle`,
+      :class:`ForkSignalPolicy`, and :class:`RusageFormat` enums from
+      :mod:`lib_cli_exit_tools.core.configuration`.
     * ``config_overrides`` and ``reset_config`` helpers to manage configuration
       state safely during temporary tweaks.
-    * ``get_system_exit_code`` from :mod:`lib_cli_exit_tools.core.exit_codes`.
-    * ``handle_cli_exception`` and ``run_cli`` from
+    * ``get_system_exit_code``, ``classify_exception``, ``is_transient``, and
+      :class:`FailureKind` from :mod:`lib_cli_exit_tools.core.exit_codes`.
+    * ``handle_cli_exception``, ``run_cli``, and ``run_cli_async`` from
       :mod:`lib_cli_exit_tools.application.runner`.
+    * :class:`RetryPolicy` from :mod:`lib_cli_exit_tools.application.retry`.
+    * :class:`Zygote` and :func:`request_zygote_run` from
+      :mod:`lib_cli_exit_tools.application.zygote`.
     * :func:`i_should_fail` defined here for intentionally exercising error paths.
-    * Signal helpers from :mod:`lib_cli_exit_tools.adapters.signals`.
+    * Signal helpers, including :func:`signal_deliveries` and
+      :func:`defer_signals`, from
+      :mod:`lib_cli_exit_tools.adapters.signals`.
+    * :func:`install_signal_relay` from
+      :mod:`lib_cli_exit_tools.adapters.signal_relay`.
+    * :class:`PhaseTimings` and :data:`PhaseHook` from
+      :mod:`lib_cli_exit_tools.application.timings`.
+    * :class:`GcPolicy` and :class:`GcStats` from
+      :mod:`lib_cli_exit_tools.adapters.gc_policy`.
+    * :class:`StatsStore`, :class:`RunRecord`, and :class:`CommandStats` from
+      :mod:`lib_cli_exit_tools.adapters.stats`.
+    * :class:`CancellationToken` and :func:`current_cancellation_token` from
+      :mod:`lib_cli_exit_tools.adapters.cancellation`.
+    * :class:`CancellableThreadPool` and :class:`CancellableProcessPool` from
+      :mod:`lib_cli_exit_tools.adapters.pools`.
+    * :func:`run_child`, :class:`ChildResult`, :func:`fan_out`,
+      :func:`fan_out_async`, and :class:`FanOutError` from
+      :mod:`lib_cli_exit_tools.adapters.child_process`.
+    * :class:`ExceptionRecord`, :class:`RemoteError`, and
+      :func:`transport_exceptions` from
+      :mod:`lib_cli_exit_tools.core.exception_record`.
+    * :class:`ThreadFailure` and :class:`WorkerThreadFailed` from
+      :mod:`lib_cli_exit_tools.adapters.thread_failures`.
+    * :func:`heartbeat` from :mod:`lib_cli_exit_tools.adapters.watchdog`.
 System Integration:
     The CLI adapter (:mod:`lib_cli_exit_tools.cli`) and external consumers
     continue importing from this facade to avoid knowledge of the new package
@@ -21,26 +50,52 @@ System Integration:
 
 from __future__ import annotations
 
+from .adapters.cancellation import CancellationToken, current_cancellation_token
+from .adapters.child_process import ChildResult, FanOutError, fan_out, fan_out_async, run_child
+from .adapters.gc_policy import GcPolicy, GcStats
+from .adapters.pools import CancellableProcessPool, CancellableThreadPool
+from .adapters.signal_relay import install_signal_relay
 from .adapters.signals import (
     CliSignalError,
     SigBreakInterrupt,
     SigIntInterrupt,
     SigTermInterrupt,
     SignalSpec,
+    StallInterrupt,
+    TimeoutInterrupt,
     default_signal_specs,
+    defer_signals,
     install_signal_handlers,
+    signal_deliveries,
 )
+from .adapters.stats import CommandStats, RunRecord, StatsStore
+from .adapters.thread_failures import ThreadFailure, WorkerThreadFailed
+from .adapters.watchdog import heartbeat
+from .application.retry import RetryPolicy
 from .application.runner import (
     cli_session,
     flush_streams,
     handle_cli_exception,
     print_exception_message,
     run_cli,
+    run_cli_async,
 )
-from .core.configuration import ExitCodeStyle, config, config_overrides, reset_config
-from .core.exit_codes import get_system_exit_code
+from .application.timings import PhaseHook, PhaseTimings
+from .application.zygote import Zygote, request_zygote_run
+from .core.configuration import (
+    BrokenPipeStrategy,
+    ExitCodeStyle,
+    ForkSignalPolicy,
+    RusageFormat,
+    config,
+    config_overrides,
+    reset_config,
+)
+from .core.exception_record import ExceptionRecord, RemoteError, transport_exceptions
+from .core.exit_codes import FailureKind, classify_exception, get_system_exit_code, is_transient
 
 __all__ = [
+    "BrokenPipeStrategy",
     "ExitCodeStyle",
     "config",
     "get_system_exit_code",
@@ -51,14 +106,50 @@ __all__ = [
     "SigIntInterrupt",
     "SigTermInterrupt",
     "SigBreakInterrupt",
+    "TimeoutInterrupt",
+    "StallInterrupt",
     "default_signal_specs",
     "install_signal_handlers",
+    "signal_deliveries",
+    "defer_signals",
+    "install_signal_relay",
     "handle_cli_exception",
     "i_should_fail",
     "cli_session",
     "run_cli",
+    "run_cli_async",
     "config_overrides",
     "reset_config",
+    "Zygote",
+    "request_zygote_run",
+    "GcPolicy",
+    "GcStats",
+    "PhaseHook",
+    "PhaseTimings",
+    "StatsStore",
+    "RunRecord",
+    "CommandStats",
+    "RusageFormat",
+    "ForkSignalPolicy",
+    "FailureKind",
+    "classify_exception",
+    "is_transient",
+    "RetryPolicy",
+    "ThreadFailure",
+    "WorkerThreadFailed",
+    "heartbeat",
+    "CancellationToken",
+    "current_cancellation_token",
+    "CancellableThreadPool",
+    "CancellableProcessPool",
+    "run_child",
+    "ChildResult",
+    "fan_out",
+    "fan_out_async",
+    "FanOutError",
+    "ExceptionRecord",
+    "RemoteError",
+    "transport_exceptions",
 ]
 
 PUBLIC_API = tuple(__all__)
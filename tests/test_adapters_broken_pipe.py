@@ -0,0 +1,137 @@
+"""Tests for the broken-pipe strategy adapters.
+
+Each test verifies exactly one broken-pipe behavior:
+- The SIGNAL strategy restores SIGPIPE to SIG_DFL and undoes it afterwards
+- Other strategies leave SIGPIPE untouched
+- discard_stdout silences the stdout descriptor
+- Each strategy terminates a ``cmd | head -1`` pipeline cleanly
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from lib_cli_exit_tools.adapters.broken_pipe import discard_stdout, install_broken_pipe_strategy
+from lib_cli_exit_tools.core.configuration import BrokenPipeStrategy
+
+# =============================================================================
+# SIGPIPE Disposition
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_signal_strategy_restores_default_sigpipe() -> None:
+    restore = install_broken_pipe_strategy(BrokenPipeStrategy.SIGNAL)
+    try:
+        assert signal.getsignal(signal.SIGPIPE) == signal.SIG_DFL
+    finally:
+        restore()
+
+
+@pytest.mark.posix_only
+def test_signal_strategy_restorer_reinstates_previous_disposition() -> None:
+    before = signal.getsignal(signal.SIGPIPE)
+    install_broken_pipe_strategy(BrokenPipeStrategy.SIGNAL)()
+    assert signal.getsignal(signal.SIGPIPE) == before
+
+
+@pytest.mark.posix_only
+@pytest.mark.parametrize("strategy", [BrokenPipeStrategy.EXCEPTION, BrokenPipeStrategy.DEVNULL])
+def test_non_signal_strategies_leave_sigpipe_alone(strategy: BrokenPipeStrategy) -> None:
+    before = signal.getsignal(signal.SIGPIPE)
+    restore = install_broken_pipe_strategy(strategy)
+    try:
+        assert signal.getsignal(signal.SIGPIPE) == before
+    finally:
+        restore()
+
+
+# =============================================================================
+# Discarding Stdout
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_discard_stdout_redirects_descriptor_to_devnull(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = tmp_path / "out.txt"
+    with target.open("w", encoding="utf-8") as stream:
+        monkeypatch.setattr(sys, "stdout", stream)
+        discard_stdout()
+        stream.write("dropped")
+        stream.flush()
+    assert target.read_text(encoding="utf-8") == ""
+
+
+@pytest.mark.os_agnostic
+def test_discard_stdout_ignores_streams_without_descriptor(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    discard_stdout()
+
+
+# =============================================================================
+# Pipeline Integration
+# =============================================================================
+
+
+_PIPELINE_SCRIPT = """
+import sys
+
+import rich_click as click
+
+from lib_cli_exit_tools import BrokenPipeStrategy, config, run_cli
+
+
+@click.command()
+def flood() -> None:
+    for index in range(1_000_000):
+        click.echo(f"line {index}")
+
+
+config.broken_pipe_strategy = BrokenPipeStrategy(sys.argv[1])
+raise SystemExit(run_cli(flood, argv=[]))
+"""
+
+
+def _run_into_closed_pipe(tmp_path: Path, strategy: BrokenPipeStrategy) -> tuple[int, str]:
+    """Emulate ``script | head -1`` and return the exit status and stderr."""
+    script = tmp_path / "flood.py"
+    script.write_text(textwrap.dedent(_PIPELINE_SCRIPT), encoding="utf-8")
+    env = {**os.environ, "PYTHONUNBUFFERED": "0"}
+    proc = subprocess.Popen(
+        [sys.executable, str(script), strategy.value],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    proc.stdout.readline()
+    proc.stdout.close()
+    stderr = proc.stderr.read().decode("utf-8", errors="replace")
+    proc.stderr.close()
+    return proc.wait(timeout=30), stderr
+
+
+@pytest.mark.posix_only
+def test_devnull_strategy_exits_141_without_teardown_noise(tmp_path: Path) -> None:
+    code, stderr = _run_into_closed_pipe(tmp_path, BrokenPipeStrategy.DEVNULL)
+    assert (code, "Exception ignored" in stderr) == (141, False)
+
+
+@pytest.mark.posix_only
+def test_signal_strategy_is_killed_by_sigpipe(tmp_path: Path) -> None:
+    code, _ = _run_into_closed_pipe(tmp_path, BrokenPipeStrategy.SIGNAL)
+    assert code == -signal.SIGPIPE
+
+
+@pytest.mark.posix_only
+def test_exception_strategy_maps_to_configured_code(tmp_path: Path) -> None:
+    code, _ = _run_into_closed_pipe(tmp_path, BrokenPipeStrategy.EXCEPTION)
+    assert code == 141
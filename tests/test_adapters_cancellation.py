@@ -0,0 +1,88 @@
+"""Tests for the run-scoped cancellation token.
+
+Each test verifies exactly one cancellation behavior:
+- The token is set once and keeps the first reason
+- Waiters and pollers observe cancellation
+- A scope activates a token for its block only
+- Installed signal handlers cancel the current token
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from lib_cli_exit_tools.adapters import cancellation
+from lib_cli_exit_tools.adapters.signals import SigIntInterrupt, SignalSpec, install_signal_handlers
+
+# =============================================================================
+# Token
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_first_cancel_reason_wins() -> None:
+    token = cancellation.CancellationToken()
+    token.cancel("SIGTERM", signum=15)
+    token.cancel("later")
+    assert (token.reason, token.signum) == ("SIGTERM", 15)
+
+
+@pytest.mark.os_agnostic
+def test_raise_if_cancelled_raises_cancelled_error() -> None:
+    token = cancellation.CancellationToken()
+    token.cancel("stop")
+    with pytest.raises(CancelledError):
+        token.raise_if_cancelled()
+
+
+@pytest.mark.os_agnostic
+def test_raise_if_cancelled_is_quiet_before_cancel() -> None:
+    cancellation.CancellationToken().raise_if_cancelled()
+
+
+@pytest.mark.os_agnostic
+def test_wait_returns_when_cancelled_from_another_thread() -> None:
+    token = cancellation.CancellationToken()
+    threading.Timer(0.01, token.cancel).start()
+    assert token.wait(5) is True
+
+
+# =============================================================================
+# Scope
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_scope_activates_token_inside_block() -> None:
+    with cancellation.cancellation_scope() as token:
+        assert cancellation.current_cancellation_token() is token
+
+
+@pytest.mark.os_agnostic
+def test_no_token_outside_scope() -> None:
+    assert cancellation.current_cancellation_token() is None
+
+
+@pytest.mark.os_agnostic
+def test_cancel_current_sets_active_token() -> None:
+    with cancellation.cancellation_scope() as token:
+        cancellation.cancel_current("manual")
+    assert token.cancelled is True
+
+
+@pytest.mark.posix_only
+def test_signal_handler_cancels_current_token() -> None:
+    restore = install_signal_handlers([SignalSpec(signal.SIGINT, SigIntInterrupt, "Aborted", 130)])
+    try:
+        with cancellation.cancellation_scope() as token, pytest.raises(SigIntInterrupt):
+            os.kill(os.getpid(), signal.SIGINT)
+            time.sleep(5)
+    finally:
+        restore()
+    assert (token.reason, token.signum) == ("SIGINT", signal.SIGINT)
@@ -0,0 +1,218 @@
+"""Tests for the child-process runner.
+
+Each test verifies exactly one runner behavior:
+- Output is streamed to the sinks and its tail kept
+- Failures raise CalledProcessError with the tails
+- Signal deaths map to 128 + N
+- Interrupts are forwarded to the child's process group
+- Fan-out limits concurrency, prefixes lines, and groups failures
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from lib_cli_exit_tools.adapters.cancellation import cancellation_scope
+from lib_cli_exit_tools.adapters.child_process import FanOutError, fan_out, run_child
+from lib_cli_exit_tools.core.exit_codes import get_system_exit_code
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+# =============================================================================
+# Output Streaming
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_run_child_streams_stdout_to_sink() -> None:
+    sink = io.StringIO()
+    run_child(_python("print('hello')"), stdout=sink)
+    assert sink.getvalue().strip() == "hello"
+
+
+@pytest.mark.os_agnostic
+def test_run_child_writes_bytes_to_binary_sink() -> None:
+    sink = io.BytesIO()
+    run_child(_python("import sys; sys.stdout.write('raw')"), stdout=sink)
+    assert sink.getvalue() == b"raw"
+
+
+@pytest.mark.os_agnostic
+def test_run_child_keeps_only_the_tail() -> None:
+    result = run_child(_python("print('x' * 10000 + 'END', end='')"), stdout=None, tail_bytes=8)
+    assert result.stdout_tail == b"xxxxxEND"
+
+
+@pytest.mark.os_agnostic
+def test_run_child_streams_stderr_separately() -> None:
+    out, err = io.StringIO(), io.StringIO()
+    result = run_child(_python("import sys; sys.stderr.write('oops')"), stdout=out, stderr=err)
+    assert (out.getvalue(), err.getvalue(), result.stderr_tail) == ("", "oops", b"oops")
+
+
+# =============================================================================
+# Exit Status
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_run_child_returns_result_on_success() -> None:
+    result = run_child(_python("pass"))
+    assert (result.returncode, result.exit_code) == (0, 0)
+
+
+@pytest.mark.os_agnostic
+def test_run_child_raises_called_process_error_with_tails() -> None:
+    code = "import sys; sys.stdout.write('out'); sys.stderr.write('err'); sys.exit(3)"
+    with pytest.raises(subprocess.CalledProcessError) as caught:
+        run_child(_python(code), stdout=None, stderr=None)
+    assert (caught.value.returncode, caught.value.output, caught.value.stderr) == (3, b"out", b"err")
+
+
+@pytest.mark.os_agnostic
+def test_run_child_without_check_returns_failure() -> None:
+    result = run_child(_python("raise SystemExit(4)"), check=False, stderr=None)
+    assert result.exit_code == 4
+
+
+@pytest.mark.posix_only
+def test_run_child_maps_signal_death_to_128_plus_signal() -> None:
+    result = run_child(_python("import os, signal; os.kill(os.getpid(), signal.SIGKILL)"), check=False)
+    assert (result.returncode, result.exit_code) == (-9, 137)
+
+
+# =============================================================================
+# Signal Forwarding
+# =============================================================================
+
+
+def _interrupt_main_soon() -> None:
+    def _fire() -> None:
+        time.sleep(0.3)
+        os.kill(os.getpid(), signal.SIGINT)
+
+    threading.Thread(target=_fire, daemon=True).start()
+
+
+@pytest.mark.posix_only
+def test_run_child_forwards_interrupt_to_child() -> None:
+    code = "import signal, sys, time\nsignal.signal(signal.SIGINT, lambda *_: sys.exit(42))\nprint('ready', flush=True)\ntime.sleep(30)"
+    sink = io.StringIO()
+    started = time.monotonic()
+    _interrupt_main_soon()
+    with pytest.raises(KeyboardInterrupt):
+        run_child(_python(code), stdout=sink)
+    assert time.monotonic() - started < 10
+    assert "ready" in sink.getvalue()
+
+
+@pytest.mark.posix_only
+def test_run_child_forwards_token_signal() -> None:
+    code = "import signal, time\nsignal.signal(signal.SIGINT, signal.SIG_IGN)\ntime.sleep(30)"
+    with cancellation_scope() as token:
+        token.cancel("SIGTERM", signum=signal.SIGTERM)
+        _interrupt_main_soon()
+        started = time.monotonic()
+        with pytest.raises(KeyboardInterrupt):
+            run_child(_python(code), kill_timeout=20)
+    assert time.monotonic() - started < 10
+
+
+@pytest.mark.posix_only
+def test_run_child_kills_child_ignoring_forwarded_signal() -> None:
+    code = "import signal, time\nsignal.signal(signal.SIGINT, signal.SIG_IGN)\nprint('ready', flush=True)\ntime.sleep(30)"
+    started = time.monotonic()
+    _interrupt_main_soon()
+    with pytest.raises(KeyboardInterrupt):
+        run_child(_python(code), stdout=None, kill_timeout=0.2)
+    assert time.monotonic() - started < 10
+
+
+# =============================================================================
+# Fan-Out
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_fan_out_returns_results_in_command_order() -> None:
+    commands = [_python(f"import time; time.sleep({0.2 - n * 0.05}); print({n})") for n in range(4)]
+    results = fan_out(commands, stdout=None)
+    assert [result.stdout_tail.strip() for result in results] == [b"0", b"1", b"2", b"3"]
+
+
+@pytest.mark.os_agnostic
+def test_fan_out_prefixes_each_line_with_name() -> None:
+    sink = io.StringIO()
+    fan_out([_python("print('a'); print('b')")], names=["job"], stdout=sink)
+    assert sink.getvalue().splitlines() == ["[job] a", "[job] b"]
+
+
+@pytest.mark.os_agnostic
+def test_fan_out_terminates_unfinished_last_line() -> None:
+    sink = io.StringIO()
+    fan_out([_python("import sys; sys.stdout.write('partial')")], stdout=sink)
+    assert sink.getvalue() == "[0] partial\n"
+
+
+@pytest.mark.os_agnostic
+def test_fan_out_respects_concurrency_limit(tmp_path: Path) -> None:
+    code = (
+        "import os, sys, time\n"
+        "marker = os.path.join(sys.argv[1], str(os.getpid()))\n"
+        "open(marker, 'w').close()\n"
+        "print(len(os.listdir(sys.argv[1])))\n"
+        "time.sleep(0.1)\n"
+        "os.remove(marker)\n"
+    )
+    results = fan_out([[*_python(code), str(tmp_path)] for _ in range(6)], limit=2, stdout=None)
+    assert max(int(result.stdout_tail) for result in results) <= 2
+
+
+@pytest.mark.os_agnostic
+def test_fan_out_raises_group_of_failures_after_all_finish() -> None:
+    commands = [_python("raise SystemExit(3)"), _python("pass"), _python("raise SystemExit(5)")]
+    with pytest.raises(FanOutError) as caught:
+        fan_out(commands, stderr=None)
+    assert [getattr(exc, "returncode", None) for exc in caught.value.exceptions] == [3, 5]
+    assert get_system_exit_code(caught.value) == 3
+
+
+@pytest.mark.os_agnostic
+def test_fan_out_reports_commands_that_cannot_start() -> None:
+    with pytest.raises(FanOutError) as caught:
+        fan_out([["definitely-not-a-real-command-xyz"]], check=False)
+    assert isinstance(caught.value.exceptions[0], OSError)
+
+
+@pytest.mark.os_agnostic
+def test_fan_out_without_check_returns_failures() -> None:
+    results = fan_out([_python("raise SystemExit(2)")], check=False, stderr=None)
+    assert results[0].exit_code == 2
+
+
+@pytest.mark.os_agnostic
+def test_fan_out_rejects_mismatched_names() -> None:
+    with pytest.raises(ValueError, match="names"):
+        fan_out([_python("pass")], names=["a", "b"])
+
+
+@pytest.mark.posix_only
+def test_fan_out_stops_children_on_interrupt() -> None:
+    code = "import time\nprint('ready', flush=True)\ntime.sleep(30)"
+    started = time.monotonic()
+    _interrupt_main_soon()
+    with pytest.raises(KeyboardInterrupt):
+        fan_out([_python(code) for _ in range(3)], stdout=None, kill_timeout=1)
+    assert time.monotonic() - started < 10
@@ -0,0 +1,147 @@
+"""Tests for running coroutine commands on a managed event loop.
+
+Each test verifies exactly one event-loop behavior:
+- Awaitables are run to completion; other values pass through
+- The loop factory is pluggable
+- A signal cancels the main task and surfaces the spec's exception
+- Leftover tasks are cancelled and drained within the timeout
+- Signal handlers are restored after the loop closes
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+
+import pytest
+
+from lib_cli_exit_tools.adapters import event_loop
+from lib_cli_exit_tools.adapters.signals import SigIntInterrupt, SignalSpec
+
+_SIGINT_SPEC = SignalSpec(signum=signal.SIGINT, exception=SigIntInterrupt, message="Aborted (SIGINT).", exit_code=130)
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return 42
+
+
+async def _interrupt_self(cleanup: list[str]) -> None:
+    try:
+        os.kill(os.getpid(), signal.SIGINT)
+        await asyncio.sleep(5)
+    finally:
+        cleanup.append("closed")
+
+
+# =============================================================================
+# Running Awaitables
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_run_awaitable_returns_plain_values_unchanged() -> None:
+    assert event_loop.run_awaitable(7) == 7
+
+
+@pytest.mark.os_agnostic
+def test_run_awaitable_runs_coroutine_to_completion() -> None:
+    assert event_loop.run_awaitable(_answer()) == 42
+
+
+@pytest.mark.os_agnostic
+def test_run_awaitable_uses_session_loop_factory() -> None:
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def _factory() -> asyncio.AbstractEventLoop:
+        created.append(asyncio.new_event_loop())
+        return created[-1]
+
+    with event_loop.event_loop_session(loop_factory=_factory):
+        event_loop.run_awaitable(_answer())
+    assert len(created) == 1 and created[0].is_closed()
+
+
+# =============================================================================
+# Signals
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_signal_cancels_main_task_with_spec_exception() -> None:
+    with pytest.raises(SigIntInterrupt), event_loop.event_loop_session(signal_specs=[_SIGINT_SPEC]):
+        event_loop.run_awaitable(_interrupt_self([]))
+
+
+@pytest.mark.posix_only
+def test_signal_lets_main_task_unwind() -> None:
+    cleanup: list[str] = []
+    with pytest.raises(SigIntInterrupt), event_loop.event_loop_session(signal_specs=[_SIGINT_SPEC]):
+        event_loop.run_awaitable(_interrupt_self(cleanup))
+    assert cleanup == ["closed"]
+
+
+@pytest.mark.posix_only
+def test_main_task_overrunning_drain_timeout_still_ends_with_spec_exception() -> None:
+    async def _stubborn() -> None:
+        os.kill(os.getpid(), signal.SIGINT)
+        try:
+            await asyncio.sleep(5)
+        finally:
+            await asyncio.shield(asyncio.sleep(0.5))
+
+    with (
+        pytest.raises(SigIntInterrupt),
+        event_loop.event_loop_session(signal_specs=[_SIGINT_SPEC], drain_timeout=0.05),
+    ):
+        event_loop.run_awaitable(_stubborn())
+
+
+@pytest.mark.posix_only
+def test_signal_handler_is_restored_after_loop_closes() -> None:
+    before = signal.getsignal(signal.SIGINT)
+    with event_loop.event_loop_session(signal_specs=[_SIGINT_SPEC]):
+        event_loop.run_awaitable(_answer())
+    assert signal.getsignal(signal.SIGINT) is before
+
+
+# =============================================================================
+# Draining
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_leftover_tasks_are_cancelled() -> None:
+    outcome: list[str] = []
+
+    async def _background() -> None:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            outcome.append("cancelled")
+            raise
+
+    async def _main() -> None:
+        asyncio.get_running_loop().create_task(_background())
+        await asyncio.sleep(0)
+
+    event_loop.run_awaitable(_main())
+    assert outcome == ["cancelled"]
+
+
+@pytest.mark.os_agnostic
+def test_drain_timeout_abandons_stubborn_tasks(capsys: pytest.CaptureFixture[str]) -> None:
+    async def _stubborn() -> None:
+        try:
+            await asyncio.sleep(5)
+        finally:
+            await asyncio.shield(asyncio.sleep(0.5))
+
+    async def _main() -> None:
+        asyncio.get_running_loop().create_task(_stubborn())
+        await asyncio.sleep(0)
+
+    with event_loop.event_loop_session(drain_timeout=0.05):
+        event_loop.run_awaitable(_main())
+    assert "abandoned 1 task(s)" in capsys.readouterr().err
@@ -0,0 +1,244 @@
+"""Tests for the NDJSON lifecycle event stream.
+
+Each test verifies exactly one event behavior:
+- Events are single compact JSON lines carrying event, ts, and pid
+- Oversized lines are shortened to stay atomic
+- Full or closed descriptors drop events instead of blocking or raising
+- The descriptor's blocking mode is left as inherited
+- The environment variable selects the descriptor defensively
+- run_cli emits start, resolved, signal, and exit events
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import select
+import signal
+from collections.abc import Iterator
+
+import pytest
+import rich_click as click
+
+from lib_cli_exit_tools.adapters import events
+from lib_cli_exit_tools.application import runner
+
+
+@pytest.fixture
+def event_pipe() -> Iterator[tuple[int, int]]:
+    """Yield a ``(read_fd, write_fd)`` pipe and close both ends afterwards."""
+    read_fd, write_fd = os.pipe()
+    try:
+        yield read_fd, write_fd
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def _read_events(read_fd: int) -> list[dict[str, object]]:
+    os.set_blocking(read_fd, False)
+    try:
+        data = os.read(read_fd, 1 << 16)
+    except BlockingIOError:
+        return []
+    return [json.loads(line) for line in data.decode("utf-8").splitlines()]
+
+
+def _names(read_fd: int) -> list[object]:
+    return [event["event"] for event in _read_events(read_fd)]
+
+
+@click.command()
+def _succeed() -> None:
+    """Finish without output."""
+
+
+@click.command()
+def _explode() -> None:
+    """Fail with an unhandled exception."""
+    raise RuntimeError("boom")
+
+
+@click.command()
+def _exit_three() -> None:
+    """Exit through ``SystemExit``."""
+    raise SystemExit(3)
+
+
+@click.command()
+def _interrupt_self() -> None:
+    """Deliver SIGINT to the current process."""
+    os.kill(os.getpid(), signal.SIGINT)
+
+
+# =============================================================================
+# Line Format
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_emit_writes_one_compact_line(event_pipe: tuple[int, int]) -> None:
+    read_fd, write_fd = event_pipe
+    events.EventStream(write_fd).emit("start", argv=["info"])
+    line = os.read(read_fd, 4096)
+    assert line.endswith(b"\n") and b" " not in line
+
+
+@pytest.mark.posix_only
+def test_emit_includes_event_timestamp_and_pid(event_pipe: tuple[int, int]) -> None:
+    read_fd, write_fd = event_pipe
+    events.EventStream(write_fd).emit("exit", exit_code=0)
+    (event,) = _read_events(read_fd)
+    assert (event["event"], event["pid"], "ts" in event) == ("exit", os.getpid(), True)
+
+
+@pytest.mark.posix_only
+def test_oversized_line_is_shortened_to_pipe_buf(event_pipe: tuple[int, int]) -> None:
+    read_fd, write_fd = event_pipe
+    events.EventStream(write_fd).emit("start", argv=["x" * 10_000] * 40)
+    os.set_blocking(read_fd, False)
+    line = os.read(read_fd, 1 << 16)
+    assert 0 < len(line) <= getattr(select, "PIPE_BUF", 512)
+
+
+# =============================================================================
+# Never Blocking
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_full_pipe_drops_event(event_pipe: tuple[int, int]) -> None:
+    _, write_fd = event_pipe
+    stream = events.EventStream(write_fd)
+    os.set_blocking(write_fd, False)
+    with pytest.raises(BlockingIOError):
+        while True:
+            os.write(write_fd, b"x" * 4096)
+    os.set_blocking(write_fd, True)
+    stream.emit("exit", exit_code=0)
+    assert stream.dropped == 1
+
+
+@pytest.mark.posix_only
+def test_stream_leaves_descriptor_blocking(event_pipe: tuple[int, int]) -> None:
+    _, write_fd = event_pipe
+    events.EventStream(write_fd).emit("exit", exit_code=0)
+    assert os.get_blocking(write_fd) is True
+
+
+@pytest.mark.posix_only
+def test_closed_descriptor_drops_event() -> None:
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    stream = events.EventStream(write_fd)
+    os.close(write_fd)
+    stream.emit("exit", exit_code=0)
+    assert stream.dropped == 1
+
+
+@pytest.mark.os_agnostic
+def test_emit_event_is_noop_without_active_stream() -> None:
+    events.emit_event("start")
+
+
+# =============================================================================
+# Environment Resolution
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_env_without_variable_yields_no_stream() -> None:
+    assert events.event_stream_from_env({}) is None
+
+
+@pytest.mark.os_agnostic
+def test_env_with_garbage_yields_no_stream() -> None:
+    assert events.event_stream_from_env({events.EVENT_FD_ENV: "three"}) is None
+
+
+@pytest.mark.posix_only
+def test_env_with_closed_descriptor_yields_no_stream() -> None:
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    os.close(write_fd)
+    assert events.event_stream_from_env({events.EVENT_FD_ENV: str(write_fd)}) is None
+
+
+@pytest.mark.posix_only
+def test_env_with_open_descriptor_yields_stream(event_pipe: tuple[int, int]) -> None:
+    _, write_fd = event_pipe
+    stream = events.event_stream_from_env({events.EVENT_FD_ENV: str(write_fd)})
+    assert stream is not None and stream.fd == write_fd
+
+
+# =============================================================================
+# run_cli Integration
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_successful_run_emits_start_and_exit(event_pipe: tuple[int, int]) -> None:
+    read_fd, write_fd = event_pipe
+    runner.run_cli(_succeed, argv=[], install_signals=False, event_fd=write_fd)
+    assert _names(read_fd) == ["start", "exit"]
+
+
+@pytest.mark.posix_only
+def test_exit_event_carries_code_and_duration(event_pipe: tuple[int, int]) -> None:
+    read_fd, write_fd = event_pipe
+    runner.run_cli(_exit_three, argv=[], install_signals=False, event_fd=write_fd)
+    exit_event = _read_events(read_fd)[-1]
+    assert (exit_event["exit_code"], isinstance(exit_event["duration"], float)) == (3, True)
+
+
+@pytest.mark.posix_only
+def test_system_exit_names_its_resolver(event_pipe: tuple[int, int]) -> None:
+    read_fd, write_fd = event_pipe
+    runner.run_cli(_exit_three, argv=[], install_signals=False, event_fd=write_fd)
+    resolved = [event for event in _read_events(read_fd) if event["event"] == "resolved"]
+    assert resolved == [
+        {**resolved[0], "resolver": "system_exit", "exit_code": 3, "exception": "SystemExit"},
+    ]
+
+
+@pytest.mark.posix_only
+def test_unhandled_exception_uses_fallback_resolver(
+    event_pipe: tuple[int, int],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    read_fd, write_fd = event_pipe
+    runner.run_cli(_explode, argv=[], install_signals=False, event_fd=write_fd)
+    capsys.readouterr()
+    resolved = [event for event in _read_events(read_fd) if event["event"] == "resolved"]
+    assert resolved[0]["resolver"] == "exception"
+
+
+@pytest.mark.posix_only
+def test_signal_is_reported_before_resolution(
+    event_pipe: tuple[int, int],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    read_fd, write_fd = event_pipe
+    runner.run_cli(_interrupt_self, argv=[], event_fd=write_fd)
+    capsys.readouterr()
+    assert _names(read_fd) == ["start", "signal", "resolved", "exit"]
+
+
+@pytest.mark.posix_only
+def test_signal_event_carries_delivery_count_and_action(
+    event_pipe: tuple[int, int],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    read_fd, write_fd = event_pipe
+    runner.run_cli(_interrupt_self, argv=[], event_fd=write_fd)
+    capsys.readouterr()
+    signal_event = next(event for event in _read_events(read_fd) if event["event"] == "signal")
+    assert (signal_event["count"], signal_event["action"]) == (1, "raise")
+
+
+@pytest.mark.posix_only
+def test_env_variable_enables_events(event_pipe: tuple[int, int], monkeypatch: pytest.MonkeyPatch) -> None:
+    read_fd, write_fd = event_pipe
+    monkeypatch.setenv(events.EVENT_FD_ENV, str(write_fd))
+    runner.run_cli(_succeed, argv=[], install_signals=False)
+    assert _names(read_fd) == ["start", "exit"]
@@ -0,0 +1,107 @@
+"""Tests for deadline-bounded stream flushing.
+
+Each test verifies exactly one flush behavior:
+- Streams without a deadline or descriptor receive a plain flush
+- Healthy readers receive every byte before the deadline
+- Stalled readers cost at most the deadline and report dropped bytes
+- Descriptor blocking mode is restored afterwards
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import time
+from collections.abc import Iterator
+from contextlib import suppress
+
+import pytest
+
+from lib_cli_exit_tools.adapters.flush import flush_within
+
+_PAYLOAD_BYTES = 512 * 1024
+
+
+@pytest.fixture
+def stalled_stream() -> Iterator[io.TextIOWrapper]:
+    """Yield a text stream whose pipe reader never drains, with output pending."""
+    read_fd, write_fd = os.pipe()
+    stream = open(write_fd, "w", buffering=_PAYLOAD_BYTES * 2, encoding="ascii")  # noqa: SIM115
+    stream.write("x" * _PAYLOAD_BYTES)
+    try:
+        yield stream
+    finally:
+        os.set_blocking(stream.fileno(), True)
+        stream.close()
+        os.close(read_fd)
+
+
+# =============================================================================
+# Plain Flush
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_flush_without_deadline_calls_flush() -> None:
+    stream = io.StringIO()
+    assert flush_within(stream, None) == 0
+
+
+@pytest.mark.os_agnostic
+def test_flush_ignores_objects_without_flush() -> None:
+    assert flush_within(object(), time.monotonic() + 1) == 0
+
+
+@pytest.mark.posix_only
+def test_flush_propagates_broken_pipe() -> None:
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    stream = open(write_fd, "w", encoding="ascii")  # noqa: SIM115
+    stream.write("lost")
+    try:
+        with pytest.raises(BrokenPipeError):
+            flush_within(stream, time.monotonic() + 1)
+    finally:
+        with suppress(OSError):
+            stream.close()
+
+
+# =============================================================================
+# Deadline
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_healthy_reader_receives_everything() -> None:
+    read_fd, write_fd = os.pipe()
+    with open(write_fd, "w", encoding="ascii") as stream:
+        stream.write("hello")
+        dropped = flush_within(stream, time.monotonic() + 1)
+    assert (dropped, os.read(read_fd, 16)) == (0, b"hello")
+    os.close(read_fd)
+
+
+@pytest.mark.posix_only
+def test_stalled_reader_reports_dropped_bytes(stalled_stream: io.TextIOWrapper) -> None:
+    dropped = flush_within(stalled_stream, time.monotonic() + 0.05)
+    assert 0 < dropped < _PAYLOAD_BYTES
+
+
+@pytest.mark.posix_only
+def test_stalled_reader_returns_near_deadline(stalled_stream: io.TextIOWrapper) -> None:
+    started = time.monotonic()
+    flush_within(stalled_stream, started + 0.05)
+    assert time.monotonic() - started < 2.0
+
+
+@pytest.mark.posix_only
+def test_stalled_descriptor_is_redirected_to_devnull(stalled_stream: io.TextIOWrapper) -> None:
+    flush_within(stalled_stream, time.monotonic() + 0.05)
+    stalled_stream.write("y" * _PAYLOAD_BYTES)
+    assert flush_within(stalled_stream, time.monotonic() + 0.05) == 0
+
+
+@pytest.mark.posix_only
+def test_blocking_mode_is_restored(stalled_stream: io.TextIOWrapper) -> None:
+    flush_within(stalled_stream, time.monotonic() + 0.05)
+    assert os.get_blocking(stalled_stream.fileno()) is True
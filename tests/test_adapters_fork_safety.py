@@ -0,0 +1,139 @@
+"""Tests for the fork hooks that keep children quiet.
+
+Each test verifies exactly one fork-safety behavior:
+- Each ForkSignalPolicy replaces the recorded raising handlers as documented
+- Uninstalled handlers are no longer recorded
+- Forked children get the policy, drop per-run reports, and die silently
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from lib_cli_exit_tools.adapters import fork_safety
+from lib_cli_exit_tools.adapters.signals import SigIntInterrupt, SignalSpec, install_signal_handlers
+from lib_cli_exit_tools.core.configuration import ForkSignalPolicy, config
+
+_SIGINT_SPEC = SignalSpec(signum=signal.SIGINT, exception=SigIntInterrupt, message="Aborted (SIGINT).", exit_code=130)
+
+
+@pytest.fixture
+def raising_sigint() -> Iterator[None]:
+    """Install the raising SIGINT handler and restore the original afterwards."""
+    original = signal.getsignal(signal.SIGINT)
+    restore = install_signal_handlers([_SIGINT_SPEC])
+    try:
+        yield
+    finally:
+        restore()
+        signal.signal(signal.SIGINT, original)
+
+
+def _in_fork(probe: Callable[[], str]) -> str:
+    """Fork, run ``probe`` in the child, and return what it reported."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child
+        os.close(read_fd)
+        try:
+            os.write(write_fd, probe().encode())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as reader:
+        report = reader.read().decode()
+    os.waitpid(pid, 0)
+    return report
+
+
+# =============================================================================
+# Signal Policies
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_previous_policy_restores_handler_from_before_install(raising_sigint: None) -> None:
+    fork_safety.apply_fork_signal_policy(ForkSignalPolicy.PREVIOUS)
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+
+@pytest.mark.os_agnostic
+def test_default_policy_resets_handler_to_sig_dfl(raising_sigint: None) -> None:
+    fork_safety.apply_fork_signal_policy(ForkSignalPolicy.DEFAULT)
+    assert signal.getsignal(signal.SIGINT) == signal.SIG_DFL
+
+
+@pytest.mark.os_agnostic
+def test_ignore_policy_ignores_signal(raising_sigint: None) -> None:
+    fork_safety.apply_fork_signal_policy(ForkSignalPolicy.IGNORE)
+    assert signal.getsignal(signal.SIGINT) == signal.SIG_IGN
+
+
+@pytest.mark.os_agnostic
+def test_keep_policy_leaves_raising_handler(raising_sigint: None) -> None:
+    installed = signal.getsignal(signal.SIGINT)
+    fork_safety.apply_fork_signal_policy(ForkSignalPolicy.KEEP)
+    assert signal.getsignal(signal.SIGINT) is installed
+
+
+@pytest.mark.os_agnostic
+def test_restored_handlers_are_forgotten() -> None:
+    install_signal_handlers([_SIGINT_SPEC])()
+    fork_safety.apply_fork_signal_policy(ForkSignalPolicy.IGNORE)
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+
+# =============================================================================
+# Forked Children
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_forked_child_gets_handler_from_before_install(raising_sigint: None) -> None:
+    report = _in_fork(lambda: "default" if signal.getsignal(signal.SIGINT) is signal.default_int_handler else "raising")
+    assert report == "default"
+
+
+@pytest.mark.posix_only
+def test_forked_child_drops_run_reports(raising_sigint: None, reset_config: None) -> None:
+    config.traceback = True
+    config.profile_path = "parent.pstats"
+    report = _in_fork(lambda: f"{config.traceback} {config.profile_path}")
+    assert report == "True None"
+
+
+@pytest.mark.posix_only
+def test_forked_child_dies_silently_on_sigterm(reset_config: None) -> None:
+    restore = install_signal_handlers()
+    try:
+        status, stderr = _terminate_forked_sleeper()
+    finally:
+        restore()
+    assert (os.WIFSIGNALED(status), os.WTERMSIG(status), stderr) == (True, signal.SIGTERM, b"")
+
+
+def _terminate_forked_sleeper() -> tuple[int, bytes]:
+    """Fork a child that sleeps with stderr on a pipe, SIGTERM it, and collect the results."""
+    ready_read, ready_write = os.pipe()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child
+        os.dup2(write_fd, 2)
+        try:
+            os.write(ready_write, b"r")
+            time.sleep(30)
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    os.close(ready_write)
+    os.read(ready_read, 1)
+    os.close(ready_read)
+    os.kill(pid, signal.SIGTERM)
+    _, status = os.waitpid(pid, 0)
+    with os.fdopen(read_fd, "rb") as reader:
+        return status, reader.read()
@@ -0,0 +1,156 @@
+"""Tests for the garbage-collector tuning policy.
+
+Each test verifies exactly one GC policy behavior:
+- Thresholds, enablement, and freezing are applied and then restored
+- A freeze the host made before the policy is left in place
+- Collections and pauses are counted while the policy is active
+- Statistics are reported to callbacks and stderr on request
+- A failing callback is noted on stderr instead of raising
+"""
+
+from __future__ import annotations
+
+import gc
+import io
+from collections.abc import Iterator
+
+import pytest
+
+from lib_cli_exit_tools.adapters.gc_policy import GcPolicy, GcStats, apply_gc_policy
+
+
+@pytest.fixture
+def preserved_gc_state() -> Iterator[None]:
+    """Restore global collector state even when a test fails midway."""
+    thresholds = gc.get_threshold()
+    enabled = gc.isenabled()
+    callbacks = list(gc.callbacks)
+    yield
+    gc.set_threshold(*thresholds)
+    if enabled:
+        gc.enable()
+    gc.unfreeze()
+    gc.callbacks[:] = callbacks
+
+
+# =============================================================================
+# Applying and Restoring
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_thresholds_apply_while_policy_is_active(preserved_gc_state: None) -> None:
+    restore = apply_gc_policy(GcPolicy(thresholds=(50_000, 20, 20)))
+    try:
+        assert gc.get_threshold() == (50_000, 20, 20)
+    finally:
+        restore()
+
+
+@pytest.mark.os_agnostic
+def test_restore_reinstates_previous_thresholds(preserved_gc_state: None) -> None:
+    before = gc.get_threshold()
+    apply_gc_policy(GcPolicy(thresholds=(50_000, 20, 20)))()
+    assert gc.get_threshold() == before
+
+
+@pytest.mark.os_agnostic
+def test_disable_turns_collection_off_until_restore(preserved_gc_state: None) -> None:
+    gc.enable()
+    restore = apply_gc_policy(GcPolicy(disable=True))
+    assert gc.isenabled() is False
+    restore()
+    assert gc.isenabled() is True
+
+
+@pytest.mark.os_agnostic
+def test_freeze_moves_heap_into_permanent_generation(preserved_gc_state: None) -> None:
+    restore = apply_gc_policy(GcPolicy(freeze=True))
+    try:
+        assert gc.get_freeze_count() > 0
+    finally:
+        restore()
+
+
+@pytest.mark.os_agnostic
+def test_restore_unfreezes_heap(preserved_gc_state: None) -> None:
+    apply_gc_policy(GcPolicy(freeze=True))()
+    assert gc.get_freeze_count() == 0
+
+
+@pytest.mark.os_agnostic
+def test_restore_keeps_host_freeze(preserved_gc_state: None) -> None:
+    gc.freeze()
+    apply_gc_policy(GcPolicy(freeze=True))()
+    assert gc.get_freeze_count() > 0
+
+
+@pytest.mark.os_agnostic
+def test_restore_detaches_callback(preserved_gc_state: None) -> None:
+    before = len(gc.callbacks)
+    restore = apply_gc_policy(GcPolicy())
+    restore()
+    assert len(gc.callbacks) == before
+
+
+# =============================================================================
+# Instrumentation
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_explicit_collection_is_counted(preserved_gc_state: None) -> None:
+    restore = apply_gc_policy(GcPolicy())
+    gc.collect()
+    stats = restore()
+    assert stats.collections[2] >= 1
+
+
+@pytest.mark.os_agnostic
+def test_collected_cycles_are_counted(preserved_gc_state: None) -> None:
+    restore = apply_gc_policy(GcPolicy(disable=True))
+    cycle: list[object] = []
+    cycle.append(cycle)
+    del cycle
+    gc.collect()
+    stats = restore()
+    assert stats.collected >= 1
+
+
+@pytest.mark.os_agnostic
+def test_pause_time_is_accumulated(preserved_gc_state: None) -> None:
+    restore = apply_gc_policy(GcPolicy())
+    gc.collect()
+    stats = restore()
+    assert stats.pause_seconds > 0.0
+
+
+@pytest.mark.os_agnostic
+def test_on_stats_receives_statistics(preserved_gc_state: None) -> None:
+    received: list[GcStats] = []
+    restore = apply_gc_policy(GcPolicy(on_stats=received.append))
+    stats = restore()
+    assert received == [stats]
+
+
+@pytest.mark.os_agnostic
+def test_failing_on_stats_is_noted_on_stderr(preserved_gc_state: None, capsys: pytest.CaptureFixture[str]) -> None:
+    def broken_callback(stats: GcStats) -> None:
+        raise RuntimeError("metrics down")
+
+    apply_gc_policy(GcPolicy(on_stats=broken_callback))()
+    assert "on_stats callback failed" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_report_writes_summary_to_stream(preserved_gc_state: None) -> None:
+    stream = io.StringIO()
+    apply_gc_policy(GcPolicy(report=True), stream=stream)()
+    assert stream.getvalue().startswith("gc: collections gen0=")
+
+
+@pytest.mark.os_agnostic
+def test_report_is_silent_by_default(preserved_gc_state: None) -> None:
+    stream = io.StringIO()
+    apply_gc_policy(GcPolicy(), stream=stream)()
+    assert stream.getvalue() == ""
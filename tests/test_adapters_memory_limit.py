@@ -0,0 +1,155 @@
+"""Tests for the memory ceiling and emergency reserve.
+
+Each test verifies exactly one memory-limit behavior:
+- Sizes with binary suffixes are parsed; malformed ones are rejected
+- The reserve holds its buffer until released
+- The reserve is filled only once a ceiling is applied
+- The soft limit is lowered inside the block and restored afterwards
+- Allocations beyond the ceiling raise MemoryError
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from lib_cli_exit_tools.adapters import memory_limit
+
+# =============================================================================
+# Size Parsing
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("4096", 4096), ("64k", 64 * 1024), ("512M", 512 << 20), ("2G", 2 << 30), ("1.5GiB", 3 << 29)],
+)
+def test_parse_memory_size_reads_binary_suffixes(text: str, expected: int) -> None:
+    assert memory_limit.parse_memory_size(text) == expected
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("text", ["", "lots", "-5M", "12X"])
+def test_parse_memory_size_rejects_malformed_text(text: str) -> None:
+    with pytest.raises(ValueError, match="invalid memory size"):
+        memory_limit.parse_memory_size(text)
+
+
+@pytest.mark.os_agnostic
+def test_parse_memory_size_rejects_zero() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        memory_limit.parse_memory_size("0M")
+
+
+# =============================================================================
+# Reserve
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_reserve_holds_requested_bytes() -> None:
+    assert memory_limit.MemoryReserve(4096).held == 4096
+
+
+@pytest.mark.os_agnostic
+def test_reserve_release_frees_buffer() -> None:
+    reserve = memory_limit.MemoryReserve(4096)
+    reserve.release()
+    assert reserve.held == 0
+
+
+@pytest.mark.os_agnostic
+def test_reserve_hold_fills_empty_reserve() -> None:
+    reserve = memory_limit.MemoryReserve(0)
+    reserve.hold(4096)
+    assert reserve.held == 4096
+
+
+@pytest.mark.os_agnostic
+def test_reserve_hold_keeps_existing_buffer() -> None:
+    reserve = memory_limit.MemoryReserve(4096)
+    reserve.hold(8192)
+    assert reserve.held == 4096
+
+
+# =============================================================================
+# Ceiling
+# =============================================================================
+
+
+def _soft_limit() -> int:
+    import resource
+
+    which = resource.RLIMIT_DATA if sys.platform == "darwin" else resource.RLIMIT_AS
+    return resource.getrlimit(which)[0]
+
+
+@pytest.mark.posix_only
+def test_memory_limited_lowers_soft_limit() -> None:
+    with memory_limit.memory_limited(64 << 30):
+        assert _soft_limit() == 64 << 30
+
+
+@pytest.mark.posix_only
+def test_memory_limited_restores_soft_limit() -> None:
+    before = _soft_limit()
+    with memory_limit.memory_limited(64 << 30):
+        pass
+    assert _soft_limit() == before
+
+
+@pytest.mark.posix_only
+def test_start_memory_limit_applies_inside_block() -> None:
+    with memory_limit.memory_limited(None):
+        memory_limit.start_memory_limit(32 << 30)
+        assert _soft_limit() == 32 << 30
+
+
+@pytest.mark.os_agnostic
+def test_memory_limited_without_ceiling_leaves_reserve_empty() -> None:
+    reserve = memory_limit.MemoryReserve(0)
+    with memory_limit.memory_limited(None, reserve=reserve):
+        assert reserve.held == 0
+
+
+@pytest.mark.posix_only
+def test_memory_limited_fills_reserve_with_ceiling() -> None:
+    reserve = memory_limit.MemoryReserve(0)
+    with memory_limit.memory_limited(64 << 30, reserve=reserve):
+        assert reserve.held == memory_limit.DEFAULT_RESERVE_BYTES
+
+
+@pytest.mark.posix_only
+def test_start_memory_limit_fills_reserve() -> None:
+    reserve = memory_limit.MemoryReserve(0)
+    with memory_limit.memory_limited(None, reserve=reserve):
+        memory_limit.start_memory_limit(32 << 30)
+        assert reserve.held == memory_limit.DEFAULT_RESERVE_BYTES
+
+
+@pytest.mark.os_agnostic
+def test_start_memory_limit_outside_block_returns_false() -> None:
+    assert memory_limit.start_memory_limit(1 << 30) is False
+
+
+@pytest.mark.posix_only
+@pytest.mark.skipif(sys.platform == "darwin", reason="macOS does not enforce RLIMIT_DATA for mmap allocations")
+def test_allocation_beyond_ceiling_raises_memory_error() -> None:
+    script = textwrap.dedent(
+        """
+        import resource
+        from lib_cli_exit_tools.adapters.memory_limit import memory_limited
+
+        with memory_limited(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 + (256 << 20)):
+            try:
+                bytearray(8 << 30)
+            except MemoryError:
+                raise SystemExit(42)
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60, check=False)
+    assert result.returncode == 42
@@ -0,0 +1,152 @@
+"""Tests for tracemalloc-based memory tracing.
+
+Each test verifies exactly one memory-tracing behavior:
+- Reports list peak memory and the top allocation sites
+- Failures are reported once, from handle_cli_exception
+- Tracers started elsewhere are left running
+- Discarded traces stop silently
+- Snapshots from two runs can be compared
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from lib_cli_exit_tools.adapters import memory_trace
+from lib_cli_exit_tools.application import runner
+from lib_cli_exit_tools.core.configuration import config
+
+
+def _allocate(count: int) -> list[bytes]:
+    return [bytes(1024) for _ in range(count)]
+
+
+class _Command:
+    """Minimal Click-like command that allocates and optionally fails."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self._fail = fail
+
+    def main(
+        self,
+        args: Sequence[str] | None = None,
+        prog_name: str | None = None,
+        complete_var: str | None = None,
+        standalone_mode: bool = False,
+        **_: object,
+    ) -> None:
+        kept = _allocate(2000)
+        if self._fail:
+            raise RuntimeError(f"failed with {len(kept)} blocks")
+
+
+# =============================================================================
+# Reports
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_traced_memory_reports_peak(capsys: pytest.CaptureFixture[str]) -> None:
+    with memory_trace.traced_memory(3):
+        _allocate(100)
+    assert "memory: peak" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_traced_memory_lists_allocation_site(capsys: pytest.CaptureFixture[str]) -> None:
+    with memory_trace.traced_memory(5):
+        kept = _allocate(2000)
+        assert kept
+    assert "test_adapters_memory_trace.py" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_traced_memory_without_top_stays_silent(capsys: pytest.CaptureFixture[str]) -> None:
+    with memory_trace.traced_memory(None):
+        _allocate(10)
+    assert capsys.readouterr().err == ""
+
+
+@pytest.mark.os_agnostic
+def test_traced_memory_stops_tracer_it_started() -> None:
+    with memory_trace.traced_memory(1):
+        pass
+    assert tracemalloc.is_tracing() is False
+
+
+@pytest.mark.os_agnostic
+def test_traced_memory_leaves_foreign_tracer_running() -> None:
+    tracemalloc.start()
+    try:
+        with memory_trace.traced_memory(1):
+            pass
+        assert tracemalloc.is_tracing() is True
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.os_agnostic
+def test_discard_memory_trace_stops_without_report(capsys: pytest.CaptureFixture[str]) -> None:
+    with memory_trace.traced_memory(5):
+        memory_trace.discard_memory_trace()
+        assert tracemalloc.is_tracing() is False
+    assert capsys.readouterr().err == ""
+
+
+@pytest.mark.os_agnostic
+def test_start_memory_trace_outside_block_returns_false() -> None:
+    assert memory_trace.start_memory_trace(5) is False
+
+
+# =============================================================================
+# run_cli Integration
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_reports_memory_after_success(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    runner.run_cli(_Command(), install_signals=False, trace_memory=3)
+    assert "memory: peak" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_reports_failure_once_after_error_message(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    runner.run_cli(_Command(fail=True), install_signals=False, trace_memory=3)
+    err = capsys.readouterr().err
+    assert (err.count("memory: peak"), err.index("failed with") < err.index("memory: peak")) == (1, True)
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_trace_memory_defaults_to_config(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    config.trace_memory = 2
+    runner.run_cli(_Command(), install_signals=False)
+    assert "memory: peak" in capsys.readouterr().err
+
+
+# =============================================================================
+# Snapshot Comparison
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_traced_memory_writes_snapshot(tmp_path: Path) -> None:
+    target = tmp_path / "run.snapshot"
+    with memory_trace.traced_memory(1, str(target)):
+        _allocate(10)
+    assert tracemalloc.Snapshot.load(str(target)).traces is not None
+
+
+@pytest.mark.os_agnostic
+def test_compare_snapshots_shows_growth_at_allocation_site(tmp_path: Path) -> None:
+    small, large = tmp_path / "small.snapshot", tmp_path / "large.snapshot"
+    with memory_trace.traced_memory(0, str(small)):
+        kept = _allocate(10)
+    with memory_trace.traced_memory(0, str(large)):
+        kept = _allocate(5000)
+    assert kept
+    first_row = memory_trace.compare_snapshots(str(small), str(large), 1).splitlines()[1]
+    assert "+" in first_row and "test_adapters_memory_trace.py" in first_row
@@ -0,0 +1,165 @@
+"""Tests for worker pools that honour the cancellation token.
+
+Each test verifies exactly one pool behavior:
+- Work runs and results arrive through futures
+- Cancellation refuses new work and drops queued work
+- Running work is joined only up to the deadline
+- Process pool workers receive the cancelling signal
+- Process pool worker exceptions arrive rebuilt
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import signal
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+
+import pytest
+
+from lib_cli_exit_tools.adapters.cancellation import CancellationToken, cancellation_scope
+from lib_cli_exit_tools.adapters.pools import CancellableProcessPool, CancellableThreadPool
+from lib_cli_exit_tools.core.exception_record import RemoteError
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def _sleep_until_signalled(seconds: float) -> str:
+    time.sleep(seconds)
+    return "finished"
+
+
+# =============================================================================
+# Thread Pool
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_thread_pool_runs_work() -> None:
+    with CancellableThreadPool(2) as pool:
+        results = list(pool.map(_square, range(5)))
+    assert results == [0, 1, 4, 9, 16]
+
+
+@pytest.mark.os_agnostic
+def test_thread_pool_delivers_exceptions_through_future() -> None:
+    with CancellableThreadPool(1) as pool:
+        future = pool.submit(int, "not a number")
+    with pytest.raises(ValueError):
+        future.result()
+
+
+@pytest.mark.os_agnostic
+def test_thread_pool_defaults_to_current_token() -> None:
+    with cancellation_scope() as token, CancellableThreadPool(1) as pool:
+        assert pool.token is token
+
+
+@pytest.mark.os_agnostic
+def test_thread_pool_refuses_work_after_cancel() -> None:
+    token = CancellationToken()
+    token.cancel()
+    with CancellableThreadPool(1, token=token) as pool, pytest.raises(CancelledError):
+        pool.submit(_square, 2)
+
+
+@pytest.mark.os_agnostic
+def test_thread_pool_cancels_queued_work_on_cancel() -> None:
+    token = CancellationToken()
+    release = threading.Event()
+    pool = CancellableThreadPool(1, token=token, join_timeout=5)
+    pool.submit(release.wait, 5)
+    queued: Future[int] = pool.submit(_square, 3)
+    token.cancel()
+    release.set()
+    pool.shutdown()
+    assert queued.cancelled()
+
+
+@pytest.mark.os_agnostic
+def test_thread_pool_bounds_join_after_cancel(capsys: pytest.CaptureFixture[str]) -> None:
+    token = CancellationToken()
+    pool = CancellableThreadPool(1, token=token, join_timeout=0.05)
+    pool.submit(time.sleep, 2)
+    token.cancel()
+    started = time.monotonic()
+    pool.shutdown()
+    assert time.monotonic() - started < 1
+    assert "abandoned 1 running task(s)" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_thread_pool_exception_in_block_cancels_queued_work() -> None:
+    release = threading.Event()
+    queued: list[Future[int]] = []
+    with pytest.raises(KeyError), CancellableThreadPool(1, join_timeout=5) as pool:
+        pool.submit(release.wait, 5)
+        queued.append(pool.submit(_square, 3))
+        release.set()
+        raise KeyError("boom")
+    assert queued[0].cancelled() or queued[0].done()
+
+
+# =============================================================================
+# Process Pool
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_process_pool_runs_work() -> None:
+    with CancellableProcessPool(1) as pool:
+        assert pool.submit(_square, 4).result(timeout=30) == 16
+
+
+@pytest.mark.posix_only
+def test_process_pool_workers_lead_their_own_process_group() -> None:
+    with CancellableProcessPool(1) as pool:
+        pid = pool.submit(os.getpid).result(timeout=30)
+        group = pool.submit(os.getpgid, 0).result(timeout=30)
+    assert group == pid
+
+
+@pytest.mark.posix_only
+def test_process_pool_forwards_signal_on_cancel() -> None:
+    token = CancellationToken()
+    pool = CancellableProcessPool(1, token=token, join_timeout=10)
+    pool.submit(_square, 1).result(timeout=30)
+    running = pool.submit(_sleep_until_signalled, 30)
+    time.sleep(0.2)
+    token.cancel("SIGTERM", signum=signal.SIGTERM)
+    started = time.monotonic()
+    pool.shutdown()
+    assert time.monotonic() - started < 10
+    assert running.done()
+
+
+def _fail_with_unpicklable_error() -> None:
+    raise _PickyError(1, 2)
+
+
+def _fail_with_errno() -> None:
+    raise FileNotFoundError(errno.ENOENT, "missing input")
+
+
+class _PickyError(Exception):
+    def __init__(self, first: int, second: int) -> None:
+        super().__init__(f"{first}/{second}")
+
+
+@pytest.mark.posix_only
+def test_process_pool_rebuilds_worker_exception_with_errno() -> None:
+    with CancellableProcessPool(1) as pool:
+        error = pool.submit(_fail_with_errno).exception(timeout=30)
+    assert isinstance(error, FileNotFoundError) and error.errno == errno.ENOENT
+
+
+@pytest.mark.posix_only
+def test_process_pool_delivers_unpicklable_worker_exception() -> None:
+    with CancellableProcessPool(1) as pool:
+        error = pool.submit(_fail_with_unpicklable_error).exception(timeout=30)
+    assert isinstance(error, RemoteError)
+    assert "_PickyError: 1/2" in str(error)
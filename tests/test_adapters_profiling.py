@@ -0,0 +1,170 @@
+"""Tests for the cProfile integration.
+
+Each test verifies exactly one profiling behavior:
+- A pstats file is written on success, failure, and signal interrupts
+- Profiling can be switched on from inside a running block
+- Discarded profiles write nothing
+- The top-functions table leaves out this package's own frames
+- run_cli profiles the command when config.profile_path is set
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from lib_cli_exit_tools.adapters import profiling
+from lib_cli_exit_tools.adapters.signals import SigIntInterrupt
+from lib_cli_exit_tools.application import runner
+from lib_cli_exit_tools.core.configuration import config
+
+
+def _busy() -> int:
+    return sum(range(10_000))
+
+
+class _Command:
+    """Minimal Click-like command calling ``behaviour``."""
+
+    def __init__(self, behaviour: type[BaseException] | None = None) -> None:
+        self._behaviour = behaviour
+
+    def main(
+        self,
+        args: Sequence[str] | None = None,
+        prog_name: str | None = None,
+        complete_var: str | None = None,
+        standalone_mode: bool = False,
+        **_: object,
+    ) -> None:
+        _busy()
+        if self._behaviour is not None:
+            raise self._behaviour()
+
+
+# =============================================================================
+# Writing Profiles
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_profiled_writes_pstats_file(tmp_path: Path) -> None:
+    target = tmp_path / "run.pstats"
+    with profiling.profiled(str(target)):
+        _busy()
+    assert "_busy" in profiling.top_functions(pstats.Stats(str(target)), 10)
+
+
+@pytest.mark.os_agnostic
+def test_profiled_writes_pstats_file_when_block_fails(tmp_path: Path) -> None:
+    target = tmp_path / "run.pstats"
+    with pytest.raises(RuntimeError), profiling.profiled(str(target)):
+        raise RuntimeError("boom")
+    assert target.exists()
+
+
+@pytest.mark.os_agnostic
+def test_profiled_writes_pstats_file_when_interrupted(tmp_path: Path) -> None:
+    target = tmp_path / "run.pstats"
+    with pytest.raises(SigIntInterrupt), profiling.profiled(str(target)):
+        raise SigIntInterrupt()
+    assert target.exists()
+
+
+@pytest.mark.os_agnostic
+def test_profiled_without_path_writes_nothing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    with profiling.profiled(None):
+        _busy()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.os_agnostic
+def test_profiled_reports_unwritable_destination(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with profiling.profiled(str(tmp_path / "missing" / "run.pstats")):
+        _busy()
+    assert "could not write" in capsys.readouterr().err
+
+
+# =============================================================================
+# Starting From Inside A Run
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_start_profiling_outside_profiled_block_returns_false(tmp_path: Path) -> None:
+    assert profiling.start_profiling(str(tmp_path / "run.pstats")) is False
+
+
+@pytest.mark.os_agnostic
+def test_start_profiling_inside_block_writes_on_exit(tmp_path: Path) -> None:
+    target = tmp_path / "late.pstats"
+    with profiling.profiled(None):
+        profiling.start_profiling(str(target))
+        _busy()
+    assert target.exists()
+
+
+@pytest.mark.os_agnostic
+def test_discard_profiling_writes_nothing(tmp_path: Path) -> None:
+    target = tmp_path / "discarded.pstats"
+    with profiling.profiled(str(target)):
+        profiling.discard_profiling()
+    assert not target.exists()
+
+
+# =============================================================================
+# Top Functions
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_top_functions_excludes_package_frames() -> None:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    runner._normalised_args(["x"])  # pyright: ignore[reportPrivateUsage]
+    _busy()
+    profiler.disable()
+    table = profiling.top_functions(pstats.Stats(profiler), 50)
+    assert ("_busy" in table, "_normalised_args" in table) == (True, False)
+
+
+@pytest.mark.os_agnostic
+def test_top_functions_honours_limit() -> None:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _busy()
+    profiler.disable()
+    table = profiling.top_functions(pstats.Stats(profiler), 1)
+    assert len(table.splitlines()) == 2
+
+
+# =============================================================================
+# run_cli Integration
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_writes_profile_for_failing_command(tmp_path: Path, reset_config: None) -> None:
+    config.profile_path = str(tmp_path / "run.pstats")
+    runner.run_cli(_Command(RuntimeError), install_signals=False)
+    assert Path(config.profile_path).exists()
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_writes_profile_for_interrupted_command(tmp_path: Path, reset_config: None) -> None:
+    config.profile_path = str(tmp_path / "run.pstats")
+    assert runner.run_cli(_Command(SigIntInterrupt), install_signals=False) == 130
+    assert Path(config.profile_path).exists()
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_prints_top_functions_when_requested(tmp_path: Path, capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    config.profile_path = str(tmp_path / "run.pstats")
+    config.profile_top = 3
+    runner.run_cli(_Command(), install_signals=False)
+    assert "cumtime" in capsys.readouterr().err
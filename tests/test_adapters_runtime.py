@@ -0,0 +1,99 @@
+"""Tests for the interpreter-level helpers shared by the adapters.
+
+Each test verifies exactly one helper behavior:
+- note() writes to stderr and tolerates a broken stream
+- raise_in_thread() interrupts another thread, and None clears a pending exception
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+import time
+
+import pytest
+
+from lib_cli_exit_tools.adapters.runtime import note, raise_in_thread
+
+
+class _Injected(Exception):
+    """Marker exception injected into a worker thread."""
+
+
+def _busy_wait(seconds: float) -> None:
+    """Spin in Python bytecode so an asynchronously injected exception lands."""
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        time.sleep(0.001)
+
+
+# =============================================================================
+# note
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_note_writes_line_to_stderr(capsys: pytest.CaptureFixture[str]) -> None:
+    note("hello")
+    assert capsys.readouterr().err == "hello\n"
+
+
+@pytest.mark.os_agnostic
+def test_note_ignores_closed_stderr(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed = io.StringIO()
+    closed.close()
+    monkeypatch.setattr(sys, "stderr", closed)
+    note("lost")
+
+
+# =============================================================================
+# raise_in_thread
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_raise_in_thread_interrupts_worker() -> None:
+    started = threading.Event()
+    outcome: list[BaseException] = []
+
+    def _worker() -> None:
+        started.set()
+        try:
+            _busy_wait(5)
+        except _Injected as exc:
+            outcome.append(exc)
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    started.wait(5)
+    assert thread.ident is not None
+    raise_in_thread(thread.ident, _Injected)
+    thread.join(10)
+    assert len(outcome) == 1
+
+
+@pytest.mark.os_agnostic
+def test_raise_in_thread_with_none_clears_pending_exception() -> None:
+    ready, release = threading.Event(), threading.Event()
+    outcome: list[str] = []
+
+    def _worker() -> None:
+        try:
+            ready.set()
+            release.wait(10)  # blocked in C, so the injected exception stays pending
+            _busy_wait(0.05)
+            outcome.append("finished")
+        except _Injected:
+            outcome.append("interrupted")
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    ready.wait(5)
+    time.sleep(0.05)
+    assert thread.ident is not None
+    raise_in_thread(thread.ident, _Injected)
+    raise_in_thread(thread.ident, None)
+    release.set()
+    thread.join(10)
+    assert outcome == ["finished"]
@@ -0,0 +1,76 @@
+"""Tests for the resource-usage report.
+
+Each test verifies exactly one rusage behavior:
+- Sampling covers the process and its children
+- Child processes show up in the children scope
+- Human output hides idle children; JSON output always includes them
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from lib_cli_exit_tools.adapters import rusage
+from lib_cli_exit_tools.core.configuration import RusageFormat
+
+_IDLE = rusage.ResourceUsage(0.0, 0.0, 0, 0, 0, 0, 0)
+_BUSY = rusage.ResourceUsage(0.5, 0.25, 8 * 1024 * 1024, 3, 1, 2, 4)
+
+
+# =============================================================================
+# Sampling
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_sample_reports_positive_peak_rss() -> None:
+    report = rusage.sample_resource_report(0.0)
+    assert report is not None and report.self_usage.max_rss > 0
+
+
+@pytest.mark.posix_only
+def test_sample_keeps_requested_wall_time() -> None:
+    report = rusage.sample_resource_report(1.25)
+    assert report is not None and report.wall == 1.25
+
+
+@pytest.mark.posix_only
+def test_waited_children_count_towards_children_scope() -> None:
+    subprocess.run([sys.executable, "-c", "sum(range(2_000_000))"], check=True)
+    report = rusage.sample_resource_report(0.0)
+    assert report is not None and report.children.max_rss > 0
+
+
+# =============================================================================
+# Formatting
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_human_report_omits_idle_children() -> None:
+    text = rusage.format_resource_report(rusage.ResourceReport(1.0, _BUSY, _IDLE), RusageFormat.HUMAN)
+    assert "children" not in text
+
+
+@pytest.mark.os_agnostic
+def test_human_report_lists_busy_children() -> None:
+    text = rusage.format_resource_report(rusage.ResourceReport(1.0, _BUSY, _BUSY), RusageFormat.HUMAN)
+    assert "rusage (children):" in text
+
+
+@pytest.mark.os_agnostic
+def test_json_report_serialises_every_counter() -> None:
+    text = rusage.format_resource_report(rusage.ResourceReport(1.0, _BUSY, _IDLE), RusageFormat.JSON)
+    assert json.loads(text)["self"] == {
+        "user_cpu": 0.5,
+        "system_cpu": 0.25,
+        "max_rss": 8 * 1024 * 1024,
+        "voluntary_switches": 3,
+        "involuntary_switches": 1,
+        "block_in": 2,
+        "block_out": 4,
+    }
@@ -0,0 +1,209 @@
+"""Tests for the main-thread signal relay.
+
+Each test verifies exactly one relay behavior:
+- Worker threads install handlers without failing, with or without a relay
+- Relayed signals interrupt and cancel runs on worker threads
+- Signals fall through to the previous handler while no run listens
+- The relay is installed once, from the main thread, and restores on removal
+- run_cli on a worker thread ends with the spec's exit code
+"""
+
+from __future__ import annotations
+
+import signal
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+from types import FrameType
+
+import pytest
+import rich_click as click
+
+from lib_cli_exit_tools.adapters import signal_relay
+from lib_cli_exit_tools.adapters.cancellation import cancellation_scope
+from lib_cli_exit_tools.adapters.signals import SigIntInterrupt, SignalSpec, install_signal_handlers
+from lib_cli_exit_tools.application import runner
+
+_SIGINT_SPEC = SignalSpec(signum=signal.SIGINT, exception=SigIntInterrupt, message="Aborted (SIGINT).", exit_code=130)
+
+
+@pytest.fixture
+def relay() -> Iterator[None]:
+    """Install a SIGINT relay for the test and remove it afterwards."""
+    uninstall = signal_relay.install_signal_relay([signal.SIGINT])
+    try:
+        yield
+    finally:
+        uninstall()
+
+
+def _start_worker(target: Callable[[], object]) -> tuple[threading.Thread, list[object]]:
+    """Start ``target`` on a worker thread that records what it returned or raised."""
+    outcome: list[object] = []
+
+    def _run() -> None:
+        try:
+            outcome.append(target())
+        except BaseException as exc:  # noqa: BLE001 - reported to the test
+            outcome.append(exc)
+
+    worker = threading.Thread(target=_run)
+    worker.start()
+    return worker, outcome
+
+
+def _in_worker(target: Callable[[], object]) -> list[object]:
+    """Run ``target`` on a worker thread and return what it returned or raised."""
+    worker, outcome = _start_worker(target)
+    worker.join(10)
+    return outcome
+
+
+def _interrupted_worker(started: threading.Event, body: Callable[[], object]) -> list[object]:
+    """Run ``body`` on a worker thread, send SIGINT once it started, and collect the outcome."""
+    worker, outcome = _start_worker(body)
+    assert started.wait(5)
+    signal.raise_signal(signal.SIGINT)
+    worker.join(10)
+    return outcome
+
+
+def _wait_for_interrupt(started: threading.Event) -> str:
+    """Announce the start, then spin until an exception arrives."""
+    started.set()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        time.sleep(0.01)
+    return "not interrupted"
+
+
+# =============================================================================
+# Installing From Worker Threads
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_worker_thread_install_without_relay_does_not_fail() -> None:
+    outcome = _in_worker(lambda: install_signal_handlers([_SIGINT_SPEC])())
+    assert outcome == [None]
+
+
+@pytest.mark.os_agnostic
+def test_relay_refuses_worker_thread() -> None:
+    outcome = _in_worker(signal_relay.install_signal_relay)
+    assert isinstance(outcome[0], ValueError)
+
+
+@pytest.mark.os_agnostic
+def test_relay_refuses_second_install(relay: None) -> None:
+    with pytest.raises(RuntimeError):
+        signal_relay.install_signal_relay([signal.SIGINT])
+
+
+@pytest.mark.os_agnostic
+def test_uninstall_restores_previous_handler() -> None:
+    original = signal.getsignal(signal.SIGINT)
+    signal_relay.install_signal_relay([signal.SIGINT])()
+    assert signal.getsignal(signal.SIGINT) is original
+
+
+# =============================================================================
+# Relayed Delivery
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_relayed_signal_interrupts_worker_run(relay: None) -> None:
+    started = threading.Event()
+
+    def _body() -> str:
+        restore = install_signal_handlers([_SIGINT_SPEC])
+        try:
+            return _wait_for_interrupt(started)
+        finally:
+            restore()
+
+    outcome = _interrupted_worker(started, _body)
+    assert isinstance(outcome[0], SigIntInterrupt)
+
+
+@pytest.mark.os_agnostic
+def test_relayed_signal_cancels_worker_token(relay: None) -> None:
+    started = threading.Event()
+
+    def _body() -> object:
+        with cancellation_scope() as token:
+            restore = install_signal_handlers([_SIGINT_SPEC])
+            try:
+                _wait_for_interrupt(started)
+            except SigIntInterrupt:
+                return token.reason
+            finally:
+                restore()
+        return None
+
+    outcome = _interrupted_worker(started, _body)
+    assert outcome == ["SIGINT"]
+
+
+@pytest.mark.os_agnostic
+def test_relay_dispatches_from_handler_when_wakeup_fd_is_taken() -> None:
+    reader, writer = socket.socketpair()
+    writer.setblocking(False)
+    signal.set_wakeup_fd(writer.fileno())
+    uninstall = signal_relay.install_signal_relay([signal.SIGINT])
+    try:
+        started = threading.Event()
+
+        def _body() -> str:
+            restore = install_signal_handlers([_SIGINT_SPEC])
+            try:
+                return _wait_for_interrupt(started)
+            finally:
+                restore()
+
+        outcome = _interrupted_worker(started, _body)
+    finally:
+        uninstall()
+        signal.set_wakeup_fd(-1)
+        reader.close()
+        writer.close()
+    assert isinstance(outcome[0], SigIntInterrupt)
+
+
+@pytest.mark.os_agnostic
+def test_signal_without_subscriber_reaches_previous_handler() -> None:
+    seen: list[int] = []
+
+    def _previous(signum: int, frame: FrameType | None) -> None:
+        seen.append(signum)
+
+    original = signal.signal(signal.SIGINT, _previous)
+    try:
+        uninstall = signal_relay.install_signal_relay([signal.SIGINT])
+        try:
+            signal.raise_signal(signal.SIGINT)
+        finally:
+            uninstall()
+    finally:
+        signal.signal(signal.SIGINT, original)
+    assert seen == [signal.SIGINT]
+
+
+# =============================================================================
+# run_cli Integration
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_on_worker_thread_returns_spec_exit_code(relay: None, capsys: pytest.CaptureFixture[str]) -> None:
+    started = threading.Event()
+
+    @click.command()
+    def _wait() -> None:
+        _wait_for_interrupt(started)
+
+    outcome = _interrupted_worker(started, lambda: runner.run_cli(_wait, argv=[], signal_specs=[_SIGINT_SPEC]))
+    capsys.readouterr()
+    assert outcome == [130]
@@ -5,11 +5,16 @@ Each test verifies exactly one signal handling behavior:
 - Platform-specific signals are included when available
 - Signal handlers can be installed and restored
 - Custom specs can be appended
+- Repeats within the grace window are counted, not raised; enough repeats escalate
+- Signals inside defer_signals are raised when the block exits or the deferral expires
 """
 
 from __future__ import annotations
 
 import signal
+import threading
+import time
+from collections.abc import Callable, Iterator
 
 import pytest
 
@@ -196,3 +201,193 @@ def test_restorer_calls_signal_to_restore_previous_handlers() -> None:
     # After restoration, handler should be back to original
     restored_handler = signal.getsignal(signal.SIGINT)
     assert restored_handler == original_handler
+
+
+# =============================================================================
+# Repeated Signals
+# =============================================================================
+
+
+_Installer = Callable[..., None]
+
+
+@pytest.fixture
+def install_sigint() -> Iterator[_Installer]:
+    """Install raising SIGINT handlers with a repeat policy; restore them afterwards."""
+    restorers: list[Callable[[], None]] = []
+
+    def _install(grace_window: float | None = None, escalate_after: int | None = None) -> None:
+        spec = sig.SignalSpec(
+            signum=signal.SIGINT,
+            exception=RuntimeError,
+            message="Aborted.",
+            exit_code=130,
+            grace_window=grace_window,
+            escalate_after=escalate_after,
+        )
+        restorers.append(sig.install_signal_handlers([spec]))
+
+    yield _install
+    for restore in reversed(restorers):
+        restore()
+
+
+@pytest.mark.os_agnostic
+def test_first_delivery_raises(install_sigint: _Installer) -> None:
+    install_sigint(grace_window=60.0)
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+
+
+@pytest.mark.os_agnostic
+def test_repeat_within_grace_window_is_not_raised(install_sigint: _Installer) -> None:
+    install_sigint(grace_window=60.0)
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+    signal.raise_signal(signal.SIGINT)
+    assert sig.signal_deliveries()[signal.SIGINT] == 2
+
+
+@pytest.mark.os_agnostic
+def test_repeat_without_grace_window_raises_again(install_sigint: _Installer) -> None:
+    install_sigint()
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+
+
+@pytest.mark.os_agnostic
+def test_repeat_after_grace_window_raises_again(install_sigint: _Installer) -> None:
+    install_sigint(grace_window=0.0)
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+
+
+@pytest.mark.os_agnostic
+def test_escalation_exits_with_spec_exit_code(
+    install_sigint: _Installer,
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+) -> None:
+    exits: list[int] = []
+    monkeypatch.setattr(sig.os, "_exit", exits.append)
+    install_sigint(grace_window=60.0, escalate_after=2)
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+    signal.raise_signal(signal.SIGINT)
+    assert (exits, capfd.readouterr().err) == ([130], "Aborted. Received 2 times; exiting immediately.\n")
+
+
+@pytest.mark.os_agnostic
+def test_reinstalling_handlers_resets_delivery_count(install_sigint: _Installer) -> None:
+    install_sigint(grace_window=60.0)
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+    install_sigint(grace_window=60.0)
+    assert sig.signal_deliveries()[signal.SIGINT] == 0
+
+
+@pytest.mark.os_agnostic
+def test_delivery_after_grace_window_restarts_count(install_sigint: _Installer) -> None:
+    install_sigint(grace_window=0.0)
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+    assert sig.signal_deliveries()[signal.SIGINT] == 1
+
+
+@pytest.mark.os_agnostic
+def test_handled_deliveries_do_not_escalate(install_sigint: _Installer, monkeypatch: pytest.MonkeyPatch) -> None:
+    exits: list[int] = []
+    monkeypatch.setattr(sig.os, "_exit", exits.append)
+    install_sigint(grace_window=0.0, escalate_after=2)
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            signal.raise_signal(signal.SIGINT)
+    assert exits == []
+
+
+@pytest.mark.os_agnostic
+def test_default_specs_raise_on_every_delivery() -> None:
+    policies = {(spec.grace_window, spec.escalate_after) for spec in sig.default_signal_specs()}
+    assert policies == {(None, None)}
+
+
+# =============================================================================
+# Deferred Signals
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_deferred_signal_lets_block_finish(install_sigint: _Installer) -> None:
+    install_sigint()
+    finished: list[bool] = []
+    with pytest.raises(RuntimeError), sig.defer_signals():
+        signal.raise_signal(signal.SIGINT)
+        finished.append(True)
+    assert finished == [True]
+
+
+@pytest.mark.os_agnostic
+def test_block_without_signal_raises_nothing(install_sigint: _Installer) -> None:
+    install_sigint()
+    with sig.defer_signals():
+        pass
+
+
+@pytest.mark.os_agnostic
+def test_signal_after_block_raises_immediately(install_sigint: _Installer) -> None:
+    install_sigint()
+    with sig.defer_signals():
+        pass
+    with pytest.raises(RuntimeError):
+        signal.raise_signal(signal.SIGINT)
+
+
+@pytest.mark.os_agnostic
+def test_nested_block_defers_until_outermost_exit(install_sigint: _Installer) -> None:
+    install_sigint()
+    reached: list[str] = []
+    with pytest.raises(RuntimeError), sig.defer_signals():
+        with sig.defer_signals():
+            signal.raise_signal(signal.SIGINT)
+        reached.append("after inner block")
+    assert reached == ["after inner block"]
+
+
+@pytest.mark.os_agnostic
+def test_deferred_signal_keeps_block_failure_as_context(install_sigint: _Installer) -> None:
+    install_sigint()
+    with pytest.raises(RuntimeError) as excinfo, sig.defer_signals():
+        signal.raise_signal(signal.SIGINT)
+        raise ValueError("write failed")
+    assert isinstance(excinfo.value.__context__, ValueError)
+
+
+@pytest.mark.os_agnostic
+def test_max_deferral_raises_inside_block(install_sigint: _Installer) -> None:
+    install_sigint()
+    deadline = time.monotonic() + 5.0
+    with pytest.raises(RuntimeError), sig.defer_signals(max_deferral=0.05):
+        signal.raise_signal(signal.SIGINT)
+        while time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert time.monotonic() < deadline
+
+
+@pytest.mark.os_agnostic
+def test_defer_signals_outside_main_thread_has_no_effect() -> None:
+    entered: list[bool] = []
+
+    def _enter() -> None:
+        with sig.defer_signals():
+            entered.append(sig._deferral is None)  # pyright: ignore[reportPrivateUsage]
+
+    worker = threading.Thread(target=_enter)
+    worker.start()
+    worker.join()
+    assert entered == [True]
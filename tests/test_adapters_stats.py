@@ -0,0 +1,157 @@
+"""Tests for the persistent run-statistics store.
+
+Each test verifies exactly one statistics behavior:
+- Records land in the log and the rollups
+- Summaries derive percentiles and exit-code histograms from rollups
+- The database runs in WAL mode
+- run_cli records one run per invocation when a database is configured
+- Command paths follow nested subcommands
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+import rich_click as click
+
+from lib_cli_exit_tools.adapters import stats
+from lib_cli_exit_tools.application import runner
+from lib_cli_exit_tools.core.configuration import config
+
+
+def _record(command: str = "cli sync", exit_code: int = 0, duration: float = 0.010) -> stats.RunRecord:
+    return stats.RunRecord(command=command, exit_code=exit_code, duration=duration, cpu_time=0.005, peak_rss=1024, ts=0.0)
+
+
+@click.group("tool")
+def _tool() -> None:
+    """Group with one nested subcommand."""
+
+
+@_tool.group("remote")
+def _remote() -> None:
+    """Nested group."""
+
+
+@_remote.command("sync")
+def _sync() -> None:
+    """Leaf command."""
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_record_appends_every_run_to_the_log(tmp_path: Path) -> None:
+    store = stats.StatsStore(tmp_path / "runs.db")
+    store.record([_record(), _record(exit_code=1)])
+    with sqlite3.connect(store.path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM runs").fetchone() == (2,)
+
+
+@pytest.mark.os_agnostic
+def test_record_returns_number_of_written_runs(tmp_path: Path) -> None:
+    assert stats.StatsStore(tmp_path / "runs.db").record([_record()] * 3) == 3
+
+
+@pytest.mark.os_agnostic
+def test_record_creates_missing_parent_directories(tmp_path: Path) -> None:
+    store = stats.StatsStore(tmp_path / "nested" / "runs.db")
+    store.record([_record()])
+    assert store.path.exists()
+
+
+@pytest.mark.os_agnostic
+def test_database_uses_write_ahead_logging(tmp_path: Path) -> None:
+    store = stats.StatsStore(tmp_path / "runs.db")
+    store.record([_record()])
+    with sqlite3.connect(store.path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+# =============================================================================
+# Summaries
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_summaries_of_missing_database_are_empty(tmp_path: Path) -> None:
+    assert stats.StatsStore(tmp_path / "absent.db").summaries() == []
+
+
+@pytest.mark.os_agnostic
+def test_summaries_count_exit_codes_per_command(tmp_path: Path) -> None:
+    store = stats.StatsStore(tmp_path / "runs.db")
+    store.record([_record(), _record(), _record(exit_code=2), _record(command="cli other")])
+    by_command = {entry.command: dict(entry.exit_codes) for entry in store.summaries()}
+    assert by_command == {"cli other": {0: 1}, "cli sync": {0: 2, 2: 1}}
+
+
+@pytest.mark.os_agnostic
+def test_summaries_percentiles_stay_within_one_bucket(tmp_path: Path) -> None:
+    store = stats.StatsStore(tmp_path / "runs.db")
+    store.record([_record(duration=index / 1000) for index in range(1, 101)])
+    (entry,) = store.summaries()
+    assert 0.050 <= entry.percentiles[50.0] <= 0.050 * 1.1
+
+
+@pytest.mark.os_agnostic
+def test_summaries_report_largest_peak_rss(tmp_path: Path) -> None:
+    store = stats.StatsStore(tmp_path / "runs.db")
+    store.record([_record(), stats.RunRecord("cli sync", 0, 0.01, None, 4096, 0.0)])
+    (entry,) = store.summaries()
+    assert entry.max_rss == 4096
+
+
+# =============================================================================
+# Environment
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_stats_path_from_env_reads_variable() -> None:
+    assert stats.stats_path_from_env({stats.STATS_PATH_ENV: "/tmp/runs.db"}) == "/tmp/runs.db"
+
+
+@pytest.mark.os_agnostic
+def test_stats_path_from_env_ignores_blank_value() -> None:
+    assert stats.stats_path_from_env({stats.STATS_PATH_ENV: "  "}) is None
+
+
+# =============================================================================
+# run_cli Integration
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_records_run_when_stats_path_configured(tmp_path: Path, reset_config: None) -> None:
+    config.stats_path = str(tmp_path / "runs.db")
+    runner.run_cli(_tool, argv=["remote", "sync"], install_signals=False)
+    (entry,) = stats.StatsStore(config.stats_path).summaries()
+    assert (entry.command, dict(entry.exit_codes)) == ("tool remote sync", {0: 1})
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_records_nothing_without_stats_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, reset_config: None) -> None:
+    monkeypatch.delenv(stats.STATS_PATH_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+    runner.run_cli(_tool, argv=["remote", "sync"], install_signals=False)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_ignores_unwritable_stats_database(tmp_path: Path, reset_config: None) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    config.stats_path = str(blocker / "runs.db")
+    assert runner.run_cli(_tool, argv=["remote", "sync"], install_signals=False) == 0
+
+
+@pytest.mark.os_agnostic
+def test_command_path_skips_options_between_subcommands() -> None:
+    path = runner._command_path(_tool, ["--verbose", "remote", "sync", "--dry-run"], "tool")  # pyright: ignore[reportPrivateUsage]
+    assert path == "tool remote sync"
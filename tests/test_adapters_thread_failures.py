@@ -0,0 +1,172 @@
+"""Tests for capturing exceptions that escape worker threads.
+
+Each test verifies exactly one thread-failure behavior:
+- Thread and unraisable exceptions are recorded and rendered
+- SystemExit in a thread is ignored, as with the default hook
+- The previous hooks are restored and host hooks keep running
+- The watch can be enabled from inside a block
+- The first failure can cancel the watching thread, never after the block exited
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+import pytest
+
+from lib_cli_exit_tools.adapters import thread_failures
+from lib_cli_exit_tools.adapters.thread_failures import ThreadFailure, WorkerThreadFailed
+
+# pytest's own excepthook runs after ours, as any host hook would.
+pytestmark = [
+    pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning"),
+    pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning"),
+]
+
+
+def _run_thread(target: Callable[[], object], name: str = "worker") -> None:
+    thread = threading.Thread(target=target, name=name)
+    thread.start()
+    thread.join()
+
+
+def _fail() -> None:
+    raise ValueError("bad row")
+
+
+class _Unraisable:
+    def __del__(self) -> None:
+        raise OSError("close failed")
+
+
+def _render_into(rendered: list[ThreadFailure]) -> Callable[[ThreadFailure], None]:
+    return rendered.append
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_thread_exception_is_recorded() -> None:
+    with thread_failures.watch_thread_failures(True, render=lambda failure: None) as failures:
+        _run_thread(_fail)
+    assert [type(failure.exception) for failure in failures] == [ValueError]
+
+
+@pytest.mark.os_agnostic
+def test_thread_failure_names_its_thread() -> None:
+    with thread_failures.watch_thread_failures(True, render=lambda failure: None) as failures:
+        _run_thread(_fail, name="loader")
+    assert failures[0].origin == "Exception in thread loader"
+
+
+@pytest.mark.os_agnostic
+def test_thread_failure_is_rendered() -> None:
+    rendered: list[ThreadFailure] = []
+    with thread_failures.watch_thread_failures(True, render=_render_into(rendered)):
+        _run_thread(_fail)
+    assert len(rendered) == 1
+
+
+@pytest.mark.os_agnostic
+def test_unraisable_exception_is_recorded() -> None:
+    with thread_failures.watch_thread_failures(True, render=lambda failure: None) as failures:
+        _Unraisable()
+    assert failures[0].origin.startswith("Exception ignored in")
+
+
+@pytest.mark.os_agnostic
+def test_system_exit_in_thread_is_ignored() -> None:
+    def _exit() -> None:
+        raise SystemExit(3)
+
+    with thread_failures.watch_thread_failures(True, render=lambda failure: None) as failures:
+        _run_thread(_exit)
+    assert list(failures) == []
+
+
+@pytest.mark.os_agnostic
+def test_disabled_watch_records_nothing() -> None:
+    before = threading.excepthook
+    with thread_failures.watch_thread_failures(False, render=lambda failure: None):
+        assert threading.excepthook is before
+
+
+# =============================================================================
+# Hook Lifetime
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_hooks_are_restored_after_block() -> None:
+    before = threading.excepthook
+    with thread_failures.watch_thread_failures(True, render=lambda failure: None):
+        pass
+    assert threading.excepthook is before
+
+
+@pytest.mark.os_agnostic
+def test_host_hook_still_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[str] = []
+
+    def _host_hook(args: threading.ExceptHookArgs) -> None:
+        seen.append(args.thread.name if args.thread is not None else "")
+
+    monkeypatch.setattr(threading, "excepthook", _host_hook)
+    with thread_failures.watch_thread_failures(True, render=lambda failure: None):
+        _run_thread(_fail, name="loader")
+    assert seen == ["loader"]
+
+
+@pytest.mark.os_agnostic
+def test_start_thread_watch_outside_block_returns_false() -> None:
+    assert thread_failures.start_thread_watch() is False
+
+
+@pytest.mark.os_agnostic
+def test_start_thread_watch_installs_hooks_inside_block() -> None:
+    with thread_failures.watch_thread_failures(False, render=lambda failure: None) as failures:
+        thread_failures.start_thread_watch()
+        _run_thread(_fail)
+    assert len(failures) == 1
+
+
+# =============================================================================
+# Cancellation
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_first_failure_cancels_watching_thread() -> None:
+    with pytest.raises(WorkerThreadFailed), thread_failures.watch_thread_failures(True, cancel=True, render=lambda failure: None):
+        threading.Thread(target=_fail).start()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            time.sleep(0.001)
+
+
+@pytest.mark.os_agnostic
+def test_cancellation_does_not_outlive_block_during_slow_render() -> None:
+    rendering = threading.Event()
+    cancelled: list[WorkerThreadFailed] = []
+
+    def _slow_render(failure: ThreadFailure) -> None:
+        rendering.set()
+        time.sleep(0.3)
+
+    with thread_failures.watch_thread_failures(True, cancel=True, render=_slow_render):
+        try:
+            threading.Thread(target=_fail).start()
+            while not rendering.is_set():
+                time.sleep(0.001)
+            time.sleep(0.01)
+        except WorkerThreadFailed as exc:
+            cancelled.append(exc)
+    deadline = time.monotonic() + 0.5  # an injection landing late would raise here
+    while time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert len(cancelled) == 1
@@ -0,0 +1,174 @@
+"""Tests for the wall-clock timeout adapter.
+
+Each test verifies exactly one timeout behavior:
+- The deadline interrupts the block on the main thread and on worker threads
+- Blocks finishing in time are left alone and leave no handler behind
+- The timeout can be armed from inside a block
+- Stacks are dumped on request
+- The grace period ends in a hard exit with code 124
+- An expired deadline emits a timeout lifecycle event
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from lib_cli_exit_tools.adapters import events, timeout
+from lib_cli_exit_tools.adapters.signals import TimeoutInterrupt
+
+
+def _busy_wait(seconds: float) -> None:
+    """Spin in Python bytecode so an asynchronously injected exception lands."""
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        time.sleep(0.001)
+
+
+# =============================================================================
+# Deadline
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_enforce_timeout_interrupts_blocking_call() -> None:
+    with pytest.raises(TimeoutInterrupt), timeout.enforce_timeout(0.05):
+        time.sleep(5)
+
+
+@pytest.mark.posix_only
+def test_interrupt_carries_exceeded_limit() -> None:
+    with pytest.raises(TimeoutInterrupt) as caught, timeout.enforce_timeout(0.05):
+        time.sleep(5)
+    assert caught.value.seconds == 0.05
+
+
+@pytest.mark.os_agnostic
+def test_enforce_timeout_leaves_fast_block_alone() -> None:
+    with timeout.enforce_timeout(5):
+        pass
+
+
+@pytest.mark.posix_only
+def test_enforce_timeout_restores_sigalrm_handler() -> None:
+    before = signal.getsignal(signal.SIGALRM)
+    with timeout.enforce_timeout(5):
+        pass
+    assert signal.getsignal(signal.SIGALRM) is before
+
+
+@pytest.mark.os_agnostic
+def test_enforce_timeout_interrupts_worker_thread() -> None:
+    outcome: list[BaseException] = []
+
+    def _worker() -> None:
+        try:
+            with timeout.enforce_timeout(0.05):
+                _busy_wait(5)
+        except TimeoutInterrupt as exc:
+            outcome.append(exc)
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join(10)
+    assert len(outcome) == 1
+
+
+@pytest.mark.os_agnostic
+def test_enforce_timeout_without_seconds_never_fires() -> None:
+    with timeout.enforce_timeout(None):
+        _busy_wait(0.05)
+
+
+# =============================================================================
+# Arming From Inside
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_start_timeout_outside_block_returns_false() -> None:
+    assert timeout.start_timeout(1) is False
+
+
+@pytest.mark.posix_only
+def test_start_timeout_arms_enclosing_block() -> None:
+    with pytest.raises(TimeoutInterrupt), timeout.enforce_timeout(None):
+        timeout.start_timeout(0.05)
+        time.sleep(5)
+
+
+# =============================================================================
+# Stack Dump
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_format_stacks_names_current_thread() -> None:
+    assert f"Thread {threading.current_thread().name}" in timeout.format_stacks()
+
+
+@pytest.mark.posix_only
+def test_dump_stacks_prints_interrupted_frame(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(TimeoutInterrupt), timeout.enforce_timeout(0.05, dump_stacks=True):
+        time.sleep(5)
+    assert "test_dump_stacks_prints_interrupted_frame" in capsys.readouterr().err
+
+
+# =============================================================================
+# Grace Period
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_grace_period_expiry_exits_with_124() -> None:
+    script = textwrap.dedent(
+        """
+        import time
+        from lib_cli_exit_tools.adapters.signals import TimeoutInterrupt
+        from lib_cli_exit_tools.adapters.timeout import enforce_timeout
+
+        with enforce_timeout(0.05, grace=0.1):
+            try:
+                time.sleep(5)
+            except TimeoutInterrupt:
+                time.sleep(5)
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=30, check=False)
+    assert result.returncode == timeout.TIMEOUT_EXIT_CODE
+
+
+# =============================================================================
+# Lifecycle Event
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_worker_thread_timeout_emits_event() -> None:
+    read_fd, write_fd = os.pipe()
+
+    def _worker() -> None:
+        token = events.activate_event_stream(events.EventStream(write_fd))
+        try:
+            with timeout.enforce_timeout(0.05):
+                _busy_wait(5)
+        except TimeoutInterrupt:
+            pass
+        finally:
+            events.deactivate_event_stream(token)
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join(10)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as reader:
+        names = [json.loads(line)["event"] for line in reader.read().splitlines()]
+    assert names == ["timeout"]
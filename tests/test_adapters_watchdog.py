@@ -0,0 +1,172 @@
+"""Tests for the heartbeat watchdog.
+
+Each test verifies exactly one watchdog behavior:
+- heartbeat() advances the process-wide count
+- Silent blocks are reported with all thread stacks; heartbeating blocks are not
+- A stall is reported once and again only after heartbeats resumed
+- With interrupt, StallInterrupt lands in the watched thread
+- The watchdog can be armed from inside a block
+- A stall emits a stall lifecycle event
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+
+import pytest
+
+from lib_cli_exit_tools.adapters import events, watchdog
+from lib_cli_exit_tools.adapters.signals import StallInterrupt
+
+
+def _stall_reports(stderr: str) -> int:
+    """Count the stall report headers in ``stderr`` (dumped source lines are indented)."""
+    return sum(line.startswith("No heartbeat for") for line in stderr.splitlines())
+
+
+def _busy_wait(seconds: float, beat: Callable[[], None] | None = None) -> None:
+    """Spin in Python bytecode, calling ``beat`` on every round when given."""
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        if beat is not None:
+            beat()
+        time.sleep(0.005)
+
+
+# =============================================================================
+# Heartbeat
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_heartbeat_advances_count() -> None:
+    before = watchdog._beats  # pyright: ignore[reportPrivateUsage]
+    watchdog.heartbeat()
+    assert watchdog._beats == before + 1  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.os_agnostic
+def test_heartbeat_outside_watched_block_is_harmless() -> None:
+    watchdog.heartbeat()
+
+
+# =============================================================================
+# Stall Reports
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_silent_block_is_reported(capsys: pytest.CaptureFixture[str]) -> None:
+    with watchdog.watch_heartbeat(0.05):
+        _busy_wait(0.3)
+    assert "No heartbeat for" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_report_contains_stalled_frame(capsys: pytest.CaptureFixture[str]) -> None:
+    with watchdog.watch_heartbeat(0.05):
+        _busy_wait(0.3)
+    assert "test_report_contains_stalled_frame" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_heartbeating_block_is_left_alone(capsys: pytest.CaptureFixture[str]) -> None:
+    with watchdog.watch_heartbeat(0.1):
+        _busy_wait(0.4, watchdog.heartbeat)
+    assert "No heartbeat" not in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_unwatched_block_is_left_alone(capsys: pytest.CaptureFixture[str]) -> None:
+    with watchdog.watch_heartbeat(None):
+        _busy_wait(0.1)
+    assert "No heartbeat" not in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_stall_is_reported_once(capsys: pytest.CaptureFixture[str]) -> None:
+    with watchdog.watch_heartbeat(0.05):
+        _busy_wait(0.4)
+    assert _stall_reports(capsys.readouterr().err) == 1
+
+
+@pytest.mark.os_agnostic
+def test_stall_after_resumed_heartbeats_is_reported_again(capsys: pytest.CaptureFixture[str]) -> None:
+    with watchdog.watch_heartbeat(0.05):
+        _busy_wait(0.3)
+        watchdog.heartbeat()
+        _busy_wait(0.3)
+    assert _stall_reports(capsys.readouterr().err) == 2
+
+
+# =============================================================================
+# Interrupting
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_interrupt_raises_stall_interrupt(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(StallInterrupt), watchdog.watch_heartbeat(0.05, interrupt=True):
+        _busy_wait(5)
+    capsys.readouterr()
+
+
+@pytest.mark.os_agnostic
+def test_interrupt_lands_in_worker_thread(capsys: pytest.CaptureFixture[str]) -> None:
+    outcome: list[BaseException] = []
+
+    def _worker() -> None:
+        try:
+            with watchdog.watch_heartbeat(0.05, interrupt=True):
+                _busy_wait(5)
+        except StallInterrupt as exc:
+            outcome.append(exc)
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join(10)
+    capsys.readouterr()
+    assert len(outcome) == 1
+
+
+# =============================================================================
+# Arming From Inside
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_start_watchdog_outside_block_returns_false() -> None:
+    assert watchdog.start_watchdog(1) is False
+
+
+@pytest.mark.os_agnostic
+def test_start_watchdog_arms_enclosing_block(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(StallInterrupt), watchdog.watch_heartbeat(None):
+        watchdog.start_watchdog(0.05, interrupt=True)
+        _busy_wait(5)
+    capsys.readouterr()
+
+
+# =============================================================================
+# Lifecycle Event
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_stall_emits_event(capsys: pytest.CaptureFixture[str]) -> None:
+    read_fd, write_fd = os.pipe()
+    token = events.activate_event_stream(events.EventStream(write_fd))
+    try:
+        with watchdog.watch_heartbeat(0.05):
+            _busy_wait(0.3)
+    finally:
+        events.deactivate_event_stream(token)
+        os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as reader:
+        names = [json.loads(line)["event"] for line in reader.read().splitlines()]
+    capsys.readouterr()
+    assert names == ["stall"]
@@ -0,0 +1,137 @@
+"""Tests for in-process retries of transient failures.
+
+Each test verifies exactly one retry behavior:
+- Backoff grows exponentially, is capped, and is jittered
+- Transient failures are retried until success or the attempts run out
+- Permanent failures and the total-time cap stop retrying
+- Retries are announced to the on_retry callback
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from lib_cli_exit_tools.application.retry import RetryPolicy, call_with_retry
+
+
+class _Flaky:
+    """Callable failing with ``error`` for the first ``failures`` calls."""
+
+    def __init__(self, failures: int, error: BaseException | None = None) -> None:
+        self.calls = 0
+        self._failures = failures
+        self._error = error or ConnectionResetError("reset")
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self._failures:
+            raise self._error
+        return "done"
+
+
+class _Clock:
+    """Fake monotonic clock advanced by the fake sleep."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+_STEADY = RetryPolicy(attempts=4, initial_delay=0.1, multiplier=2.0, max_delay=1.0, jitter=0.0)
+
+
+def _run(action: _Flaky, policy: RetryPolicy = _STEADY) -> tuple[str, _Clock]:
+    clock = _Clock()
+    return call_with_retry(action, policy, sleep=clock.sleep, clock=clock), clock
+
+
+# =============================================================================
+# Backoff
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_backoff_is_capped_at_max_delay() -> None:
+    assert RetryPolicy(initial_delay=1.0, max_delay=2.0).backoff(10, sample=0.0) == 2.0
+
+
+@pytest.mark.os_agnostic
+def test_full_jitter_can_shrink_delay_to_zero() -> None:
+    assert RetryPolicy(initial_delay=1.0, jitter=1.0).backoff(1, sample=1.0) == 0.0
+
+
+@pytest.mark.os_agnostic
+def test_jittered_backoff_stays_within_ceiling() -> None:
+    policy = RetryPolicy(initial_delay=1.0, max_delay=1.0)
+    assert all(0.0 <= policy.backoff(3) <= 1.0 for _ in range(100))
+
+
+# =============================================================================
+# Retrying
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_transient_failures_are_retried_until_success() -> None:
+    action = _Flaky(failures=2)
+    result, _ = _run(action)
+    assert (result, action.calls) == ("done", 3)
+
+
+@pytest.mark.os_agnostic
+def test_retries_sleep_with_exponential_backoff() -> None:
+    _, clock = _run(_Flaky(failures=3))
+    assert clock.sleeps == pytest.approx([0.1, 0.2, 0.4])
+
+
+@pytest.mark.os_agnostic
+def test_last_failure_is_raised_when_attempts_run_out() -> None:
+    action = _Flaky(failures=10)
+    with pytest.raises(ConnectionResetError):
+        _run(action)
+    assert action.calls == 4
+
+
+@pytest.mark.os_agnostic
+def test_permanent_failure_is_not_retried() -> None:
+    action = _Flaky(failures=1, error=ValueError("bad input"))
+    with pytest.raises(ValueError):
+        _run(action)
+    assert action.calls == 1
+
+
+@pytest.mark.os_agnostic
+def test_total_time_cap_stops_retrying() -> None:
+    action = _Flaky(failures=10)
+    policy = RetryPolicy(attempts=10, initial_delay=1.0, multiplier=1.0, jitter=0.0, max_total=2.5)
+    with pytest.raises(ConnectionResetError):
+        _run(action, policy)
+    assert action.calls == 3
+
+
+@pytest.mark.os_agnostic
+def test_custom_predicate_decides_what_is_retried() -> None:
+    action = _Flaky(failures=1, error=ValueError("flaky parser"))
+    result, _ = _run(action, RetryPolicy(jitter=0.0, retry_on=lambda exc: isinstance(exc, ValueError)))
+    assert result == "done"
+
+
+@pytest.mark.os_agnostic
+def test_on_retry_receives_attempt_and_delay() -> None:
+    seen: list[tuple[int, float]] = []
+    policy = RetryPolicy(initial_delay=0.1, jitter=0.0, on_retry=lambda attempt, exc, delay: seen.append((attempt, delay)))
+    _run(_Flaky(failures=1), policy)
+    assert seen == [(1, 0.1)]
+
+
+@pytest.mark.os_agnostic
+def test_retry_is_announced_on_stderr(capsys: pytest.CaptureFixture[str]) -> None:
+    _run(_Flaky(failures=1))
+    assert "retry: attempt 1 of 4 failed (ConnectionResetError" in capsys.readouterr().err
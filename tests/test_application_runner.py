@@ -6,13 +6,22 @@ Each test verifies exactly one behavior:
 - Exception handling and exit code resolution
 - CLI session management
 - Output decoding and truncation
+- Timeouts and stalled commands reported by the heartbeat watchdog
+- Finalisation runs every restorer even when one of them fails
 """
 
 from __future__ import annotations
 
+import asyncio
+import gc
 import io
+import json
+import os
+import signal
 import subprocess
 import sys
+import threading
+import time
 from collections.abc import Callable, Sequence
 from contextlib import AbstractContextManager
 from types import SimpleNamespace
@@ -21,8 +30,13 @@ import click
 import pytest
 from rich.text import Text
 
-from lib_cli_exit_tools.adapters.signals import SignalSpec
+from lib_cli_exit_tools.adapters.cancellation import CancellationToken, current_cancellation_token
+from lib_cli_exit_tools.adapters.child_process import run_child
+from lib_cli_exit_tools.adapters.gc_policy import GcPolicy, GcStats
+from lib_cli_exit_tools.adapters.memory_limit import MemoryReserve
+from lib_cli_exit_tools.adapters.signals import SignalSpec, StallInterrupt, TimeoutInterrupt
 from lib_cli_exit_tools.application import runner
+from lib_cli_exit_tools.application.retry import RetryPolicy
 from lib_cli_exit_tools.core import configuration as cfg
 
 
@@ -274,6 +288,42 @@ def test_handle_exception_for_broken_pipe_uses_configured_code(reset_config: Non
     assert runner.handle_cli_exception(BrokenPipeError()) == 77
 
 
+@pytest.mark.os_agnostic
+def test_run_cli_unwraps_broken_pipe_hidden_in_click_exit(reset_config: None) -> None:
+    def exit_like_click() -> None:
+        try:
+            raise BrokenPipeError()
+        except BrokenPipeError:
+            raise SystemExit(1) from None
+
+    cfg.config.broken_pipe_exit_code = 77
+    assert runner.run_cli(DummyCommand(exit_like_click), install_signals=False) == 77
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_keeps_explicit_success_exit_after_broken_pipe(reset_config: None) -> None:
+    def exit_quietly_on_broken_pipe() -> None:
+        try:
+            raise BrokenPipeError()
+        except BrokenPipeError:
+            sys.exit(0)
+
+    cfg.config.broken_pipe_exit_code = 77
+    assert runner.run_cli(DummyCommand(exit_quietly_on_broken_pipe), install_signals=False) == 0
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_keeps_explicit_exit_code_after_broken_pipe(reset_config: None) -> None:
+    def exit_with_own_code() -> None:
+        try:
+            raise BrokenPipeError()
+        except BrokenPipeError:
+            sys.exit(3)
+
+    cfg.config.broken_pipe_exit_code = 77
+    assert runner.run_cli(DummyCommand(exit_with_own_code), install_signals=False) == 3
+
+
 # =============================================================================
 # Exception Handling - Click Exceptions
 # =============================================================================
@@ -474,3 +524,607 @@ def test_run_cli_skips_signal_installation_when_disabled(monkeypatch: pytest.Mon
     runner.run_cli(DummyCommand(lambda: None), install_signals=False)
 
     assert called == []
+
+
+# =============================================================================
+# Fast Exit
+# =============================================================================
+
+
+@pytest.fixture
+def recorded_exits(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Replace os._exit and atexit processing with recorders."""
+    exits: list[int] = []
+    monkeypatch.setattr(runner.os, "_exit", exits.append)
+    monkeypatch.setattr(runner, "_run_atexit_callbacks", lambda: exits.append(-1))
+    return exits
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_fast_exit_terminates_with_exit_code(recorded_exits: list[int]) -> None:
+    def raise_error() -> None:
+        raise RuntimeError("boom")
+
+    runner.run_cli(DummyCommand(raise_error), install_signals=False, exception_handler=lambda _: 9, fast_exit=True)
+
+    assert recorded_exits[-1] == 9
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_fast_exit_runs_atexit_callbacks_first(recorded_exits: list[int]) -> None:
+    runner.run_cli(DummyCommand(lambda: None), install_signals=False, fast_exit=True)
+
+    assert recorded_exits == [-1, 0]
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_without_fast_exit_returns_normally(recorded_exits: list[int], reset_config: None) -> None:
+    result = runner.run_cli(DummyCommand(lambda: None), install_signals=False)
+
+    assert result == 0
+    assert recorded_exits == []
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_fast_exit_follows_config(recorded_exits: list[int], reset_config: None) -> None:
+    cfg.config.fast_exit = True
+
+    runner.run_cli(DummyCommand(lambda: None), install_signals=False)
+
+    assert recorded_exits == [-1, 0]
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_fast_exit_falls_back_when_flush_fails(recorded_exits: list[int], monkeypatch: pytest.MonkeyPatch) -> None:
+    class BrokenStream(io.StringIO):
+        def flush(self) -> None:
+            raise BrokenPipeError()
+
+    monkeypatch.setattr(sys, "stdout", BrokenStream())
+
+    result = runner.run_cli(DummyCommand(lambda: None), install_signals=False, fast_exit=True)
+
+    assert result == 0
+    assert recorded_exits == []
+
+
+@pytest.mark.os_agnostic
+def test_flush_streams_reliably_reports_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    class BrokenStream(io.StringIO):
+        def flush(self) -> None:
+            raise OSError("disk full")
+
+    monkeypatch.setattr(sys, "stderr", BrokenStream())
+
+    assert runner._flush_streams_reliably() is False  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.os_agnostic
+def test_flush_streams_reliably_reports_closed_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    class ClosedStream(io.StringIO):
+        def flush(self) -> None:
+            raise ValueError("I/O operation on closed file.")
+
+    monkeypatch.setattr(sys, "stderr", ClosedStream())
+
+    assert runner._flush_streams_reliably() is False  # pyright: ignore[reportPrivateUsage]
+
+
+# =============================================================================
+# GC Policy
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_applies_gc_policy_during_command() -> None:
+    observed: list[bool] = []
+
+    runner.run_cli(
+        DummyCommand(lambda: observed.append(gc.isenabled())),
+        install_signals=False,
+        gc_policy=GcPolicy(disable=True),
+    )
+
+    assert observed == [False]
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_restores_gc_policy_after_failure() -> None:
+    def raise_error() -> None:
+        raise RuntimeError("boom")
+
+    before = gc.get_threshold()
+    runner.run_cli(
+        DummyCommand(raise_error),
+        install_signals=False,
+        exception_handler=lambda _: 1,
+        gc_policy=GcPolicy(thresholds=(90_000, 50, 50)),
+    )
+
+    assert gc.get_threshold() == before
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_delivers_gc_stats_to_callback() -> None:
+    received: list[GcStats] = []
+
+    def collect() -> None:
+        gc.collect()
+
+    runner.run_cli(
+        DummyCommand(collect),
+        install_signals=False,
+        gc_policy=GcPolicy(on_stats=received.append),
+    )
+
+    assert received[0].collections[2] >= 1
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_survives_failing_gc_stats_callback(capsys: pytest.CaptureFixture[str]) -> None:
+    def broken_callback(stats: GcStats) -> None:
+        raise RuntimeError("metrics down")
+
+    before = signal.getsignal(signal.SIGINT)
+    exit_code = runner.run_cli(DummyCommand(lambda: None), gc_policy=GcPolicy(on_stats=broken_callback))
+
+    assert (exit_code, signal.getsignal(signal.SIGINT)) == (0, before)
+    assert "on_stats callback failed" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_runs_every_restorer_when_one_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    restored: list[str] = []
+
+    def failing_restorer() -> GcStats:
+        raise RuntimeError("restore failed")
+
+    def apply_failing_policy(policy: GcPolicy) -> Callable[[], GcStats]:
+        return failing_restorer
+
+    monkeypatch.setattr(runner, "apply_gc_policy", apply_failing_policy)
+    with pytest.raises(RuntimeError, match="restore failed"):
+        runner.run_cli(
+            DummyCommand(lambda: None),
+            signal_installer=lambda specs: lambda: restored.append("signals"),
+            gc_policy=GcPolicy(),
+        )
+
+    assert restored == ["signals"]
+
+
+# =============================================================================
+# Flush Deadline
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_flush_streams_reports_nothing_dropped_without_deadline() -> None:
+    assert runner.flush_streams() == 0
+
+
+@pytest.mark.posix_only
+def test_run_cli_reports_truncated_output_with_configured_code(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    reset_config: None,
+) -> None:
+    read_fd, write_fd = os.pipe()
+    stalled = open(write_fd, "w", buffering=1 << 20, encoding="ascii")  # noqa: SIM115
+    monkeypatch.setattr(sys, "stdout", stalled)
+    cfg.config.flush_deadline = 0.05
+    cfg.config.flush_truncated_exit_code = 42
+
+    def flood() -> None:
+        stalled.write("x" * 512 * 1024)
+
+    try:
+        result = runner.run_cli(DummyCommand(flood), install_signals=False)
+    finally:
+        monkeypatch.undo()
+        stalled.close()
+        os.close(read_fd)
+
+    assert result == 42
+    assert "dropped" in capsys.readouterr().err
+
+
+@pytest.mark.posix_only
+def test_exception_report_respects_flush_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    reset_config: None,
+) -> None:
+    read_fd, write_fd = os.pipe()
+    stalled = open(write_fd, "w", buffering=1 << 20, encoding="ascii")  # noqa: SIM115
+    monkeypatch.setattr(sys, "stdout", stalled)
+    cfg.config.flush_deadline = 0.05
+
+    def flood_then_fail() -> None:
+        stalled.write("x" * 512 * 1024)
+        raise RuntimeError("boom")
+
+    try:
+        result = runner.run_cli(DummyCommand(flood_then_fail), install_signals=False)
+    finally:
+        monkeypatch.undo()
+        stalled.close()
+        os.close(read_fd)
+
+    assert result == 1
+    assert "dropped" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_truncation_keeps_existing_failure_code(reset_config: None) -> None:
+    assert runner._exit_code_after_flush(3, dropped=10) == 3  # pyright: ignore[reportPrivateUsage]
+
+
+# =============================================================================
+# Resource Usage Report
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_run_cli_prints_rusage_report_after_success(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    runner.run_cli(DummyCommand(lambda: None), install_signals=False, rusage=cfg.RusageFormat.HUMAN)
+
+    assert "peak rss" in capsys.readouterr().err
+
+
+@pytest.mark.posix_only
+def test_run_cli_prints_rusage_report_after_failure(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    def explode() -> None:
+        raise RuntimeError("boom")
+
+    runner.run_cli(DummyCommand(explode), install_signals=False, rusage=cfg.RusageFormat.HUMAN)
+
+    assert "peak rss" in capsys.readouterr().err
+
+
+@pytest.mark.posix_only
+def test_run_cli_rusage_json_is_last_stderr_line(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    runner.run_cli(DummyCommand(lambda: None), install_signals=False, rusage=cfg.RusageFormat.JSON)
+
+    report = json.loads(capsys.readouterr().err.splitlines()[-1])
+    assert set(report) == {"wall", "self", "children"}
+
+
+@pytest.mark.posix_only
+def test_run_cli_rusage_defaults_to_config(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cfg.config.rusage = cfg.RusageFormat.HUMAN
+
+    runner.run_cli(DummyCommand(lambda: None), install_signals=False)
+
+    assert "rusage:" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_prints_no_rusage_by_default(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    runner.run_cli(DummyCommand(lambda: None), install_signals=False)
+
+    assert "rusage" not in capsys.readouterr().err
+
+
+# =============================================================================
+# Timeout
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_handle_cli_exception_maps_timeout_to_124() -> None:
+    assert runner.handle_cli_exception(TimeoutInterrupt(5), echo=lambda message, *, err=True: None) == 124
+
+
+@pytest.mark.os_agnostic
+def test_handle_cli_exception_reports_exceeded_limit() -> None:
+    messages: list[str] = []
+
+    runner.handle_cli_exception(TimeoutInterrupt(2.5), echo=lambda message, *, err=True: messages.append(message))
+
+    assert messages == ["Timed out after 2.5s."]
+
+
+@pytest.mark.posix_only
+def test_run_cli_interrupts_command_after_timeout(reset_config: None) -> None:
+    exit_code = runner.run_cli(DummyCommand(lambda: time.sleep(5)), install_signals=False, timeout=0.05)
+
+    assert exit_code == 124
+
+
+@pytest.mark.posix_only
+def test_run_cli_timeout_defaults_to_config(reset_config: None) -> None:
+    cfg.config.timeout = 0.05
+
+    assert runner.run_cli(DummyCommand(lambda: time.sleep(5)), install_signals=False) == 124
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_timeout_leaves_fast_command_alone(reset_config: None) -> None:
+    assert runner.run_cli(DummyCommand(lambda: None), install_signals=False, timeout=5) == 0
+
+
+# =============================================================================
+# Heartbeat Watchdog
+# =============================================================================
+
+
+def _stall() -> None:
+    """Spin in Python bytecode without calling ``heartbeat()``."""
+    end = time.monotonic() + 5
+    while time.monotonic() < end:
+        time.sleep(0.005)
+
+
+@pytest.mark.os_agnostic
+def test_handle_cli_exception_maps_stall_to_125() -> None:
+    assert runner.handle_cli_exception(StallInterrupt(5), echo=lambda message, *, err=True: None) == 125
+
+
+@pytest.mark.os_agnostic
+def test_handle_cli_exception_reports_heartbeat_interval() -> None:
+    messages: list[str] = []
+
+    runner.handle_cli_exception(StallInterrupt(2.5), echo=lambda message, *, err=True: messages.append(message))
+
+    assert messages == ["Stalled: no heartbeat for 2.5s."]
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_interrupts_stalled_command(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cfg.config.watchdog_interrupt = True
+
+    exit_code = runner.run_cli(DummyCommand(_stall), install_signals=False, watchdog=0.05)
+
+    assert (exit_code, "Stalled." in capsys.readouterr().err) == (125, True)
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_watchdog_defaults_to_config(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cfg.config.watchdog = 0.05
+    cfg.config.watchdog_interrupt = True
+
+    assert runner.run_cli(DummyCommand(_stall), install_signals=False) == 125
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_watchdog_without_interrupt_only_reports(
+    capsys: pytest.CaptureFixture[str],
+    reset_config: None,
+) -> None:
+    exit_code = runner.run_cli(DummyCommand(lambda: time.sleep(0.3)), install_signals=False, watchdog=0.05)
+
+    assert (exit_code, "No heartbeat for" in capsys.readouterr().err) == (0, True)
+
+
+# =============================================================================
+# Memory Ceiling
+# =============================================================================
+
+
+def _exhaust_memory() -> None:
+    raise MemoryError()
+
+
+@pytest.mark.posix_only
+def test_run_cli_maps_memory_error_to_enomem(reset_config: None) -> None:
+    assert runner.run_cli(DummyCommand(_exhaust_memory), install_signals=False) == 12
+
+
+@pytest.mark.os_agnostic
+def test_handle_failure_releases_reserve_on_memory_error() -> None:
+    reserve = MemoryReserve(4096)
+
+    runner._handle_failure(lambda exc: 1, MemoryError(), reserve)  # pyright: ignore[reportPrivateUsage]
+
+    assert reserve.held == 0
+
+
+@pytest.mark.os_agnostic
+def test_handle_failure_keeps_reserve_for_other_errors() -> None:
+    reserve = MemoryReserve(4096)
+
+    runner._handle_failure(lambda exc: 1, RuntimeError("boom"), reserve)  # pyright: ignore[reportPrivateUsage]
+
+    assert reserve.held == 4096
+
+
+@pytest.mark.posix_only
+def test_handle_failure_survives_memory_error_in_handler() -> None:
+    def _failing_handler(exc: BaseException) -> int:
+        raise MemoryError()
+
+    result = runner._handle_failure(_failing_handler, MemoryError(), MemoryReserve(4096))  # pyright: ignore[reportPrivateUsage]
+
+    assert result == 12
+
+
+# =============================================================================
+# Retry Policy
+# =============================================================================
+
+
+def _flaky(failures: int) -> Callable[[], None]:
+    calls: list[int] = []
+
+    def _behaviour() -> None:
+        calls.append(1)
+        if len(calls) <= failures:
+            raise ConnectionResetError(104, "reset")
+
+    return _behaviour
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_retries_transient_failure(reset_config: None) -> None:
+    policy = RetryPolicy(initial_delay=0.0, jitter=0.0)
+
+    assert runner.run_cli(DummyCommand(_flaky(2)), install_signals=False, retry=policy) == 0
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_without_retry_reports_first_failure(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    assert runner.run_cli(DummyCommand(_flaky(1)), install_signals=False) != 0
+
+
+# =============================================================================
+# Worker-Thread Failures
+# =============================================================================
+
+
+def _crash_worker() -> None:
+    def _work() -> None:
+        raise FileNotFoundError(2, "missing input")
+
+    worker = threading.Thread(target=_work, name="loader")
+    worker.start()
+    worker.join()
+
+
+def _crash_worker_then_wait() -> None:
+    threading.Thread(target=lambda: 1 / 0, name="loader").start()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_run_cli_ignores_worker_failures_by_default(reset_config: None) -> None:
+    assert runner.run_cli(DummyCommand(_crash_worker), install_signals=False) == 0
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_run_cli_folds_worker_failure_into_exit_code(reset_config: None) -> None:
+    assert runner.run_cli(DummyCommand(_crash_worker), install_signals=False, thread_failures=True) == 2
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_run_cli_renders_worker_failure(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    runner.run_cli(DummyCommand(_crash_worker), install_signals=False, thread_failures=True)
+
+    err = capsys.readouterr().err
+    assert "Exception in thread loader:" in err and "missing input" in err
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_run_cli_keeps_command_exit_code_over_worker_failure(reset_config: None) -> None:
+    def _crash_then_exit() -> None:
+        _crash_worker()
+        raise SystemExit(5)
+
+    assert runner.run_cli(DummyCommand(_crash_then_exit), install_signals=False, thread_failures=True) == 5
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_run_cli_cancels_command_on_worker_failure(reset_config: None) -> None:
+    cfg.config.cancel_on_thread_failure = True
+    started = time.monotonic()
+
+    code = runner.run_cli(DummyCommand(_crash_worker_then_wait), install_signals=False)
+
+    assert (code, time.monotonic() - started < 4) == (1, True)
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_run_cli_restores_thread_excepthook(reset_config: None) -> None:
+    before = threading.excepthook
+
+    runner.run_cli(DummyCommand(_crash_worker), install_signals=False, thread_failures=True)
+
+    assert threading.excepthook is before
+
+
+# =============================================================================
+# Async Commands
+# =============================================================================
+
+
+@click.command()
+async def _async_hello() -> None:
+    await asyncio.sleep(0)
+    click.echo("hello from the loop")
+
+
+@click.command()
+async def _async_interrupted() -> None:
+    os.kill(os.getpid(), signal.SIGINT)
+    await asyncio.sleep(5)
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_awaits_coroutine_commands(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    assert runner.run_cli(_async_hello, argv=[], install_signals=False) == 0
+    assert "hello from the loop" in capsys.readouterr().out
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_async_runs_coroutine_command(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    assert runner.run_cli_async(_async_hello, argv=[]) == 0
+    assert "hello from the loop" in capsys.readouterr().out
+
+
+@pytest.mark.posix_only
+def test_run_cli_async_maps_signal_to_spec_exit_code(reset_config: None) -> None:
+    assert runner.run_cli_async(_async_interrupted, argv=[]) == 130
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_async_uses_loop_factory(reset_config: None) -> None:
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def _factory() -> asyncio.AbstractEventLoop:
+        created.append(asyncio.new_event_loop())
+        return created[-1]
+
+    runner.run_cli_async(_async_hello, argv=[], loop_factory=_factory)
+
+    assert len(created) == 1
+
+
+# =============================================================================
+# Cancellation Token
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_run_cli_activates_cancellation_token(reset_config: None) -> None:
+    seen: list[object] = []
+    runner.run_cli(DummyCommand(lambda: seen.append(current_cancellation_token())), argv=[], install_signals=False)
+    assert seen[0] is not None
+    assert current_cancellation_token() is None
+
+
+@pytest.mark.posix_only
+def test_run_cli_signal_cancels_token_seen_by_workers(reset_config: None) -> None:
+    tokens: list[CancellationToken] = []
+
+    def _interrupted() -> None:
+        token = current_cancellation_token()
+        assert token is not None
+        tokens.append(token)
+        os.kill(os.getpid(), signal.SIGINT)
+        time.sleep(5)
+
+    assert runner.run_cli(DummyCommand(_interrupted), argv=[]) == 130
+    assert tokens[0].cancelled
+    assert tokens[0].signum == signal.SIGINT
+
+
+# =============================================================================
+# Child Processes
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_run_cli_maps_child_signal_death_to_128_plus_signal(reset_config: None, capsys: pytest.CaptureFixture[str]) -> None:
+    def _shell_out() -> None:
+        run_child([sys.executable, "-c", "import os, signal; print('partial'); os.kill(os.getpid(), signal.SIGKILL)"])
+
+    assert runner.run_cli(DummyCommand(_shell_out), argv=[], install_signals=False) == 137
+    assert "STDOUT: partial" in capsys.readouterr().err
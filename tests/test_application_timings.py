@@ -0,0 +1,185 @@
+"""Tests for per-phase timing instrumentation.
+
+Each test verifies exactly one timing behavior:
+- Recorders store phases, forward them to hooks, and summarise them
+- timed_phase only records while a recorder is active
+- The invoke probe separates Click parsing from command execution
+- The probe is installed only while timings are requested and removed afterwards
+- start_command_phase marks the same boundary from inside a run
+- run_cli reports each phase of success and failure paths
+"""
+
+from __future__ import annotations
+
+import pytest
+import rich_click as click
+
+from lib_cli_exit_tools.application import runner, timings
+
+
+@click.command()
+def _noop() -> None:
+    """Do nothing so only the framework phases remain."""
+
+
+@click.command()
+def _explode() -> None:
+    """Fail so the exception phases are exercised."""
+    raise RuntimeError("boom")
+
+
+def _phases_of(command: click.Command) -> list[str]:
+    seen: list[str] = []
+    runner.run_cli(command, argv=[], install_signals=False, phase_hook=lambda phase, _started, _finished: seen.append(phase))
+    return seen
+
+
+# =============================================================================
+# Recorder
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_record_forwards_to_hook() -> None:
+    received: list[tuple[str, float, float]] = []
+    recorder = timings.PhaseTimings(hook=lambda phase, started, finished: received.append((phase, started, finished)))
+    recorder.record("parse", 1.0, 2.0)
+    assert received == [("parse", 1.0, 2.0)]
+
+
+@pytest.mark.os_agnostic
+def test_durations_sum_repeated_phases() -> None:
+    recorder = timings.PhaseTimings()
+    recorder.record("command", 0.0, 1.0)
+    recorder.record("command", 2.0, 2.5)
+    assert recorder.durations() == {"command": 1.5}
+
+
+@pytest.mark.os_agnostic
+def test_stop_without_start_records_nothing() -> None:
+    recorder = timings.PhaseTimings()
+    recorder.stop("parse")
+    assert recorder.records == []
+
+
+@pytest.mark.os_agnostic
+def test_summary_without_records_says_so() -> None:
+    assert timings.PhaseTimings().summary() == "timings (ms): no phases recorded"
+
+
+@pytest.mark.os_agnostic
+def test_timed_phase_is_noop_without_active_recorder() -> None:
+    with timings.timed_phase("anything"):
+        pass
+    assert timings.current_timings() is None
+
+
+@pytest.mark.os_agnostic
+def test_timed_phase_records_on_active_recorder() -> None:
+    recorder = timings.PhaseTimings()
+    token = timings.activate_timings(recorder)
+    try:
+        with timings.timed_phase("work"):
+            pass
+    finally:
+        timings.deactivate_timings(token)
+    assert [record[0] for record in recorder.records] == ["work"]
+
+
+# =============================================================================
+# run_cli Integration
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_successful_run_reports_framework_phases() -> None:
+    assert _phases_of(_noop) == [
+        timings.PHASE_SIGNALS,
+        timings.PHASE_PARSE,
+        timings.PHASE_COMMAND,
+        timings.PHASE_FINALISE,
+    ]
+
+
+@pytest.mark.os_agnostic
+def test_failing_run_reports_exception_phases(capsys: pytest.CaptureFixture[str]) -> None:
+    phases = _phases_of(_explode)
+    capsys.readouterr()
+    assert phases[-3:] == [
+        timings.PHASE_PRINT_EXCEPTION,
+        timings.PHASE_HANDLE_EXCEPTION,
+        timings.PHASE_FINALISE,
+    ]
+
+
+@pytest.mark.os_agnostic
+def test_usage_error_is_reported_as_parse_only(capsys: pytest.CaptureFixture[str]) -> None:
+    seen: list[str] = []
+    runner.run_cli(_noop, argv=["--bogus"], install_signals=False, phase_hook=lambda phase, _started, _finished: seen.append(phase))
+    capsys.readouterr()
+    assert timings.PHASE_COMMAND not in seen
+
+
+@pytest.mark.os_agnostic
+def test_recorder_is_deactivated_after_run() -> None:
+    _phases_of(_noop)
+    assert timings.current_timings() is None
+
+
+# =============================================================================
+# Invoke Probe Lifetime
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_probe_is_not_installed_without_timings_request(reset_config: None) -> None:
+    seen: list[object] = []
+
+    @click.command()
+    def _look() -> None:
+        seen.append(vars(_look).get("invoke"))
+
+    runner.run_cli(_look, argv=[], install_signals=False)
+    assert seen == [None]
+
+
+@pytest.mark.os_agnostic
+def test_probe_is_removed_after_run() -> None:
+    _phases_of(_noop)
+    assert "invoke" not in vars(_noop)
+
+
+@pytest.mark.os_agnostic
+def test_restore_puts_back_instance_invoke() -> None:
+    @click.command()
+    def _command() -> None:
+        """Carry its own ``invoke`` attribute."""
+
+    own_invoke = _command.invoke
+    _command.invoke = own_invoke  # type: ignore[method-assign]
+    restore = timings.install_invoke_probe(_command)
+    assert restore is not None
+    restore()
+    assert vars(_command)["invoke"] is own_invoke
+
+
+# =============================================================================
+# start_command_phase
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_start_command_phase_outside_run_returns_false() -> None:
+    assert timings.start_command_phase() is False
+
+
+@pytest.mark.os_agnostic
+def test_start_command_phase_closes_parsing() -> None:
+    recorder = timings.PhaseTimings()
+    token = timings.activate_timings(recorder)
+    try:
+        recorder.start(timings.PHASE_PARSE)
+        timings.start_command_phase()
+    finally:
+        timings.deactivate_timings(token)
+    assert [record[0] for record in recorder.records] == [timings.PHASE_PARSE]
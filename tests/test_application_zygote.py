@@ -0,0 +1,203 @@
+"""Tests for the pre-fork zygote launcher.
+
+Each test verifies exactly one zygote behavior:
+- Forked children report the command's exit code
+- Children start from a reset configuration
+- Warm modules are imported once in the zygote
+- Socket-served requests round-trip exit codes and stdio
+- Malformed requests are dropped without stopping the server
+- Wait statuses translate into shell-style exit codes
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+import rich_click as click
+
+from lib_cli_exit_tools.application import zygote
+from lib_cli_exit_tools.core import configuration as cfg
+
+
+def _exiting_command(code: int) -> click.Command:
+    """Build a command that exits with ``code`` so the parent can observe it."""
+
+    @click.command()
+    def _exit_with() -> None:
+        raise SystemExit(code)
+
+    return _exit_with
+
+
+@click.command()
+def _report_traceback_flag() -> None:
+    """Exit with 1 when the inherited config still has tracebacks enabled."""
+    raise SystemExit(1 if cfg.config.traceback else 0)
+
+
+@click.command()
+def _say_hello() -> None:
+    """Write a marker to stdout."""
+    click.echo("hello from child")
+
+
+# =============================================================================
+# Direct Fork
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_run_returns_child_exit_code() -> None:
+    launcher = zygote.Zygote(_exiting_command(7))
+    assert launcher.run([]) == 7
+
+
+@pytest.mark.posix_only
+def test_run_returns_zero_on_success() -> None:
+    launcher = zygote.Zygote(_exiting_command(0))
+    assert launcher.run([]) == 0
+
+
+@pytest.mark.posix_only
+def test_child_starts_from_reset_config(reset_config: None) -> None:
+    cfg.config.traceback = True
+    launcher = zygote.Zygote(_report_traceback_flag)
+    assert launcher.run([]) == 0
+
+
+@pytest.mark.posix_only
+def test_child_writes_to_supplied_stdio(tmp_path: Path) -> None:
+    target = tmp_path / "out.txt"
+    fd = os.open(target, os.O_WRONLY | os.O_CREAT, 0o600)
+    try:
+        zygote.Zygote(_say_hello).run([], stdio=(0, fd, 2))
+    finally:
+        os.close(fd)
+    assert "hello from child" in target.read_text(encoding="utf-8")
+
+
+@pytest.mark.posix_only
+def test_warm_modules_are_imported(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    zygote.Zygote(_exiting_command(0), warm_modules=["colorsys"])
+    assert "colorsys" in sys.modules
+
+
+# =============================================================================
+# Socket Server
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_served_request_reports_exit_code(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "zygote.sock")
+    launcher = zygote.Zygote(_exiting_command(5))
+    server = threading.Thread(target=launcher.serve, args=(socket_path,), kwargs={"max_requests": 1})
+    server.start()
+    try:
+        _wait_for_socket(socket_path)
+        code = zygote.request_zygote_run(socket_path, [])
+    finally:
+        server.join(timeout=10)
+    assert code == 5
+
+
+@pytest.mark.posix_only
+def test_serve_removes_socket_file_afterwards(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "zygote.sock")
+    launcher = zygote.Zygote(_exiting_command(0))
+    server = threading.Thread(target=launcher.serve, args=(socket_path,), kwargs={"max_requests": 1})
+    server.start()
+    _wait_for_socket(socket_path)
+    zygote.request_zygote_run(socket_path, [])
+    server.join(timeout=10)
+    assert not os.path.exists(socket_path)
+
+
+@pytest.mark.posix_only
+def test_non_json_request_leaves_server_running(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "zygote.sock")
+    launcher = zygote.Zygote(_exiting_command(4))
+    server = threading.Thread(target=launcher.serve, args=(socket_path,), kwargs={"max_requests": 2})
+    server.start()
+    try:
+        _wait_for_socket(socket_path)
+        reply = _send_raw(socket_path, b"not json\n", [0, 1, 2])
+        code = zygote.request_zygote_run(socket_path, [])
+    finally:
+        server.join(timeout=10)
+    assert (reply, code) == (b"", 4)
+
+
+@pytest.mark.posix_only
+def test_request_without_stdio_leaves_server_running(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "zygote.sock")
+    launcher = zygote.Zygote(_exiting_command(4))
+    server = threading.Thread(target=launcher.serve, args=(socket_path,), kwargs={"max_requests": 2})
+    server.start()
+    try:
+        _wait_for_socket(socket_path)
+        reply = _send_raw(socket_path, b'{"argv": []}\n', [0])
+        code = zygote.request_zygote_run(socket_path, [])
+    finally:
+        server.join(timeout=10)
+    assert (reply, code) == (b"", 4)
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("payload", [b"[]\n", b'{"args": []}\n', b'{"argv": "info"}\n', b"\xff\n"])
+def test_malformed_payload_is_rejected(payload: bytes) -> None:
+    with pytest.raises(ValueError, match="malformed request payload"):
+        zygote._parse_argv(payload)  # pyright: ignore[reportPrivateUsage]
+
+
+# =============================================================================
+# Status Translation
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_exit_status_translates_normal_exit() -> None:
+    status = 3 << 8
+    assert zygote._exit_code_from_status(status) == 3  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.posix_only
+def test_exit_status_translates_signal_death() -> None:
+    status = int(signal.SIGTERM)
+    assert zygote._exit_code_from_status(status) == 128 + signal.SIGTERM  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.os_agnostic
+def test_zygote_requires_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delattr(os, "fork", raising=False)
+    with pytest.raises(RuntimeError, match="os.fork"):
+        zygote.Zygote(_exiting_command(0))
+
+
+def _send_raw(path: str, payload: bytes, fds: list[int]) -> bytes:
+    """Send ``payload`` with duplicates of ``fds`` and return the server's reply."""
+    duplicates = [os.dup(fd) for fd in fds]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(path)
+            socket.send_fds(client, [payload], duplicates)
+            return client.recv(64)
+    finally:
+        for fd in duplicates:
+            os.close(fd)
+
+
+def _wait_for_socket(path: str, *, timeout: float = 5.0) -> None:
+    waited = 0.0
+    while not os.path.exists(path):
+        if waited >= timeout:
+            pytest.fail("zygote socket never appeared")
+        threading.Event().wait(0.01)
+        waited += 0.01
@@ -124,6 +124,7 @@ def test_cli_session_applies_traceback_override(monkeypatch: pytest.MonkeyPatch,
         install_signals: bool = True,
         exception_handler: Callable[[BaseException], int] | None = None,
         signal_installer: Callable[[Sequence[object] | None], Callable[[], None]] | None = None,
+        **_: object,
     ) -> int:
         states.append(lib_cli_exit_tools.config.traceback)
         command.main(args=argv, prog_name=prog_name, standalone_mode=False)
@@ -149,6 +150,7 @@ def test_cli_session_restores_traceback_after_exit(monkeypatch: pytest.MonkeyPat
         install_signals: bool = True,
         exception_handler: Callable[[BaseException], int] | None = None,
         signal_installer: Callable[[Sequence[object] | None], Callable[[], None]] | None = None,
+        **_: object,
     ) -> int:
         command.main(args=argv, prog_name=prog_name, standalone_mode=False)
         return 0
@@ -179,6 +181,7 @@ def test_cli_session_returns_exit_code(monkeypatch: pytest.MonkeyPatch, reset_co
         install_signals: bool = True,
         exception_handler: Callable[[BaseException], int] | None = None,
         signal_installer: Callable[[Sequence[object] | None], Callable[[], None]] | None = None,
+        **_: object,
     ) -> int:
         try:
             command.main(args=argv, prog_name=prog_name, standalone_mode=False)
@@ -212,6 +215,7 @@ def test_cli_session_applies_force_color_with_traceback(monkeypatch: pytest.Monk
         install_signals: bool = True,
         exception_handler: Callable[[BaseException], int] | None = None,
         signal_installer: Callable[[Sequence[object] | None], Callable[[], None]] | None = None,
+        **_: object,
     ) -> int:
         states.append((lib_cli_exit_tools.config.traceback, lib_cli_exit_tools.config.traceback_force_color))
         command.main(args=argv, prog_name=prog_name, standalone_mode=False)
@@ -11,6 +11,7 @@ Each test verifies exactly one CLI behavior:
 from __future__ import annotations
 
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -48,6 +49,7 @@ def test_main_delegates_to_run_cli(monkeypatch: pytest.MonkeyPatch) -> None:
         install_signals: bool = True,
         exception_handler: Any = None,
         signal_installer: Any = None,
+        **_: Any,
     ) -> int:
         ledger.update(command=command, argv=argv, prog_name=prog_name)
         return 123
@@ -92,6 +94,22 @@ def test_main_passes_prog_name_from_metadata(monkeypatch: pytest.MonkeyPatch) ->
     assert ledger["prog_name"] == metadata.shell_command
 
 
+@pytest.mark.os_agnostic
+def test_main_forwards_fast_exit_to_run_cli(monkeypatch: pytest.MonkeyPatch) -> None:
+    ledger: dict[str, Any] = {}
+
+    def fake_run_cli(command: Any, *, fast_exit: bool | None = None, **kwargs: Any) -> int:
+        ledger["fast_exit"] = fast_exit
+        return 0
+
+    monkeypatch.setattr("lib_cli_exit_tools.lib_cli_exit_tools.run_cli", fake_run_cli)
+    monkeypatch.setattr(runner_mod, "run_cli", fake_run_cli)
+
+    cli_mod.main(["info"], fast_exit=True)
+
+    assert ledger["fast_exit"] is True
+
+
 # =============================================================================
 # Traceback Flag
 # =============================================================================
@@ -121,6 +139,175 @@ def test_traceback_flag_allows_successful_command_execution(
     assert result.exit_code == 0
 
 
+# =============================================================================
+# Timings Flag
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_timings_flag_prints_phase_breakdown(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cli_mod.main(["--timings", "info"])
+
+    assert "timings (ms):" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_timings_flag_separates_command_from_parsing(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cli_mod.main(["--timings", "info"])
+
+    assert "  command" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_timings_breakdown_is_silent_by_default(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cli_mod.main(["info"])
+
+    assert "timings" not in capsys.readouterr().err
+
+
+@pytest.mark.posix_only
+def test_rusage_flag_prints_human_report(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cli_mod.main(["--rusage", "info"])
+
+    assert "peak rss" in capsys.readouterr().err
+
+
+@pytest.mark.posix_only
+def test_rusage_json_flag_prints_json_report(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cli_mod.main(["--rusage-json", "fail"])
+
+    assert '"children"' in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_profile_output_writes_pstats_file(tmp_path: Path, reset_config: None) -> None:
+    target = tmp_path / "cli.pstats"
+
+    cli_mod.main(["--profile-output", str(target), "info"])
+
+    assert target.exists()
+
+
+@pytest.mark.os_agnostic
+def test_profile_top_prints_function_table(tmp_path: Path, capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cli_mod.main(["--profile-output", str(tmp_path / "cli.pstats"), "--profile-top", "3", "info"])
+
+    assert "cumtime" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_trace_memory_flag_reports_peak(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cli_mod.main(["--trace-memory", "fail"])
+
+    assert "memory: peak" in capsys.readouterr().err
+
+
+@pytest.mark.os_agnostic
+def test_memory_diff_compares_snapshots(tmp_path: Path, capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    first, second = str(tmp_path / "a.snapshot"), str(tmp_path / "b.snapshot")
+    cli_mod.main(["--trace-memory-snapshot", first, "info"])
+    cli_mod.main(["--trace-memory-snapshot", second, "info"])
+    capsys.readouterr()
+
+    assert cli_mod.main(["memory-diff", first, second]) == 0
+    assert "size diff" in capsys.readouterr().out
+
+
+@pytest.mark.os_agnostic
+def test_timeout_option_lets_fast_command_finish(reset_config: None) -> None:
+    assert cli_mod.main(["--timeout", "5", "info"]) == 0
+
+
+@pytest.mark.os_agnostic
+def test_timeout_option_stores_limit_in_config(reset_config: None) -> None:
+    cli_mod.main(["--timeout", "5", "--timeout-grace", "1", "info"])
+
+    assert (lib_cli_exit_tools.config.timeout, lib_cli_exit_tools.config.timeout_grace) == (5.0, 1.0)
+
+
+@pytest.mark.os_agnostic
+def test_timeout_option_rejects_zero(reset_config: None) -> None:
+    assert cli_mod.main(["--timeout", "0", "info"]) == 2
+
+
+@pytest.mark.os_agnostic
+def test_watchdog_option_stores_interval_in_config(reset_config: None) -> None:
+    cli_mod.main(["--watchdog", "30", "--watchdog-interrupt", "info"])
+
+    assert (lib_cli_exit_tools.config.watchdog, lib_cli_exit_tools.config.watchdog_interrupt) == (30.0, True)
+
+
+@pytest.mark.os_agnostic
+def test_watchdog_option_lets_fast_command_finish(reset_config: None) -> None:
+    assert cli_mod.main(["--watchdog", "5", "info"]) == 0
+
+
+@pytest.mark.os_agnostic
+def test_max_memory_option_stores_ceiling_in_config(reset_config: None) -> None:
+    cli_mod.main(["--max-memory", "64G", "info"])
+
+    assert lib_cli_exit_tools.config.max_memory == 64 << 30
+
+
+@pytest.mark.os_agnostic
+def test_max_memory_option_rejects_malformed_size(reset_config: None) -> None:
+    assert cli_mod.main(["--max-memory", "lots", "info"]) == 2
+
+
+@pytest.mark.os_agnostic
+def test_cancel_on_thread_failure_option_implies_thread_failures(reset_config: None) -> None:
+    cli_mod.main(["--cancel-on-thread-failure", "info"])
+
+    assert (lib_cli_exit_tools.config.thread_failures, lib_cli_exit_tools.config.cancel_on_thread_failure) == (True, True)
+
+
+# =============================================================================
+# Repeated Invocations
+# =============================================================================
+
+
+@pytest.mark.posix_only
+def test_options_do_not_leak_into_next_invocation(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cli_mod.main(["--timeout", "30", "--rusage", "--max-memory", "64G", "info"])
+    cli_mod.main(["info"])
+    capsys.readouterr()
+
+    config = lib_cli_exit_tools.config
+    assert (config.timeout, config.rusage, config.max_memory) == (None, None, None)
+
+
+@pytest.mark.posix_only
+def test_rusage_report_stops_once_flag_is_dropped(capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    cli_mod.main(["--rusage", "info"])
+    capsys.readouterr()
+    cli_mod.main(["info"])
+
+    assert "peak rss" not in capsys.readouterr().err
+
+
+# =============================================================================
+# Stats Command
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_stats_command_lists_recorded_commands(tmp_path: Path, capsys: pytest.CaptureFixture[str], reset_config: None) -> None:
+    database = str(tmp_path / "runs.db")
+    lib_cli_exit_tools.config.stats_path = database
+    cli_mod.main(["info"])
+    capsys.readouterr()
+
+    cli_mod.main(["stats", "--db", database])
+
+    assert f"{metadata.shell_command} info" in capsys.readouterr().out
+
+
+@pytest.mark.os_agnostic
+def test_stats_command_without_database_is_usage_error(monkeypatch: pytest.MonkeyPatch, reset_config: None) -> None:
+    monkeypatch.delenv("LIB_CLI_EXIT_TOOLS_STATS_DB", raising=False)
+    assert cli_mod.main(["stats"]) == 2
+
+
 # =============================================================================
 # Info Command
 # =============================================================================
@@ -5,6 +5,7 @@ Each test verifies exactly one behavior of the configuration system:
 - Override context manager semantics
 - Snapshot and restore operations
 - Unknown field rejection
+- Per-run report reset for forked children
 """
 
 from __future__ import annotations
@@ -14,7 +15,7 @@ from collections.abc import Iterator
 import pytest
 
 from lib_cli_exit_tools.core import configuration as cfg
-from lib_cli_exit_tools.core.configuration import ExitCodeStyle
+from lib_cli_exit_tools.core.configuration import ExitCodeStyle, ForkSignalPolicy
 
 
 # =============================================================================
@@ -29,6 +30,26 @@ def modified_config() -> Iterator[None]:
     cfg.config.exit_code_style = ExitCodeStyle.SYSEXITS
     cfg.config.broken_pipe_exit_code = 0
     cfg.config.traceback_force_color = True
+    cfg.config.fast_exit = True
+    cfg.config.broken_pipe_strategy = cfg.BrokenPipeStrategy.DEVNULL
+    cfg.config.flush_deadline = 0.5
+    cfg.config.flush_truncated_exit_code = 3
+    cfg.config.timings = True
+    cfg.config.stats_path = "runs.db"
+    cfg.config.rusage = cfg.RusageFormat.JSON
+    cfg.config.profile_path = "run.pstats"
+    cfg.config.profile_top = 5
+    cfg.config.trace_memory = 10
+    cfg.config.trace_memory_snapshot = "run.snapshot"
+    cfg.config.timeout = 30.0
+    cfg.config.timeout_grace = 5.0
+    cfg.config.timeout_dump_stacks = True
+    cfg.config.watchdog = 30.0
+    cfg.config.watchdog_interrupt = True
+    cfg.config.max_memory = 1 << 30
+    cfg.config.thread_failures = True
+    cfg.config.cancel_on_thread_failure = True
+    cfg.config.fork_signal_policy = ForkSignalPolicy.KEEP
     yield
     cfg.reset_config()
 
@@ -62,6 +83,126 @@ def test_reset_restores_traceback_force_color_to_false(modified_config: None) ->
     assert cfg.config.traceback_force_color is False
 
 
+@pytest.mark.os_agnostic
+def test_reset_restores_fast_exit_to_false(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.fast_exit is False
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_broken_pipe_strategy_to_exception(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.broken_pipe_strategy is cfg.BrokenPipeStrategy.EXCEPTION
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_flush_deadline_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.flush_deadline is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_flush_truncated_exit_code_to_75(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.flush_truncated_exit_code == 75
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_timings_to_false(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.timings is False
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_stats_path_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.stats_path is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_rusage_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.rusage is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_profile_path_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.profile_path is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_profile_top_to_zero(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.profile_top == 0
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_trace_memory_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.trace_memory is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_trace_memory_snapshot_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.trace_memory_snapshot is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_timeout_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.timeout is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_timeout_grace_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.timeout_grace is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_timeout_dump_stacks_to_false(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.timeout_dump_stacks is False
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_max_memory_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.max_memory is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_thread_failures_to_false(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.thread_failures is False
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_cancel_on_thread_failure_to_false(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.cancel_on_thread_failure is False
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_watchdog_to_none(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.watchdog is None
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_watchdog_interrupt_to_false(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.watchdog_interrupt is False
+
+
+@pytest.mark.os_agnostic
+def test_reset_restores_fork_signal_policy_to_previous(modified_config: None) -> None:
+    cfg.reset_config()
+    assert cfg.config.fork_signal_policy is ForkSignalPolicy.PREVIOUS
+
+
 # =============================================================================
 # Override Context Manager
 # =============================================================================
@@ -100,6 +241,23 @@ def test_override_can_change_multiple_fields_at_once(reset_config: None) -> None
         assert cfg.config.broken_pipe_exit_code == 99
 
 
+# =============================================================================
+# Run Report Reset
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_reset_run_reports_switches_off_profiling_and_timeout(modified_config: None) -> None:
+    cfg.reset_run_reports()
+    assert (cfg.config.profile_path, cfg.config.timeout, cfg.config.timings) == (None, None, False)
+
+
+@pytest.mark.os_agnostic
+def test_reset_run_reports_keeps_exit_code_semantics(modified_config: None) -> None:
+    cfg.reset_run_reports()
+    assert (cfg.config.traceback, cfg.config.exit_code_style) == (True, ExitCodeStyle.SYSEXITS)
+
+
 # =============================================================================
 # Unknown Field Rejection
 # =============================================================================
@@ -153,13 +311,38 @@ def test_snapshot_captures_current_force_color_value(reset_config: None) -> None
 
 
 @pytest.mark.os_agnostic
-def test_snapshot_contains_exactly_four_fields() -> None:
+def test_snapshot_contains_every_config_field() -> None:
     snapshot = cfg._snapshot_current_settings()  # pyright: ignore[reportPrivateUsage]
-    assert len(snapshot) == 4
+    assert len(snapshot) == len(cfg._field_names())  # pyright: ignore[reportPrivateUsage]
 
 
 @pytest.mark.os_agnostic
 def test_snapshot_keys_match_config_field_names() -> None:
     snapshot = cfg._snapshot_current_settings()  # pyright: ignore[reportPrivateUsage]
-    expected_keys = {"traceback", "exit_code_style", "broken_pipe_exit_code", "traceback_force_color"}
+    expected_keys = {
+        "traceback",
+        "exit_code_style",
+        "broken_pipe_exit_code",
+        "broken_pipe_strategy",
+        "traceback_force_color",
+        "fast_exit",
+        "flush_deadline",
+        "flush_truncated_exit_code",
+        "timings",
+        "stats_path",
+        "rusage",
+        "profile_path",
+        "profile_top",
+        "trace_memory",
+        "trace_memory_snapshot",
+        "timeout",
+        "timeout_grace",
+        "timeout_dump_stacks",
+        "watchdog",
+        "watchdog_interrupt",
+        "max_memory",
+        "thread_failures",
+        "cancel_on_thread_failure",
+        "fork_signal_policy",
+    }
     assert set(snapshot.keys()) == expected_keys
@@ -0,0 +1,160 @@
+"""Tests for cross-process exception records.
+
+Each test verifies exactly one record behavior:
+- Capture keeps type, message, exit-code attributes, frames, and chain
+- Rebuild recreates the class or an equivalent stand-in
+- Records survive JSON and pickle round trips
+- Transported exceptions unpickle as rebuilt exceptions
+"""
+
+from __future__ import annotations
+
+import errno
+import json
+import pickle
+import subprocess
+from collections.abc import Callable
+
+import pytest
+
+from lib_cli_exit_tools.core.exception_record import (
+    ExceptionRecord,
+    RemoteError,
+    RemoteTraceback,
+    transport_exceptions,
+)
+from lib_cli_exit_tools.core.exit_codes import get_system_exit_code
+
+
+class _PickyError(Exception):
+    """Constructor does not match ``args``, so plain pickling fails."""
+
+    def __init__(self, first: int, second: int) -> None:
+        super().__init__(f"{first}/{second}")
+
+
+def _raise_chained() -> None:
+    try:
+        raise KeyError("inner")
+    except KeyError as exc:
+        raise ValueError("outer") from exc
+
+
+def _caught(action: Callable[[], object]) -> BaseException:
+    try:
+        action()
+    except BaseException as exc:  # noqa: BLE001 - the test inspects whatever was raised
+        return exc
+    raise AssertionError("action did not raise")
+
+
+def _fail_with_errno() -> None:
+    raise PermissionError(errno.EACCES, "denied")
+
+
+# =============================================================================
+# Capture
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_capture_records_type_path_and_message() -> None:
+    record = ExceptionRecord.capture(ValueError("bad value"))
+    assert (record.type_path, record.message, record.type_name) == ("builtins.ValueError", "bad value", "ValueError")
+
+
+@pytest.mark.os_agnostic
+def test_capture_records_returncode() -> None:
+    record = ExceptionRecord.capture(subprocess.CalledProcessError(3, ["cmd"]))
+    assert record.returncode == 3
+
+
+@pytest.mark.os_agnostic
+def test_capture_records_frames_without_source() -> None:
+    record = ExceptionRecord.capture(_caught(_raise_chained))
+    assert record.frames[-1].name == "_raise_chained"
+
+
+@pytest.mark.os_agnostic
+def test_capture_limits_frames_to_innermost() -> None:
+    record = ExceptionRecord.capture(_caught(_raise_chained), max_frames=1)
+    assert [frame.name for frame in record.frames] == ["_raise_chained"]
+
+
+@pytest.mark.os_agnostic
+def test_capture_follows_cause() -> None:
+    record = ExceptionRecord.capture(_caught(_raise_chained))
+    assert record.cause is not None and record.cause.type_path == "builtins.KeyError"
+
+
+@pytest.mark.os_agnostic
+def test_capture_drops_unportable_args() -> None:
+    assert ExceptionRecord.capture(ValueError(object())).args is None
+
+
+# =============================================================================
+# Rebuild
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_rebuild_recreates_original_class_and_errno() -> None:
+    rebuilt = ExceptionRecord.capture(_caught(_fail_with_errno)).rebuild()
+    assert isinstance(rebuilt, PermissionError) and rebuilt.errno == errno.EACCES
+
+
+@pytest.mark.os_agnostic
+def test_rebuild_attaches_remote_traceback_as_cause() -> None:
+    rebuilt = ExceptionRecord.capture(_caught(_raise_chained)).rebuild()
+    assert isinstance(rebuilt.__cause__, RemoteTraceback)
+    assert "The above exception was the direct cause" in rebuilt.__cause__.text
+    assert 'raise ValueError("outer") from exc' in rebuilt.__cause__.text
+
+
+@pytest.mark.os_agnostic
+def test_rebuild_falls_back_to_remote_error() -> None:
+    rebuilt = ExceptionRecord.capture(_PickyError(1, 2)).rebuild()
+    assert isinstance(rebuilt, RemoteError)
+    assert str(rebuilt).endswith("_PickyError: 1/2")
+
+
+@pytest.mark.os_agnostic
+def test_rebuild_of_unknown_type_with_errno_keeps_exit_code() -> None:
+    record = ExceptionRecord(type_path="gone.module.Error", message="lost", errno=errno.ENOENT)
+    assert get_system_exit_code(record.rebuild()) == get_system_exit_code(FileNotFoundError(errno.ENOENT, "x"))
+
+
+@pytest.mark.os_agnostic
+def test_rebuild_of_unknown_type_with_returncode_keeps_exit_code() -> None:
+    record = ExceptionRecord(type_path="gone.module.Error", message="lost", returncode=-15)
+    assert get_system_exit_code(record.rebuild()) == 143
+
+
+# =============================================================================
+# Serialisation
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_record_survives_json_round_trip() -> None:
+    record = ExceptionRecord.capture(_caught(_raise_chained))
+    assert ExceptionRecord.from_dict(json.loads(json.dumps(record.to_dict()))) == record
+
+
+@pytest.mark.os_agnostic
+def test_record_of_called_process_error_survives_json_round_trip() -> None:
+    record = ExceptionRecord.capture(subprocess.CalledProcessError(2, ["a", "b"]))
+    assert ExceptionRecord.from_dict(json.loads(json.dumps(record.to_dict()))) == record
+
+
+@pytest.mark.os_agnostic
+def test_transported_exception_unpickles_as_rebuilt_exception() -> None:
+    wrapped = transport_exceptions(_fail_with_errno)
+    payload = pickle.dumps(_caught(wrapped))
+    restored = pickle.loads(payload)
+    assert isinstance(restored, PermissionError) and restored.errno == errno.EACCES
+
+
+@pytest.mark.os_agnostic
+def test_transport_exceptions_passes_results_through() -> None:
+    assert transport_exceptions(int)("7") == 7
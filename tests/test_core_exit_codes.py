@@ -2,20 +2,24 @@
 
 Each test verifies exactly one exit code mapping behavior:
 - CalledProcessError returns subprocess exit codes
+- Exception groups resolve to their first member, also in sysexits mode
 - KeyboardInterrupt maps to 130
 - BrokenPipeError respects configuration
 - SystemExit preserves payloads
 - Platform-specific mappings for POSIX and Windows
 - Sysexits mode mappings
+- Transient/permanent classification
 """
 
 from __future__ import annotations
 
+import errno
 import subprocess
 
 import pytest
 from hypothesis import given, strategies as st
 
+from lib_cli_exit_tools.adapters.child_process import FanOutError
 from lib_cli_exit_tools.core import configuration as cfg
 from lib_cli_exit_tools.core import exit_codes as codes
 from lib_cli_exit_tools.core.configuration import ExitCodeStyle
@@ -40,9 +44,43 @@ def test_called_process_error_with_zero_returns_one() -> None:
 
 
 @pytest.mark.os_agnostic
-def test_called_process_error_with_negative_code_returns_negative() -> None:
+def test_called_process_error_killed_by_signal_returns_128_plus_signal() -> None:
     error = subprocess.CalledProcessError(returncode=-9, cmd=["killed"])
-    assert codes.get_system_exit_code(error) == -9
+    assert codes.get_system_exit_code(error) == 137
+
+
+@pytest.mark.os_agnostic
+def test_exit_code_from_returncode_passes_normal_statuses_through() -> None:
+    assert codes.exit_code_from_returncode(3) == 3
+
+
+# =============================================================================
+# Exception Groups
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_exception_group_returns_first_member_exit_code() -> None:
+    group = FanOutError("many", [subprocess.CalledProcessError(3, ["a"]), subprocess.CalledProcessError(4, ["b"])])
+    assert codes.get_system_exit_code(group) == 3
+
+
+@pytest.mark.os_agnostic
+def test_nested_exception_group_resolves_innermost_first_member() -> None:
+    inner = FanOutError("inner", [subprocess.CalledProcessError(-15, ["a"])])
+    assert codes.get_system_exit_code(FanOutError("outer", [inner])) == 143
+
+
+@pytest.mark.os_agnostic
+def test_exception_group_in_sysexits_mode_uses_first_member_sysexits_code(sysexits_mode: None) -> None:
+    group = FanOutError("many", [ValueError("bad"), subprocess.CalledProcessError(4, ["b"])])
+    assert codes.get_system_exit_code(group) == 64
+
+
+@pytest.mark.os_agnostic
+def test_sysexits_resolvers_unwrap_exception_group(sysexits_mode: None) -> None:
+    group = FanOutError("many", [ValueError("bad")])
+    assert codes._sysexits_resolved_code(group) == 64  # pyright: ignore[reportPrivateUsage]
 
 
 # =============================================================================
@@ -182,6 +220,11 @@ def test_posix_permission_error_maps_to_13() -> None:
     assert codes.get_system_exit_code(error) == 13
 
 
+@pytest.mark.posix_only
+def test_posix_memory_error_maps_to_enomem() -> None:
+    assert codes.get_system_exit_code(MemoryError()) == 12
+
+
 # =============================================================================
 # Platform-Specific Mappings (Windows)
 # =============================================================================
@@ -195,6 +238,12 @@ def test_windows_permission_error_maps_to_5(monkeypatch: pytest.MonkeyPatch) ->
     assert codes.get_system_exit_code(error) == 5
 
 
+@pytest.mark.windows_only
+def test_windows_memory_error_maps_to_8(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(codes, "_is_posix_platform", lambda: False)
+    assert codes.get_system_exit_code(MemoryError()) == 8
+
+
 @pytest.mark.windows_only
 def test_windows_file_exists_maps_to_80(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(codes, "_is_posix_platform", lambda: False)
@@ -238,6 +287,11 @@ def test_sysexits_oserror_maps_to_74(sysexits_mode: None) -> None:
     assert codes.get_system_exit_code(OSError("io")) == 74
 
 
+@pytest.mark.os_agnostic
+def test_sysexits_memory_error_maps_to_71(sysexits_mode: None) -> None:
+    assert codes.get_system_exit_code(MemoryError()) == 71
+
+
 @pytest.mark.os_agnostic
 def test_sysexits_broken_pipe_respects_config(sysexits_mode: None) -> None:
     cfg.config.broken_pipe_exit_code = 12
@@ -357,3 +411,51 @@ def test_broken_pipe_respects_any_configured_code(exit_code: int) -> None:
 def test_safe_int_never_raises(value: object | None) -> None:
     result = codes._safe_int(value)  # pyright: ignore[reportPrivateUsage]
     assert result is None or isinstance(result, int)
+
+
+# =============================================================================
+# Transience Classification
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("code", [errno.EAGAIN, errno.ETIMEDOUT, errno.ECONNRESET, errno.EBUSY])
+def test_transient_errno_is_transient(code: int) -> None:
+    assert codes.is_transient(OSError(code, "temporary")) is True
+
+
+@pytest.mark.os_agnostic
+def test_missing_file_is_permanent() -> None:
+    assert codes.classify_exception(FileNotFoundError(errno.ENOENT, "missing")) is codes.FailureKind.PERMANENT
+
+
+@pytest.mark.os_agnostic
+def test_timeout_error_without_errno_is_transient() -> None:
+    assert codes.classify_exception(TimeoutError("slow")) is codes.FailureKind.TRANSIENT
+
+
+@pytest.mark.os_agnostic
+def test_broken_pipe_is_permanent() -> None:
+    assert codes.is_transient(BrokenPipeError(errno.EPIPE, "gone")) is False
+
+
+@pytest.mark.os_agnostic
+def test_value_error_is_permanent() -> None:
+    assert codes.is_transient(ValueError("bad")) is False
+
+
+@pytest.mark.os_agnostic
+def test_system_exit_with_tempfail_is_transient() -> None:
+    assert codes.is_transient(SystemExit(75)) is True
+
+
+@pytest.mark.os_agnostic
+def test_called_process_error_with_tempfail_is_transient() -> None:
+    assert codes.is_transient(subprocess.CalledProcessError(75, ["sync"])) is True
+
+
+@pytest.mark.os_agnostic
+def test_transient_attribute_overrides_errno() -> None:
+    error = ConnectionResetError(errno.ECONNRESET, "reset")
+    error.transient = False  # type: ignore[attr-defined]
+    assert codes.is_transient(error) is False
@@ -43,6 +43,7 @@ def fake_run_cli_recording(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
         install_signals: bool = True,
         exception_handler: Any = None,
         signal_installer: Any = None,
+        **_: Any,
     ) -> int:
         ledger.update(
             command=command,